@@ -82,7 +82,8 @@ async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsMana
     if args.auto_set_permissions is not None:
         autofix_permissions(args.auto_set_permissions)
 
-    if not Security.login(secrets_manager):
+    # When a strategy is started right away only the configs of the connectors it uses need to be decrypted
+    if not Security.login(secrets_manager, lazy_decryption=config_file_name is not None):
         logging.getLogger().error("Invalid password.")
         return
 
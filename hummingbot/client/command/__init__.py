@@ -8,9 +8,11 @@ from .gateway_command import GatewayCommand
 from .help_command import HelpCommand
 from .history_command import HistoryCommand
 from .import_command import ImportCommand
+from .latency_command import LatencyCommand
 from .mqtt_command import MQTTCommand
 from .order_book_command import OrderBookCommand
 from .previous_strategy_command import PreviousCommand
+from .profile_command import ProfileCommand
 from .rate_command import RateCommand
 from .silly_commands import SillyCommands
 from .start_command import StartCommand
@@ -38,4 +40,6 @@ __all__ = [
     StopCommand,
     TickerCommand,
     MQTTCommand,
+    LatencyCommand,
+    ProfileCommand,
 ]
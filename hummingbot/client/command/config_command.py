@@ -65,6 +65,11 @@ client_configs_to_display = ["autofill_import",
                              "mqtt_events",
                              "mqtt_external_events",
                              "mqtt_autostart",
+                             "mqtt_publish_interval",
+                             "mqtt_publish_queue_size",
+                             "mqtt_publish_batches",
+                             "mqtt_market_data",
+                             "mqtt_market_data_interval",
                              "instance_id",
                              "send_error_logs",
                              "ethereum_chain_name",
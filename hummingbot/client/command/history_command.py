@@ -6,6 +6,7 @@ from decimal import Decimal
 from typing import TYPE_CHECKING, List, Optional, Set, Tuple
 
 import pandas as pd
+from sqlalchemy.orm import Session
 
 from hummingbot.client.command.gateway_command import GatewayCommand
 from hummingbot.client.performance import PerformanceMetrics
@@ -13,6 +14,7 @@ from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllCo
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_ledger import TradeFillLedger
 from hummingbot.user.user_balances import UserBalances
 
 s_float_0 = float(0)
@@ -42,16 +44,16 @@ class HistoryCommand:
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
+            trades, ledger_entries = self._get_trades_and_ledger_entries_from_session(
                 int(start_time * 1e3),
                 session=session,
                 config_file_path=self.strategy_file_name)
-            if not trades:
+            if not trades and not ledger_entries:
                 self.notify("\n  No past trades to report.")
                 return
             if verbose:
                 self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+            safe_ensure_future(self.history_report(start_time, trades, precision, ledger_entries=ledger_entries))
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
@@ -65,17 +67,49 @@ class HistoryCommand:
                 config_file_path=self.strategy_file_name)
             return list([TradeFill.to_bounty_api_json(t) for t in trades])
 
+    def _get_trades_and_ledger_entries_from_session(
+        self,  # type: HummingbotApplication
+        start_timestamp: int,
+        session: Session,
+        config_file_path: str,
+    ) -> Tuple[List[TradeFill], List[TradeFillLedger]]:
+        """
+        Loads the trades since `start_timestamp` as the trade fill ledger entries of the hours they entirely cover, plus
+        the trades of the hour `start_timestamp` is in. The trades of derivatives markets are all loaded, their P&L is
+        computed by pairing their open and close orders.
+        """
+        ledger_start_timestamp = TradeFillLedger.first_full_period_start(start_timestamp)
+        trades: List[TradeFill] = self._get_trades_from_session(
+            start_timestamp,
+            session=session,
+            config_file_path=config_file_path,
+            end_timestamp=ledger_start_timestamp)
+        ledger_entries = TradeFillLedger.get_entries(session, config_file_path, ledger_start_timestamp)
+        derivative_markets = set((e.market, e.symbol) for e in ledger_entries if e.num_position_fills > 0)
+        for market, symbol in derivative_markets:
+            trades.extend(self._get_trades_from_session(
+                ledger_start_timestamp,
+                session=session,
+                config_file_path=config_file_path,
+                market=market,
+                symbol=symbol))
+        ledger_entries = [e for e in ledger_entries if (e.market, e.symbol) not in derivative_markets]
+        return trades, ledger_entries
+
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
                              trades: List[TradeFill],
                              precision: Optional[int] = None,
-                             display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+                             display_report: bool = True,
+                             ledger_entries: Optional[List[TradeFillLedger]] = None) -> Decimal:
+        ledger_entries = ledger_entries or []
+        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades + ledger_entries)
         if display_report:
             self.report_header(start_time)
         return_pcts = []
         for market, symbol in market_info:
             cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+            cur_ledger_entries = [e for e in ledger_entries if e.market == market and e.symbol == symbol]
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -84,7 +118,7 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances, cur_ledger_entries)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -209,11 +243,12 @@ class HistoryCommand:
         start_time = self.init_time
 
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
+            trades, ledger_entries = self._get_trades_and_ledger_entries_from_session(
                 int(start_time * 1e3),
                 session=session,
                 config_file_path=self.strategy_file_name)
-            avg_return = await self.history_report(start_time, trades, display_report=False)
+            avg_return = await self.history_report(
+                start_time, trades, display_report=False, ledger_entries=ledger_entries)
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
@@ -0,0 +1,55 @@
+import threading
+from typing import TYPE_CHECKING, Optional
+
+import pandas as pd
+
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.utils.latency_tracer import LatencyTracer
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+
+SUBCOMMANDS = ['start', 'stop', 'reset']
+
+
+class LatencyCommand:
+    def latency(self,  # type: HummingbotApplication
+                option: Optional[str] = None):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.latency, option)
+            return
+        latency_tracer = LatencyTracer.get_instance()
+        if option == "start":
+            latency_tracer.start()
+            self.notify("Latency tracing started.")
+        elif option == "stop":
+            latency_tracer.stop()
+            self.notify("Latency tracing stopped.")
+        elif option == "reset":
+            latency_tracer.reset()
+            self.notify("Latency statistics reset.")
+        else:
+            self.notify(self.latency_report())
+
+    def latency_report(self,  # type: HummingbotApplication
+                       ) -> str:
+        latency_tracer = LatencyTracer.get_instance()
+        stats = latency_tracer.stats()
+        lines = [f"\n  Latency tracing is {'enabled' if latency_tracer.enabled else 'disabled'}."]
+        if len(stats) == 0:
+            if not latency_tracer.enabled:
+                lines.append("  Run `latency start` to trace the hot path latencies.")
+            else:
+                lines.append("  No latency recorded yet.")
+            return "\n".join(lines)
+        columns = ["Stage", "Count", "Mean (ms)", "p50 (ms)", "p90 (ms)", "p99 (ms)", "Max (ms)"]
+        data = [
+            [stage, stage_stats["count"], stage_stats["mean_ms"], stage_stats["p50_ms"], stage_stats["p90_ms"],
+             stage_stats["p99_ms"], stage_stats["max_ms"]]
+            for stage, stage_stats in stats.items()
+        ]
+        df = pd.DataFrame(data=data, columns=columns).round(3)
+        lines.extend(["    " + line for line in format_df_for_printout(
+            df, self.client_config_map.tables_format).split("\n")])
+        return "\n".join(lines)
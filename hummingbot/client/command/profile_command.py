@@ -0,0 +1,71 @@
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Optional
+
+from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.sampling_profiler import SamplingProfiler
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+
+SUBCOMMANDS = ['start', 'stop']
+
+
+class ProfileCommand:
+    _profiling_stop_event: Optional[asyncio.Event] = None
+
+    def profile(self,  # type: HummingbotApplication
+                option: Optional[str] = None,
+                duration: float = 30.0,
+                sampling_interval: float = 10.0,
+                blocking_threshold: float = 100.0):
+        """
+        :param option: start (default) or stop
+        :param duration: the duration (in seconds) of the profiling
+        :param sampling_interval: the time (in milliseconds) between two samples
+        :param blocking_threshold: the time (in milliseconds) a callback has to block the event loop to be reported
+        """
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.profile, option, duration, sampling_interval, blocking_threshold)
+            return
+        if option == "stop":
+            if self._profiling_stop_event is None:
+                self.notify("No profiling is running.")
+            else:
+                self._profiling_stop_event.set()
+            return
+        if self._profiling_stop_event is not None:
+            self.notify("A profiling is already running, run `profile stop` to stop it.")
+            return
+        for name, value in (("duration", duration),
+                            ("sampling interval", sampling_interval),
+                            ("blocking threshold", blocking_threshold)):
+            if not value > 0:
+                self.notify(f"The profiling {name} must be greater than 0.")
+                return
+        self._profiling_stop_event = asyncio.Event()
+        safe_ensure_future(self.profile_async(duration, sampling_interval, blocking_threshold), loop=self.ev_loop)
+
+    async def profile_async(self,  # type: HummingbotApplication
+                            duration: float,
+                            sampling_interval: float,
+                            blocking_threshold: float):
+        profiler = SamplingProfiler(
+            self.ev_loop, sampling_interval=sampling_interval / 1e3, blocking_threshold=blocking_threshold / 1e3)
+        profiler.start()
+        self.notify(f"Profiling for {duration:g} seconds...")
+        try:
+            await asyncio.wait_for(self._profiling_stop_event.wait(), timeout=duration)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            profiler.stop()
+            self._profiling_stop_event = None
+
+        output_dir = self.client_config_map.log_file_path or DEFAULT_LOG_FILE_PATH
+        folded_stacks_path, blocking_callbacks_path = profiler.write_reports(str(output_dir))
+        self.notify(f"Profiling done.\n"
+                    f"  {profiler.samples_count} samples written to {folded_stacks_path}\n"
+                    f"  {len(profiler.blocking_callbacks)} blocking callbacks written to {blocking_callbacks_path}")
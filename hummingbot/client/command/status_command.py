@@ -16,8 +16,10 @@ from hummingbot.client.config.config_helpers import (
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import ethereum_wallet_required, required_exchanges
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.signing_service import SigningService
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.loop_lag_monitor import LoopLagMonitor
 from hummingbot.logger.application_warning import ApplicationWarning
 from hummingbot.user.user_balances import UserBalances
 
@@ -76,9 +78,29 @@ class StatusCommand:
             st_status = await self.strategy.format_status()
         else:
             st_status = self.strategy.format_status()
-        status = paper_trade + "\n" + st_status
+        status = paper_trade + "\n" + st_status + self._format_loop_lag_status() + self._format_signing_latency_status()
         return status
 
+    def _format_loop_lag_status(self,  # type: HummingbotApplication
+                                ) -> str:
+        lag_stats = LoopLagMonitor.get_instance().stats()
+        if len(lag_stats) == 0:
+            return ""
+        return (f"\n\n  Event loop lag since start: p50 {lag_stats['p50_ms']:.1f} ms, p90 {lag_stats['p90_ms']:.1f} ms, "
+                f"p99 {lag_stats['p99_ms']:.1f} ms, max {lag_stats['max_ms']:.1f} ms")
+
+    def _format_signing_latency_status(self,  # type: HummingbotApplication
+                                       ) -> str:
+        signing_service = SigningService.get_instance()
+        lines = []
+        for label in signing_service.labels():
+            stats = signing_service.latency_stats(label)
+            lines.append(f"    {label}: {stats.count} signatures, mean {stats.mean * 1e3:.1f} ms, "
+                         f"max {stats.max * 1e3:.1f} ms, last {stats.last * 1e3:.1f} ms")
+        if len(lines) == 0:
+            return ""
+        return "\n\n  Signing latency:\n" + "\n".join(lines)
+
     def application_warning(self):
         # Application warnings.
         self._expire_old_application_warnings()
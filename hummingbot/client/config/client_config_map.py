@@ -16,6 +16,7 @@ from hummingbot.client.settings import DEFAULT_GATEWAY_CERTS_PATH, DEFAULT_LOG_F
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.connector_metrics_collector import (
     DummyMetricsCollector,
+    LoopLagMetricCollector,
     MetricsCollector,
     TradeVolumeMetricCollector,
 )
@@ -26,6 +27,7 @@ from hummingbot.connector.exchange.kucoin.kucoin_utils import KuCoinConfigMap
 from hummingbot.core.rate_oracle.rate_oracle import RATE_ORACLE_SOURCES, RateOracle
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils.kill_switch import ActiveKillSwitch, KillSwitch, PassThroughKillSwitch
+from hummingbot.core.web_assistant.connections.connection_pool import HTTPConnectionPoolSettings
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 
 if TYPE_CHECKING:
@@ -136,6 +138,51 @@ class MQTTBridgeConfigMap(BaseClientModel):
             ),
         ),
     )
+    mqtt_publish_interval: float = Field(
+        default=0.1,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the interval in seconds between the publications of the queued MQTT messages"
+                " (0 to publish them immediately)"
+            ),
+        ),
+    )
+    mqtt_publish_queue_size: int = Field(
+        default=10000,
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum number of queued messages per MQTT topic, the oldest ones are dropped beyond it"
+            ),
+        ),
+    )
+    mqtt_publish_batches: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable publishing the queued MQTT messages of each topic as a single list (subscribers must"
+                " unpack the 'messages' field)"
+            ),
+        ),
+    )
+    mqtt_market_data: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the MQTT top of book and candles stream"
+            ),
+        ),
+    )
+    mqtt_market_data_interval: float = Field(
+        default=1.0,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the interval in seconds between the MQTT market data updates"
+            ),
+        ),
+    )
 
     class Config:
         title = "mqtt_bridge"
@@ -317,6 +364,31 @@ class PaperTradeConfigMap(BaseClientModel):
         ),
     )
 
+    paper_trade_realistic_fills: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Fill paper trade limit orders taking into account their queue position and the trades volume?"
+            ),
+        ),
+    )
+    paper_trade_order_entry_latency: float = Field(
+        default=0.0,
+        ge=0,
+        description="Seconds until a paper trade limit order rests in the order book (with realistic fills only).",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the paper trade order entry latency in seconds",
+        ),
+    )
+    paper_trade_cancel_latency: float = Field(
+        default=0.0,
+        ge=0,
+        description="Seconds until a paper trade cancel is effective (with realistic fills only).",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the paper trade cancel latency in seconds",
+        ),
+    )
+
     @validator("paper_trade_account_balance", pre=True)
     def validate_paper_trade_account_balance(cls, v: Union[str, Dict[str, float]]):
         if isinstance(v, str):
@@ -517,6 +589,90 @@ class GatewayConfigMap(BaseClientModel):
         title = "gateway"
 
 
+class HTTPConnectionPoolConfigMap(BaseClientModel):
+    http_pool_limit: int = Field(
+        default=100,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Maximum number of simultaneous HTTP connections of each connector (Enter 0 for no limit)"
+            ),
+        ),
+    )
+    http_pool_limit_per_host: int = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Maximum number of simultaneous HTTP connections to the same host (Enter 0 for no limit)"
+            ),
+        ),
+    )
+    http_keepalive_timeout: float = Field(
+        default=15,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "How long (in seconds) should idle HTTP connections be kept open to be reused?"
+            ),
+        ),
+    )
+    http_dns_cache_ttl: int = Field(
+        default=10,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "How long (in seconds) should resolved host addresses be cached? (Enter 0 to disable the cache)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "http_connection_pool"
+
+    def get_connection_pool_settings(self) -> HTTPConnectionPoolSettings:
+        return HTTPConnectionPoolSettings(
+            limit=self.http_pool_limit,
+            limit_per_host=self.http_pool_limit_per_host,
+            keepalive_timeout=self.http_keepalive_timeout,
+            dns_cache_ttl=self.http_dns_cache_ttl,
+        )
+
+
+class RESTEndpointSelectionConfigMap(BaseClientModel):
+    rest_endpoint_selection_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want to send the REST requests to the fastest of the API hosts published by the exchange?"
+                " (Yes/No)"
+            ),
+        ),
+    )
+    rest_request_hedging_delay: float = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "After how long (in seconds) should a slow read request be sent again to the second fastest API host?"
+                " (Enter 0 to disable)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "rest_endpoint_selection"
+
+    @validator("rest_endpoint_selection_enabled", pre=True)
+    def validate_bool(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
+
 class GlobalTokenConfigMap(BaseClientModel):
     global_token_name: str = Field(
         default="USDT",
@@ -597,6 +753,10 @@ class AnonymizedMetricsMode(BaseClientModel, ABC):
     ) -> MetricsCollector:
         ...
 
+    @abstractmethod
+    def get_loop_lag_collector(self, instance_id: str) -> MetricsCollector:
+        ...
+
 
 class AnonymizedMetricsDisabledMode(AnonymizedMetricsMode):
     class Config:
@@ -611,6 +771,9 @@ class AnonymizedMetricsDisabledMode(AnonymizedMetricsMode):
     ) -> MetricsCollector:
         return DummyMetricsCollector()
 
+    def get_loop_lag_collector(self, instance_id: str) -> MetricsCollector:
+        return DummyMetricsCollector()
+
 
 class AnonymizedMetricsEnabledMode(AnonymizedMetricsMode):
     anonymized_metrics_interval_min: Decimal = Field(
@@ -640,6 +803,12 @@ class AnonymizedMetricsEnabledMode(AnonymizedMetricsMode):
         )
         return instance
 
+    def get_loop_lag_collector(self, instance_id: str) -> MetricsCollector:
+        return LoopLagMetricCollector(
+            dispatch_interval=float(self.anonymized_metrics_interval_min) * 60,
+            instance_id=instance_id,
+        )
+
     @validator("anonymized_metrics_interval_min", pre=True)
     def validate_decimal(cls, v: str, field: Field):
         """Used for client-friendly error output."""
@@ -1072,6 +1241,28 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    ws_trading_pairs_per_connection: int = Field(
+        default=0,
+        ge=0,
+        description=("Number of trading pairs whose order book streams are subscribed on each websocket connection."
+                     "\nEnter 0 to use a single connection, unless the exchange limits the streams per connection."
+                     "\nOnly used by the connectors supporting several order book connections."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "How many trading pairs do you want to subscribe on each order book websocket connection?"
+                " (Enter 0 to use a single connection)"
+            ),
+        ),
+    )
+    http_connection_pool: HTTPConnectionPoolConfigMap = Field(
+        default=HTTPConnectionPoolConfigMap(),
+        description="Connection pool settings of the HTTP requests sent to the exchanges and to Gateway.",
+    )
+    rest_endpoint_selection: RESTEndpointSelectionConfigMap = Field(
+        default=RESTEndpointSelectionConfigMap(),
+        description=("Latency based selection of the API host of the REST requests."
+                     "\nOnly used by the connectors of exchanges publishing several equivalent API hosts."),
+    )
     commands_timeout: CommandsTimeoutConfigMap = Field(default=CommandsTimeoutConfigMap())
     tables_format: ClientConfigEnum(
         value="TabulateFormats",  # noqa: F821
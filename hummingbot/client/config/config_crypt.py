@@ -1,16 +1,24 @@
 import binascii
+import hmac
 import json
+import os
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional
 
-from eth_account import Account
 from eth_keyfile.keyfile import (
     DKLEN,
     SCRYPT_P,
     SCRYPT_R,
     Random,
+    _derive_pbkdf_key,
+    _derive_scrypt_key,
     _pbkdf2_hash,
     _scrypt_hash,
     big_endian_to_int,
+    decode_hex,
+    decrypt_aes_ctr,
     encode_hex_no_prefix,
     encrypt_aes_ctr,
     get_default_work_factor_for_kdf,
@@ -41,14 +49,39 @@ class BaseSecretsManager(ABC):
     def decrypt_secret_value(self, attr: str, value: str) -> str:
         pass
 
+    def prepare_decryption(self, encrypted_values: Iterable[str]):
+        """
+        Gives the secrets manager the chance to do the expensive work needed to decrypt a batch of values at once,
+        before they are decrypted one by one.
+        """
+        pass
+
 
 class ETHKeyFileSecretManger(BaseSecretsManager):
+    """
+    Encrypts every secret value as an Ethereum v3 keyfile. The key derived from the password is cached for every set of
+    KDF parameters (including the salt), and the values encrypted by an instance share the same salt, so decrypting
+    them only requires a single key derivation.
+    """
+
+    def __init__(self, password: str):
+        super().__init__(password)
+        self._derived_keys: Dict[str, bytes] = {}
+        self._derived_keys_lock = threading.Lock()
+        self._encryption_salt: Optional[bytes] = None
+
     def encrypt_secret_value(self, attr: str, value: str):
         if self._password is None:
             raise ValueError(f"Could not encrypt secret attribute {attr} because no password was provided.")
         password_bytes = self._password.encode()
         value_bytes = value.encode()
-        keyfile_json = _create_v3_keyfile_json(value_bytes, password_bytes)
+        if self._encryption_salt is None:
+            self._encryption_salt = Random.get_random_bytes(16)
+        kdfparams = _pbkdf2_kdfparams(self._encryption_salt, get_default_work_factor_for_kdf("pbkdf2"))
+        derived_key = self._derived_key({"kdf": "pbkdf2", "kdfparams": kdfparams})
+        keyfile_json = _create_v3_keyfile_json(
+            value_bytes, password_bytes, salt=self._encryption_salt, derived_key=derived_key
+        )
         json_str = json.dumps(keyfile_json)
         encrypted_value = binascii.hexlify(json_str.encode()).decode()
         return encrypted_value
@@ -56,10 +89,47 @@ class ETHKeyFileSecretManger(BaseSecretsManager):
     def decrypt_secret_value(self, attr: str, value: str) -> str:
         if self._password is None:
             raise ValueError(f"Could not decrypt secret attribute {attr} because no password was provided.")
-        value = binascii.unhexlify(value)
-        decrypted_value = Account.decrypt(value.decode(), self._password).decode()
+        keyfile_json = _keyfile_json_from_encrypted_value(value)
+        if keyfile_json is None or keyfile_json.get("version") != 3:
+            raise ValueError(f"Could not decrypt secret attribute {attr}, it is not a v3 keyfile.")
+        derived_key = self._derived_key(keyfile_json["crypto"])
+        decrypted_value = _decrypt_v3_keyfile_json(keyfile_json, derived_key).decode()
         return decrypted_value
 
+    def prepare_decryption(self, encrypted_values: Iterable[str]):
+        """
+        Derives the keys of all the values in parallel. The standard library KDFs release the GIL, so a thread pool is
+        enough to use all the cores without shipping the password to other processes.
+        """
+        if self._password is None:
+            return
+        missing_keys: Dict[str, Dict[str, Any]] = {}
+        for value in encrypted_values:
+            keyfile_json = _keyfile_json_from_encrypted_value(value)
+            if keyfile_json is not None and "crypto" in keyfile_json:
+                cache_key = _kdf_cache_key(keyfile_json["crypto"])
+                if cache_key not in self._derived_keys:
+                    missing_keys[cache_key] = keyfile_json["crypto"]
+        if len(missing_keys) == 0:
+            return
+        max_workers = min(len(missing_keys), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            derived_keys = executor.map(
+                _derive_key, missing_keys.values(), [self._password.encode()] * len(missing_keys)
+            )
+            for cache_key, derived_key in zip(missing_keys.keys(), derived_keys):
+                with self._derived_keys_lock:
+                    self._derived_keys[cache_key] = derived_key
+
+    def _derived_key(self, crypto: Dict[str, Any]) -> bytes:
+        cache_key = _kdf_cache_key(crypto)
+        derived_key = self._derived_keys.get(cache_key)
+        if derived_key is None:
+            derived_key = _derive_key(crypto, self._password.encode())
+            with self._derived_keys_lock:
+                self._derived_keys[cache_key] = derived_key
+        return derived_key
+
 
 def store_password_verification(secrets_manager: BaseSecretsManager):
     encrypted_word = secrets_manager.encrypt_secret_value(PASSWORD_VERIFICATION_WORD, PASSWORD_VERIFICATION_WORD)
@@ -80,39 +150,93 @@ def validate_password(secrets_manager: BaseSecretsManager) -> bool:
     return valid
 
 
-def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_factor=None):
+def _keyfile_json_from_encrypted_value(value: str) -> Optional[Dict[str, Any]]:
+    try:
+        keyfile_json = json.loads(binascii.unhexlify(value).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        return None
+    return keyfile_json if isinstance(keyfile_json, dict) else None
+
+
+def _kdf_cache_key(crypto: Dict[str, Any]) -> str:
+    return json.dumps({"kdf": crypto["kdf"], "kdfparams": crypto["kdfparams"]}, sort_keys=True)
+
+
+def _derive_key(crypto: Dict[str, Any], password: bytes) -> bytes:
+    kdf = crypto["kdf"]
+    if kdf == "pbkdf2":
+        derived_key = _derive_pbkdf_key(crypto, password)
+    elif kdf == "scrypt":
+        derived_key = _derive_scrypt_key(crypto, password)
+    else:
+        raise TypeError("Unsupported key derivation function: {0}".format(kdf))
+    return derived_key
+
+
+def _decrypt_v3_keyfile_json(keyfile_json: Dict[str, Any], derived_key: bytes) -> bytes:
+    """
+    Same as eth_keyfile.keyfile._decode_keyfile_json_v3, with an already derived key.
+    """
+    crypto = keyfile_json["crypto"]
+    ciphertext = decode_hex(crypto["ciphertext"])
+    mac = keccak(derived_key[16:32] + ciphertext)
+    expected_mac = decode_hex(crypto["mac"])
+    if not hmac.compare_digest(mac, expected_mac):
+        raise ValueError("MAC mismatch")
+
+    encrypt_key = derived_key[:16]
+    iv = big_endian_to_int(decode_hex(crypto["cipherparams"]["iv"]))
+    return decrypt_aes_ctr(ciphertext, encrypt_key, iv)
+
+
+def _pbkdf2_kdfparams(salt: bytes, work_factor: int) -> Dict[str, Any]:
+    return {
+        'c': work_factor,
+        'dklen': DKLEN,
+        'prf': 'hmac-sha256',
+        'salt': encode_hex_no_prefix(salt),
+    }
+
+
+def _create_v3_keyfile_json(
+    message_to_encrypt,
+    password,
+    kdf="pbkdf2",
+    work_factor=None,
+    salt: Optional[bytes] = None,
+    derived_key: Optional[bytes] = None,
+):
     """
     Encrypt message by a given password.
     Most of this code is copied from eth_key_file.key_file, removed address and is from json result.
+    When the salt and the key derived from the password with it are provided the key derivation is skipped.
     """
-    salt = Random.get_random_bytes(16)
+    if salt is None:
+        salt = Random.get_random_bytes(16)
 
     if work_factor is None:
         work_factor = get_default_work_factor_for_kdf(kdf)
 
     if kdf == 'pbkdf2':
-        derived_key = _pbkdf2_hash(
-            password,
-            hash_name='sha256',
-            salt=salt,
-            iterations=work_factor,
-            dklen=DKLEN,
-        )
-        kdfparams = {
-            'c': work_factor,
-            'dklen': DKLEN,
-            'prf': 'hmac-sha256',
-            'salt': encode_hex_no_prefix(salt),
-        }
+        if derived_key is None:
+            derived_key = _pbkdf2_hash(
+                password,
+                hash_name='sha256',
+                salt=salt,
+                iterations=work_factor,
+                dklen=DKLEN,
+            )
+        kdfparams = _pbkdf2_kdfparams(salt, work_factor)
     elif kdf == 'scrypt':
-        derived_key = _scrypt_hash(
-            password,
-            salt=salt,
-            buflen=DKLEN,
-            r=SCRYPT_R,
-            p=SCRYPT_P,
-            n=work_factor,
-        )
+        if derived_key is None:
+            derived_key = _scrypt_hash(
+                password,
+                salt=salt,
+                buflen=DKLEN,
+                r=SCRYPT_R,
+                p=SCRYPT_P,
+                n=work_factor,
+            )
         kdfparams = {
             'dklen': DKLEN,
             'n': work_factor,
@@ -1,7 +1,8 @@
 import asyncio
 import logging
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from hummingbot.client.config.config_crypt import PASSWORD_VERIFICATION_PATH, BaseSecretsManager, validate_password
 from hummingbot.client.config.config_helpers import (
@@ -11,6 +12,7 @@ from hummingbot.client.config.config_helpers import (
     get_connector_config_yml_path,
     list_connector_configs,
     load_connector_config_map_from_file,
+    read_yml_file,
     reset_connector_hb_config,
     save_to_yml,
     update_connector_hb_config,
@@ -25,6 +27,7 @@ class Security:
     secrets_manager: Optional[BaseSecretsManager] = None
     _secure_configs = {}
     _decryption_done = asyncio.Event()
+    _decryption_lock = threading.RLock()
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -40,7 +43,7 @@ class Security:
 
     @classmethod
     def any_secure_configs(cls):
-        return len(cls._secure_configs) > 0
+        return len(cls._secure_configs) > 0 or len(list_connector_configs()) > 0
 
     @staticmethod
     def connector_config_file_exists(connector_name: str) -> bool:
@@ -48,27 +51,80 @@ class Security:
         return connector_configs_path.exists()
 
     @classmethod
-    def login(cls, secrets_manager: BaseSecretsManager) -> bool:
+    def login(cls, secrets_manager: BaseSecretsManager, lazy_decryption: bool = False) -> bool:
+        """
+        Validates the password and decrypts the connectors configs in the background. With lazy decryption, only the
+        keys are derived in the background, and the configs are decrypted when they are first requested, so only the
+        connectors actually used pay for it.
+        """
         if not validate_password(secrets_manager):
             return False
         cls.secrets_manager = secrets_manager
-        coro = AsyncCallScheduler.shared_instance().call_async(cls.decrypt_all, timeout_seconds=30)
+        decrypt_function = cls.prepare_decryption if lazy_decryption else cls.decrypt_all
+        coro = AsyncCallScheduler.shared_instance().call_async(decrypt_function, timeout_seconds=30)
         safe_ensure_future(coro)
         return True
 
+    @classmethod
+    def prepare_decryption(cls):
+        """
+        Derives the keys of all the connectors configs without decrypting them, so decrypting them later doesn't run
+        the key derivation on the event loop.
+        """
+        # Runs in a background thread, while the configs may be decrypted lazily from the event loop
+        with cls._decryption_lock:
+            cls._secure_configs.clear()
+        cls._decryption_done.clear()
+        cls._prepare_decryption(list_connector_configs())
+        cls._decryption_done.set()
+
     @classmethod
     def decrypt_all(cls):
-        cls._secure_configs.clear()
+        with cls._decryption_lock:
+            cls._secure_configs.clear()
         cls._decryption_done.clear()
         encrypted_files = list_connector_configs()
-        for file in encrypted_files:
-            cls.decrypt_connector_config(file)
+        cls._decrypt_connector_configs(encrypted_files)
         cls._decryption_done.set()
 
     @classmethod
     def decrypt_connector_config(cls, file_path: Path):
         connector_name = connector_name_from_file(file_path)
-        cls._secure_configs[connector_name] = load_connector_config_map_from_file(file_path)
+        with cls._decryption_lock:
+            cls._secure_configs[connector_name] = load_connector_config_map_from_file(file_path)
+
+    @classmethod
+    def _decrypt_connector_configs(cls, file_paths: List[Path]):
+        cls._prepare_decryption(file_paths)
+        for file_path in file_paths:
+            cls.decrypt_connector_config(file_path)
+
+    @classmethod
+    def _prepare_decryption(cls, file_paths: List[Path]):
+        if cls.secrets_manager is not None:
+            # The key derivations of all the files are done at once
+            encrypted_values = [
+                value for file_path in file_paths for value in cls._yml_string_values(read_yml_file(file_path))
+            ]
+            cls.secrets_manager.prepare_decryption(encrypted_values)
+
+    @classmethod
+    def _yml_string_values(cls, data: Dict[str, Any]) -> Iterable[str]:
+        for value in data.values():
+            if isinstance(value, str):
+                yield value
+            elif isinstance(value, dict):
+                yield from cls._yml_string_values(value)
+
+    @classmethod
+    def _decrypt_pending_connector_configs(cls):
+        with cls._decryption_lock:
+            pending_files = [
+                file_path for file_path in list_connector_configs()
+                if file_path.stem not in cls._secure_configs
+            ]
+            if len(pending_files) > 0:
+                cls._decrypt_connector_configs(pending_files)
 
     @classmethod
     def update_secure_config(cls, connector_config: ClientConfigAdapter):
@@ -91,10 +147,16 @@ class Security:
 
     @classmethod
     def decrypted_value(cls, key: str) -> Optional[ClientConfigAdapter]:
+        if key not in cls._secure_configs and cls.secrets_manager is not None:
+            with cls._decryption_lock:
+                if key not in cls._secure_configs and cls.connector_config_file_exists(key):
+                    cls._decrypt_connector_configs([get_connector_config_yml_path(key)])
         return cls._secure_configs.get(key, None)
 
     @classmethod
     def all_decrypted_values(cls) -> Dict[str, ClientConfigAdapter]:
+        if cls.secrets_manager is not None:
+            cls._decrypt_pending_connector_configs()
         return cls._secure_configs.copy()
 
     @classmethod
@@ -29,10 +29,13 @@ from hummingbot.client.ui.keybindings import load_key_bindings
 from hummingbot.client.ui.parser import ThrowingArgumentParser, load_parser
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock
 from hummingbot.core.gateway.gateway_status_monitor import GatewayStatusMonitor
 from hummingbot.core.utils.kill_switch import KillSwitch
+from hummingbot.core.utils.loop_lag_monitor import LoopLagMonitor
+from hummingbot.core.utils.trading_pair_cache import TradingPairCache
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.exceptions import ArgumentParserError
@@ -275,7 +278,17 @@ class HummingbotApplication(*commands):
         return success
 
     async def run(self):
-        await self.app.run()
+        loop_lag_monitor = LoopLagMonitor.get_instance()
+        loop_lag_monitor.start(self.ev_loop)
+        # The event loop is shared by all the connectors, its lag is dispatched once for the application
+        loop_lag_metric_collector = self.client_config_map.anonymized_metrics_mode.get_loop_lag_collector(
+            instance_id=self.instance_id)
+        loop_lag_metric_collector.start()
+        try:
+            await self.app.run()
+        finally:
+            loop_lag_metric_collector.stop()
+            loop_lag_monitor.stop()
 
     def add_application_warning(self, app_warning: ApplicationWarning):
         self._expire_old_application_warnings()
@@ -318,6 +331,8 @@ class HummingbotApplication(*commands):
                 )
                 connector_class = get_connector_class(connector_name)
                 connector = connector_class(**init_params)
+                if isinstance(connector, ExchangePyBase):
+                    connector.set_trading_pair_cache(TradingPairCache())
             self.markets[connector_name] = connector
 
         self.markets_recorder = MarketsRecorder(
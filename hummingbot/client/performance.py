@@ -10,6 +10,7 @@ from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, Tok
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_ledger import TradeFillLedger
 
 s_decimal_0 = Decimal("0")
 s_decimal_nan = Decimal("NaN")
@@ -66,9 +67,18 @@ class PerformanceMetrics:
     async def create(cls,
                      trading_pair: str,
                      trades: List[Any],
-                     current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+                     current_balances: Dict[str, Decimal],
+                     ledger_entries: Optional[List[TradeFillLedger]] = None) -> 'PerformanceMetrics':
+        """
+        :param trading_pair: the trading market to get performance metrics
+        :param trades: the list of TradeFill or Trade object, in chronological order
+        :param current_balances: current user account balance
+        :param ledger_entries: the trade fill ledger entries of the market for the periods following the trades, so
+        their fills are accounted for without being loaded. The derivatives P&L requires the trades, it is not
+        computed from ledger entries
+        """
         performance = PerformanceMetrics()
-        await performance._initialize_metrics(trading_pair, trades, current_balances)
+        await performance._initialize_metrics(trading_pair, trades, current_balances, ledger_entries or [])
         return performance
 
     @staticmethod
@@ -196,6 +206,20 @@ class PerformanceMetrics:
 
             self.s_vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
 
+        self._calculate_total_volumes_and_average_prices()
+
+        return buys, sells
+
+    def _add_ledger_entries_volumes(self, ledger_entries: List[TradeFillLedger]):
+        for entry in ledger_entries:
+            self.b_vol_base += entry.buy_base_volume
+            self.b_vol_quote -= entry.buy_quote_volume
+            self.s_vol_base -= entry.sell_base_volume
+            self.s_vol_quote += entry.sell_quote_volume - entry.deducted_fees_in_quote
+
+        self._calculate_total_volumes_and_average_prices()
+
+    def _calculate_total_volumes_and_average_prices(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -206,8 +230,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     def _process_deducted_fees_impact_in_quote_vol(self, trade):
         fee_percent = None
         fee_type = ""
@@ -224,7 +246,7 @@ class PerformanceMetrics:
             impact = Decimal(str(trade.amount)) * Decimal(str(trade.price)) * fee_percent * Decimal("-1")
         return impact
 
-    async def _calculate_fees(self, quote: str, trades: List[Any]):
+    async def _calculate_fees(self, quote: str, trades: List[Any], ledger_entries: List[TradeFillLedger] = ()):
         for trade in trades:
             fee_percent = None
             trade_price = None
@@ -248,6 +270,10 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        for entry in ledger_entries:
+            for fee_token, fee_amount in entry.fee_amounts.items():
+                self.fees[fee_token] += fee_amount
+
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -287,19 +313,22 @@ class PerformanceMetrics:
     async def _initialize_metrics(self,
                                   trading_pair: str,
                                   trades: List[Any],
-                                  current_balances: Dict[str, Decimal]):
+                                  current_balances: Dict[str, Decimal],
+                                  ledger_entries: List[TradeFillLedger] = ()):
         """
         Calculates PnL, fees, Return % and etc...
         :param trading_pair: the trading market to get performance metrics
         :param trades: the list of TradeFill or Trade object
         :param current_balances: current user account balance
+        :param ledger_entries: the trade fill ledger entries of the periods following the trades
         """
 
         base, quote = split_hb_trading_pair(trading_pair)
         buys, sells = self._preprocess_trades_and_group_by_type(trades)
+        self._add_ledger_entries_volumes(ledger_entries)
 
-        self.num_buys = len(buys)
-        self.num_sells = len(sells)
+        self.num_buys = len(buys) + sum(entry.num_buys for entry in ledger_entries)
+        self.num_sells = len(sells) + sum(entry.num_sells for entry in ledger_entries)
         self.num_trades = self.num_buys + self.num_sells
 
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
@@ -307,10 +336,10 @@ class PerformanceMetrics:
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = Decimal(str(trades[0].price)) if trades else ledger_entries[0].first_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = ledger_entries[-1].last_price if ledger_entries else Decimal(str(trades[-1].price))
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -320,7 +349,7 @@ class PerformanceMetrics:
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
         self._calculate_trade_pnl(buys, sells)
 
-        await self._calculate_fees(quote, trades)
+        await self._calculate_fees(quote, trades, ledger_entries)
 
         self.total_pnl = self.trade_pnl - self.fee_in_quote
         self.return_pct = self.divide(self.total_pnl, self.hold_value)
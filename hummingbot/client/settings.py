@@ -1,15 +1,19 @@
+import hashlib
 import importlib
+import importlib.util
 import json
+import logging
 from decimal import Decimal
 from enum import Enum
 from os import DirEntry, scandir
 from os.path import exists, join, realpath
+from pathlib import Path
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
 
 from pydantic import SecretStr
 
-from hummingbot import get_strategy_list, root_path
+from hummingbot import data_path, get_strategy_list, root_path
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
 if TYPE_CHECKING:
@@ -56,6 +60,7 @@ GATEAWAY_CLIENT_CERT_PATH = DEFAULT_GATEWAY_CERTS_PATH / "client_cert.pem"
 GATEAWAY_CLIENT_KEY_PATH = DEFAULT_GATEWAY_CERTS_PATH / "client_key.pem"
 
 CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES = ["test_support", "utilities", "gateway"]
+CONNECTOR_MANIFEST_VERSION = 2
 
 
 class ConnectorType(Enum):
@@ -345,77 +350,147 @@ class ConnectorSetting(NamedTuple):
         return self.type.name.lower()
 
 
+class LazyConnectorConfigKeys:
+    """
+    Placeholder for the config keys of a connector built from the connector manifest. The connector utils module is
+    only imported the first time the config keys are needed.
+    """
+
+    def __init__(self, util_module_path: str, domain: Optional[str] = None):
+        self.util_module_path = util_module_path
+        self.domain = domain
+        self._loaded = False
+        self._config_keys: Optional["BaseConnectorConfigMap"] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    def load(self) -> Optional["BaseConnectorConfigMap"]:
+        if not self._loaded:
+            util_module = importlib.import_module(self.util_module_path)
+            if self.domain is None:
+                self._config_keys = getattr(util_module, "KEYS", None)
+            else:
+                self._config_keys = getattr(util_module, "OTHER_DOMAINS_KEYS")[self.domain]
+            self._loaded = True
+        return self._config_keys
+
+
+class LazyConnectorSetting(ConnectorSetting):
+    """
+    Connector setting whose `config_keys` field holds a `LazyConnectorConfigKeys`, resolved on first access.
+    """
+    __slots__ = ()
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        config_keys = super().config_keys
+        if isinstance(config_keys, LazyConnectorConfigKeys):
+            config_keys = config_keys.load()
+        return config_keys
+
+
+class ConnectorManifest:
+    """
+    Cache of the connectors metadata found in the connectors utils modules, so they don't have to be imported at
+    startup. The manifest is invalidated when any of the connectors utils files changes, or when a module missing to
+    import the utils of a connector has been installed since.
+    """
+
+    @staticmethod
+    def path() -> str:
+        return realpath(join(data_path(), "connector_manifest.json"))
+
+    @staticmethod
+    def fingerprint(util_module_files: List[str]) -> str:
+        digest = hashlib.sha1(str(CONNECTOR_MANIFEST_VERSION).encode())
+        for file_path in sorted(util_module_files):
+            digest.update(file_path.encode())
+            if exists(file_path):
+                stat = Path(file_path).stat()
+                digest.update(f"{stat.st_mtime_ns}:{stat.st_size}".encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def load(fingerprint: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        manifest_path: str = ConnectorManifest.path()
+        if not exists(manifest_path):
+            return None
+        try:
+            with open(manifest_path) as fd:
+                manifest = json.load(fd)
+        except (OSError, ValueError):
+            return None
+        if manifest.get("fingerprint") != fingerprint:
+            return None
+        for missing_module in manifest.get("missing_modules", {}).values():
+            if ConnectorManifest._is_module_installed(missing_module):
+                return None
+        return manifest["connectors"]
+
+    @staticmethod
+    def save(fingerprint: str, connectors: Dict[str, Dict[str, Any]], missing_modules: Dict[str, str]):
+        """
+        :param missing_modules: the name of the module missing to import the utils module, by skipped connector
+        """
+        try:
+            with open(ConnectorManifest.path(), "w") as fd:
+                json.dump({"fingerprint": fingerprint, "connectors": connectors, "missing_modules": missing_modules},
+                          fd,
+                          indent=2)
+        except OSError:
+            logging.getLogger(__name__).warning("Could not write the connector manifest.", exc_info=True)
+
+    @staticmethod
+    def _is_module_installed(module_name: str) -> bool:
+        try:
+            return importlib.util.find_spec(module_name) is not None
+        except (ImportError, ValueError):
+            # find_spec imports the parent packages of a dotted name, it raises ModuleNotFoundError if one is missing
+            return False
+
+
 class AllConnectorSettings:
     paper_trade_connectors_names: List[str] = []
     all_connector_settings: Dict[str, ConnectorSetting] = {}
 
     @classmethod
-    def create_connector_settings(cls):
+    def create_connector_settings(cls, use_manifest: bool = True):
         """
         Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        The connectors metadata is read from the connector manifest when it is up to date, otherwise the connectors
+        utils modules are imported and the manifest is regenerated.
         """
         cls.all_connector_settings = {}  # reset
-        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
-        # connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade", "injective_v2", "injective_v2_perpetual"]
-
-        type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
-            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
+        util_module_paths: Dict[str, str] = cls._connector_util_module_paths()
+        util_module_files: List[str] = [
+            join(root_path(), *module_path.split(".")) + ".py" for module_path in util_module_paths.values()
         ]
-        for type_dir in type_dirs:
-            if type_dir.name == 'gateway':
-                continue
-            connector_dirs: List[DirEntry] = [
-                cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+        fingerprint: str = ConnectorManifest.fingerprint(util_module_files)
+        manifest: Optional[Dict[str, Dict[str, Any]]] = ConnectorManifest.load(fingerprint) if use_manifest else None
+        if manifest is None:
+            missing_modules: Dict[str, str] = {}
+            manifest = cls._create_connector_manifest(util_module_paths, missing_modules)
+            ConnectorManifest.save(fingerprint, manifest, missing_modules)
+
+        for connector_name, entry in manifest.items():
+            cls.all_connector_settings[connector_name] = LazyConnectorSetting(
+                name=connector_name,
+                type=ConnectorType[entry["type"]],
+                centralised=entry["centralised"],
+                example_pair=entry["example_pair"],
+                use_ethereum_wallet=entry["use_ethereum_wallet"],
+                trade_fee_schema=TradeFeeSchema.from_json(entry["trade_fee_schema"]),
+                config_keys=LazyConnectorConfigKeys(
+                    util_module_path=entry["util_module"],
+                    domain=connector_name if entry["is_sub_domain"] else None,
+                ),
+                is_sub_domain=entry["is_sub_domain"],
+                parent_name=entry["parent_name"],
+                domain_parameter=entry["domain_parameter"],
+                use_eth_gas_lookup=entry["use_eth_gas_lookup"],
+            )
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -440,24 +515,95 @@ class AllConnectorSettings:
 
         return cls.all_connector_settings
 
+    @staticmethod
+    def _connector_util_module_paths() -> Dict[str, str]:
+        """
+        Returns the utils module path of every connector package, without importing them.
+        """
+        util_module_paths: Dict[str, str] = {}
+        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+        # connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade", "injective_v2", "injective_v2_perpetual"]
+
+        type_dirs: List[DirEntry] = [
+            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
+            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
+        ]
+        for type_dir in type_dirs:
+            if type_dir.name == 'gateway':
+                continue
+            connector_dirs: List[DirEntry] = [
+                cast(DirEntry, f) for f in scandir(type_dir.path)
+                if f.is_dir() and exists(join(f.path, "__init__.py"))
+            ]
+            for connector_dir in connector_dirs:
+                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
+                    continue
+                if connector_dir.name in util_module_paths:
+                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
+                util_module_paths[connector_dir.name] = f"hummingbot.connector.{type_dir.name}." \
+                                                        f"{connector_dir.name}.{connector_dir.name}_utils"
+        return util_module_paths
+
+    @classmethod
+    def _create_connector_manifest(cls,
+                                   util_module_paths: Dict[str, str],
+                                   missing_modules: Optional[Dict[str, str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Imports the connectors utils modules and collects the metadata needed to build the connectors settings.
+
+        :param missing_modules: filled with the name of the missing module, by connector skipped because its utils
+        module could not be imported
+        """
+        manifest: Dict[str, Dict[str, Any]] = {}
+        for connector_name, util_module_path in util_module_paths.items():
+            try:
+                util_module = importlib.import_module(util_module_path)
+            except ModuleNotFoundError as e:
+                if missing_modules is not None:
+                    missing_modules[connector_name] = e.name or util_module_path
+                continue
+            trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+            trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(connector_name, trade_fee_settings)
+            entry = {
+                "type": util_module_path.split(".")[2].capitalize(),
+                "centralised": getattr(util_module, "CENTRALIZED", True),
+                "example_pair": getattr(util_module, "EXAMPLE_PAIR", ""),
+                "use_ethereum_wallet": getattr(util_module, "USE_ETHEREUM_WALLET", False),
+                "trade_fee_schema": trade_fee_schema.to_json(),
+                "util_module": util_module_path,
+                "is_sub_domain": False,
+                "parent_name": None,
+                "domain_parameter": None,
+                "use_eth_gas_lookup": getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            }
+            manifest[connector_name] = entry
+            # Adds other domains of connector
+            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+            for domain in other_domains:
+                trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+                trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+                manifest[domain] = dict(
+                    entry,
+                    example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                    trade_fee_schema=trade_fee_schema.to_json(),
+                    is_sub_domain=True,
+                    parent_name=connector_name,
+                    domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                )
+        return manifest
+
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
         cls.paper_trade_connectors_names = paper_trade_exchanges
         for e in paper_trade_exchanges:
             base_connector_settings: Optional[ConnectorSetting] = cls.all_connector_settings.get(e, None)
             if base_connector_settings:
-                paper_trade_settings = ConnectorSetting(
+                # _replace keeps the config keys of lazy settings unresolved
+                paper_trade_settings = base_connector_settings._replace(
                     name=f"{e}_paper_trade",
-                    type=base_connector_settings.type,
-                    centralised=base_connector_settings.centralised,
-                    example_pair=base_connector_settings.example_pair,
-                    use_ethereum_wallet=base_connector_settings.use_ethereum_wallet,
-                    trade_fee_schema=base_connector_settings.trade_fee_schema,
-                    config_keys=base_connector_settings.config_keys,
                     is_sub_domain=False,
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
-                    use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
 
@@ -64,6 +64,9 @@ class HummingbotCompleter(Completer):
         self._controller_completer = self.get_available_controllers()
         self._rate_oracle_completer = WordCompleter(list(RATE_ORACLE_SOURCES.keys()), ignore_case=True)
         self._mqtt_completer = WordCompleter(["start", "stop", "restart"], ignore_case=True)
+        self._latency_completer = WordCompleter(["start", "stop", "reset"], ignore_case=True)
+        self._profile_completer = WordCompleter(["start", "stop", "--duration", "--interval", "--threshold"],
+                                                ignore_case=True)
         self._gateway_chains = []
         self._gateway_networks = []
         self._list_gateway_wallets_parameters = {"wallets": [], "chain": ""}
@@ -290,6 +293,14 @@ class HummingbotCompleter(Completer):
         text_before_cursor: str = document.text_before_cursor
         return text_before_cursor.startswith("mqtt ")
 
+    def _complete_latency_arguments(self, document: Document) -> bool:
+        text_before_cursor: str = document.text_before_cursor
+        return text_before_cursor.startswith("latency ")
+
+    def _complete_profile_arguments(self, document: Document) -> bool:
+        text_before_cursor: str = document.text_before_cursor
+        return text_before_cursor.startswith("profile ")
+
     def get_completions(self, document: Document, complete_event: CompleteEvent):
         """
         Get completions for the current scope. This is the defining function for the completer
@@ -446,6 +457,14 @@ class HummingbotCompleter(Completer):
             for c in self._mqtt_completer.get_completions(document, complete_event):
                 yield c
 
+        elif self._complete_latency_arguments(document):
+            for c in self._latency_completer.get_completions(document, complete_event):
+                yield c
+
+        elif self._complete_profile_arguments(document):
+            for c in self._profile_completer.get_completions(document, complete_event):
+                yield c
+
         else:
             text_before_cursor: str = document.text_before_cursor
             try:
@@ -1,10 +1,14 @@
 from __future__ import unicode_literals
 
+import asyncio
 import re
+import threading
+import time
 from collections import deque
-from typing import Callable, Deque, Dict, List, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 import six
+from prompt_toolkit.application.current import get_app
 from prompt_toolkit.auto_suggest import DynamicAutoSuggest
 from prompt_toolkit.buffer import Buffer
 from prompt_toolkit.completion import DynamicCompleter
@@ -104,7 +108,8 @@ class CustomTextArea:
                  dont_extend_height=False, dont_extend_width=False,
                  line_numbers=False, get_line_prefix=None, scrollbar=False,
                  style='', search_field=None, preview_search=True, prompt='',
-                 input_processors=None, max_line_count=1000, initial_text="", align=WindowAlign.LEFT):
+                 input_processors=None, max_line_count=1000, initial_text="", align=WindowAlign.LEFT,
+                 max_refresh_rate=20):
         assert isinstance(text, six.text_type)
         assert search_field is None or isinstance(search_field, SearchToolbar)
 
@@ -182,7 +187,18 @@ class CustomTextArea:
             get_line_prefix=get_line_prefix,
             align=align)
 
-        self.log_lines: Deque[str] = deque()
+        # The logged lines are kept in a ring buffer. While the pane follows the last lines, only the lines it can show
+        # are rendered, at most `max_refresh_rate` times per second. The lines above are rendered as soon as the cursor
+        # leaves the rendered ones (scrolling) or a search starts, so scrolling and searching cover all the lines.
+        self.log_lines: Deque[str] = deque(maxlen=max_line_count)
+        self.max_refresh_rate = max_refresh_rate
+        self._ev_loop = asyncio.get_event_loop()
+        self._refresh_lock = threading.Lock()
+        self._refresh_pending = False
+        self._refresh_handle: Optional[asyncio.TimerHandle] = None
+        self._last_refresh_time = 0.0
+        self._hidden_log_lines: Optional[List[str]] = None
+        self.buffer.on_cursor_position_changed += self._on_cursor_position_changed
         self.log(initial_text)
 
     @property
@@ -245,10 +261,73 @@ class CustomTextArea:
 
         if save_log:
             self.log_lines.extend(new_lines)
-            while len(self.log_lines) > self.max_line_count:
-                self.log_lines.popleft()
-            new_text: str = "\n".join(self.log_lines)
-        else:
+            if not silent:
+                self._schedule_refresh()
+        elif not silent:
+            self._cancel_refresh()
+            self._hidden_log_lines = None
             new_text: str = "\n".join(new_lines)
-        if not silent:
-            self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
+            self._set_document(new_text)
+
+    def render_all_log_lines(self):
+        """
+        Renders all the lines of the ring buffer instead of the last ones only, keeping the cursor on the same line.
+        """
+        hidden_log_lines = self._hidden_log_lines
+        if hidden_log_lines is None:
+            return
+        self._hidden_log_lines = None
+        document = self.buffer.document
+        hidden_text = "\n".join(hidden_log_lines) + "\n"
+        self._set_document(hidden_text + document.text, len(hidden_text) + document.cursor_position)
+
+    def _is_search_target(self) -> bool:
+        return get_app().layout.search_target_buffer_control is self.control
+
+    def _schedule_refresh(self):
+        with self._refresh_lock:
+            if self._refresh_pending:
+                return
+            self._refresh_pending = True
+        if self._ev_loop.is_running():
+            # The lines can be logged from other threads, the pane is rendered in the event loop
+            self._ev_loop.call_soon_threadsafe(self._schedule_refresh_in_loop)
+        else:
+            self._refresh()
+
+    def _schedule_refresh_in_loop(self):
+        delay = self._last_refresh_time + 1.0 / self.max_refresh_rate - time.perf_counter()
+        self._refresh_handle = self._ev_loop.call_later(max(0.0, delay), self._refresh)
+
+    def _cancel_refresh(self):
+        with self._refresh_lock:
+            self._refresh_pending = False
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+
+    def _refresh(self):
+        with self._refresh_lock:
+            self._refresh_pending = False
+        self._refresh_handle = None
+        self._last_refresh_time = time.perf_counter()
+
+        log_lines = list(self.log_lines)
+        render_info = self.window.render_info
+        # Twice the window height, so that there are lines to scroll up to with the mouse wheel
+        rendered_lines_count = 2 * render_info.window_height if render_info is not None else len(log_lines)
+        if len(log_lines) > rendered_lines_count and not self._is_search_target():
+            self._hidden_log_lines = log_lines[:-rendered_lines_count]
+            log_lines = log_lines[-rendered_lines_count:]
+        else:
+            self._hidden_log_lines = None
+        new_text: str = "\n".join(log_lines)
+        self._set_document(new_text)
+
+    def _set_document(self, text: str, cursor_position: Optional[int] = None):
+        cursor_position = len(text) if cursor_position is None else cursor_position
+        self.buffer.document = Document(text=text, cursor_position=cursor_position)
+
+    def _on_cursor_position_changed(self, _: Buffer):
+        if self._hidden_log_lines is not None and self.buffer.cursor_position < len(self.buffer.text):
+            self.render_all_log_lines()
@@ -35,6 +35,7 @@ def load_key_bindings(hb) -> KeyBindings:
 
     @bindings.add("c-f", filter=to_filter(not is_searching()))
     def do_find(event):
+        hb.app.log_field.render_all_log_lines()
         start_search(hb.app.log_field.control)
 
     @bindings.add("c-f", filter=is_searching)
@@ -171,6 +171,22 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
     )
     mqtt_restart_parser.set_defaults(func=hummingbot.mqtt_restart)
 
+    latency_parser = subparsers.add_parser("latency", help="Trace the latencies from market data to order acknowledgement")
+    latency_parser.add_argument("option", nargs="?", choices=["start", "stop", "reset"], default=None,
+                                help="Start or stop the tracing, or reset the statistics")
+    latency_parser.set_defaults(func=hummingbot.latency)
+
+    profile_parser = subparsers.add_parser("profile", help="Profile the running bot and report the callbacks blocking it")
+    profile_parser.add_argument("option", nargs="?", choices=["start", "stop"], default="start",
+                                help="Start or stop the profiling")
+    profile_parser.add_argument("-d", "--duration", type=float, default=30.0, dest="duration",
+                                help="Duration of the profiling in seconds")
+    profile_parser.add_argument("--interval", type=float, default=10.0, dest="sampling_interval",
+                                help="Time between two samples in milliseconds")
+    profile_parser.add_argument("--threshold", type=float, default=100.0, dest="blocking_threshold",
+                                help="Time a callback has to block the event loop to be reported in milliseconds")
+    profile_parser.set_defaults(func=hummingbot.profile)
+
     # add shortcuts so they appear in command help
     shortcuts = hummingbot.client_config_map.command_shortcuts
     for shortcut in shortcuts:
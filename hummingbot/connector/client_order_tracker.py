@@ -21,12 +21,14 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.latency_tracer import LatencyTracer
 from hummingbot.logger.logger import HummingbotLogger
 
 if TYPE_CHECKING:
     from hummingbot.connector.connector_base import ConnectorBase
 
 cot_logger = None
+latency_tracer = LatencyTracer.get_instance()
 
 
 class ClientOrderTracker:
@@ -147,6 +149,7 @@ class ClientOrderTracker:
         if client_order_id in self._in_flight_orders:
             self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
             del self._in_flight_orders[client_order_id]
+            latency_tracer.order_discarded(client_order_id)
             if client_order_id in self._order_not_found_records:
                 del self._order_not_found_records[client_order_id]
 
@@ -393,6 +396,7 @@ class ClientOrderTracker:
         if (previous_state == OrderState.PENDING_CREATE and
                 previous_state != new_state and
                 new_state not in [OrderState.CANCELED, OrderState.FAILED, OrderState.PENDING_CANCEL]):
+            latency_tracer.order_acknowledged(tracked_order.client_order_id)
             self.logger().info(tracked_order.build_order_created_message())
             self._trigger_created_event(tracked_order)
 
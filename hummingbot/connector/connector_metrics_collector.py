@@ -5,13 +5,14 @@ import platform
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from os.path import dirname, join, realpath
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.loop_lag_monitor import LoopLagMonitor
 from hummingbot.logger import HummingbotLogger
 from hummingbot.logger.log_server_client import LogServerClient
 
@@ -167,3 +168,84 @@ class TradeVolumeMetricCollector(MetricsCollector):
 
     def _register_fill_event(self, event: OrderFilledEvent):
         self._collected_events.append(event)
+
+
+class LoopLagMetricCollector(MetricsCollector):
+    """
+    Dispatches the p99 lag of the event loop measured by the `LoopLagMonitor` during each dispatch interval. The
+    event loop is shared by all the connectors, so the metric is dispatched once for the whole application, by its own
+    task since it is not ticked by the clock.
+    """
+
+    _logger = None
+
+    METRIC_NAME = "event_loop_lag_p99_ms"
+
+    def __init__(self, dispatch_interval: float, instance_id: str):
+        """
+        :param dispatch_interval: the time (in seconds) between two dispatches of the metric
+        """
+        super().__init__()
+        self._dispatch_interval = dispatch_interval
+        self._dispatcher = LogServerClient(log_server_url=self.DEFAULT_METRICS_SERVER_URL)
+        self._instance_id = instance_id
+        self._client_version = CLIENT_VERSION
+        self._dispatch_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def start(self):
+        self._dispatcher.start()
+        if self._dispatch_task is None:
+            self._dispatch_task = safe_ensure_future(self._dispatch_loop())
+
+    def stop(self):
+        if self._dispatch_task is not None:
+            self._dispatch_task.cancel()
+            self._dispatch_task = None
+        self._dispatcher.stop()
+
+    def process_tick(self, timestamp: float):
+        # The metric is dispatched by the dispatch task
+        pass
+
+    async def _dispatch_loop(self):
+        while True:
+            await asyncio.sleep(self._dispatch_interval)
+            try:
+                self.dispatch_loop_lag()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error dispatching the event loop lag metric.", exc_info=True)
+
+    def dispatch_loop_lag(self):
+        lag_stats = LoopLagMonitor.get_instance().window_stats()
+        if len(lag_stats) == 0:
+            return
+        metric_request = {
+            "url": f"{self._dispatcher.log_server_url}/client_metrics",
+            "method": "POST",
+            "request_obj": {
+                "headers": {
+                    'Content-Type': "application/json"
+                },
+                "data": json.dumps({
+                    "source": "hummingbot",
+                    "name": self.METRIC_NAME,
+                    "instance_id": self._instance_id,
+                    "version": self._client_version,
+                    "system": f"{platform.system()} {platform.release()}({platform.platform()})",
+                    "value": str(lag_stats["p99_ms"])}),
+                "params": {"ddtags": f"instance_id:{self._instance_id},"
+                                     f"client_version:{self._client_version},"
+                                     f"type:metrics",
+                           "ddsource": "hummingbot-client"}
+            }
+        }
+
+        self._dispatcher.request(metric_request)
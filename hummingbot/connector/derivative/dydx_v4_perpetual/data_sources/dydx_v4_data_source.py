@@ -1,5 +1,6 @@
 from asyncio import Lock
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Tuple
 
 import certifi
@@ -22,6 +23,22 @@ from v4_proto.dydxprotocol.subaccounts.subaccount_pb2 import SubaccountId
 from hummingbot.connector.derivative.dydx_v4_perpetual import dydx_v4_perpetual_constants as CONSTANTS
 from hummingbot.connector.derivative.dydx_v4_perpetual.data_sources.keypairs import PrivateKey
 from hummingbot.connector.derivative.dydx_v4_perpetual.data_sources.tx import SigningCfg, Transaction
+from hummingbot.connector.signing_service import SigningService
+
+
+@lru_cache(maxsize=8)
+def _private_key_from_bytes(private_key_bytes: bytes) -> PrivateKey:
+    return PrivateKey(private_key_bytes)
+
+
+def sign_transaction(tx: Transaction, private_key_bytes: bytes, chain_id: str, account_number: int) -> bytes:
+    """
+    Signs a sealed transaction and returns it serialized. The key pairs sign with pure Python ECDSA, which holds the GIL,
+    so this runs in the process pool of the signing service and only takes picklable arguments.
+    """
+    tx.sign(_private_key_from_bytes(private_key_bytes), chain_id, account_number)
+    tx.complete()
+    return tx.tx.SerializeToString()
 
 
 class DydxPerpetualV4Client:
@@ -273,12 +290,17 @@ class DydxPerpetualV4Client:
                 gas_limit=CONSTANTS.TX_GAS_LIMIT,
                 memo=memo,
             )
-            tx.sign(self._private_key, CONSTANTS.CHAIN_ID, number)
-            tx.complete()
-
-            broadcast_req = BroadcastTxRequest(
-                tx_bytes=tx.tx.SerializeToString(), mode=BroadcastMode.BROADCAST_MODE_SYNC
+            tx_bytes = await SigningService.get_instance().sign(
+                sign_transaction,
+                tx,
+                self._private_key.private_key_bytes,
+                CONSTANTS.CHAIN_ID,
+                number,
+                label=CONSTANTS.EXCHANGE_NAME,
+                use_process_pool=True,
             )
+
+            broadcast_req = BroadcastTxRequest(tx_bytes=tx_bytes, mode=BroadcastMode.BROADCAST_MODE_SYNC)
             result = await self.send_tx_sync_mode(broadcast_req)
             err_msg = result.get("raw_log", "")
             if CONSTANTS.ACCOUNT_SEQUENCE_MISMATCH_ERROR in err_msg:
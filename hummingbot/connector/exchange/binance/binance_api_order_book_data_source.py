@@ -20,6 +20,8 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     TRADE_STREAM_ID = 1
     DIFF_STREAM_ID = 2
     ONE_HOUR = 60 * 60
+    # Binance accepts 1024 streams per connection, and each trading pair uses two (trades and depth)
+    WS_MAX_TRADING_PAIRS_PER_CONNECTION = 512
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -68,10 +70,13 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         Subscribes to the trade events and diff orders events through the provided websocket connection.
         :param ws: the websocket assistant used to connect to the exchange
         """
+        await self._subscribe_channels_for_trading_pairs(ws, self._trading_pairs)
+
+    async def _subscribe_channels_for_trading_pairs(self, ws: WSAssistant, trading_pairs: List[str]):
         try:
             trade_params = []
             depth_params = []
-            for trading_pair in self._trading_pairs:
+            for trading_pair in trading_pairs:
                 symbol = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
                 trade_params.append(f"{symbol.lower()}@trade")
                 depth_params.append(f"{symbol.lower()}@depth@100ms")
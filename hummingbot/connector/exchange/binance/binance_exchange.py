@@ -1,4 +1,5 @@
 import asyncio
+from collections import defaultdict
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
@@ -101,6 +102,10 @@ class BinanceExchange(ExchangePyBase):
     def check_network_request_path(self):
         return CONSTANTS.PING_PATH_URL
 
+    @property
+    def rest_endpoint_base_urls(self) -> List[str]:
+        return CONSTANTS.REST_URLS.get(self.domain, [])
+
     @property
     def trading_pairs(self):
         return self._trading_pairs
@@ -467,28 +472,53 @@ class BinanceExchange(ExchangePyBase):
                 limit_id=CONSTANTS.MY_TRADES_PATH_URL)
 
             for trade in all_fills_response:
-                exchange_order_id = str(trade["orderId"])
-                fee = TradeFeeBase.new_spot_fee(
-                    fee_schema=self.trade_fee_schema(),
-                    trade_type=order.trade_type,
-                    percent_token=trade["commissionAsset"],
-                    flat_fees=[TokenAmount(amount=Decimal(trade["commission"]), token=trade["commissionAsset"])]
-                )
-                trade_update = TradeUpdate(
-                    trade_id=str(trade["id"]),
-                    client_order_id=order.client_order_id,
-                    exchange_order_id=exchange_order_id,
-                    trading_pair=trading_pair,
-                    fee=fee,
-                    fill_base_amount=Decimal(trade["qty"]),
-                    fill_quote_amount=Decimal(trade["quoteQty"]),
-                    fill_price=Decimal(trade["price"]),
-                    fill_timestamp=trade["time"] * 1e-3,
-                )
-                trade_updates.append(trade_update)
+                trade_updates.append(self._trade_update_from_fill_data(order=order, trade=trade, symbol=trading_pair))
+
+        return trade_updates
+
+    async def _request_bulk_trade_updates(self, orders: List[InFlightOrder]) -> Dict[str, List[TradeUpdate]]:
+        trade_updates = {}
+        for trading_pair, pair_orders in self._orders_to_update_in_bulk(orders).items():
+            symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            recent_fills = await self._api_get(
+                path_url=CONSTANTS.MY_TRADES_PATH_URL,
+                params={"symbol": symbol, "limit": CONSTANTS.MY_TRADES_MAX_LIMIT},
+                is_auth_required=True,
+                limit_id=CONSTANTS.MY_TRADES_PATH_URL)
+            # A full page might not include the oldest fills of the orders, they are then requested one by one
+            if len(recent_fills) >= CONSTANTS.MY_TRADES_MAX_LIMIT:
+                continue
+            fills_by_exchange_order_id = defaultdict(list)
+            for trade in recent_fills:
+                fills_by_exchange_order_id[str(trade["orderId"])].append(trade)
+            for order in pair_orders:
+                if order.exchange_order_id is not None:
+                    trade_updates[order.client_order_id] = [
+                        self._trade_update_from_fill_data(order=order, trade=trade, symbol=symbol)
+                        for trade in fills_by_exchange_order_id[order.exchange_order_id]
+                    ]
 
         return trade_updates
 
+    def _trade_update_from_fill_data(self, order: InFlightOrder, trade: Dict[str, Any], symbol: str) -> TradeUpdate:
+        fee = TradeFeeBase.new_spot_fee(
+            fee_schema=self.trade_fee_schema(),
+            trade_type=order.trade_type,
+            percent_token=trade["commissionAsset"],
+            flat_fees=[TokenAmount(amount=Decimal(trade["commission"]), token=trade["commissionAsset"])]
+        )
+        return TradeUpdate(
+            trade_id=str(trade["id"]),
+            client_order_id=order.client_order_id,
+            exchange_order_id=str(trade["orderId"]),
+            trading_pair=symbol,
+            fee=fee,
+            fill_base_amount=Decimal(trade["qty"]),
+            fill_quote_amount=Decimal(trade["quoteQty"]),
+            fill_price=Decimal(trade["price"]),
+            fill_timestamp=trade["time"] * 1e-3,
+        )
+
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         trading_pair = await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair)
         updated_order_data = await self._api_get(
@@ -498,18 +528,49 @@ class BinanceExchange(ExchangePyBase):
                 "origClientOrderId": tracked_order.client_order_id},
             is_auth_required=True)
 
-        new_state = CONSTANTS.ORDER_STATE[updated_order_data["status"]]
+        return self._order_update_from_order_data(tracked_order=tracked_order, order_data=updated_order_data)
+
+    async def _request_bulk_order_status(self, tracked_orders: List[InFlightOrder]) -> Dict[str, OrderUpdate]:
+        order_updates = {}
+        for trading_pair, pair_orders in self._orders_to_update_in_bulk(tracked_orders).items():
+            symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            open_orders = await self._api_get(
+                path_url=CONSTANTS.OPEN_ORDERS_PATH_URL,
+                params={"symbol": symbol},
+                is_auth_required=True)
+            # The orders no longer open are missing from the response, their status is requested one by one
+            orders_by_client_order_id = {order.client_order_id: order for order in pair_orders}
+            for order_data in open_orders:
+                tracked_order = orders_by_client_order_id.get(order_data["clientOrderId"])
+                if tracked_order is not None:
+                    order_updates[tracked_order.client_order_id] = self._order_update_from_order_data(
+                        tracked_order=tracked_order, order_data=order_data)
+
+        return order_updates
+
+    @staticmethod
+    def _orders_to_update_in_bulk(orders: List[InFlightOrder]) -> Dict[str, List[InFlightOrder]]:
+        """
+        :return: the orders grouped by trading pair, only for the trading pairs with several orders (a single order
+        is as cheap to update on its own)
+        """
+        orders_by_trading_pair = defaultdict(list)
+        for order in orders:
+            orders_by_trading_pair[order.trading_pair].append(order)
+        return {trading_pair: pair_orders
+                for trading_pair, pair_orders in orders_by_trading_pair.items()
+                if len(pair_orders) > 1}
 
-        order_update = OrderUpdate(
+    @staticmethod
+    def _order_update_from_order_data(tracked_order: InFlightOrder, order_data: Dict[str, Any]) -> OrderUpdate:
+        return OrderUpdate(
             client_order_id=tracked_order.client_order_id,
-            exchange_order_id=str(updated_order_data["orderId"]),
+            exchange_order_id=str(order_data["orderId"]),
             trading_pair=tracked_order.trading_pair,
-            update_timestamp=updated_order_data["updateTime"] * 1e-3,
-            new_state=new_state,
+            update_timestamp=order_data["updateTime"] * 1e-3,
+            new_state=CONSTANTS.ORDER_STATE[order_data["status"]],
         )
 
-        return order_update
-
     async def _update_balances(self):
         local_asset_names = set(self._account_balances.keys())
         remote_asset_names = set()
@@ -11,6 +11,7 @@ from web3.middleware import async_geth_poa_middleware
 
 from hummingbot.connector.exchange.dexalot import dexalot_constants as CONSTANTS
 from hummingbot.connector.gateway.gateway_in_flight_order import GatewayInFlightOrder
+from hummingbot.connector.signing_service import SigningService
 from hummingbot.core.data_type.common import OrderType, TradeType
 
 DEXALOT_TRADEPAIRS_ABI = '[{"name": "cancelAddList", "type": "function", "inputs": [{"name": "_orderIdsToCancel", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "_orders", "type": "tuple[]", "components": [{"name": "clientOrderId", "type": "bytes32", "internalType": "bytes32"}, {"name": "tradePairId", "type": "bytes32", "internalType": "bytes32"}, {"name": "price", "type": "uint256", "internalType": "uint256"}, {"name": "quantity", "type": "uint256", "internalType": "uint256"}, {"name": "traderaddress", "type": "address", "internalType": "address"}, {"name": "side", "type": "uint8", "internalType": "enum ITradePairs.Side"}, {"name": "type1", "type": "uint8", "internalType": "enum ITradePairs.Type1"}, {"name": "type2", "type": "uint8", "internalType": "enum ITradePairs.Type2"}, {"name": "stp", "type": "uint8", "internalType": "enum ITradePairs.STP"}], "internalType": "struct ITradePairs.NewOrder[]"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "addOrderList", "type": "function", "inputs": [{"name": "_orders", "type": "tuple[]", "components": [{"name": "clientOrderId", "type": "bytes32", "internalType": "bytes32"}, {"name": "tradePairId", "type": "bytes32", "internalType": "bytes32"}, {"name": "price", "type": "uint256", "internalType": "uint256"}, {"name": "quantity", "type": "uint256", "internalType": "uint256"}, {"name": "traderaddress", "type": "address", "internalType": "address"}, {"name": "side", "type": "uint8", "internalType": "enum ITradePairs.Side"}, {"name": "type1", "type": "uint8", "internalType": "enum ITradePairs.Type1"}, {"name": "type2", "type": "uint8", "internalType": "enum ITradePairs.Type2"}, {"name": "stp", "type": "uint8", "internalType": "enum ITradePairs.STP"}], "internalType": "struct ITradePairs.NewOrder[]"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "cancelOrderList", "type": "function", "inputs": [{"name": "_orderIds", "type": "bytes32[]", "internalType": "bytes32[]"}], "outputs": [], "stateMutability": "nonpayable"}]'
@@ -144,8 +145,8 @@ class DexalotClient:
                         'gas': gas,
                     }
                     transaction = await function.build_transaction(tx_params)
-                    signed_txn = self.async_w3.eth.account.sign_transaction(
-                        transaction, private_key=self._private_key
+                    signed_txn = await SigningService.get_instance().sign(
+                        self.async_w3.eth.account.sign_transaction, transaction, self._private_key, label=self._domain
                     )
                     result = await self.async_w3.eth.send_raw_transaction(signed_txn.rawTransaction)
                     return result.hex()
@@ -12,6 +12,7 @@ class DexalotAuth(AuthBase):
         self.secret_key = secret_key
         self.time_provider = time_provider
         self.wallet = Account.from_key(secret_key) if secret_key else None
+        self._signature = None
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         """
@@ -20,9 +21,7 @@ class DexalotAuth(AuthBase):
         :param request: the request to be configured for authenticated interaction
         """
 
-        message = encode_defunct(text="dexalot")
-        signed_message = self.wallet.sign_message(signable_message=message)
-        headers = {"x-signature": f"{self.wallet.address}:{signed_message.signature.hex()}"}
+        headers = {"x-signature": self._get_signature()}
         if request.headers is not None:
             headers.update(request.headers)
         request.headers = headers
@@ -34,7 +33,13 @@ class DexalotAuth(AuthBase):
         This method is intended to configure a websocket request to be authenticated. Dexalot does not use this
         functionality
         """
-        message = encode_defunct(text="dexalot")
-        signed_message = self.wallet.sign_message(signable_message=message)
-        request.payload["signature"] = f"{self.wallet.address}:{signed_message.signature.hex()}"
+        request.payload["signature"] = self._get_signature()
         return request
+
+    def _get_signature(self) -> str:
+        # The signed message never changes and the signature is deterministic, so it is generated only once
+        if self._signature is None:
+            message = encode_defunct(text="dexalot")
+            signed_message = self.wallet.sign_message(signable_message=message)
+            self._signature = f"{self.wallet.address}:{signed_message.signature.hex()}"
+        return self._signature
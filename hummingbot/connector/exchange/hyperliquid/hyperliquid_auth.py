@@ -1,6 +1,7 @@
 import json
 import time
 from collections import OrderedDict
+from typing import Optional
 
 import eth_account
 import msgpack
@@ -9,6 +10,7 @@ from eth_utils import keccak, to_hex
 
 from hummingbot.connector.exchange.hyperliquid import hyperliquid_constants as CONSTANTS
 from hummingbot.connector.exchange.hyperliquid.hyperliquid_web_utils import order_spec_to_order_wire
+from hummingbot.connector.signing_service import EIP712StructHasher, SigningService
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, WSRequest
 
@@ -18,11 +20,35 @@ class HyperliquidAuth(AuthBase):
     Auth class required by Hyperliquid API
     """
 
+    # The domain and types of the signed agent never change, so their hashes are computed only once
+    AGENT_HASHER = EIP712StructHasher(
+        domain={
+            "chainId": 1337,
+            "name": "Exchange",
+            "verifyingContract": "0x0000000000000000000000000000000000000000",
+            "version": "1",
+        },
+        types={
+            "Agent": [
+                {"name": "source", "type": "string"},
+                {"name": "connectionId", "type": "bytes32"},
+            ],
+            "EIP712Domain": [
+                {"name": "name", "type": "string"},
+                {"name": "version", "type": "string"},
+                {"name": "chainId", "type": "uint256"},
+                {"name": "verifyingContract", "type": "address"},
+            ],
+        },
+        primary_type="Agent",
+    )
+
     def __init__(self, api_key: str, api_secret: str, use_vault: bool):
         self._api_key: str = api_key
         self._api_secret: str = api_secret
         self._use_vault: bool = use_vault
         self.wallet = eth_account.Account.from_key(api_secret)
+        self._last_nonce: int = 0
 
     @classmethod
     def address_to_bytes(cls, address):
@@ -50,35 +76,17 @@ class HyperliquidAuth(AuthBase):
     def sign_l1_action(self, wallet, action, active_pool, nonce, is_mainnet):
         _hash = self.action_hash(action, active_pool, nonce)
         phantom_agent = self.construct_phantom_agent(_hash, is_mainnet)
-
-        data = {
-            "domain": {
-                "chainId": 1337,
-                "name": "Exchange",
-                "verifyingContract": "0x0000000000000000000000000000000000000000",
-                "version": "1",
-            },
-            "types": {
-                "Agent": [
-                    {"name": "source", "type": "string"},
-                    {"name": "connectionId", "type": "bytes32"},
-                ],
-                "EIP712Domain": [
-                    {"name": "name", "type": "string"},
-                    {"name": "version", "type": "string"},
-                    {"name": "chainId", "type": "uint256"},
-                    {"name": "verifyingContract", "type": "address"},
-                ],
-            },
-            "primaryType": "Agent",
-            "message": phantom_agent,
-        }
-        return self.sign_inner(wallet, data)
+        signed = wallet.sign_message(self.AGENT_HASHER.signable_message(phantom_agent))
+        return {"r": to_hex(signed["r"]), "s": to_hex(signed["s"]), "v": signed["v"]}
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         base_url = request.url
         if request.method == RESTMethod.POST:
-            request.data = self.add_auth_to_params_post(request.data, base_url)
+            # The nonce is generated on the event loop, so the nonces are unique and increase in the order of the
+            # requests even when the signatures run concurrently in the signing service workers
+            request.data = await SigningService.get_instance().sign(
+                self.add_auth_to_params_post, request.data, base_url, self._next_nonce(), label=CONSTANTS.EXCHANGE_NAME
+            )
         return request
 
     async def ws_authenticate(self, request: WSRequest) -> WSRequest:
@@ -147,8 +155,8 @@ class HyperliquidAuth(AuthBase):
         }
         return payload
 
-    def add_auth_to_params_post(self, params: str, base_url):
-        timestamp = int(self._get_timestamp() * 1e3)
+    def add_auth_to_params_post(self, params: str, base_url, timestamp: Optional[int] = None):
+        timestamp = timestamp if timestamp is not None else self._next_nonce()
         payload = {}
         data = json.loads(params) if params is not None else {}
 
@@ -164,6 +172,11 @@ class HyperliquidAuth(AuthBase):
         payload = json.dumps(payload)
         return payload
 
+    def _next_nonce(self) -> int:
+        nonce = max(int(self._get_timestamp() * 1e3), self._last_nonce + 1)
+        self._last_nonce = nonce
+        return nonce
+
     @staticmethod
     def _get_timestamp():
         return time.time()
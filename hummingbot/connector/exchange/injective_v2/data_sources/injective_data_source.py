@@ -5,6 +5,7 @@ import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 from bidict import bidict
@@ -14,6 +15,7 @@ from pyinjective import Transaction
 from pyinjective.composer import Composer, injective_exchange_tx_pb
 from pyinjective.core.market import DerivativeMarket, SpotMarket
 from pyinjective.core.token import Token
+from pyinjective.wallet import PrivateKey
 
 from hummingbot.connector.derivative.position import Position
 from hummingbot.connector.exchange.injective_v2 import injective_constants as CONSTANTS
@@ -45,6 +47,19 @@ from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
+@lru_cache(maxsize=8)
+def _private_key_from_hex(private_key_hex: str) -> PrivateKey:
+    return PrivateKey.from_hex(private_key_hex)
+
+
+def sign_message(private_key_hex: str, message: bytes) -> bytes:
+    """
+    Signs the message with the private key. The keys sign with pure Python ECDSA, which holds the GIL, so this runs in
+    the process pool of the signing service and only takes picklable arguments.
+    """
+    return _private_key_from_hex(private_key_hex).sign(message)
+
+
 class InjectiveDataSource(ABC):
     _logger: Optional[HummingbotLogger] = None
 
@@ -683,7 +698,7 @@ class InjectiveDataSource(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def _sign_and_encode(self, transaction: Transaction) -> bytes:
+    async def _sign_and_encode(self, transaction: Transaction) -> bytes:
         raise NotImplementedError
 
     @abstractmethod
@@ -996,7 +1011,7 @@ class InjectiveDataSource(ABC):
         transaction.with_memo("")
         transaction.with_timeout_height(await self.timeout_height())
 
-        signed_transaction_data = self._sign_and_encode(transaction=transaction)
+        signed_transaction_data = await self._sign_and_encode(transaction=transaction)
 
         async with self.throttler.execute_task(limit_id=CONSTANTS.SEND_TRANSACTION):
             result = await self.query_executor.send_tx_sync_mode(tx_byte=signed_transaction_data)
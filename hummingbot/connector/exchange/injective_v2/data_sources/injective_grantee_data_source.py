@@ -10,7 +10,10 @@ from pyinjective.core.network import Network
 from pyinjective.wallet import Address, PrivateKey
 
 from hummingbot.connector.exchange.injective_v2 import injective_constants as CONSTANTS
-from hummingbot.connector.exchange.injective_v2.data_sources.injective_data_source import InjectiveDataSource
+from hummingbot.connector.exchange.injective_v2.data_sources.injective_data_source import (
+    InjectiveDataSource,
+    sign_message,
+)
 from hummingbot.connector.exchange.injective_v2.injective_market import (
     InjectiveDerivativeMarket,
     InjectiveSpotMarket,
@@ -18,6 +21,7 @@ from hummingbot.connector.exchange.injective_v2.injective_market import (
 )
 from hummingbot.connector.exchange.injective_v2.injective_query_executor import PythonSDKInjectiveQueryExecutor
 from hummingbot.connector.gateway.gateway_in_flight_order import GatewayInFlightOrder, GatewayPerpetualInFlightOrder
+from hummingbot.connector.signing_service import SigningService
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
@@ -352,9 +356,15 @@ class InjectiveGranteeDataSource(InjectiveDataSource):
         await self._client.sync_timeout_height()
         self._is_timeout_height_initialized = True
 
-    def _sign_and_encode(self, transaction: Transaction) -> bytes:
+    async def _sign_and_encode(self, transaction: Transaction) -> bytes:
         sign_doc = transaction.get_sign_doc(self._public_key)
-        sig = self._private_key.sign(sign_doc.SerializeToString())
+        sig = await SigningService.get_instance().sign(
+            sign_message,
+            self._private_key.to_hex(),
+            sign_doc.SerializeToString(),
+            label=CONSTANTS.EXCHANGE_NAME,
+            use_process_pool=True,
+        )
         tx_raw_bytes = transaction.get_tx_data(sig, self._public_key)
         return tx_raw_bytes
 
@@ -262,7 +262,7 @@ class InjectiveReadOnlyDataSource(InjectiveDataSource):
         # Do nothing
         pass
 
-    def _sign_and_encode(self, transaction: Transaction) -> bytes:
+    async def _sign_and_encode(self, transaction: Transaction) -> bytes:
         raise NotImplementedError
 
     def _uses_default_portfolio_subaccount(self) -> bool:
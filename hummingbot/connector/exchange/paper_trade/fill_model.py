@@ -0,0 +1,186 @@
+from decimal import Decimal
+from typing import Dict, Optional, Tuple
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+s_decimal_0 = Decimal(0)
+
+
+class PaperTradeOrderState:
+    """
+    Simulation state of a resting paper trade limit order.
+    """
+    __slots__ = ("order_id", "is_buy", "price", "amount", "queue_ahead", "filled_amount", "active_timestamp",
+                 "executed_base_amount", "executed_quote_amount")
+
+    def __init__(self,
+                 order_id: str,
+                 is_buy: bool,
+                 price: Decimal,
+                 amount: Decimal,
+                 queue_ahead: Decimal,
+                 active_timestamp: float):
+        self.order_id = order_id
+        self.is_buy = is_buy
+        self.price = price
+        self.amount = amount
+        self.queue_ahead = queue_ahead
+        self.filled_amount = s_decimal_0
+        self.active_timestamp = active_timestamp
+        self.executed_base_amount = s_decimal_0
+        self.executed_quote_amount = s_decimal_0
+
+    @property
+    def remaining_amount(self) -> Decimal:
+        return self.amount - self.filled_amount
+
+    @property
+    def is_filled(self) -> bool:
+        return self.filled_amount >= self.amount
+
+    def __repr__(self) -> str:
+        return (f"PaperTradeOrderState('{self.order_id}', {self.is_buy}, {self.price}, {self.amount}, "
+                f"queue_ahead={self.queue_ahead}, filled_amount={self.filled_amount}, "
+                f"active_timestamp={self.active_timestamp})")
+
+
+class PaperTradeFillModel:
+    """
+    Fill model for the limit orders of the paper trade exchange, more conservative than filling an order as soon as
+    its price is touched.
+
+    - An order only rests in the book once the order entry latency has elapsed, and a cancel only takes effect after
+      the cancel latency, so the order can still be filled in between.
+    - The amount resting at the order price when the order is placed is queued ahead of it. Trades at the order price
+      consume that queue first, and only the remaining trade amount fills the order.
+    - Trades through the order price (or an opposite book crossing it) mean the whole price level was consumed, so
+      the queue is cleared and the order is filled up to the trade amount.
+    """
+
+    def __init__(self,
+                 order_entry_latency: float = 0.0,
+                 cancel_latency: float = 0.0,
+                 queue_position: bool = True):
+        self._order_entry_latency = order_entry_latency
+        self._cancel_latency = cancel_latency
+        self._queue_position = queue_position
+        self._orders: Dict[str, PaperTradeOrderState] = {}
+
+    @property
+    def order_entry_latency(self) -> float:
+        return self._order_entry_latency
+
+    @property
+    def cancel_latency(self) -> float:
+        return self._cancel_latency
+
+    @property
+    def orders(self) -> Dict[str, PaperTradeOrderState]:
+        return self._orders
+
+    def add_order(self,
+                  order_id: str,
+                  is_buy: bool,
+                  price: Decimal,
+                  amount: Decimal,
+                  timestamp: float,
+                  order_book: Optional[OrderBook] = None) -> PaperTradeOrderState:
+        queue_ahead = (self.volume_at_price(order_book, is_buy, price)
+                       if self._queue_position and order_book is not None
+                       else s_decimal_0)
+        state = PaperTradeOrderState(
+            order_id=order_id,
+            is_buy=is_buy,
+            price=price,
+            amount=amount,
+            queue_ahead=queue_ahead,
+            active_timestamp=timestamp + self._order_entry_latency,
+        )
+        self._orders[order_id] = state
+        return state
+
+    def remove_order(self, order_id: str):
+        self._orders.pop(order_id, None)
+
+    def get_order(self, order_id: str) -> Optional[PaperTradeOrderState]:
+        return self._orders.get(order_id)
+
+    def remaining_amount(self, order_id: str, amount: Decimal) -> Decimal:
+        state = self._orders.get(order_id)
+        return amount if state is None else state.remaining_amount
+
+    def is_active(self, order_id: str, timestamp: float) -> bool:
+        state = self._orders.get(order_id)
+        return state is not None and timestamp >= state.active_timestamp
+
+    def match_trade(self,
+                    order_id: str,
+                    trade_price: Decimal,
+                    trade_amount: Decimal,
+                    timestamp: float) -> Tuple[Decimal, Decimal]:
+        """
+        Matches a public trade against a resting order, consuming the queue ahead of it when the trade happened at
+        the order price.
+
+        :return: the amount filled from the order, and the amount of the trade consumed (queue ahead included)
+        """
+        state = self._orders.get(order_id)
+        if state is None or timestamp < state.active_timestamp or trade_amount <= s_decimal_0:
+            return s_decimal_0, s_decimal_0
+        if (trade_price > state.price) if state.is_buy else (trade_price < state.price):
+            return s_decimal_0, s_decimal_0
+
+        consumed_queue = s_decimal_0
+        if trade_price == state.price:
+            consumed_queue = min(state.queue_ahead, trade_amount)
+            state.queue_ahead -= consumed_queue
+        else:
+            state.queue_ahead = s_decimal_0
+        fill_amount = min(state.remaining_amount, trade_amount - consumed_queue)
+        return fill_amount, consumed_queue + fill_amount
+
+    def match_crossed_book(self, order_id: str, opposite_price: Decimal, timestamp: float) -> Decimal:
+        """
+        :return: the amount filled from the order when the best opposite price has crossed the order price. An
+        opposite price equal to the order price only touches the order and does not fill it.
+        """
+        state = self._orders.get(order_id)
+        if state is None or timestamp < state.active_timestamp:
+            return s_decimal_0
+        if (opposite_price < state.price) if state.is_buy else (opposite_price > state.price):
+            state.queue_ahead = s_decimal_0
+            return state.remaining_amount
+        return s_decimal_0
+
+    def register_fill(self,
+                      order_id: str,
+                      fill_amount: Decimal,
+                      base_amount: Decimal,
+                      quote_amount: Decimal) -> Optional[PaperTradeOrderState]:
+        """
+        Records a (partial) fill of an order.
+
+        :param base_amount: the base asset amount bought or sold in the fill, fees included
+        :param quote_amount: the quote asset amount paid or acquired in the fill, fees included
+        :return: the updated state of the order, or None if the order is not tracked
+        """
+        state = self._orders.get(order_id)
+        if state is not None:
+            state.filled_amount += fill_amount
+            state.executed_base_amount += base_amount
+            state.executed_quote_amount += quote_amount
+        return state
+
+    @staticmethod
+    def volume_at_price(order_book: OrderBook, is_buy: bool, price: Decimal) -> Decimal:
+        """
+        :return: the amount resting in the order book at exactly the given price, on the side of the order
+        """
+        float_price = float(price)
+        entries = order_book.bid_entries() if is_buy else order_book.ask_entries()
+        for entry in entries:
+            if entry.price == float_price:
+                return Decimal(str(entry.amount))
+            if (entry.price < float_price) if is_buy else (entry.price > float_price):
+                break
+        return s_decimal_0
@@ -0,0 +1,276 @@
+import heapq
+import json
+import logging
+import math
+from os.path import join
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from hummingbot import data_path
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
+
+
+class L2ReplayEventType:
+    SNAPSHOT = "snapshot"
+    DIFF = "diff"
+    TRADE = "trade"
+
+
+class L2ReplayEvent(NamedTuple):
+    timestamp: float
+    trading_pair: str
+    event_type: str
+    content: Dict[str, Any]
+
+
+def recorded_data_file_path(exchange: str, trading_pair: str, source_type: str, date: str,
+                            data_dir: Optional[str] = None) -> str:
+    """
+    :param source_type: "order_book_snapshots" or "trades"
+    :param date: the recording date, in the YYYY-MM-DD format
+    :return: the path of the file written by the download_order_book_and_trades script
+    """
+    return join(data_dir or data_path(), f"{exchange}_{trading_pair}_{source_type}_{date}.txt")
+
+
+def _read_json_lines(file_path: str) -> Iterator[Dict[str, Any]]:
+    with open(file_path) as fd:
+        for line in fd:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def read_order_book_events(file_path: str, trading_pair: str) -> Iterator[L2ReplayEvent]:
+    """
+    Reads a file of order book records, one JSON object per line, in timestamp order.
+    Each record has a "ts" timestamp and the "bids" and "asks" rows as [price, amount] lists. The records are
+    snapshots, unless they have "type": "diff" (rows with amount 0 remove the price level).
+    """
+    for record in _read_json_lines(file_path):
+        event_type = L2ReplayEventType.DIFF if record.get("type") == L2ReplayEventType.DIFF else L2ReplayEventType.SNAPSHOT
+        yield L2ReplayEvent(float(record["ts"]), trading_pair, event_type, record)
+
+
+def read_trade_events(file_path: str, trading_pair: str) -> Iterator[L2ReplayEvent]:
+    """
+    Reads a file of public trades, one JSON object per line, in timestamp order.
+    Each record has the "ts" timestamp, the trade "price", the base amount "q_base" and the taker "side".
+    """
+    for record in _read_json_lines(file_path):
+        yield L2ReplayEvent(float(record["ts"]), trading_pair, L2ReplayEventType.TRADE, record)
+
+
+def merge_replay_events(*streams: Iterable[L2ReplayEvent]) -> Iterator[L2ReplayEvent]:
+    """
+    Merges streams already sorted by timestamp. The streams are consumed lazily, so only one event per stream is kept
+    in memory. Events with the same timestamp keep the order of the streams.
+    """
+    return heapq.merge(*streams, key=lambda event: event.timestamp)
+
+
+class L2ReplayOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+
+class L2ReplayOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker whose order books are only updated by the replay exchange.
+    """
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(data_source=L2ReplayOrderBookTrackerDataSource(trading_pairs), trading_pairs=trading_pairs)
+
+    def create_order_books(self):
+        for trading_pair in self._trading_pairs:
+            self._order_books[trading_pair] = self._data_source.order_book_create_function()
+        self._order_books_initialized.set()
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class L2ReplayExchange(PaperTradeExchange):
+    """
+    Paper trade exchange fed with recorded level 2 data instead of a live connection. It is driven by a clock in
+    backtest mode: on each tick every recorded snapshot, diff and trade up to the tick timestamp is applied to the
+    order books, so the strategies see the market as it was recorded and the limit orders are filled by the recorded
+    trades. The recorded files are read as streams, so the memory used does not depend on their length.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 client_config_map: "ClientConfigAdapter",
+                 exchange_name: str,
+                 trading_pairs: List[str],
+                 replay_events: Iterable[L2ReplayEvent]):
+        order_book_tracker = L2ReplayOrderBookTracker(trading_pairs=trading_pairs)
+        super().__init__(client_config_map, order_book_tracker, L2ReplayExchange, exchange_name=exchange_name)
+        # The replay order books are created upfront, so the paper trade market (trading pairs and trade listeners)
+        # can be initialized right away instead of when the exchange is first ready
+        order_book_tracker.create_order_books()
+        self.init_paper_trade_market()
+        self._replay_events: Iterator[L2ReplayEvent] = iter(replay_events)
+        self._next_replay_event: Optional[L2ReplayEvent] = next(self._replay_events, None)
+        self._pending_snapshot_pairs = set(trading_pairs)
+        self._update_ids: Dict[str, int] = {trading_pair: 0 for trading_pair in trading_pairs}
+        self._replayed_events_count = 0
+
+    @classmethod
+    def from_files(cls,
+                   client_config_map: "ClientConfigAdapter",
+                   exchange_name: str,
+                   order_book_files: Dict[str, str],
+                   trade_files: Optional[Dict[str, str]] = None) -> "L2ReplayExchange":
+        """
+        :param order_book_files: the order book records file of each trading pair
+        :param trade_files: the public trades file of each trading pair
+        """
+        trade_files = trade_files or {}
+        # Trades are merged before the order book records with the same timestamp, since the recorded snapshots
+        # already include their effect
+        streams = ([read_trade_events(path, trading_pair) for trading_pair, path in trade_files.items()]
+                   + [read_order_book_events(path, trading_pair) for trading_pair, path in order_book_files.items()])
+        trading_pairs = list(dict.fromkeys(list(order_book_files.keys()) + list(trade_files.keys())))
+        return cls(client_config_map=client_config_map,
+                   exchange_name=exchange_name,
+                   trading_pairs=trading_pairs,
+                   replay_events=merge_replay_events(*streams))
+
+    @classmethod
+    def from_recorded_data(cls,
+                           client_config_map: "ClientConfigAdapter",
+                           recorded_exchange: str,
+                           trading_pairs: List[str],
+                           date: str,
+                           data_dir: Optional[str] = None) -> "L2ReplayExchange":
+        """
+        Creates a replay exchange from the files written by the download_order_book_and_trades script.
+
+        :param recorded_exchange: the connector the data was recorded from (e.g. binance_paper_trade)
+        :param date: the recording date, in the YYYY-MM-DD format
+        """
+        return cls.from_files(
+            client_config_map=client_config_map,
+            exchange_name=recorded_exchange.replace("_paper_trade", ""),
+            order_book_files={
+                trading_pair: recorded_data_file_path(
+                    recorded_exchange, trading_pair, "order_book_snapshots", date, data_dir)
+                for trading_pair in trading_pairs
+            },
+            trade_files={
+                trading_pair: recorded_data_file_path(recorded_exchange, trading_pair, "trades", date, data_dir)
+                for trading_pair in trading_pairs
+            },
+        )
+
+    @staticmethod
+    def convert_from_exchange_trading_pair(exchange_trading_pair: str) -> str:
+        return exchange_trading_pair
+
+    @staticmethod
+    def convert_to_exchange_trading_pair(hb_trading_pair: str) -> str:
+        return hb_trading_pair
+
+    @staticmethod
+    def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
+        base, quote = trading_pair.split("-")
+        return base, quote
+
+    @property
+    def ready(self):
+        return len(self._pending_snapshot_pairs) == 0 and super().ready
+
+    @property
+    def first_timestamp(self) -> Optional[float]:
+        """
+        :return: the timestamp of the next event to replay, the first one if the replay has not started
+        """
+        return self._next_replay_event.timestamp if self._next_replay_event is not None else None
+
+    @property
+    def replay_finished(self) -> bool:
+        return self._next_replay_event is None
+
+    @property
+    def replayed_events_count(self) -> int:
+        return self._replayed_events_count
+
+    def tick(self, timestamp: float):
+        self.replay_until(timestamp)
+
+    def next_wakeup_time(self, timestamp: float) -> float:
+        """
+        The order books only change when a recorded event is replayed, so the exchange has work at the next event, or
+        before it when a queued order or cancel is due. It has none once the replay is finished.
+        """
+        next_event_time = self._next_replay_event.timestamp if self._next_replay_event is not None else math.inf
+        pending_wakeup_time = super().next_wakeup_time(timestamp)
+        if math.isnan(pending_wakeup_time):
+            return next_event_time
+        return min(next_event_time, pending_wakeup_time)
+
+    def replay_until(self, timestamp: float):
+        """
+        Applies all the recorded events up to (and including) the timestamp.
+        """
+        event = self._next_replay_event
+        while event is not None and event.timestamp <= timestamp:
+            try:
+                self._apply_replay_event(event)
+            except Exception:
+                self.logger().error(f"Error replaying the recorded event {event}.", exc_info=True)
+            self._replayed_events_count += 1
+            event = next(self._replay_events, None)
+        self._next_replay_event = event
+
+    def _apply_replay_event(self, event: L2ReplayEvent):
+        order_book: Optional[OrderBook] = self.order_book_tracker.order_books.get(event.trading_pair)
+        if order_book is None:
+            return
+        if event.event_type == L2ReplayEventType.TRADE:
+            if event.trading_pair in self._pending_snapshot_pairs:
+                return
+            content = event.content
+            order_book.apply_trade(OrderBookTradeEvent(
+                trading_pair=event.trading_pair,
+                timestamp=event.timestamp,
+                type=TradeType[content["side"].upper()],
+                price=float(content["price"]),
+                amount=float(content["q_base"]),
+            ))
+            return
+
+        update_id = event.content.get("update_id", self._update_ids[event.trading_pair] + 1)
+        self._update_ids[event.trading_pair] = update_id
+        bids = self._order_book_rows(event.content.get("bids", event.content.get("bid", [])), update_id)
+        asks = self._order_book_rows(event.content.get("asks", event.content.get("ask", [])), update_id)
+        if event.event_type == L2ReplayEventType.SNAPSHOT:
+            order_book.apply_snapshot(bids, asks, update_id)
+            self._pending_snapshot_pairs.discard(event.trading_pair)
+        elif event.trading_pair not in self._pending_snapshot_pairs:
+            order_book.apply_diffs(bids, asks, update_id)
+
+    @staticmethod
+    def _order_book_rows(rows: List[List[float]], update_id: int) -> List[OrderBookRow]:
+        return [OrderBookRow(float(row[0]), float(row[1]), update_id) for row in rows]
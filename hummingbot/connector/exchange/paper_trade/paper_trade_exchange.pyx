@@ -14,6 +14,7 @@ from libcpp.vector cimport vector
 
 from hummingbot.connector.budget_checker import BudgetChecker
 from hummingbot.connector.connector_metrics_collector import DummyMetricsCollector
+from hummingbot.connector.exchange.paper_trade.fill_model import PaperTradeFillModel
 from hummingbot.connector.exchange.paper_trade.trading_pair import TradingPair
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.clock cimport Clock
@@ -173,6 +174,8 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
         self.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._market_order_filled_listener)
+        self._fill_model = None
+        self._pending_cancels = deque()
 
         # Trade volume metrics should never be gather for paper trade connector
         self._trade_volume_metric_collector = DummyMetricsCollector()
@@ -181,12 +184,25 @@ cdef class PaperTradeExchange(ExchangeBase):
     def budget_checker(self) -> BudgetChecker:
         return self._budget_checker
 
+    @property
+    def fill_model(self) -> Optional[PaperTradeFillModel]:
+        return self._fill_model
+
+    def set_fill_model(self, fill_model: Optional[PaperTradeFillModel]):
+        """
+        Sets the model used to fill the limit orders. Without a fill model limit orders are filled completely as soon
+        as a trade or the opposite side of the order book reaches their price.
+        """
+        self._fill_model = fill_model
+
     @classmethod
     def random_order_id(cls, order_side: str, trading_pair: str) -> str:
         vals = [random.choice(range(0, 256)) for i in range(0, 13)]
         return f"{order_side}://" + trading_pair + "/" + "".join([f"{val:02x}" for val in vals])
 
     def init_paper_trade_market(self):
+        if self._paper_trade_market_initialized:
+            return
         for trading_pair_str, order_book in self.order_book_tracker.order_books.items():
             assert type(order_book) is CompositeOrderBook
             base_asset, quote_asset = self.split_trading_pair(trading_pair_str)
@@ -195,6 +211,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                 self.ORDER_BOOK_TRADE_EVENT_TAG,
                 self._order_book_trade_listener
             )
+        self._paper_trade_market_initialized = True
 
     def split_trading_pair(self, trading_pair: str) -> Tuple[str, str]:
         return self._target_market.split_trading_pair(trading_pair)
@@ -231,9 +248,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         if not self.order_book_tracker.ready:
             return False
         if all(self.status_dict.values()):
-            if not self._paper_trade_market_initialized:
-                self.init_paper_trade_market()
-                self._paper_trade_market_initialized = True
+            self.init_paper_trade_market()
             return True
         else:
             return False
@@ -278,10 +293,13 @@ cdef class PaperTradeExchange(ExchangeBase):
     def on_hold_balances(self) -> Dict[str, Decimal]:
         _on_hold_balances = defaultdict(Decimal)
         for limit_order in self.limit_orders:
+            quantity = (limit_order.quantity
+                        if self._fill_model is None
+                        else self._fill_model.remaining_amount(limit_order.client_order_id, limit_order.quantity))
             if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
+                _on_hold_balances[limit_order.quote_currency] += quantity * limit_order.price
             else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
+                _on_hold_balances[limit_order.base_currency] += quantity
         return _on_hold_balances
 
     @property
@@ -318,8 +336,26 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_tick(self, double timestamp):
         ExchangeBase.c_tick(self, timestamp)
         self.c_process_market_orders()
+        self.c_process_pending_cancels()
         self.c_process_crossed_limit_orders()
 
+    cpdef double next_wakeup_time(self, double timestamp):
+        """
+        :return: the earliest time a queued market order or a pending cancel is due at, the default wake up time when
+        there is none
+        """
+        cdef:
+            QueuedOrder front_order
+            double wakeup_time = math.inf
+        if len(self._queued_orders) > 0:
+            front_order = self._queued_orders[0]
+            wakeup_time = front_order.create_timestamp + self.TRADE_EXECUTION_DELAY
+        if len(self._pending_cancels) > 0:
+            wakeup_time = min(wakeup_time, self._pending_cancels[0][0])
+        if math.isinf(wakeup_time):
+            return ExchangeBase.next_wakeup_time(self, timestamp)
+        return wakeup_time
+
     cdef str c_buy(self,
                    str trading_pair_str,
                    object amount,
@@ -370,6 +406,9 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            if self._fill_model is not None:
+                self._fill_model.add_order(order_id, True, quantized_price, quantized_amount, self._current_timestamp,
+                                           self.order_books.get(trading_pair_str))
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -430,6 +469,9 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            if self._fill_model is not None:
+                self._fill_model.add_order(order_id, False, quantized_price, quantized_amount, self._current_timestamp,
+                                           self.order_books.get(trading_pair_str))
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -622,6 +664,17 @@ cdef class PaperTradeExchange(ExchangeBase):
             else:
                 return
 
+    cdef c_process_pending_cancels(self):
+        cdef:
+            tuple front_cancel
+        while len(self._pending_cancels) > 0:
+            front_cancel = self._pending_cancels[0]
+            if front_cancel[0] <= self._current_timestamp:
+                self._pending_cancels.popleft()
+                self.c_execute_cancel(front_cancel[1], front_cancel[2])
+            else:
+                return
+
     cdef c_delete_limit_order(self,
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
@@ -629,6 +682,8 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            if self._fill_model is not None:
+                self._fill_model.remove_order(deref(orders_it).getClientOrderID().decode("utf8"))
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -640,17 +695,19 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
             str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
-            object amount = <object> cpp_limit_order_ptr.getQuantity()
+            object amount = fill_amount if fill_amount is not None else <object> cpp_limit_order_ptr.getQuantity()
             object price = <object> cpp_limit_order_ptr.getPrice()
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
+            object order_state = None
 
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
@@ -709,12 +766,20 @@ cdef class PaperTradeExchange(ExchangeBase):
                 trading_pair_str,
                 TradeType.BUY,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                price,
+                amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
+        if self._fill_model is not None:
+            order_state = self._fill_model.register_fill(order_id, amount, acquired_amount, paid_amount)
+            if order_state is not None:
+                if not order_state.is_filled:
+                    return
+                acquired_amount = order_state.executed_base_amount
+                paid_amount = order_state.executed_quote_amount
+
         self.c_trigger_event(
             self.BUY_ORDER_COMPLETED_EVENT_TAG,
             BuyOrderCompletedEvent(
@@ -731,17 +796,19 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
             str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
-            object amount = <object> cpp_limit_order_ptr.getQuantity()
+            object amount = fill_amount if fill_amount is not None else <object> cpp_limit_order_ptr.getQuantity()
             object price = <object> cpp_limit_order_ptr.getPrice()
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
+            object order_state = None
 
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
@@ -800,12 +867,20 @@ cdef class PaperTradeExchange(ExchangeBase):
                 trading_pair_str,
                 TradeType.SELL,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                price,
+                amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
+        if self._fill_model is not None:
+            order_state = self._fill_model.register_fill(order_id, amount, sold_amount, acquired_amount)
+            if order_state is not None:
+                if not order_state.is_filled:
+                    return
+                sold_amount = order_state.executed_base_amount
+                acquired_amount = order_state.executed_quote_amount
+
         self.c_trigger_event(
             self.SELL_ORDER_COMPLETED_EVENT_TAG,
             SellOrderCompletedEvent(
@@ -823,12 +898,13 @@ cdef class PaperTradeExchange(ExchangeBase):
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it):
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=None):
         try:
             if is_buy:
-                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
             else:
-                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
 
@@ -870,7 +946,15 @@ cdef class PaperTradeExchange(ExchangeBase):
                 inc(orders_it)
 
         for orders_it in process_order_its:
-            self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
+            if self._fill_model is None:
+                self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
+            else:
+                fill_amount = self._fill_model.match_crossed_book(
+                    deref(orders_it).getClientOrderID().decode("utf8"),
+                    opposite_order_book_price,
+                    self._current_timestamp)
+                if fill_amount > s_decimal_0:
+                    self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
 
     cdef c_process_crossed_limit_orders(self):
         cdef:
@@ -894,6 +978,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event):
         """
         Trigger limit orders when incoming market orders have crossed the limit order's price.
+        With a fill model, trades at the limit order's price are matched too, and the traded amount is shared by the
+        limit orders in price priority.
 
         :param order_book_trade_event: trade event from order book
         """
@@ -911,6 +997,8 @@ cdef class PaperTradeExchange(ExchangeBase):
             SingleTradingPairLimitOrdersRIterator orders_rit
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            bint match_trade_price = self._fill_model is not None
+            object remaining_trade_quantity
 
         if map_it == limit_orders_map_ptr.end():
             return
@@ -920,7 +1008,9 @@ cdef class PaperTradeExchange(ExchangeBase):
             orders_rit = orders_collection_ptr.rbegin()
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if <object>cpp_limit_order_ptr.getPrice() <= trade_price:
+                if (<object>cpp_limit_order_ptr.getPrice() < trade_price
+                        if match_trade_price
+                        else <object>cpp_limit_order_ptr.getPrice() <= trade_price):
                     break
                 process_order_its.push_back(getIteratorFromReverseIterator(
                     <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
@@ -929,13 +1019,31 @@ cdef class PaperTradeExchange(ExchangeBase):
             orders_it = orders_collection_ptr.begin()
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if <object>cpp_limit_order_ptr.getPrice() >= trade_price:
+                if (<object>cpp_limit_order_ptr.getPrice() > trade_price
+                        if match_trade_price
+                        else <object>cpp_limit_order_ptr.getPrice() >= trade_price):
                     break
                 process_order_its.push_back(orders_it)
                 inc(orders_it)
 
+        if self._fill_model is None:
+            for orders_it in process_order_its:
+                self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
+            return
+
+        trade_price = Decimal(str(trade_price))
+        remaining_trade_quantity = Decimal(str(trade_quantity))
         for orders_it in process_order_its:
-            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
+            if remaining_trade_quantity <= s_decimal_0:
+                break
+            fill_amount, consumed_quantity = self._fill_model.match_trade(
+                deref(orders_it).getClientOrderID().decode("utf8"),
+                trade_price,
+                remaining_trade_quantity,
+                self._current_timestamp)
+            remaining_trade_quantity -= consumed_quantity
+            if fill_amount > s_decimal_0:
+                self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it, fill_amount)
 
     # </editor-fold>
 
@@ -999,9 +1107,16 @@ cdef class PaperTradeExchange(ExchangeBase):
             self.logger().error(f"Error canceling order.", exc_info=True)
 
     cdef c_cancel(self, str trading_pair_str, str client_order_id):
+        if self._fill_model is not None and self._fill_model.cancel_latency > 0:
+            # The order can still be filled until the cancel reaches the exchange
+            self._pending_cancels.append((self._current_timestamp + self._fill_model.cancel_latency,
+                                          trading_pair_str,
+                                          client_order_id))
+            return
+        self.c_execute_cancel(trading_pair_str, client_order_id)
+
+    cdef c_execute_cancel(self, str trading_pair_str, str client_order_id):
         cdef:
-            string cpp_trading_pair = trading_pair_str.encode("utf8")
-            string cpp_client_order_id = client_order_id.encode("utf8")
             str trade_type = client_order_id.split("://")[0]
             bint is_maker_buy = trade_type.upper() == "BUY"
             LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
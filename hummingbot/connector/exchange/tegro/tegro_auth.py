@@ -1,6 +1,6 @@
 import json
 from collections import OrderedDict
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from eth_account import Account, messages
 
@@ -16,6 +16,7 @@ class TegroAuth(AuthBase):
     def __init__(self, api_key: str, api_secret: str):
         self._api_key: str = api_key
         self._api_secret: str = api_secret
+        self._address_signature: Optional[str] = None
 
     def sign_inner(self, data):
         """
@@ -53,11 +54,12 @@ class TegroAuth(AuthBase):
                            params: Dict[str, Any]):
         request_params = OrderedDict(params or {})
 
-        addr = self._api_key
-        address = addr.lower()
-        structured_data = messages.encode_defunct(text=address)
-        signature = self.sign_inner(structured_data)
-        request_params["signature"] = signature
+        # The signed address never changes and the signature is deterministic, so it is generated only once
+        if self._address_signature is None:
+            address = self._api_key.lower()
+            structured_data = messages.encode_defunct(text=address)
+            self._address_signature = self.sign_inner(structured_data)
+        request_params["signature"] = self._address_signature
         return request_params
 
     def header_for_authentication(self) -> Dict[str, Any]:
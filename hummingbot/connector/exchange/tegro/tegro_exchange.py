@@ -15,6 +15,7 @@ from hummingbot.connector.exchange.tegro.tegro_api_user_stream_data_source impor
 from hummingbot.connector.exchange.tegro.tegro_auth import TegroAuth
 from hummingbot.connector.exchange.tegro.tegro_messages import encode_typed_data
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.signing_service import SigningService
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -247,7 +248,7 @@ class TegroExchange(ExchangePyBase):
         transaction_data = await self._generate_typed_data(amount, order_type, price, trade_type, trading_pair)
         s = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
         symbol: str = s.replace('-', '_')
-        signature = self.sign_inner(transaction_data)
+        signature = await SigningService.get_instance().sign(self.sign_inner, transaction_data, label=self.name)
         api_params = {
             "chain_id": self.chain,
             "base_asset": transaction_data["limit_order"]["base_asset"],
@@ -325,7 +326,7 @@ class TegroExchange(ExchangePyBase):
                 is_auth_required=False,
                 limit_id=CONSTANTS.GENERATE_ORDER_URL,
             )
-            return self.sign_inner(data)
+            return await SigningService.get_instance().sign(self.sign_inner, data, label=self.name)
         except IOError as e:
             error_description = str(e)
             is_not_active = ("Orders not found" in error_description)
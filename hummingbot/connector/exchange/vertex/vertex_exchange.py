@@ -16,6 +16,7 @@ from hummingbot.connector.exchange.vertex.vertex_api_order_book_data_source impo
 from hummingbot.connector.exchange.vertex.vertex_api_user_stream_data_source import VertexAPIUserStreamDataSource
 from hummingbot.connector.exchange.vertex.vertex_auth import VertexAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.signing_service import SigningBatcher
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -56,6 +57,8 @@ class VertexExchange(ExchangePyBase):
         self._contracts = {}
         self._chain_id = CONSTANTS.CHAIN_IDS[self.domain]
         super().__init__(client_config_map)
+        # The orders and cancels created at once (batches, cancel all) are signed in a single job of the signing service
+        self._signing_batcher = SigningBatcher(self.authenticator.sign_payload, label=self.name)
 
     @staticmethod
     def vertex_order_type(order_type: OrderType) -> str:
@@ -228,7 +231,7 @@ class VertexExchange(ExchangePyBase):
             sender=sender, priceX18=int(price_str), amount=int(amount_str), expiration=int(expiration), nonce=nonce
         )
 
-        signature, digest = self.authenticator.sign_payload(order, contract, self._chain_id)
+        signature, digest = await self._signing_batcher.sign(order, contract, self._chain_id)
 
         place_order = {
             "place_order": {
@@ -282,7 +285,7 @@ class VertexExchange(ExchangePyBase):
         cancel = vertex_eip712_structs.Cancellation(
             sender=sender, productIds=[int(product_id)], digests=[order_id_bytes], nonce=nonce
         )
-        signature, digest = self.authenticator.sign_payload(cancel, endpoint_contract, self._chain_id)
+        signature, digest = await self._signing_batcher.sign(cancel, endpoint_contract, self._chain_id)
 
         cancel_orders = {
             "cancel_orders": {
@@ -102,6 +102,15 @@ REQUEST_ORDERBOOK_INTERVAL = 3
 # Client refresh interval
 CLIENT_REFRESH_INTERVAL = 60
 
+# Persistent clients used to submit transactions
+SUBMISSION_CLIENT_POOL_SIZE = 2
+
+# Maximum time a transaction waits for the transactions with lower sequence numbers to be submitted
+SUBMISSION_TURN_TIMEOUT = 10
+
+# Maximum times a transaction is prepared with a new sequence after a transaction with a lower sequence failed
+SUBMISSION_MAX_ATTEMPTS = 3
+
 # Markets list
 MARKETS = {
     "XRP-USD": {
@@ -43,6 +43,8 @@ from hummingbot.connector.exchange.xrpl.xrpl_api_order_book_data_source import X
 from hummingbot.connector.exchange.xrpl.xrpl_api_user_stream_data_source import XRPLAPIUserStreamDataSource
 from hummingbot.connector.exchange.xrpl.xrpl_auth import XRPLAuth
 from hummingbot.connector.exchange.xrpl.xrpl_utils import (
+    XRPLAccountSequence,
+    XRPLClientPool,
     XRPLMarket,
     _wait_for_final_transaction_outcome,
     autofill,
@@ -50,6 +52,7 @@ from hummingbot.connector.exchange.xrpl.xrpl_utils import (
     get_token_from_changes,
 )
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.signing_service import SigningService
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
@@ -86,17 +89,18 @@ class XrplExchange(ExchangePyBase):
         self._wss_node_url = wss_node_url
         self._wss_second_node_url = wss_second_node_url
         self._wss_third_node_url = wss_third_node_url
-        # self._xrpl_place_order_client = AsyncWebsocketClient(self._wss_node_url)
+        self._xrpl_submission_client_pool = XRPLClientPool(self._wss_node_url, CONSTANTS.SUBMISSION_CLIENT_POOL_SIZE)
+        self._xrpl_second_node_client_pool = XRPLClientPool(self._wss_second_node_url)
         self._xrpl_query_client = AsyncWebsocketClient(self._wss_second_node_url)
         self._xrpl_order_book_data_client = AsyncWebsocketClient(self._wss_second_node_url)
         self._xrpl_user_stream_client = AsyncWebsocketClient(self._wss_third_node_url)
         self._trading_required = trading_required
         self._trading_pairs = trading_pairs
         self._auth: XRPLAuth = self.authenticator
+        self._xrpl_account_sequence = XRPLAccountSequence(self._auth.get_account())
         self._trading_pair_symbol_map: Optional[Mapping[str, str]] = None
         self._trading_pair_fee_rules: Dict[str, Dict[str, Any]] = {}
         self._xrpl_query_client_lock = asyncio.Lock()
-        self._xrpl_place_order_client_lock = asyncio.Lock()
         self._xrpl_fetch_trades_client_lock = asyncio.Lock()
         self._nonce_creator = NonceCreator.for_microseconds()
         self._custom_markets = custom_markets or {}
@@ -352,21 +356,17 @@ class XrplExchange(ExchangePyBase):
             o_id = None
 
             while retry < CONSTANTS.PLACE_ORDER_MAX_RETRY:
-                async with self._xrpl_place_order_client_lock:
-                    async with AsyncWebsocketClient(self._wss_node_url) as client:
-                        filled_tx = await self.tx_autofill(request, client)
-                        signed_tx = self.tx_sign(filled_tx, self._auth.get_wallet())
-                        o_id = f"{signed_tx.sequence}-{signed_tx.last_ledger_sequence}"
-                        submit_response = await self.tx_submit(signed_tx, client)
-                        transact_time = time.time()
-                        prelim_result = submit_response.result["engine_result"]
-
-                        submit_data = {"transaction": signed_tx, "prelim_result": prelim_result}
-
-                    if prelim_result[0:3] != "tes" and prelim_result != "terQUEUED":
-                        error_message = submit_response.result["engine_result_message"]
-                        self.logger().error(f"{prelim_result}: {error_message}, data: {submit_response}")
-                        raise Exception(f"Failed to place order {order_id} ({o_id})")
+                signed_tx, submit_response = await self._submit_transaction(request)
+                o_id = f"{signed_tx.sequence}-{signed_tx.last_ledger_sequence}"
+                transact_time = time.time()
+                prelim_result = submit_response.result["engine_result"]
+
+                submit_data = {"transaction": signed_tx, "prelim_result": prelim_result}
+
+                if prelim_result[0:3] != "tes" and prelim_result != "terQUEUED":
+                    error_message = submit_response.result["engine_result_message"]
+                    self.logger().error(f"{prelim_result}: {error_message}, data: {submit_response}")
+                    raise Exception(f"Failed to place order {order_id} ({o_id})")
 
                 if retry == 0:
                     order_update: OrderUpdate = OrderUpdate(
@@ -498,33 +498,28 @@ class XrplExchange(ExchangePyBase):
             return False, {}
 
         try:
-            # await self._client_health_check()
-            async with self._xrpl_place_order_client_lock:
-                async with AsyncWebsocketClient(self._wss_node_url) as client:
-                    sequence, _ = exchange_order_id.split("-")
-                    memo = Memo(
-                        memo_data=convert_string_to_hex(order_id, padding=False),
-                    )
-                    request = OfferCancel(account=self._auth.get_account(), offer_sequence=int(sequence), memos=[memo])
-
-                    filled_tx = await self.tx_autofill(request, client)
-                    signed_tx = self.tx_sign(filled_tx, self._auth.get_wallet())
+            sequence, _ = exchange_order_id.split("-")
+            memo = Memo(
+                memo_data=convert_string_to_hex(order_id, padding=False),
+            )
+            request = OfferCancel(account=self._auth.get_account(), offer_sequence=int(sequence), memos=[memo])
 
-                    submit_response = await self.tx_submit(signed_tx, client)
-                    prelim_result = submit_response.result["engine_result"]
+            signed_tx, submit_response = await self._submit_transaction(request)
+            prelim_result = submit_response.result["engine_result"]
 
-                if prelim_result is None:
-                    raise Exception(
-                        f"prelim_result is None for {order_id} ({exchange_order_id}), data: {submit_response}"
-                    )
+            if prelim_result is None:
+                raise Exception(
+                    f"prelim_result is None for {order_id} ({exchange_order_id}), data: {submit_response}"
+                )
 
-                if prelim_result[0:3] != "tes":
-                    error_message = submit_response.result["engine_result_message"]
-                    raise Exception(f"{prelim_result}: {error_message}, data: {submit_response}")
+            if prelim_result[0:3] != "tes":
+                error_message = submit_response.result["engine_result_message"]
+                raise Exception(f"{prelim_result}: {error_message}, data: {submit_response}")
 
-                cancel_result = True
-                cancel_data = {"transaction": signed_tx, "prelim_result": prelim_result}
-                await self._sleep(0.3)
+            cancel_result = True
+            cancel_data = {"transaction": signed_tx, "prelim_result": prelim_result}
+            # Gives the node time to apply the cancel before its result is verified
+            await self._sleep(0.3)
 
         except Exception as e:
             self.logger().error(
@@ -1229,11 +1224,9 @@ class XrplExchange(ExchangePyBase):
                     forward=is_forward,
                 )
 
-                client_one = AsyncWebsocketClient(self._wss_node_url)
-                client_two = AsyncWebsocketClient(self._wss_second_node_url)
                 tasks = [
-                    self.request_with_retry(client_one, request, 5),
-                    self.request_with_retry(client_two, request, 5),
+                    self.pooled_request_with_retry(self._xrpl_submission_client_pool, request, 5),
+                    self.pooled_request_with_retry(self._xrpl_second_node_client_pool, request, 5),
                 ]
                 task_results = await safe_gather(*tasks, return_exceptions=True)
 
@@ -1473,6 +1466,11 @@ class XrplExchange(ExchangePyBase):
         except Exception as e:
             self.logger().exception(f"There was an error requesting exchange info: {e}")
 
+    async def stop_network(self):
+        await super().stop_network()
+        await self._xrpl_submission_client_pool.close()
+        await self._xrpl_second_node_client_pool.close()
+
     async def _make_network_check_request(self):
         await self._xrpl_query_client.open()
 
@@ -1634,13 +1632,63 @@ class XrplExchange(ExchangePyBase):
 
         raise XRPLRequestFailureException(response.result)
 
+    async def _submit_transaction(self, transaction: Transaction) -> Tuple[Transaction, Response]:
+        """
+        Autofills, signs and submits a transaction using a persistent client. The account sequence is assigned
+        locally, so several transactions can be prepared concurrently while being submitted in sequence order.
+        When a transaction with a lower sequence fails, the transaction is prepared again with a new sequence.
+
+        :return: the signed transaction and the submission response
+        """
+        client = await self._xrpl_submission_client_pool.get_client()
+        for attempt in range(CONSTANTS.SUBMISSION_MAX_ATTEMPTS):
+            sequence = await self._xrpl_account_sequence.reserve(client)
+            failed = True
+            try:
+                sequenced_tx = Transaction.from_dict({**transaction.to_dict(), "sequence": sequence})
+                filled_tx = await self.tx_autofill(sequenced_tx, client)
+                signed_tx = await SigningService.get_instance().sign(
+                    self.tx_sign, filled_tx, self._auth.get_wallet(), label=self.name
+                )
+                is_last_attempt = attempt == CONSTANTS.SUBMISSION_MAX_ATTEMPTS - 1
+                if not await self._xrpl_account_sequence.wait_for_submission_turn(sequence) and not is_last_attempt:
+                    # The node would reject the transaction (terPRE_SEQ), the sequence is released without failure
+                    failed = False
+                    continue
+                submit_response = await self.tx_submit(signed_tx, client)
+                prelim_result = submit_response.result.get("engine_result") or ""
+                # tec results use the sequence, the transactions with higher sequences remain valid
+                failed = prelim_result[0:3] not in ("tes", "tec") and prelim_result != "terQUEUED"
+                return signed_tx, submit_response
+            finally:
+                await self._xrpl_account_sequence.release(sequence, failed=failed)
+
     async def wait_for_final_transaction_outcome(self, transaction, prelim_result) -> Response:
-        async with AsyncWebsocketClient(self._wss_node_url) as client:
-            resp = await _wait_for_final_transaction_outcome(
-                transaction.get_hash(), client, prelim_result, transaction.last_ledger_sequence
-            )
+        client = await self._xrpl_submission_client_pool.get_client()
+        resp = await _wait_for_final_transaction_outcome(
+            transaction.get_hash(), client, prelim_result, transaction.last_ledger_sequence
+        )
         return resp
 
+    async def pooled_request_with_retry(
+        self,
+        client_pool: XRPLClientPool,
+        request: Request,
+        max_retries: int = 3,
+    ) -> Optional[Response]:
+        try:
+            client = await client_pool.get_client()
+            return await client.request(request)
+        except (TimeoutError, asyncio.exceptions.TimeoutError) as e:
+            self.logger().debug(f"Request {request} timeout error: {e}")
+            if max_retries > 0:
+                await self._sleep(CONSTANTS.REQUEST_RETRY_INTERVAL)
+                return await self.pooled_request_with_retry(client_pool, request, max_retries - 1)
+            else:
+                self.logger().error(f"Max retries reached. Request {request} failed due to timeout.")
+        except Exception as e:
+            self.logger().error(f"Request {request} to {client_pool.node_url} failed: {e}")
+
     async def request_with_retry(
         self,
         client: AsyncWebsocketClient,
@@ -3,11 +3,11 @@ import binascii
 from dataclasses import dataclass, field
 from decimal import Decimal
 from random import randrange
-from typing import Any, Dict, Final, List, Optional, cast
+from typing import Any, Dict, Final, List, Optional, Set, cast
 
 from pydantic import BaseModel, Field, SecretStr, validator
 from xrpl.asyncio.account import get_next_valid_seq_number
-from xrpl.asyncio.clients import Client, XRPLRequestFailureException
+from xrpl.asyncio.clients import AsyncWebsocketClient, Client, XRPLRequestFailureException
 from xrpl.asyncio.transaction import XRPLReliableSubmissionException
 from xrpl.asyncio.transaction.main import (
     _LEDGER_OFFSET,
@@ -296,6 +296,131 @@ async def _wait_for_final_transaction_outcome(
     return await _wait_for_final_transaction_outcome(transaction_hash, client, prelim_result, last_ledger_sequence)
 
 
+class XRPLClientPool:
+    """
+    Persistent websocket clients connected to one node. The clients are used in turns and shared by concurrent
+    requests (the websocket client matches the responses with the requests), avoiding a new connection and TLS
+    handshake for every request. A client whose connection is lost is replaced by a new one on its next use.
+    """
+
+    def __init__(self, node_url: str, size: int = 1):
+        self._node_url = node_url
+        self._clients: List[Optional[AsyncWebsocketClient]] = [None] * size
+        self._open_locks: List[asyncio.Lock] = [asyncio.Lock() for _ in range(size)]
+        self._next_index = 0
+
+    @property
+    def node_url(self) -> str:
+        return self._node_url
+
+    async def get_client(self) -> AsyncWebsocketClient:
+        index = self._next_index
+        self._next_index = (index + 1) % len(self._clients)
+        async with self._open_locks[index]:
+            client = self._clients[index]
+            if client is None or not client.is_open():
+                client = self._create_client()
+                await client.open()
+                client._websocket.max_size = 2**23
+                self._clients[index] = client
+        return client
+
+    async def close(self):
+        for index, client in enumerate(self._clients):
+            self._clients[index] = None
+            if client is not None and client.is_open():
+                await client.close()
+
+    def _create_client(self) -> AsyncWebsocketClient:
+        return AsyncWebsocketClient(self._node_url)
+
+
+class XRPLAccountSequence:
+    """
+    Hands out the sequence numbers of an account locally, so several transactions can be autofilled and signed
+    concurrently. Each transaction waits for the ones with lower sequence numbers before being submitted.
+    When a transaction fails without using its sequence, the node would reject the ones with higher sequences
+    (terPRE_SEQ), so the sequences reserved after it are invalidated and their transactions have to be prepared again.
+    The next sequence is then fetched again from the ledger once no other reserved sequence is waiting to be
+    submitted, and no sequence is handed out until then.
+    """
+
+    def __init__(self, account: str, submission_turn_timeout: float = CONSTANTS.SUBMISSION_TURN_TIMEOUT):
+        self._account = account
+        self._submission_turn_timeout = submission_turn_timeout
+        self._next_sequence: Optional[int] = None
+        self._unsubmitted: Set[int] = set()
+        self._invalidated: Set[int] = set()
+        self._resync_required = False
+        self._reserve_lock = asyncio.Lock()
+        self._submission_condition = asyncio.Condition()
+
+    async def reserve(self, client: Client) -> int:
+        async with self._reserve_lock:
+            await self._wait_for_resync()
+            if self._next_sequence is None:
+                ledger_next_sequence = await self._fetch_next_sequence(client)
+                # The ledger doesn't know yet the sequences handed out but not submitted
+                self._next_sequence = max([ledger_next_sequence] + [seq + 1 for seq in self._unsubmitted])
+            sequence = self._next_sequence
+            self._next_sequence += 1
+            self._unsubmitted.add(sequence)
+            return sequence
+
+    async def wait_for_submission_turn(self, sequence: int) -> bool:
+        """
+        Waits for the transactions with lower sequences to be submitted.
+
+        :return: False if the sequence was invalidated by a failed transaction, the transaction has to be prepared
+        again with a new sequence
+        """
+        async with self._submission_condition:
+            try:
+                await asyncio.wait_for(
+                    self._submission_condition.wait_for(
+                        lambda: sequence in self._invalidated or min(self._unsubmitted, default=sequence) >= sequence
+                    ),
+                    timeout=self._submission_turn_timeout,
+                )
+            except asyncio.TimeoutError:
+                # A lower sequence is taking too long. The transaction is submitted anyway, the node queues or
+                # rejects it if the lower sequence never arrives.
+                pass
+            return sequence not in self._invalidated
+
+    async def release(self, sequence: int, failed: bool = False):
+        """
+        Marks a reserved sequence as submitted, or abandoned if the transaction failed without using it.
+        """
+        async with self._submission_condition:
+            self._unsubmitted.discard(sequence)
+            self._invalidated.discard(sequence)
+            if failed:
+                self._resync_required = True
+                self._invalidated.update(pending for pending in self._unsubmitted if pending > sequence)
+            # Fetching the next sequence while higher ones are still pending could hand out one of them again
+            if self._resync_required and len(self._unsubmitted) == 0:
+                self._next_sequence = None
+                self._resync_required = False
+            self._submission_condition.notify_all()
+
+    async def _wait_for_resync(self):
+        async with self._submission_condition:
+            try:
+                await asyncio.wait_for(
+                    self._submission_condition.wait_for(lambda: not self._resync_required),
+                    timeout=self._submission_turn_timeout,
+                )
+            except asyncio.TimeoutError:
+                # A reserved sequence is taking too long to be released. The next sequence is fetched again anyway,
+                # skipping the sequences still reserved.
+                self._next_sequence = None
+                self._resync_required = False
+
+    async def _fetch_next_sequence(self, client: Client) -> int:
+        return await get_next_valid_seq_number(self._account, client)
+
+
 class XRPLConfigMap(BaseConnectorConfigMap):
     connector: str = Field(default="xrpl", const=True, client_data=None)
     xrpl_secret_key: SecretStr = Field(
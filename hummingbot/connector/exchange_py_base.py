@@ -4,7 +4,7 @@ import logging
 import math
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from async_timeout import timeout
 
@@ -28,23 +28,33 @@ from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.latency_tracer import LatencyTracer
+from hummingbot.core.utils.trading_pair_cache import TradingPairCache
 from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.connection_pool import HTTPConnectionPoolStats
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+from hummingbot.core.web_assistant.rest_endpoint_router import RESTEndpointRouter
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
 
+latency_tracer = LatencyTracer.get_instance()
+
 
 class ExchangePyBase(ExchangeBase, ABC):
     _logger = None
+    _trading_pair_cache: Optional[TradingPairCache] = None
 
     SHORT_POLL_INTERVAL = 5.0
     LONG_POLL_INTERVAL = 120.0
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Maximum number of orders whose status or fills are requested at the same time
+    ORDER_UPDATES_MAX_CONCURRENCY = 10
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -70,9 +80,15 @@ class ExchangePyBase(ExchangeBase, ABC):
         # init Auth and Api factory
         self._auth: AuthBase = self.authenticator
         self._web_assistants_factory: WebAssistantsFactory = self._create_web_assistants_factory()
+        if self._web_assistants_factory is not None:
+            self._web_assistants_factory.connection_pool_settings = (
+                client_config_map.http_connection_pool.get_connection_pool_settings())
+        self._rest_endpoint_router: Optional[RESTEndpointRouter] = self._create_rest_endpoint_router(
+            client_config_map)
 
         # init OrderBook Data Source and Tracker
         self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
+        self._orderbook_ds.ws_trading_pairs_per_connection = client_config_map.ws_trading_pairs_per_connection
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
@@ -165,6 +181,27 @@ class ExchangePyBase(ExchangeBase, ABC):
     def limit_orders(self) -> List[LimitOrder]:
         return [in_flight_order.to_limit_order() for in_flight_order in self.in_flight_orders.values()]
 
+    @property
+    def rest_endpoint_base_urls(self) -> List[str]:
+        """
+        The equivalent base URLs of the REST API, the first one being the URL the requests are built with.
+        The requests are routed to the fastest of them when the REST endpoint selection is enabled.
+        """
+        return []
+
+    @property
+    def rest_endpoint_router(self) -> Optional[RESTEndpointRouter]:
+        return self._rest_endpoint_router
+
+    @property
+    def http_connection_pool_stats(self) -> Optional[HTTPConnectionPoolStats]:
+        """
+        :return: the reuse statistics of the HTTP connections, None for the connectors not using the web assistants
+        """
+        if self._web_assistants_factory is None:
+            return None
+        return self._web_assistants_factory.connection_pool_stats
+
     @property
     def status_dict(self) -> Dict[str, bool]:
         return {
@@ -280,6 +317,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
+        latency_tracer.order_submitted(order_id)
         safe_ensure_future(self._create_order(
             trade_type=TradeType.BUY,
             order_id=order_id,
@@ -310,6 +348,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
+        latency_tracer.order_submitted(order_id)
         safe_ensure_future(self._create_order(
             trade_type=TradeType.SELL,
             order_id=order_id,
@@ -903,7 +942,8 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         for _ in range(2):
             try:
-                request_result = await rest_assistant.execute_request(
+                request_result = await self._execute_api_request(
+                    rest_assistant=rest_assistant,
                     url=url,
                     params=params,
                     data=data,
@@ -925,6 +965,11 @@ class ExchangePyBase(ExchangeBase, ABC):
         # Failed even after the last retry
         raise last_exception
 
+    async def _execute_api_request(self, rest_assistant: RESTAssistant, url: str, **kwargs) -> Dict[str, Any]:
+        if self._rest_endpoint_router is not None:
+            return await self._rest_endpoint_router.execute_request(rest_assistant=rest_assistant, url=url, **kwargs)
+        return await rest_assistant.execute_request(url=url, **kwargs)
+
     async def _status_polling_loop_fetch_updates(self):
         """
         Called by _status_polling_loop, which executes after each tick() is executed
@@ -950,18 +995,47 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
+        orders_to_update = orders
+        if len(orders) > 0:
             try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
-                for trade_update in trade_updates:
-                    self._order_tracker.process_trade_update(trade_update)
+                bulk_trade_updates = await self._request_bulk_trade_updates(orders=orders)
             except asyncio.CancelledError:
                 raise
             except Exception as request_error:
                 self.logger().warning(
-                    f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
+                    f"Failed to fetch the trade updates of several orders at once. Error: {request_error}",
                     exc_info=request_error,
                 )
+                bulk_trade_updates = {}
+            for trade_updates in bulk_trade_updates.values():
+                for trade_update in trade_updates:
+                    self._order_tracker.process_trade_update(trade_update)
+            orders_to_update = [order for order in orders if order.client_order_id not in bulk_trade_updates]
+
+        await self._run_with_order_updates_concurrency_limit(
+            [self._update_order_fills(order=order) for order in orders_to_update])
+
+    async def _update_order_fills(self, order: InFlightOrder):
+        try:
+            trade_updates = await self._all_trade_updates_for_order(order=order)
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
+                exc_info=request_error,
+            )
+
+    async def _run_with_order_updates_concurrency_limit(self, coroutines: List[Awaitable]):
+        semaphore = asyncio.Semaphore(self.ORDER_UPDATES_MAX_CONCURRENCY)
+
+        async def run_with_semaphore(coroutine: Awaitable):
+            async with semaphore:
+                await coroutine
+
+        await safe_gather(*[run_with_semaphore(coroutine) for coroutine in coroutines])
 
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
@@ -990,14 +1064,34 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the lost order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
-        for order in orders:
+        orders_to_update = orders
+        if len(orders) > 0:
             try:
-                order_update = await self._request_order_status(tracked_order=order)
-                self._order_tracker.process_order_update(order_update)
+                bulk_order_updates = await self._request_bulk_order_status(tracked_orders=orders)
             except asyncio.CancelledError:
                 raise
             except Exception as request_error:
-                await error_handler(order, request_error)
+                self.logger().warning(
+                    f"Failed to fetch the status of several orders at once. Error: {request_error}",
+                    exc_info=request_error,
+                )
+                bulk_order_updates = {}
+            for order_update in bulk_order_updates.values():
+                self._order_tracker.process_order_update(order_update)
+            orders_to_update = [order for order in orders if order.client_order_id not in bulk_order_updates]
+
+        await self._run_with_order_updates_concurrency_limit(
+            [self._update_order_with_error_handler(order=order, error_handler=error_handler)
+             for order in orders_to_update])
+
+    async def _update_order_with_error_handler(self, order: InFlightOrder, error_handler: Callable):
+        try:
+            order_update = await self._request_order_status(tracked_order=order)
+            self._order_tracker.process_order_update(order_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            await error_handler(order, request_error)
 
     async def _update_orders(self):
         orders_to_update = self.in_flight_orders.copy()
@@ -1049,6 +1143,31 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _request_bulk_trade_updates(self, orders: List[InFlightOrder]) -> Dict[str, List[TradeUpdate]]:
+        """
+        Fetches the fills of several orders at once, for the exchanges with a bulk "recent fills" endpoint.
+        The orders missing from the result have their fills requested one by one.
+
+        :return: the trade updates by client order id, only for the orders whose fills are all known
+        """
+        return {}
+
+    async def _request_bulk_order_status(self, tracked_orders: List[InFlightOrder]) -> Dict[str, OrderUpdate]:
+        """
+        Fetches the status of several orders at once, for the exchanges with a bulk "open orders" endpoint.
+        The orders missing from the result have their status requested one by one.
+
+        :return: the order updates by client order id
+        """
+        return {}
+
+    def _create_rest_endpoint_router(self, client_config_map: "ClientConfigAdapter") -> Optional[RESTEndpointRouter]:
+        endpoint_selection = client_config_map.rest_endpoint_selection
+        base_urls = self.rest_endpoint_base_urls
+        if not endpoint_selection.rest_endpoint_selection_enabled or len(base_urls) < 2:
+            return None
+        return RESTEndpointRouter(base_urls=base_urls, hedging_delay=endpoint_selection.rest_request_hedging_delay)
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
@@ -1068,10 +1187,47 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _create_order_tracker(self) -> ClientOrderTracker:
         return ClientOrderTracker(connector=self)
 
+    def set_trading_pair_cache(self, trading_pair_cache: Optional[TradingPairCache]):
+        """
+        Configures the on-disk cache used to warm start the trading pair symbol map. Every symbol map initialized from
+        the exchange info is stored in the cache, along with the exchange info.
+
+        :param trading_pair_cache: the cache to use, or None to disable it
+        """
+        self._trading_pair_cache = trading_pair_cache
+
+    async def _store_trading_pair_symbol_map(self, exchange_info: Any):
+        if self._trading_pair_cache is not None and self.trading_pair_symbol_map_ready():
+            # The exchange info is stored first, so a symbol map is never cached without it
+            self._trading_pair_cache.save_exchange_info(self.name, exchange_info)
+            self._trading_pair_cache.save_symbol_map(self.name, await self.trading_pair_symbol_map())
+
+    def _warm_start_trading_pair_symbol_map(self) -> bool:
+        if self._trading_pair_cache is None:
+            return False
+        entry = self._trading_pair_cache.load_fresh(self.name)
+        if entry is None or len(entry.symbol_map) == 0:
+            return False
+        exchange_info = self._trading_pair_cache.load_exchange_info(self.name)
+        if exchange_info is None:
+            return False
+        # Replaying the cached exchange info also restores the other state the connector derives from it
+        try:
+            self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
+        except Exception:
+            self.logger().debug("Could not initialize the trading pair symbols from the cached exchange info.",
+                                exc_info=True)
+            self._set_trading_pair_symbol_map(None)
+            return False
+        return self.trading_pair_symbol_map_ready()
+
     async def _initialize_trading_pair_symbol_map(self):
+        if self._warm_start_trading_pair_symbol_map():
+            return
         try:
             exchange_info = await self._make_trading_pairs_request()
             self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
+            await self._store_trading_pair_symbol_map(exchange_info)
         except Exception:
             self.logger().exception("There was an error requesting exchange info.")
 
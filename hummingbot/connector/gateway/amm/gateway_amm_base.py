@@ -1,10 +1,13 @@
 import asyncio
 import copy
+import functools
 import itertools as it
 import logging
 import time
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, cast
+
+from cachetools import TTLCache
 
 from hummingbot.client.settings import GatewayConnectionSetting
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
@@ -18,8 +21,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils import async_ttl_cache
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.logger import HummingbotLogger
 
@@ -39,6 +41,8 @@ class GatewayAMMBase(ConnectorBase):
     API_CALL_TIMEOUT = 10.0
     POLL_INTERVAL = 1.0
     UPDATE_BALANCE_INTERVAL = 30.0
+    QUOTE_PRICE_CACHE_TTL = 5.0
+    QUOTE_PRICE_CACHE_SIZE = 100
 
     _connector_name: str
     _name: str
@@ -60,6 +64,8 @@ class GatewayAMMBase(ConnectorBase):
     _order_tracker: ClientOrderTracker
     _native_currency: str
     _amount_quantum_dict: Dict[str, Decimal]
+    _quote_price_cache: TTLCache
+    _quote_price_requests: Dict[Tuple[str, bool, Decimal, bool], asyncio.Future]
 
     def __init__(self,
                  client_config_map: "ClientConfigAdapter",
@@ -100,6 +106,8 @@ class GatewayAMMBase(ConnectorBase):
         self._native_currency = None
         self._order_tracker: ClientOrderTracker = ClientOrderTracker(connector=self, lost_order_count_limit=10)
         self._amount_quantum_dict = {}
+        self._quote_price_cache = TTLCache(maxsize=self.QUOTE_PRICE_CACHE_SIZE, ttl=self.QUOTE_PRICE_CACHE_TTL)
+        self._quote_price_requests = {}
         safe_ensure_future(self.load_token_data())
 
     @classmethod
@@ -234,7 +242,6 @@ class GatewayAMMBase(ConnectorBase):
                 app_warning_msg=str(e)
             )
 
-    @async_ttl_cache(ttl=5, maxsize=10)
     async def get_quote_price(
             self,
             trading_pair: str,
@@ -244,6 +251,8 @@ class GatewayAMMBase(ConnectorBase):
     ) -> Optional[Decimal]:
         """
         Retrieves a quote price.
+        Quotes are cached for QUOTE_PRICE_CACHE_TTL seconds, and concurrent requests for the same quote share a single
+        gateway request.
 
         :param trading_pair: The market trading pair
         :param is_buy: True for an intention to buy, False for an intention to sell
@@ -251,6 +260,53 @@ class GatewayAMMBase(ConnectorBase):
         :param ignore_shim: Ignore the price shim, and return the real price on the network
         :return: The quote price.
         """
+        key = (trading_pair, is_buy, Decimal(amount), ignore_shim)
+        if key in self._quote_price_cache:
+            return self._quote_price_cache[key]
+        request = self._quote_price_requests.get(key)
+        if request is None:
+            request = safe_ensure_future(self._request_quote_price(trading_pair, is_buy, amount, ignore_shim))
+            request.add_done_callback(functools.partial(self._quote_price_request_done, key))
+            self._quote_price_requests[key] = request
+        # The request is shielded so a cancelled caller does not cancel it for the other callers waiting for it
+        return await asyncio.shield(request)
+
+    async def get_quote_price_ladder(
+            self,
+            trading_pair: str,
+            is_buy: bool,
+            amounts: List[Decimal],
+            ignore_shim: bool = False
+    ) -> Dict[Decimal, Optional[Decimal]]:
+        """
+        Retrieves the quote prices for several amounts at once.
+        Repeated amounts and amounts already quoted or being quoted don't generate new gateway requests.
+
+        :param trading_pair: The market trading pair
+        :param is_buy: True for an intention to buy, False for an intention to sell
+        :param amounts: The amounts required (in base token unit)
+        :param ignore_shim: Ignore the price shim, and return the real prices on the network
+        :return: A dictionary with the quote price for each amount.
+        """
+        unique_amounts: List[Decimal] = list(dict.fromkeys(Decimal(amount) for amount in amounts))
+        prices: List[Optional[Decimal]] = await safe_gather(*[
+            self.get_quote_price(trading_pair, is_buy, amount, ignore_shim=ignore_shim) for amount in unique_amounts
+        ])
+        return dict(zip(unique_amounts, prices))
+
+    def _quote_price_request_done(self, key: Tuple[str, bool, Decimal, bool], request: asyncio.Future):
+        if self._quote_price_requests.get(key) is request:
+            del self._quote_price_requests[key]
+        if not request.cancelled() and request.exception() is None:
+            self._quote_price_cache[key] = request.result()
+
+    async def _request_quote_price(
+            self,
+            trading_pair: str,
+            is_buy: bool,
+            amount: Decimal,
+            ignore_shim: bool
+    ) -> Optional[Decimal]:
         pool_id = None
 
         try:
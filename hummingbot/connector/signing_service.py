@@ -0,0 +1,283 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, List, NamedTuple, Optional, Tuple, TypeVar
+
+from eth_abi import encode
+from eth_account.messages import SignableMessage
+from eth_utils import keccak
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+T = TypeVar("T")
+
+
+class EIP712StructHasher:
+    """
+    Builds the EIP-712 signable message of typed data whose domain and types never change. The domain separator and
+    the type hash are computed once, so each signature only encodes the message fields.
+    Only structs with atomic, string and bytes fields are supported.
+    """
+
+    def __init__(self, domain: Dict[str, Any], types: Dict[str, List[Dict[str, str]]], primary_type: str):
+        self._primary_type = primary_type
+        self._fields: List[Dict[str, str]] = types[primary_type]
+        self._validate_fields(types["EIP712Domain"])
+        self._validate_fields(self._fields)
+        self._type_hash: bytes = keccak(text=self._encode_type(primary_type, self._fields))
+        domain_type_hash = keccak(text=self._encode_type("EIP712Domain", types["EIP712Domain"]))
+        self._domain_separator: bytes = keccak(
+            domain_type_hash + self._encode_values(types["EIP712Domain"], domain)
+        )
+
+    @property
+    def domain_separator(self) -> bytes:
+        return self._domain_separator
+
+    @property
+    def type_hash(self) -> bytes:
+        return self._type_hash
+
+    def hash_struct(self, message: Dict[str, Any]) -> bytes:
+        return keccak(self._type_hash + self._encode_values(self._fields, message))
+
+    def signable_message(self, message: Dict[str, Any]) -> SignableMessage:
+        return SignableMessage(version=b"\x01", header=self._domain_separator, body=self.hash_struct(message))
+
+    @staticmethod
+    def _validate_fields(fields: List[Dict[str, str]]):
+        for field in fields:
+            field_type = field["type"]
+            if field_type.endswith("]") or field_type[0].isupper():
+                raise NotImplementedError(f"The EIP-712 field type {field_type} is not supported.")
+
+    @staticmethod
+    def _encode_type(type_name: str, fields: List[Dict[str, str]]) -> str:
+        fields_description = ",".join(f"{field['type']} {field['name']}" for field in fields)
+        return f"{type_name}({fields_description})"
+
+    @staticmethod
+    def _encode_values(fields: List[Dict[str, str]], values: Dict[str, Any]) -> bytes:
+        encoded = b""
+        for field in fields:
+            field_type = field["type"]
+            value = values[field["name"]]
+            if field_type == "string":
+                encoded += keccak(text=value)
+            elif field_type == "bytes":
+                encoded += keccak(hexstr=value) if isinstance(value, str) else keccak(value)
+            else:
+                if field_type.startswith("bytes") and isinstance(value, str):
+                    value = bytes.fromhex(value[2:] if value.startswith("0x") else value)
+                encoded += encode([field_type], [value])
+        return encoded
+
+
+class SigningLatencyStats(NamedTuple):
+    count: int
+    mean: float
+    max: float
+    last: float
+
+
+def timed_call(sign_fn: Callable[..., T], args: Tuple) -> Tuple[T, float]:
+    """
+    Runs a signature function in a worker of the signing service.
+
+    :return: the value returned by the function and the time (in seconds) it took
+    """
+    start = time.perf_counter()
+    result = sign_fn(*args)
+    return result, time.perf_counter() - start
+
+
+def timed_batch(sign_fn: Callable[..., T], batch_args: List[Tuple]) -> List[Tuple[T, float]]:
+    """
+    Runs a signature function for each of the arguments tuples in a worker of the signing service.
+
+    :return: the value returned by the function and the time (in seconds) it took, for each arguments tuple
+    """
+    return [timed_call(sign_fn, args) for args in batch_args]
+
+
+class SigningService:
+    """
+    Runs the signature functions of the connectors on a pool of workers, so signing orders and cancels does not block
+    the event loop. Signatures run concurrently, the connectors generate the nonces on the event loop before requesting
+    them. The time spent by each signature is recorded per label.
+
+    Signers backed by C code that releases the GIL (like coincurve) run in the pool of threads. Pure Python signers
+    (like ecdsa) hold the GIL, so they can run in the pool of processes instead, as long as the function and its
+    arguments can be pickled.
+    """
+    DEFAULT_MAX_WORKERS = 4
+    DEFAULT_LATENCY_WINDOW = 1000
+
+    _shared_instance: Optional["SigningService"] = None
+
+    @classmethod
+    def get_instance(cls) -> "SigningService":
+        if cls._shared_instance is None:
+            cls._shared_instance = SigningService()
+        return cls._shared_instance
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, latency_window: int = DEFAULT_LATENCY_WINDOW):
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="signing")
+        # Created on the first signature that requires it, to not start processes for connectors that do not need them
+        self._process_executor: Optional[ProcessPoolExecutor] = None
+        self._latencies: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=latency_window))
+        self._signatures_count: Dict[str, int] = defaultdict(int)
+        self._stats_lock = threading.Lock()
+
+    async def sign(self, sign_fn: Callable[..., T], *args, label: str = "default", use_process_pool: bool = False) -> T:
+        """
+        Runs a signature function in the worker pool.
+
+        :param sign_fn: the function that generates the signature
+        :param args: the arguments for the function
+        :param label: the name used to group the latency measurements (usually the connector name)
+        :param use_process_pool: if True the function runs in the pool of processes, the function and its arguments
+        must be picklable
+        :return: the value returned by the function
+        """
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            result, latency = await loop.run_in_executor(
+                self._pool(use_process_pool), timed_call, sign_fn, args
+            )
+        except Exception:
+            self._record_latency(label, time.perf_counter() - start)
+            raise
+        self._record_latency(label, latency)
+        return result
+
+    async def sign_batch(self,
+                         sign_fn: Callable[..., T],
+                         batch_args: Iterable[Tuple],
+                         label: str = "default",
+                         use_process_pool: bool = False) -> List[T]:
+        """
+        Runs a signature function for each of the arguments tuples in a single job of the worker pool, to sign many
+        payloads at once with a single hop to the pool.
+
+        :param sign_fn: the function that generates the signature
+        :param batch_args: the arguments for each call of the function
+        :param label: the name used to group the latency measurements (usually the connector name)
+        :param use_process_pool: if True the function runs in the pool of processes, the function and its arguments
+        must be picklable
+        :return: the values returned by the function, in the same order as the arguments
+        """
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            timed_results = await loop.run_in_executor(
+                self._pool(use_process_pool), timed_batch, sign_fn, list(batch_args)
+            )
+        except Exception:
+            self._record_latency(label, time.perf_counter() - start)
+            raise
+        for _, latency in timed_results:
+            self._record_latency(label, latency)
+        return [result for result, _ in timed_results]
+
+    def latency_stats(self, label: str = "default") -> Optional[SigningLatencyStats]:
+        """
+        :return: the number of signatures and the mean, max and last latency (in seconds) of the most recent ones
+        """
+        with self._stats_lock:
+            latencies = list(self._latencies.get(label, []))
+            count = self._signatures_count.get(label, 0)
+        if len(latencies) == 0:
+            return None
+        return SigningLatencyStats(
+            count=count,
+            mean=sum(latencies) / len(latencies),
+            max=max(latencies),
+            last=latencies[-1],
+        )
+
+    def labels(self) -> List[str]:
+        """
+        :return: the labels with latency measurements
+        """
+        with self._stats_lock:
+            return sorted(label for label, latencies in self._latencies.items() if len(latencies) > 0)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+        if self._process_executor is not None:
+            self._process_executor.shutdown(wait=False)
+            self._process_executor = None
+
+    def _pool(self, use_process_pool: bool) -> Executor:
+        if not use_process_pool:
+            return self._executor
+        if self._process_executor is None:
+            # Spawned processes do not inherit the event loop and the threads of the client
+            self._process_executor = ProcessPoolExecutor(
+                max_workers=self._max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._process_executor
+
+    def _record_latency(self, label: str, latency: float):
+        with self._stats_lock:
+            self._latencies[label].append(latency)
+            self._signatures_count[label] += 1
+
+
+class SigningBatcher:
+    """
+    Groups the signatures requested during the same iteration of the event loop in a single job of the signing service.
+    The connectors that sign each order and cancel separately use it, so a batch of orders or cancels (like the ones
+    of `batch_order_create`, `batch_order_cancel` and `cancel_all`) is signed with a single hop to the worker pool.
+    """
+
+    def __init__(self,
+                 sign_fn: Callable[..., T],
+                 label: str = "default",
+                 use_process_pool: bool = False,
+                 signing_service: Optional[SigningService] = None):
+        self._sign_fn = sign_fn
+        self._label = label
+        self._use_process_pool = use_process_pool
+        self._signing_service = signing_service
+        self._pending: List[Tuple[Tuple, asyncio.Future]] = []
+
+    async def sign(self, *args) -> T:
+        """
+        Requests a signature, it is generated with all the other signatures requested during the same iteration of
+        the event loop.
+
+        :param args: the arguments for the signature function
+        :return: the value returned by the signature function
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((args, future))
+        if len(self._pending) == 1:
+            loop.call_soon(self._sign_pending)
+        return await future
+
+    def _sign_pending(self):
+        pending, self._pending = self._pending, []
+        safe_ensure_future(self._sign_batch(pending))
+
+    async def _sign_batch(self, pending: List[Tuple[Tuple, asyncio.Future]]):
+        signing_service = self._signing_service or SigningService.get_instance()
+        try:
+            results = await signing_service.sign_batch(
+                self._sign_fn, [args for args, _ in pending], label=self._label, use_process_pool=self._use_process_pool
+            )
+        except Exception as exception:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(exception)
+            return
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
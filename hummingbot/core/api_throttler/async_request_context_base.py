@@ -6,9 +6,11 @@ from decimal import Decimal
 from typing import List, Tuple
 
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.utils.latency_tracer import LatencyStage, LatencyTracer
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
+latency_tracer = LatencyTracer.get_instance()
 MAX_CAPACITY_REACHED_WARNING_INTERVAL = 30.0
 
 
@@ -67,6 +69,7 @@ class AsyncRequestContextBase(ABC):
         raise NotImplementedError
 
     async def acquire(self):
+        start_time = latency_tracer.now() if latency_tracer.enabled else None
         while True:
             async with self._lock:
                 self.flush()
@@ -86,6 +89,8 @@ class AsyncRequestContextBase(ABC):
             # Log its related limits into the tasks log as individual tasks
             for limit, weight in self._related_limits:
                 self._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
+        if start_time is not None:
+            latency_tracer.record_since(LatencyStage.THROTTLER_WAIT, start_time)
 
     async def __aenter__(self):
         await self.acquire()
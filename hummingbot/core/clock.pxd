@@ -10,3 +10,13 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        bint _skip_idle_ticks
+        object _timing_wheel
+        long long _wheel_resolution_ms
+        dict _tick_stats
+
+    cdef long long c_period_ms(self, object iterator)
+    cdef c_build_timing_wheel(self)
+    cdef c_schedule_iterator(self, object iterator, double after_time)
+    cdef c_tick_iterator(self, object iterator, double timestamp)
+    cdef double c_iterator_wakeup_time(self, object iterator, double timestamp)
@@ -2,18 +2,78 @@
 
 import asyncio
 import logging
+import math
 import time
-from typing import List
+from typing import Any, Dict, List
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.timing_wheel import TimingWheel
+from hummingbot.core.utils.latency_tracer import LatencyTracer
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
+latency_tracer = LatencyTracer.get_instance()
+
+
+class IteratorTickStats:
+    """
+    Durations of the ticks of an iterator, and how many times its next tick was already due when a tick finished
+    (an overrun), with the number of ticks skipped because of it.
+    """
+
+    def __init__(self):
+        self.ticks_count = 0
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+        self.last_duration = 0.0
+        self.overruns_count = 0
+        self.missed_ticks_count = 0
+
+    @property
+    def average_duration(self) -> float:
+        return self.total_duration / self.ticks_count if self.ticks_count > 0 else 0.0
+
+    def record_tick(self, duration: float):
+        self.ticks_count += 1
+        self.total_duration += duration
+        self.last_duration = duration
+        if duration > self.max_duration:
+            self.max_duration = duration
+
+    def record_overrun(self, missed_ticks_count: int):
+        self.overruns_count += 1
+        self.missed_ticks_count += missed_ticks_count
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ticks_count": self.ticks_count,
+            "average_duration_ms": self.average_duration * 1e3,
+            "max_duration_ms": self.max_duration * 1e3,
+            "last_duration_ms": self.last_duration * 1e3,
+            "overruns_count": self.overruns_count,
+            "missed_ticks_count": self.missed_ticks_count,
+        }
 
 
 cdef class Clock:
+    """
+    Ticks its child iterators, in the order they were added.
+
+    In real time mode each iterator is ticked at its own period, its `tick_interval`, or at the clock `tick_size` when
+    it does not declare one. The iterators are scheduled on a timing wheel whose resolution is the greatest common
+    divisor of their periods (in milliseconds), and the ticks are aligned on the multiples of the periods. The clock
+    sleeps until the next tick of any iterator, and the iterators due at the same time are ticked in the order they
+    were added. The duration of the ticks of each iterator is recorded in `tick_stats`.
+
+    In back testing mode the clock steps by `tick_size`, an iterator with a longer `tick_interval` is only ticked at
+    the steps crossing a multiple of its interval. When skipping idle ticks, the clock asks each iterator for its next
+    wake up time (`TimeIterator.next_wakeup_time`) and jumps to the first step at or after the earliest one, ticking
+    only the iterators due by then.
+    """
+    MAX_WHEEL_SLOTS = 4096
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global s_logger
@@ -21,12 +81,14 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0,
+                 skip_idle_ticks: bool = False):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param skip_idle_ticks: (back testing mode only) jump over the ticks no iterator has work at
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +98,10 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._skip_idle_ticks = skip_idle_ticks
+        self._timing_wheel = None
+        self._wheel_resolution_ms = 0
+        self._tick_stats = {}
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +123,17 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def skip_idle_ticks(self) -> bool:
+        return self._skip_idle_ticks
+
+    @property
+    def tick_stats(self) -> Dict[TimeIterator, IteratorTickStats]:
+        """
+        The tick statistics of the iterators ticked in real time mode
+        """
+        return dict(self._tick_stats)
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -75,21 +152,84 @@ cdef class Clock:
         if self._started:
             (<TimeIterator>iterator).c_start(self, self._current_tick)
         self._child_iterators.append(iterator)
+        if self._timing_wheel is not None:
+            self.c_build_timing_wheel()
 
     def remove_iterator(self, iterator: TimeIterator):
         if self._current_context is not None and iterator in self._current_context:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._tick_stats.pop(iterator, None)
+        if self._timing_wheel is not None:
+            self._timing_wheel.unschedule(iterator)
+
+    def reschedule_iterator(self, iterator: TimeIterator):
+        """
+        Schedules the iterator again after its `tick_interval` changed.
+        """
+        if self._timing_wheel is not None and iterator in self._current_context:
+            self.c_build_timing_wheel()
+
+    cdef long long c_period_ms(self, object iterator):
+        cdef double tick_interval = (<TimeIterator>iterator)._tick_interval
+        if tick_interval <= 0:
+            tick_interval = self._tick_size
+        return max(1, <long long>round(tick_interval * 1e3))
+
+    cdef c_build_timing_wheel(self):
+        cdef:
+            list periods_ms = [self.c_period_ms(iterator) for iterator in self._current_context]
+            long long resolution_ms = 0
+            long long period_ms
+        for period_ms in periods_ms:
+            resolution_ms = math.gcd(resolution_ms, period_ms)
+        if resolution_ms == 0:
+            resolution_ms = max(1, <long long>round(self._tick_size * 1e3))
+        self._wheel_resolution_ms = resolution_ms
+        self._timing_wheel = TimingWheel(
+            min(Clock.MAX_WHEEL_SLOTS, max(periods_ms, default=resolution_ms) // resolution_ms))
+        for iterator in self._current_context:
+            self.c_schedule_iterator(iterator, self._current_tick)
+
+    cdef c_schedule_iterator(self, object iterator, double after_time):
+        """
+        Schedules the iterator at the first multiple of its period after `after_time`.
+        """
+        cdef:
+            long long period_ticks = self.c_period_ms(iterator) // self._wheel_resolution_ms
+            # The tolerance keeps the wheel ticks converted to timestamps and back on the same tick
+            long long after_tick = <long long>math.floor(after_time * 1e3 / self._wheel_resolution_ms + 1e-6)
+        self._timing_wheel.schedule(iterator, (after_tick // period_ticks + 1) * period_ticks)
+
+    cdef c_tick_iterator(self, object iterator, double timestamp):
+        cdef:
+            double start = time.perf_counter()
+            bint tracing = latency_tracer.enabled
+        if tracing:
+            latency_tracer.tick_started(start)
+        try:
+            (<TimeIterator>iterator).c_tick(timestamp)
+        finally:
+            if tracing:
+                latency_tracer.tick_ended()
+            stats = self._tick_stats.get(iterator)
+            if stats is None:
+                stats = self._tick_stats[iterator] = IteratorTickStats()
+            stats.record_tick(time.perf_counter() - start)
 
     async def run(self):
         await self.run_til(float("nan"))
 
     async def run_til(self, timestamp: float):
         cdef:
-            TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            object next_wheel_tick
+            long long period_ticks
+            long long next_due_tick
+            long long now_tick
+            long long missed_ticks_count
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -97,9 +237,9 @@ cdef class Clock:
         self._current_tick = (now // self._tick_size) * self._tick_size
         if not self._started:
             for ci in self._current_context:
-                child_iterator = ci
-                child_iterator.c_start(self, self._current_tick)
+                (<TimeIterator>ci).c_start(self, self._current_tick)
             self._started = True
+        self.c_build_timing_wheel()
 
         try:
             while True:
@@ -107,28 +247,73 @@ cdef class Clock:
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
-                next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
+                # Sleep until the next tick of any iterator
+                next_wheel_tick = self._timing_wheel.next_tick()
+                if next_wheel_tick is None:
+                    next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
+                else:
+                    next_tick_time = next_wheel_tick * self._wheel_resolution_ms / 1e3
+                await asyncio.sleep(max(0.0, next_tick_time - now))
                 self._current_tick = next_tick_time
+                if next_wheel_tick is None:
+                    continue
 
-                # Run through all the child iterators.
-                for ci in self._current_context:
-                    child_iterator = ci
+                # Run through the child iterators due, in the order they were added
+                due_iterators = self._timing_wheel.pop(next_wheel_tick)
+                if len(due_iterators) > 1:
+                    due_iterators.sort(key=self._current_context.index)
+                for iterator in due_iterators:
+                    if iterator not in self._current_context:
+                        # Removed by the tick of another iterator
+                        continue
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        self.c_tick_iterator(iterator, self._current_tick)
                     except StopIteration:
                         self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+
+                    if iterator not in self._current_context or iterator in self._timing_wheel:
+                        # Removed or rescheduled during its tick
+                        continue
+                    period_ticks = self.c_period_ms(iterator) // self._wheel_resolution_ms
+                    next_due_tick = <long long>next_wheel_tick + period_ticks
+                    now_tick = <long long>math.floor(time.time() * 1e3 / self._wheel_resolution_ms)
+                    if next_due_tick <= now_tick:
+                        missed_ticks_count = (now_tick - next_due_tick) // period_ticks + 1
+                        next_due_tick += missed_ticks_count * period_ticks
+                        self._tick_stats[iterator].record_overrun(missed_ticks_count)
+                    self._timing_wheel.schedule(iterator, next_due_tick)
         finally:
+            self._timing_wheel = None
             for ci in self._current_context:
-                child_iterator = ci
-                child_iterator._clock = None
+                (<TimeIterator>ci)._clock = None
+
+    cdef double c_iterator_wakeup_time(self, object iterator, double timestamp):
+        """
+        :return: the next time the iterator has to be ticked at after `timestamp` when skipping idle ticks
+        """
+        cdef:
+            TimeIterator time_iterator = iterator
+            double wakeup_time = time_iterator.next_wakeup_time(timestamp)
+            double tick_interval
+        if wakeup_time != wakeup_time:
+            # NaN, the iterator is ticked at its tick interval
+            tick_interval = time_iterator._tick_interval
+            if tick_interval > self._tick_size:
+                wakeup_time = (timestamp // tick_interval + 1) * tick_interval
+            else:
+                wakeup_time = timestamp + self._tick_size
+        return wakeup_time
 
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        cdef:
+            TimeIterator child_iterator
+            double tick_interval
+            double previous_tick
+            double next_tick
+            list wakeup_times = None
 
         if not self._started:
             for ci in self._child_iterators:
@@ -138,9 +323,31 @@ cdef class Clock:
 
         try:
             while not (self._current_tick >= timestamp):
-                self._current_tick += self._tick_size
-                for ci in self._child_iterators:
+                previous_tick = self._current_tick
+                if self._skip_idle_ticks:
+                    wakeup_times = [self.c_iterator_wakeup_time(ci, previous_tick) for ci in self._child_iterators]
+                    next_tick = min(wakeup_times, default=math.inf)
+                    if next_tick > timestamp:
+                        next_tick = timestamp
+                    if math.isinf(next_tick):
+                        # Nothing to wake up for before the end of the data
+                        next_tick = previous_tick + self._tick_size
+                    # Round up to a clock step, the tolerance absorbs the rounding of the wake up times
+                    self._current_tick = previous_tick + max(
+                        1, math.ceil((next_tick - previous_tick) / self._tick_size - 1e-9)) * self._tick_size
+                else:
+                    self._current_tick += self._tick_size
+                for i, ci in enumerate(self._child_iterators):
                     child_iterator = ci
+                    if wakeup_times is not None:
+                        if i < len(wakeup_times) and wakeup_times[i] > self._current_tick + 1e-9 * self._tick_size:
+                            continue
+                    else:
+                        tick_interval = child_iterator._tick_interval
+                        if (tick_interval > self._tick_size
+                                and self._current_tick // tick_interval == previous_tick // tick_interval):
+                            # No multiple of the iterator interval was crossed by this step
+                            continue
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
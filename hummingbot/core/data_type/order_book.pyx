@@ -27,17 +27,24 @@ from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
+    OrderBookTopOfBookChangeEvent,
     OrderBookTradeEvent
 )
 
 cimport numpy as np
+from libc.math cimport isnan
 
 ob_logger = None
 NaN = float("nan")
 
 
+cdef inline bint same_price(double price, double other_price):
+    return price == other_price or (isnan(price) and isnan(other_price))
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_OF_BOOK_CHANGE_EVENT_TAG = OrderBookEvent.TopOfBookChangeEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -65,6 +72,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -95,6 +104,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_trigger_top_of_book_change(previous_best_bid, previous_best_ask, update_id)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -104,6 +114,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
@@ -135,6 +147,16 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_trigger_top_of_book_change(previous_best_bid, previous_best_ask, update_id)
+
+    cdef c_trigger_top_of_book_change(self, double previous_best_bid, double previous_best_ask, int64_t update_id):
+        # Most updates do not touch the best prices, and the event is only built when someone is listening to it.
+        if same_price(self._best_bid, previous_best_bid) and same_price(self._best_ask, previous_best_ask):
+            return
+        if self._events.find(self.ORDER_BOOK_TOP_OF_BOOK_CHANGE_EVENT_TAG) == self._events.end():
+            return
+        self.c_trigger_event(self.ORDER_BOOK_TOP_OF_BOOK_CHANGE_EVENT_TAG,
+                             OrderBookTopOfBookChangeEvent(self._best_bid, self._best_ask, update_id))
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
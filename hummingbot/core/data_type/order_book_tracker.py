@@ -13,8 +13,11 @@ from hummingbot.core.data_type.order_book_message import OrderBookMessage, Order
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.latency_tracer import LatencyStage, LatencyTracer
 from hummingbot.logger import HummingbotLogger
 
+latency_tracer = LatencyTracer.get_instance()
+
 
 class OrderBookTrackerDataSourceType(Enum):
     REMOTE_API = 2
@@ -272,7 +275,13 @@ class OrderBookTracker:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    if latency_tracer.enabled:
+                        latency_tracer.record(LatencyStage.ORDER_BOOK_DIFF_QUEUE_DELAY, time.time() - message.timestamp)
+                        start_time = latency_tracer.now()
+                        order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                        latency_tracer.record_since(LatencyStage.ORDER_BOOK_DIFF_APPLY, start_time)
+                    else:
+                        order_book.apply_diffs(message.bids, message.asks, message.update_id)
                     past_diffs_window.append(message)
                     diff_messages_accepted += 1
 
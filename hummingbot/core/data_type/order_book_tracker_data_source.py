@@ -7,12 +7,42 @@ from typing import Any, Callable, Dict, List, Optional
 
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
 
 
+class WSShardStats:
+    """
+    Throughput statistics of one of the websocket connections of an order book data source.
+    """
+
+    def __init__(self, shard_id: int, trading_pairs: List[str], start_timestamp: float):
+        self.shard_id = shard_id
+        self.trading_pairs = trading_pairs
+        self.start_timestamp = start_timestamp
+        self.connections_count = 0
+        self.messages_count = 0
+        self.last_message_timestamp: Optional[float] = None
+
+    def register_message(self, timestamp: float):
+        self.messages_count += 1
+        self.last_message_timestamp = timestamp
+
+    def messages_per_second(self, timestamp: float) -> float:
+        elapsed = timestamp - self.start_timestamp
+        return self.messages_count / elapsed if elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (f"WSShardStats(shard_id={self.shard_id}, trading_pairs={len(self.trading_pairs)}, "
+                f"connections_count={self.connections_count}, messages_count={self.messages_count})")
+
+
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
     FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
+    # Maximum number of trading pairs whose channels the exchange accepts on a single websocket connection (None if
+    # there is no limit). Only used by the data sources implementing _subscribe_channels_for_trading_pairs
+    WS_MAX_TRADING_PAIRS_PER_CONNECTION: Optional[int] = None
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -24,6 +54,9 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         self._trading_pairs: List[str] = trading_pairs
         self._order_book_create_function = lambda: OrderBook()
         self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
+        self._ws_trading_pairs_per_connection = 0
+        self._ws_shards_stats: List[WSShardStats] = []
+        self._ws_shard_stats_by_assistant: Dict[WSAssistant, WSShardStats] = {}
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -39,6 +72,42 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def order_book_create_function(self, func: Callable[[], OrderBook]):
         self._order_book_create_function = func
 
+    @property
+    def ws_trading_pairs_per_connection(self) -> int:
+        return self._ws_trading_pairs_per_connection
+
+    @ws_trading_pairs_per_connection.setter
+    def ws_trading_pairs_per_connection(self, trading_pairs_count: int):
+        """
+        :param trading_pairs_count: the number of trading pairs subscribed on each websocket connection, 0 to use a
+        single connection (unless the exchange limits the trading pairs per connection)
+        """
+        self._ws_trading_pairs_per_connection = trading_pairs_count
+
+    @property
+    def supports_ws_sharding(self) -> bool:
+        return (type(self)._subscribe_channels_for_trading_pairs
+                is not OrderBookTrackerDataSource._subscribe_channels_for_trading_pairs)
+
+    @property
+    def ws_shards_stats(self) -> List[WSShardStats]:
+        return list(self._ws_shards_stats)
+
+    def trading_pairs_shards(self) -> List[List[str]]:
+        """
+        Splits the trading pairs in groups, each one subscribed through its own websocket connection.
+
+        :return: the trading pairs of each websocket connection
+        """
+        shard_size = self._ws_trading_pairs_per_connection
+        if self.WS_MAX_TRADING_PAIRS_PER_CONNECTION is not None:
+            shard_size = min(shard_size or self.WS_MAX_TRADING_PAIRS_PER_CONNECTION,
+                             self.WS_MAX_TRADING_PAIRS_PER_CONNECTION)
+        trading_pairs = list(self._trading_pairs)
+        if shard_size <= 0 or len(trading_pairs) <= shard_size or not self.supports_ws_sharding:
+            return [trading_pairs]
+        return [trading_pairs[index:index + shard_size] for index in range(0, len(trading_pairs), shard_size)]
+
     @abstractmethod
     async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
         """
@@ -71,12 +140,41 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
         exchange. Each message is stored in its own queue.
+
+        When the trading pairs are split in several shards, each shard has its own websocket connection, reader and
+        reconnection loop, so a disconnection only interrupts the order books of its trading pairs.
         """
+        shards = self.trading_pairs_shards()
+        now = time.time()
+        self._ws_shards_stats = [
+            WSShardStats(shard_id=shard_id, trading_pairs=trading_pairs, start_timestamp=now)
+            for shard_id, trading_pairs in enumerate(shards)
+        ]
+        if len(shards) == 1:
+            await self._listen_for_shard_subscriptions(shard_stats=self._ws_shards_stats[0], sharded=False)
+            return
+
+        self.logger().info(f"Listening to the order book streams of {len(self._trading_pairs)} trading pairs "
+                           f"through {len(shards)} websocket connections.")
+        tasks = [safe_ensure_future(self._listen_for_shard_subscriptions(shard_stats=shard_stats, sharded=True))
+                 for shard_stats in self._ws_shards_stats]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _listen_for_shard_subscriptions(self, shard_stats: WSShardStats, sharded: bool):
         ws: Optional[WSAssistant] = None
         while True:
             try:
                 ws: WSAssistant = await self._connected_websocket_assistant()
-                await self._subscribe_channels(ws)
+                self._ws_shard_stats_by_assistant[ws] = shard_stats
+                shard_stats.connections_count += 1
+                if sharded:
+                    await self._subscribe_channels_for_trading_pairs(ws, shard_stats.trading_pairs)
+                else:
+                    await self._subscribe_channels(ws)
                 await self._process_websocket_messages(websocket_assistant=ws)
             except asyncio.CancelledError:
                 raise
@@ -88,6 +186,8 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
                 )
                 await self._sleep(1.0)
             finally:
+                if ws is not None:
+                    self._ws_shard_stats_by_assistant.pop(ws, None)
                 await self._on_order_stream_interruption(websocket_assistant=ws)
 
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
@@ -207,6 +307,17 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    async def _subscribe_channels_for_trading_pairs(self, ws: WSAssistant, trading_pairs: List[str]):
+        """
+        Subscribes to the trade events and diff orders events of some of the trading pairs through the provided
+        websocket connection. The data sources implementing it can split their trading pairs across several
+        websocket connections.
+
+        :param ws: the websocket assistant used to connect to the exchange
+        :param trading_pairs: the trading pairs to subscribe to
+        """
+        raise NotImplementedError
+
     def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
         """
         Identifies the channel for a particular event message. Used to find the correct queue to add the message in
@@ -230,9 +341,12 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         pass
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
+        shard_stats = self._ws_shard_stats_by_assistant.get(websocket_assistant)
         async for ws_response in websocket_assistant.iter_messages():
             data: Dict[str, Any] = ws_response.data
             if data is not None:  # data will be None when the websocket is disconnected
+                if shard_stats is not None:
+                    shard_stats.register_message(time.time())
                 channel: str = self._channel_originating_message(event_message=data)
                 valid_channels = self._get_messages_queue_keys()
                 if channel in valid_channels:
@@ -70,6 +70,28 @@ class TradeFeeSchema:
                 self.maker_fixed_fees[i].token, Decimal(self.maker_fixed_fees[i].amount)
             )
 
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "percent_fee_token": self.percent_fee_token,
+            "maker_percent_fee_decimal": str(self.maker_percent_fee_decimal),
+            "taker_percent_fee_decimal": str(self.taker_percent_fee_decimal),
+            "buy_percent_fee_deducted_from_returns": self.buy_percent_fee_deducted_from_returns,
+            "maker_fixed_fees": [fee.to_json() for fee in self.maker_fixed_fees],
+            "taker_fixed_fees": [fee.to_json() for fee in self.taker_fixed_fees],
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]):
+        instance = TradeFeeSchema(
+            percent_fee_token=data["percent_fee_token"],
+            maker_percent_fee_decimal=Decimal(data["maker_percent_fee_decimal"]),
+            taker_percent_fee_decimal=Decimal(data["taker_percent_fee_decimal"]),
+            buy_percent_fee_deducted_from_returns=data["buy_percent_fee_deducted_from_returns"],
+            maker_fixed_fees=[TokenAmount.from_json(fee) for fee in data["maker_fixed_fees"]],
+            taker_fixed_fees=[TokenAmount.from_json(fee) for fee in data["taker_fixed_fees"]],
+        )
+        return instance
+
 
 @dataclass
 class TradeFeeBase(ABC):
@@ -10,6 +10,7 @@ from aiohttp import ContentTypeError
 
 from hummingbot.client.config.security import Security
 from hummingbot.core.event.events import TradeType
+from hummingbot.core.web_assistant.connections.connection_pool import HTTPConnectionPoolStats
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -48,6 +49,7 @@ class GatewayHttpClient:
 
     _ghc_logger: Optional[HummingbotLogger] = None
     _shared_client: Optional[aiohttp.ClientSession] = None
+    _connection_pool_stats: HTTPConnectionPoolStats = HTTPConnectionPoolStats()
     _base_url: str
 
     __instance = None
@@ -86,8 +88,10 @@ class GatewayHttpClient:
             ssl_ctx.load_cert_chain(certfile=f"{cert_path}/client_cert.pem",
                                     keyfile=f"{cert_path}/client_key.pem",
                                     password=Security.secrets_manager.password.get_secret_value())
-            conn = aiohttp.TCPConnector(ssl_context=ssl_ctx)
-            cls._shared_client = aiohttp.ClientSession(connector=conn)
+            conn = client_config_map.http_connection_pool.get_connection_pool_settings().build_connector(
+                ssl_context=ssl_ctx)
+            cls._shared_client = aiohttp.ClientSession(
+                connector=conn, trace_configs=[cls._connection_pool_stats.trace_config()])
         return cls._shared_client
 
     @classmethod
@@ -98,6 +102,10 @@ class GatewayHttpClient:
         """
         cls._http_client(client_config_map, re_init=True)
 
+    @property
+    def connection_pool_stats(self) -> HTTPConnectionPoolStats:
+        return self._connection_pool_stats
+
     @property
     def base_url(self) -> str:
         return self._base_url
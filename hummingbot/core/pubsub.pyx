@@ -14,7 +14,6 @@ from cython.operator cimport(
 from libcpp.vector cimport vector
 from enum import Enum
 import logging
-import random
 from typing import List
 
 from hummingbot.logger import HummingbotLogger
@@ -26,24 +25,27 @@ class_logger = None
 
 cdef class PubSub:
     """
-    PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
-    event listener.
+    PubSub with weak references. This avoids the lapsed listener problem by performing GC on dead event listeners.
 
-    Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
-    alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
+    The listeners of each event are dispatched from a snapshot, an immutable tuple of the weak references of the
+    listeners, so triggering an event is a plain iteration over it. The snapshot is rebuilt, removing the dead
+    listeners, at the next trigger after the listeners of the event change or one of them is found dead while
+    dispatching an event. Since listeners dispatch from a snapshot, they are allowed to add and remove listeners while
+    being called.
 
-    Here's how the dead listener GC is performed:
+    Dead listener GC is done by calling c_remove_dead_listeners(), which checks whether the listener weak references
+    are alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n). It is called:
 
     1. c_add_listener():
-       Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
-       make sense to do the GC every time.
+       When the number of listeners of the event doubled since the last GC, so adding listeners that die without the
+       event being triggered does not grow the listeners collection indefinitely.
     2. c_remove_listener():
        Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+    3. c_get_listeners() and snapshots rebuilds:
+       Every time. Both take O(n) already.
     """
 
-    ADD_LISTENER_GC_PROBABILITY = 0.005
+    MIN_LISTENERS_COUNT_FOR_GC = 16
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,8 +54,15 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
+    def __cinit__(self, *args, **kwargs):
+        # Initialized here since some subclasses add listeners before calling __init__()
+        self._listeners_snapshots = {}
+        self._swept_listeners_counts = {}
+
     def __init__(self):
         self._events = Events()
+        self._listeners_snapshots.clear()
+        self._swept_listeners_counts.clear()
 
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
@@ -82,9 +91,12 @@ cdef class PubSub:
             deref(listeners_ptr).insert(listener_wrapper)
         else:
             new_listeners.insert(listener_wrapper)
-            self._events.insert(EventsPair(event_tag, new_listeners))
+            it = self._events.insert(EventsPair(event_tag, new_listeners)).first
+            listeners_ptr = address(deref(it).second)
+        self._listeners_snapshots.pop(event_tag, None)
 
-        if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
+        if deref(listeners_ptr).size() >= max(PubSub.MIN_LISTENERS_COUNT_FOR_GC,
+                                              2 * self._swept_listeners_counts.get(event_tag, 0)):
             self.c_remove_dead_listeners(event_tag)
 
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
@@ -100,6 +112,7 @@ cdef class PubSub:
         lit = deref(listeners_ptr).find(listener_wrapper)
         if lit != deref(listeners_ptr).end():
             deref(listeners_ptr).erase(lit)
+            self._listeners_snapshots.pop(event_tag, None)
         self.c_remove_dead_listeners(event_tag)
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
@@ -110,6 +123,7 @@ cdef class PubSub:
             EventListenersIterator lit
             vector[EventListenersIterator] lit_to_remove
         if it == self._events.end():
+            self._swept_listeners_counts.pop(event_tag, None)
             return
         listeners_ptr = address(deref(it).second)
         lit = deref(listeners_ptr).begin()
@@ -120,8 +134,29 @@ cdef class PubSub:
             inc(lit)
         for lit in lit_to_remove:
             deref(listeners_ptr).erase(lit)
+        if lit_to_remove.size() > 0:
+            self._listeners_snapshots.pop(event_tag, None)
         if deref(listeners_ptr).size() < 1:
             self._events.erase(it)
+            self._swept_listeners_counts.pop(event_tag, None)
+        else:
+            self._swept_listeners_counts[event_tag] = deref(listeners_ptr).size()
+
+    cdef tuple c_get_listeners_snapshot(self, int64_t event_tag):
+        cdef:
+            tuple snapshot = self._listeners_snapshots.get(event_tag)
+            EventsIterator it
+        if snapshot is not None:
+            return snapshot
+
+        self.c_remove_dead_listeners(event_tag)
+        it = self._events.find(event_tag)
+        if it == self._events.end():
+            snapshot = ()
+        else:
+            snapshot = tuple([<object>pyref.get() for pyref in deref(it).second])
+        self._listeners_snapshots[event_tag] = snapshot
+        return snapshot
 
     cdef c_get_listeners(self, int64_t event_tag):
         self.c_remove_dead_listeners(event_tag)
@@ -144,22 +179,20 @@ cdef class PubSub:
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            tuple snapshot = self.c_get_listeners_snapshot(event_tag)
+            object listener_weakref
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
-            return
-
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+            bint has_dead_listeners = False
+
+        # The snapshot is immutable, listeners are allowed to call c_add_listener() and c_remove_listener()
+        for listener_weakref in snapshot:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                has_dead_listeners = True
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -167,3 +200,6 @@ cdef class PubSub:
                 self.c_log_exception(event_tag, arg)
             finally:
                 typed_listener.c_set_event_info(0, None)
+
+        if has_dead_listeners and self._listeners_snapshots.get(event_tag) is snapshot:
+            del self._listeners_snapshots[event_tag]
@@ -7,8 +7,10 @@ from hummingbot.core.pubsub cimport PubSub
 cdef class TimeIterator(PubSub):
     cdef:
         double _current_timestamp
+        double _tick_interval
         Clock _clock
 
     cdef c_start(self, Clock clock, double timestamp)
     cdef c_stop(self, Clock clock)
     cdef c_tick(self, double timestamp)
+    cpdef double next_wakeup_time(self, double timestamp)
@@ -25,6 +25,16 @@ cdef class TimeIterator(PubSub):
     def tick(self, timestamp: float):
         self.c_tick(timestamp)
 
+    cpdef double next_wakeup_time(self, double timestamp):
+        """
+        Used by the clock when skipping idle ticks in back testing mode, it can be overridden by Python subclasses.
+
+        :param timestamp: the current clock timestamp
+        :return: the earliest timestamp after `timestamp` the iterator has work at, inf if it has none until another
+        iterator wakes up, NaN to be ticked at its tick interval (or every clock tick)
+        """
+        return NaN
+
     @property
     def current_timestamp(self) -> float:
         return self._current_timestamp
@@ -33,6 +43,21 @@ cdef class TimeIterator(PubSub):
     def clock(self) -> Optional[Clock]:
         return self._clock
 
+    @property
+    def tick_interval(self) -> float:
+        """
+        The period (in seconds) the clock ticks the iterator at, 0 to tick it at every clock tick.
+        """
+        return self._tick_interval
+
+    @tick_interval.setter
+    def tick_interval(self, value: float):
+        if value < 0:
+            raise ValueError("The tick interval cannot be negative.")
+        self._tick_interval = value
+        if self._clock is not None:
+            self._clock.reschedule_iterator(self)
+
     def start(self, clock: Clock):
         self.c_start(clock, clock.current_timestamp)
 
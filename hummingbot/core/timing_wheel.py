@@ -0,0 +1,72 @@
+from typing import Any, Dict, List, Optional
+
+
+class TimingWheel:
+    """
+    Hashed timing wheel of items due at integer ticks.
+
+    An item due at tick `t` is kept in the slot `t % slots_count`, so scheduling and unscheduling an item are O(1).
+    Finding the next due tick scans the slots from the last popped tick, one revolution at most, and falls back to the
+    earliest due tick when all the items are due in later revolutions.
+    """
+
+    def __init__(self, slots_count: int):
+        if slots_count < 1:
+            raise ValueError("The timing wheel needs at least one slot.")
+        self._slots: List[Dict[Any, int]] = [{} for _ in range(slots_count)]
+        self._due_ticks: Dict[Any, int] = {}
+        self._current_tick: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._due_ticks)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._due_ticks
+
+    @property
+    def slots_count(self) -> int:
+        return len(self._slots)
+
+    def due_tick(self, item: Any) -> Optional[int]:
+        return self._due_ticks.get(item)
+
+    def schedule(self, item: Any, tick: int):
+        """
+        Schedules the item at the tick, replacing its previous schedule.
+        """
+        self.unschedule(item)
+        self._slots[tick % len(self._slots)][item] = tick
+        self._due_ticks[item] = tick
+        if self._current_tick is None or tick < self._current_tick:
+            self._current_tick = tick
+
+    def unschedule(self, item: Any):
+        tick = self._due_ticks.pop(item, None)
+        if tick is not None:
+            del self._slots[tick % len(self._slots)][item]
+
+    def next_tick(self) -> Optional[int]:
+        """
+        :return: the earliest tick an item is due at, None if the wheel is empty
+        """
+        if len(self._due_ticks) == 0:
+            return None
+        slots_count = len(self._slots)
+        for tick in range(self._current_tick, self._current_tick + slots_count):
+            for due_tick in self._slots[tick % slots_count].values():
+                if due_tick == tick:
+                    self._current_tick = tick
+                    return tick
+        self._current_tick = min(self._due_ticks.values())
+        return self._current_tick
+
+    def pop(self, tick: int) -> List[Any]:
+        """
+        Unschedules and returns the items due at the tick, in the order they were scheduled.
+        """
+        slot = self._slots[tick % len(self._slots)]
+        items = [item for item, due_tick in slot.items() if due_tick == tick]
+        for item in items:
+            del slot[item]
+            del self._due_ticks[item]
+        return items
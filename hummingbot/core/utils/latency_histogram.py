@@ -0,0 +1,75 @@
+import bisect
+from typing import List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKET_BOUNDS_MS: Tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class LatencyHistogram:
+    """
+    Histogram of latencies with fixed buckets, so recording a sample takes constant time and memory no matter how long
+    it runs. The samples are recorded in seconds, and the bucket bounds are expressed in milliseconds.
+    """
+
+    def __init__(self, bucket_bounds_ms: Sequence[float] = DEFAULT_BUCKET_BOUNDS_MS):
+        self._bucket_bounds_ms: List[float] = sorted(bucket_bounds_ms)
+        # The last bucket holds the samples above the highest bound
+        self._bucket_counts: List[int] = [0] * (len(self._bucket_bounds_ms) + 1)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean_ms(self) -> Optional[float]:
+        return self._total_ms / self._count if self._count > 0 else None
+
+    @property
+    def max_ms(self) -> Optional[float]:
+        return self._max_ms if self._count > 0 else None
+
+    def record(self, latency: float):
+        """
+        :param latency: the latency in seconds
+        """
+        latency_ms = latency * 1e3
+        self._bucket_counts[bisect.bisect_left(self._bucket_bounds_ms, latency_ms)] += 1
+        self._count += 1
+        self._total_ms += latency_ms
+        self._max_ms = max(self._max_ms, latency_ms)
+
+    def percentile_ms(self, percentile: float) -> Optional[float]:
+        """
+        :param percentile: the percentile to estimate, between 0 and 100
+        :return: the upper bound of the bucket holding the percentile (the max latency for the last bucket)
+        """
+        if self._count == 0:
+            return None
+        target = self._count * percentile / 100
+        cumulative_count = 0
+        for bound, bucket_count in zip(self._bucket_bounds_ms, self._bucket_counts):
+            cumulative_count += bucket_count
+            if cumulative_count >= target and cumulative_count > 0:
+                return min(bound, self._max_ms)
+        return self._max_ms
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """
+        :return: the upper bound (in milliseconds) and the samples count of each bucket
+        """
+        return list(zip(self._bucket_bounds_ms + [float("inf")], self._bucket_counts))
+
+    def reset(self):
+        self._bucket_counts = [0] * len(self._bucket_counts)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    def summary(self) -> str:
+        if self._count == 0:
+            return "no samples"
+        return (f"count: {self._count}, mean: {self.mean_ms:.1f} ms, p50: {self.percentile_ms(50):.1f} ms, "
+                f"p90: {self.percentile_ms(90):.1f} ms, p99: {self.percentile_ms(99):.1f} ms, "
+                f"max: {self.max_ms:.1f} ms")
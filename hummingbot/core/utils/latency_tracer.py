@@ -0,0 +1,144 @@
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple
+
+from hummingbot.core.utils.latency_histogram import DEFAULT_BUCKET_BOUNDS_MS, LatencyHistogram
+
+MAX_TRACKED_ORDERS = 10000
+# Sub-millisecond buckets for the decoding and order book stages
+TRACING_BUCKET_BOUNDS_MS: Tuple[float, ...] = (0.01, 0.02, 0.05, 0.1, 0.2, 0.5) + DEFAULT_BUCKET_BOUNDS_MS
+
+
+class LatencyStage(Enum):
+    # Decoding of a message received by a websocket connection
+    WS_MESSAGE_DECODE = "ws_message_decode"
+    # Local queueing delay of an order book diff, from the message timestamp to the diff being applied by the order
+    # book tracker. Most connectors (e.g. Binance) stamp the diffs with the local time they are parsed at, not with the
+    # exchange event time, so this does not include the network latency.
+    ORDER_BOOK_DIFF_QUEUE_DELAY = "order_book_diff_queue_delay"
+    # Application of an order book diff to the order book
+    ORDER_BOOK_DIFF_APPLY = "order_book_diff_apply"
+    # Start of the clock tick (or of the control task of a strategy v2 executor or controller) to the order being
+    # submitted to the connector
+    TICK_TO_ORDER = "tick_to_order"
+    # Wait of a request for the capacity of its rate limits in the throttler
+    THROTTLER_WAIT = "throttler_wait"
+    # Authentication (signing) of a REST or websocket request
+    REQUEST_SIGNING = "request_signing"
+    # Submission of an order to the exchange acknowledgement being processed by the order tracker
+    ORDER_ACK = "order_ack"
+    # Start of the clock tick (or control task) an order was submitted in to the exchange acknowledgement being
+    # processed
+    TICK_TO_ACK = "tick_to_ack"
+
+
+class LatencyTracer:
+    """
+    Opt-in tracing of the hot path latencies, from the market data being received to the orders being acknowledged.
+
+    The instrumented code checks `enabled` before taking any timestamp, so the tracing costs an attribute lookup per
+    stage while disabled. The latencies are aggregated in one histogram per stage, the orders submitted are followed by
+    client order id until the exchange acknowledges them.
+    """
+    _shared_instance: Optional["LatencyTracer"] = None
+
+    @classmethod
+    def get_instance(cls) -> "LatencyTracer":
+        if cls._shared_instance is None:
+            cls._shared_instance = LatencyTracer()
+        return cls._shared_instance
+
+    def __init__(self):
+        self.enabled: bool = False
+        self._histograms: Dict[LatencyStage, LatencyHistogram] = {
+            stage: LatencyHistogram(TRACING_BUCKET_BOUNDS_MS) for stage in LatencyStage
+        }
+        # Client order id to the submission time and the start time of the tick the order was submitted in
+        self._submitted_orders: "OrderedDict[str, Tuple[float, Optional[float]]]" = OrderedDict()
+        # The start of the tick is held per task, the control tasks of the strategy v2 components interleave with the
+        # clock ticks at each await
+        self._tick_start_time: ContextVar[Optional[float]] = ContextVar("tick_start_time", default=None)
+
+    @staticmethod
+    def now() -> float:
+        return time.perf_counter()
+
+    def start(self):
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+        self._submitted_orders.clear()
+        self._tick_start_time.set(None)
+
+    def reset(self):
+        for histogram in self._histograms.values():
+            histogram.reset()
+        self._submitted_orders.clear()
+
+    def histogram(self, stage: LatencyStage) -> LatencyHistogram:
+        return self._histograms[stage]
+
+    def record(self, stage: LatencyStage, latency: float):
+        """
+        :param latency: the latency in seconds
+        """
+        if self.enabled and latency >= 0:
+            self._histograms[stage].record(latency)
+
+    def record_since(self, stage: LatencyStage, start_time: float):
+        """
+        :param start_time: the start of the stage, from `now()`
+        """
+        self.record(stage, self.now() - start_time)
+
+    def tick_started(self, start_time: float):
+        """
+        Marks the start of a clock tick or of a control task, in the current task.
+        """
+        self._tick_start_time.set(start_time)
+
+    def tick_ended(self):
+        self._tick_start_time.set(None)
+
+    def order_submitted(self, client_order_id: str):
+        if not self.enabled:
+            return
+        now = self.now()
+        tick_start_time = self._tick_start_time.get()
+        if tick_start_time is not None:
+            self.record(LatencyStage.TICK_TO_ORDER, now - tick_start_time)
+        self._submitted_orders[client_order_id] = (now, tick_start_time)
+        if len(self._submitted_orders) > MAX_TRACKED_ORDERS:
+            self._submitted_orders.popitem(last=False)
+
+    def order_acknowledged(self, client_order_id: str):
+        times = self._submitted_orders.pop(client_order_id, None)
+        if times is None or not self.enabled:
+            return
+        now = self.now()
+        submission_time, tick_start_time = times
+        self.record(LatencyStage.ORDER_ACK, now - submission_time)
+        if tick_start_time is not None:
+            self.record(LatencyStage.TICK_TO_ACK, now - tick_start_time)
+
+    def order_discarded(self, client_order_id: str):
+        self._submitted_orders.pop(client_order_id, None)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        :return: the samples count and the latencies (in milliseconds) of the stages with samples, by stage name
+        """
+        return {
+            stage.value: {
+                "count": histogram.count,
+                "mean_ms": histogram.mean_ms,
+                "p50_ms": histogram.percentile_ms(50),
+                "p90_ms": histogram.percentile_ms(90),
+                "p99_ms": histogram.percentile_ms(99),
+                "max_ms": histogram.max_ms,
+            }
+            for stage, histogram in self._histograms.items() if histogram.count > 0
+        }
@@ -0,0 +1,120 @@
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+from hummingbot.core.utils.stall_detector import BlockingCallback, StallDetector
+from hummingbot.logger import HummingbotLogger
+
+llm_logger = None
+
+
+class LoopLagMonitor:
+    """
+    Continuously measures the scheduling delay (lag) of the event loop with the heartbeat of a `StallDetector`, the
+    lag of each heartbeat is recorded in a histogram since the start, and in a histogram of the current window that
+    restarts at each snapshot. It costs one wake-up per interval on the event loop.
+
+    The callbacks blocking the event loop for more than the lag threshold are logged with their task and stack.
+    """
+    _shared_instance: Optional["LoopLagMonitor"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global llm_logger
+        if llm_logger is None:
+            llm_logger = logging.getLogger(__name__)
+        return llm_logger
+
+    @classmethod
+    def get_instance(cls) -> "LoopLagMonitor":
+        if cls._shared_instance is None:
+            cls._shared_instance = LoopLagMonitor()
+        return cls._shared_instance
+
+    def __init__(self, interval: float = 0.25, lag_threshold: float = 0.5):
+        """
+        :param interval: the time (in seconds) between two measures of the lag
+        :param lag_threshold: the lag (in seconds) above which the blocking callback is logged
+        """
+        self._lag_threshold = lag_threshold
+        self._lag_histogram = LatencyHistogram()
+        self._window_lag_histogram = LatencyHistogram()
+        self._last_lag: Optional[float] = None
+        self._stall_detector = StallDetector(
+            interval=interval,
+            threshold=lag_threshold,
+            on_blocking_callback=self.log_blocking_callback,
+            on_heartbeat=self.record_lag,
+            thread_name="LoopLagMonitor",
+        )
+
+    @property
+    def is_running(self) -> bool:
+        return self._stall_detector.is_running
+
+    @property
+    def lag_threshold(self) -> float:
+        return self._lag_threshold
+
+    @property
+    def lag_histogram(self) -> LatencyHistogram:
+        return self._lag_histogram
+
+    @property
+    def last_lag(self) -> Optional[float]:
+        return self._last_lag
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Starts the monitoring, must be called from the event loop thread.
+        """
+        self._stall_detector.start(loop)
+
+    def stop(self):
+        self._stall_detector.stop()
+
+    def reset(self):
+        self._lag_histogram.reset()
+        self._window_lag_histogram.reset()
+        self._last_lag = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        :return: the samples count and the lag percentiles (in milliseconds) since the start, empty without samples
+        """
+        return self._histogram_stats(self._lag_histogram)
+
+    def window_stats(self) -> Dict[str, Any]:
+        """
+        Takes a snapshot of the lag recorded since the previous snapshot, and starts a new window.
+
+        :return: the samples count and the lag percentiles (in milliseconds) of the window, empty without samples
+        """
+        lag_stats = self._histogram_stats(self._window_lag_histogram)
+        self._window_lag_histogram.reset()
+        return lag_stats
+
+    def record_lag(self, lag: float):
+        """
+        :param lag: the lag in seconds
+        """
+        self._last_lag = lag
+        self._lag_histogram.record(lag)
+        self._window_lag_histogram.record(lag)
+
+    @staticmethod
+    def _histogram_stats(histogram: LatencyHistogram) -> Dict[str, Any]:
+        if histogram.count == 0:
+            return {}
+        return {
+            "count": histogram.count,
+            "p50_ms": histogram.percentile_ms(50),
+            "p90_ms": histogram.percentile_ms(90),
+            "p99_ms": histogram.percentile_ms(99),
+            "max_ms": histogram.max_ms,
+        }
+
+    def log_blocking_callback(self, blocking_callback: BlockingCallback):
+        self.logger().warning(f"The event loop was blocked for {blocking_callback.duration * 1e3:.0f} ms by "
+                              f"{blocking_callback.task_name}:\n{blocking_callback.stack}")
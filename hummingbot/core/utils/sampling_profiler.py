@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import os
+import time
+from collections import Counter
+from datetime import datetime
+from types import FrameType
+from typing import Counter as CounterType, List, Optional, Tuple
+
+from hummingbot.core.utils.stall_detector import BlockingCallback, StallDetector, task_name
+from hummingbot.logger import HummingbotLogger
+
+sp_logger = None
+
+
+def fold_stack(frame) -> str:
+    """
+    :return: the frames of the stack from the root to the frame, in the folded format of the flame graph tools
+    """
+    frames: List[str] = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(frames))
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of the event loop thread at a fixed interval from a background thread, so the running process
+    can be profiled without restarting it under an external profiler.
+
+    Each sample is prefixed with the coroutine of the task running at the time, and the samples are counted by stack
+    in the folded format (`frame;frame;frame count`) read by flamegraph.pl, speedscope and inferno.
+
+    The samples are taken by the watchdog thread of a `StallDetector` checking the event loop at every sampling
+    interval, which also reports the callbacks blocking the event loop for more than the blocking threshold.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global sp_logger
+        if sp_logger is None:
+            sp_logger = logging.getLogger(__name__)
+        return sp_logger
+
+    def __init__(self,
+                 loop: asyncio.AbstractEventLoop,
+                 sampling_interval: float = 0.01,
+                 blocking_threshold: float = 0.1):
+        """
+        :param loop: the event loop to profile, its thread is the one sampled
+        :param sampling_interval: the time (in seconds) between two samples
+        :param blocking_threshold: the time (in seconds) a callback has to block the event loop to be reported
+        """
+        self._loop = loop
+        self._blocking_threshold = blocking_threshold
+        self._samples: CounterType[str] = Counter()
+        self._samples_count = 0
+        self._blocking_callbacks: List[BlockingCallback] = []
+        self._start_time: Optional[float] = None
+        self._stall_detector = StallDetector(
+            interval=sampling_interval,
+            threshold=blocking_threshold,
+            on_blocking_callback=self._blocking_callbacks.append,
+            on_sample=self._record_sample,
+            thread_name="SamplingProfiler",
+        )
+
+    @property
+    def is_running(self) -> bool:
+        return self._stall_detector.is_running
+
+    @property
+    def samples_count(self) -> int:
+        return self._samples_count
+
+    @property
+    def blocking_callbacks(self) -> List[BlockingCallback]:
+        return list(self._blocking_callbacks)
+
+    def folded_stacks(self) -> List[str]:
+        return [f"{stack} {count}" for stack, count in self._samples.most_common()]
+
+    def start(self):
+        """
+        Starts the profiling, must be called from the event loop thread.
+        """
+        if self.is_running:
+            return
+        self._samples.clear()
+        self._samples_count = 0
+        self._blocking_callbacks.clear()
+        self._start_time = time.time()
+        self._stall_detector.start(self._loop)
+
+    def stop(self):
+        self._stall_detector.stop()
+
+    def write_reports(self, output_dir: str) -> Tuple[str, str]:
+        """
+        Writes the folded stacks and the blocking callbacks report of the last profiling.
+
+        :return: the paths of the folded stacks file and of the blocking callbacks file
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        file_prefix = os.path.join(
+            output_dir, f"profile_{datetime.fromtimestamp(self._start_time or time.time()).strftime('%Y%m%d_%H%M%S')}")
+        folded_stacks_path = f"{file_prefix}.folded"
+        with open(folded_stacks_path, "w") as folded_stacks_file:
+            folded_stacks_file.writelines(f"{line}\n" for line in self.folded_stacks())
+        blocking_callbacks_path = f"{file_prefix}_blocking.txt"
+        with open(blocking_callbacks_path, "w") as blocking_callbacks_file:
+            blocking_callbacks_file.write(
+                f"{len(self._blocking_callbacks)} callbacks blocked the event loop for more than "
+                f"{self._blocking_threshold * 1e3:.0f} ms\n")
+            for blocking_callback in sorted(self._blocking_callbacks, key=lambda c: c.duration, reverse=True):
+                blocking_callbacks_file.write(
+                    f"\n{datetime.fromtimestamp(blocking_callback.start_time).isoformat()} "
+                    f"{blocking_callback.task_name} blocked the event loop for "
+                    f"{blocking_callback.duration * 1e3:.0f} ms\n{blocking_callback.stack}")
+        return folded_stacks_path, blocking_callbacks_path
+
+    def _record_sample(self, task: Optional[asyncio.Task], frame: FrameType):
+        self._samples[f"{task_name(task)};{fold_stack(frame)}"] += 1
+        self._samples_count += 1
@@ -0,0 +1,138 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from types import FrameType
+from typing import Callable, Optional
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+
+@dataclass
+class BlockingCallback:
+    """
+    A callback that blocked the event loop for longer than the threshold
+    """
+    start_time: float
+    duration: float
+    task_name: str
+    stack: str
+
+
+def task_name(task: Optional[asyncio.Task]) -> str:
+    """
+    :return: the qualified name of the coroutine run by the task, `loop` for callbacks run outside of a task
+    """
+    if task is None:
+        return "loop"
+    coroutine = task.get_coro()
+    return getattr(coroutine, "__qualname__", None) or task.get_name()
+
+
+class StallDetector:
+    """
+    Detects the callbacks blocking an event loop. A heartbeat task sleeps for a fixed interval on the event loop, and
+    the time it resumes late by is its lag. A watchdog thread checks the heartbeat at the same interval: when it is
+    late by more than the threshold the event loop is blocked, so the watchdog captures the task and the stack running
+    on the event loop thread. The blocking callback is reported with its duration once the event loop runs again.
+
+    The watchdog thread can also sample the stack of the event loop thread at each check.
+    """
+
+    def __init__(self,
+                 interval: float,
+                 threshold: float,
+                 on_blocking_callback: Callable[[BlockingCallback], None],
+                 on_heartbeat: Optional[Callable[[float], None]] = None,
+                 on_sample: Optional[Callable[[Optional[asyncio.Task], FrameType], None]] = None,
+                 thread_name: str = "StallDetector"):
+        """
+        :param interval: the time (in seconds) between two heartbeats, and between two checks of the watchdog
+        :param threshold: the lag (in seconds) above which the event loop is considered blocked
+        :param on_blocking_callback: called on the event loop with each blocking callback
+        :param on_heartbeat: called on the event loop with the lag (in seconds) of each heartbeat
+        :param on_sample: called from the watchdog thread with the task and the frame running on the event loop thread
+        at each check
+        :param thread_name: the name of the watchdog thread
+        """
+        self._interval = interval
+        self._threshold = threshold
+        self._on_blocking_callback = on_blocking_callback
+        self._on_heartbeat = on_heartbeat
+        self._on_sample = on_sample
+        self._thread_name = thread_name
+        self._expected_heartbeat_time: float = 0.0
+        # Captured by the watchdog while the event loop is blocked
+        self._blocking_callback: Optional[BlockingCallback] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._watchdog_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    @property
+    def is_running(self) -> bool:
+        return self._heartbeat_task is not None
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Starts the detection, must be called from the event loop thread.
+        """
+        if self.is_running:
+            return
+        self._loop = loop or asyncio.get_event_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._blocking_callback = None
+        self._expected_heartbeat_time = time.perf_counter() + self._interval
+        self._stop_event.clear()
+        self._heartbeat_task = safe_ensure_future(self._heartbeat_loop(), loop=self._loop)
+        self._watchdog_thread = threading.Thread(target=self._watchdog_loop, name=self._thread_name, daemon=True)
+        self._watchdog_thread.start()
+
+    def stop(self):
+        """
+        Stops the detection, the callback blocking the event loop until now (if any) is reported.
+        """
+        if not self.is_running:
+            return
+        self._stop_event.set()
+        self._watchdog_thread.join()
+        self._watchdog_thread = None
+        self._heartbeat_task.cancel()
+        self._heartbeat_task = None
+        self._report_blocking_callback(max(0.0, time.perf_counter() - self._expected_heartbeat_time))
+
+    async def _heartbeat_loop(self):
+        while True:
+            self._expected_heartbeat_time = time.perf_counter() + self._interval
+            await asyncio.sleep(self._interval)
+            lag = max(0.0, time.perf_counter() - self._expected_heartbeat_time)
+            if self._on_heartbeat is not None:
+                self._on_heartbeat(lag)
+            self._report_blocking_callback(lag)
+
+    def _report_blocking_callback(self, lag: float):
+        blocking_callback = self._blocking_callback
+        self._blocking_callback = None
+        if blocking_callback is not None and lag > self._threshold:
+            blocking_callback.duration = lag
+            self._on_blocking_callback(blocking_callback)
+
+    def _watchdog_loop(self):
+        while not self._stop_event.wait(self._interval):
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            task = asyncio.current_task(self._loop)
+            if self._on_sample is not None:
+                self._on_sample(task, frame)
+            lag = time.perf_counter() - self._expected_heartbeat_time
+            if self._blocking_callback is None and lag > self._threshold:
+                self._blocking_callback = BlockingCallback(
+                    start_time=time.time() - lag,
+                    duration=lag,
+                    task_name=task_name(task),
+                    stack="".join(traceback.format_stack(frame)),
+                )
@@ -0,0 +1,118 @@
+import json
+import logging
+import os
+import time
+from os.path import exists, join, realpath
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional
+
+from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+
+
+class TradingPairCacheEntry(NamedTuple):
+    timestamp: float
+    trading_pairs: List[str]
+    symbol_map: Dict[str, str]
+
+    def age(self, now: Optional[float] = None) -> float:
+        return (now if now is not None else time.time()) - self.timestamp
+
+
+class TradingPairCache:
+    """
+    On-disk cache of the trading pairs (and exchange symbol to trading pair maps) of each connector, so they can be
+    served at startup without requesting the exchange info of every exchange.
+    Each connector is stored in its own JSON file. Entries older than the TTL are still readable, but are reported as
+    stale so the caller can refresh them.
+    The exchange info the symbol map of a connector was built from is kept in a separate file, so reading the trading
+    pairs doesn't require parsing it.
+    """
+    DEFAULT_TTL = 24 * 60 * 60
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: float = DEFAULT_TTL):
+        self._cache_dir = cache_dir
+        self._ttl = ttl
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir or realpath(join(data_path(), "trading_pairs"))
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    def path(self, connector_name: str) -> str:
+        return join(self.cache_dir, f"{connector_name}.json")
+
+    def exchange_info_path(self, connector_name: str) -> str:
+        return join(self.cache_dir, f"{connector_name}.exchange_info.json")
+
+    def load(self, connector_name: str) -> Optional[TradingPairCacheEntry]:
+        file_path = self.path(connector_name)
+        if not exists(file_path):
+            return None
+        try:
+            with open(file_path) as fd:
+                content = json.load(fd)
+            symbol_map = {str(symbol): str(pair) for symbol, pair in content.get("symbol_map", {}).items()}
+            entry = TradingPairCacheEntry(
+                timestamp=float(content["timestamp"]),
+                trading_pairs=[str(pair) for pair in content["trading_pairs"]],
+                symbol_map=symbol_map,
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self.logger().debug(f"Ignoring invalid trading pairs cache file {file_path}.", exc_info=True)
+            return None
+        return entry
+
+    def load_fresh(self, connector_name: str) -> Optional[TradingPairCacheEntry]:
+        entry = self.load(connector_name)
+        if entry is None or self.is_stale(entry):
+            return None
+        return entry
+
+    def is_stale(self, entry: TradingPairCacheEntry, now: Optional[float] = None) -> bool:
+        return entry.age(now) > self._ttl
+
+    def save(self, connector_name: str, trading_pairs: List[str], symbol_map: Optional[Mapping[str, str]] = None):
+        content = {
+            "timestamp": time.time(),
+            "trading_pairs": list(trading_pairs),
+            "symbol_map": dict(symbol_map or {}),
+        }
+        self._write(connector_name, self.path(connector_name), content)
+
+    def save_symbol_map(self, connector_name: str, symbol_map: Mapping[str, str]):
+        self.save(connector_name=connector_name, trading_pairs=list(symbol_map.values()), symbol_map=symbol_map)
+
+    def load_exchange_info(self, connector_name: str) -> Optional[Any]:
+        file_path = self.exchange_info_path(connector_name)
+        if not exists(file_path):
+            return None
+        try:
+            with open(file_path) as fd:
+                return json.load(fd)
+        except (OSError, ValueError):
+            self.logger().debug(f"Ignoring invalid exchange info cache file {file_path}.", exc_info=True)
+            return None
+
+    def save_exchange_info(self, connector_name: str, exchange_info: Any):
+        self._write(connector_name, self.exchange_info_path(connector_name), exchange_info)
+
+    def _write(self, connector_name: str, file_path: str, content: Any):
+        temp_file_path = f"{file_path}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_file_path, "w") as fd:
+                json.dump(content, fd)
+            # Replacing the file atomically prevents other instances from reading a partially written cache
+            os.replace(temp_file_path, file_path)
+        except (OSError, TypeError, ValueError):
+            self.logger().warning(f"Could not write the trading pairs cache for {connector_name}.", exc_info=True)
@@ -3,10 +3,12 @@ from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
+from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.logger import HummingbotLogger
 
 from ...client.config.security import Security
 from .async_utils import safe_ensure_future
+from .trading_pair_cache import TradingPairCache
 
 
 class TradingPairFetcher:
@@ -30,6 +32,7 @@ class TradingPairFetcher:
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
         self.fetch_pairs_from_all_exchanges = client_config_map.fetch_pairs_from_all_exchanges
+        self._trading_pair_cache = TradingPairCache()
         self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
 
     def _fetch_pairs_from_connector_setting(
@@ -37,8 +40,19 @@ class TradingPairFetcher:
             connector_setting: ConnectorSetting,
             connector_name: Optional[str] = None):
         connector_name = connector_name or connector_setting.name
+        # Cached pairs are served right away. Stale ones are refreshed from the exchange in the background.
+        cached_entry = self._trading_pair_cache.load(connector_setting.name)
+        if cached_entry is not None:
+            self.trading_pairs[connector_name] = cached_entry.trading_pairs
+            if not self._trading_pair_cache.is_stale(cached_entry):
+                return
         connector = connector_setting.non_trading_connector_instance_with_default_configuration()
-        safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
+        safe_ensure_future(self.call_fetch_pairs(
+            connector.all_trading_pairs(),
+            connector_name,
+            connector=connector,
+            cache_name=connector_setting.name,
+        ))
 
     async def fetch_all(self, client_config_map: ClientConfigAdapter):
         await Security.wait_til_decryption_done()
@@ -64,15 +78,28 @@ class TradingPairFetcher:
                                         "Please check the logs")
         self.ready = True
 
-    async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
+    async def call_fetch_pairs(
+            self,
+            fetch_fn: Callable[[], Awaitable[List[str]]],
+            exchange_name: str,
+            connector: Optional[Any] = None,
+            cache_name: Optional[str] = None):
         try:
             pairs = await fetch_fn
+            if len(pairs) == 0 and len(self.trading_pairs.get(exchange_name, [])) > 0:
+                # The connector could not get the pairs from the exchange. The cached ones are kept.
+                return
             self.trading_pairs[exchange_name] = pairs
+            if cache_name is not None and len(pairs) > 0:
+                symbol_map = None
+                if isinstance(connector, ExchangeBase):
+                    symbol_map = await connector.trading_pair_symbol_map()
+                self._trading_pair_cache.save(cache_name, pairs, symbol_map)
         except Exception:
             self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
                                 f"Trading pairs autocompletion won't work.", exc_info=True)
             # In case of error just assign empty list, this is st. the bot won't stop working
-            self.trading_pairs[exchange_name] = []
+            self.trading_pairs.setdefault(exchange_name, [])
 
     def _all_connector_settings(self) -> Dict[str, ConnectorSetting]:
         # Method created to enabling patching in unit tests
@@ -0,0 +1,128 @@
+import ssl
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Union
+
+import aiohttp
+
+ConnectorBuilder = Callable[["HTTPConnectionPoolSettings", Optional[ssl.SSLContext]], aiohttp.BaseConnector]
+
+
+@dataclass(frozen=True)
+class HTTPConnectionPoolSettings:
+    """The settings of the connection pool shared by the HTTP requests of a client session.
+
+    The defaults are the `aiohttp.TCPConnector` ones. `aiohttp` only speaks HTTP/1.1, a `connector_builder` can be
+    provided to use another transport (e.g. an HTTP/2 capable connector), in which case it receives these settings
+    and is responsible for honoring them.
+    """
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 15
+    dns_cache_ttl: int = 10
+    enable_cleanup_closed: bool = False
+    connector_builder: Optional[ConnectorBuilder] = None
+
+    def build_connector(self, ssl_context: Optional[ssl.SSLContext] = None) -> aiohttp.BaseConnector:
+        """
+        :param ssl_context: the SSL context of the connections, the default one if not provided
+        :return: the connector to create the client session with. It must be called from the event loop
+        """
+        if self.connector_builder is not None:
+            return self.connector_builder(self, ssl_context)
+        ssl_argument: Union[ssl.SSLContext, bool] = ssl_context if ssl_context is not None else True
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=self.dns_cache_ttl > 0,
+            ttl_dns_cache=self.dns_cache_ttl if self.dns_cache_ttl > 0 else None,
+            enable_cleanup_closed=self.enable_cleanup_closed,
+            ssl=ssl_argument,
+        )
+
+
+DEFAULT_CONNECTION_POOL_SETTINGS = HTTPConnectionPoolSettings()
+
+
+class HTTPConnectionPoolStats:
+    """Counts the requests of a client session and how many of them reused a pooled connection.
+
+    The counters are updated through the `aiohttp` request tracing, so the client session has to be created with the
+    `trace_config` of the stats.
+    """
+
+    def __init__(self):
+        self._requests_count = 0
+        self._connections_created = 0
+        self._connections_reused = 0
+        self._dns_cache_hits = 0
+        self._dns_cache_misses = 0
+
+    @property
+    def requests_count(self) -> int:
+        return self._requests_count
+
+    @property
+    def connections_created(self) -> int:
+        return self._connections_created
+
+    @property
+    def connections_reused(self) -> int:
+        return self._connections_reused
+
+    @property
+    def dns_cache_hits(self) -> int:
+        return self._dns_cache_hits
+
+    @property
+    def dns_cache_misses(self) -> int:
+        return self._dns_cache_misses
+
+    @property
+    def reuse_ratio(self) -> Optional[float]:
+        """
+        :return: the share of the connections acquired from the pool instead of being opened
+        """
+        acquired_connections = self._connections_created + self._connections_reused
+        return self._connections_reused / acquired_connections if acquired_connections > 0 else None
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+        return trace_config
+
+    def reset(self):
+        self._requests_count = 0
+        self._connections_created = 0
+        self._connections_reused = 0
+        self._dns_cache_hits = 0
+        self._dns_cache_misses = 0
+
+    def to_dict(self) -> Dict[str, Union[int, Optional[float]]]:
+        return {
+            "requests_count": self._requests_count,
+            "connections_created": self._connections_created,
+            "connections_reused": self._connections_reused,
+            "reuse_ratio": self.reuse_ratio,
+            "dns_cache_hits": self._dns_cache_hits,
+            "dns_cache_misses": self._dns_cache_misses,
+        }
+
+    async def _on_request_start(self, session, trace_config_ctx, params):
+        self._requests_count += 1
+
+    async def _on_connection_create_end(self, session, trace_config_ctx, params):
+        self._connections_created += 1
+
+    async def _on_connection_reuseconn(self, session, trace_config_ctx, params):
+        self._connections_reused += 1
+
+    async def _on_dns_cache_hit(self, session, trace_config_ctx, params):
+        self._dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(self, session, trace_config_ctx, params):
+        self._dns_cache_misses += 1
@@ -2,6 +2,12 @@ from typing import Optional
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.connection_pool import (
+    DEFAULT_CONNECTION_POOL_SETTINGS,
+    HTTPConnectionPoolSettings,
+    HTTPConnectionPoolStats,
+)
+from hummingbot.core.web_assistant.connections.json_decoder import DEFAULT_JSON_DECODER, JSONDecoder
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -18,22 +24,52 @@ class ConnectionsFactory:
     `aiohttp` and `WSConnection`s using `signalr_aio`.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        json_decoder: JSONDecoder = DEFAULT_JSON_DECODER,
+        connection_pool_settings: HTTPConnectionPoolSettings = DEFAULT_CONNECTION_POOL_SETTINGS,
+    ):
         # _ws_independent_session is intended to be used only in unit tests
         self._ws_independent_session: Optional[aiohttp.ClientSession] = None
 
         self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._json_decoder = json_decoder
+        # Resolved once, so a missing optional decoder library fails when the factory is created
+        self._json_loads = json_decoder.loads
+        self._connection_pool_settings = connection_pool_settings
+        self._connection_pool_stats = HTTPConnectionPoolStats()
+
+    @property
+    def json_decoder(self) -> JSONDecoder:
+        return self._json_decoder
+
+    @property
+    def connection_pool_settings(self) -> HTTPConnectionPoolSettings:
+        return self._connection_pool_settings
+
+    @connection_pool_settings.setter
+    def connection_pool_settings(self, settings: HTTPConnectionPoolSettings):
+        """The settings are only used by the shared client session created after they are set."""
+        self._connection_pool_settings = settings
+
+    @property
+    def connection_pool_stats(self) -> HTTPConnectionPoolStats:
+        return self._connection_pool_stats
 
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
-        connection = RESTConnection(aiohttp_client_session=shared_client)
+        connection = RESTConnection(aiohttp_client_session=shared_client, json_loads=self._json_loads)
         return connection
 
     async def get_ws_connection(self) -> WSConnection:
         shared_client = self._ws_independent_session or await self._get_shared_client()
-        connection = WSConnection(aiohttp_client_session=shared_client)
+        connection = WSConnection(aiohttp_client_session=shared_client, json_loads=self._json_loads)
         return connection
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
-        self._shared_client = self._shared_client or aiohttp.ClientSession()
+        if self._shared_client is None:
+            self._shared_client = aiohttp.ClientSession(
+                connector=self._connection_pool_settings.build_connector(),
+                trace_configs=[self._connection_pool_stats.trace_config()],
+            )
         return self._shared_client
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING, Any, Mapping, Optional
 import aiohttp
 import ujson
 
+from hummingbot.core.web_assistant.connections.json_decoder import DEFAULT_JSON_DECODER, JSONLoads
+
 if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -85,8 +87,9 @@ class RESTResponse:
     status: int
     headers: Optional[Mapping[str, str]]
 
-    def __init__(self, aiohttp_response: aiohttp.ClientResponse):
+    def __init__(self, aiohttp_response: aiohttp.ClientResponse, json_loads: JSONLoads = DEFAULT_JSON_DECODER.loads):
         self._aiohttp_response = aiohttp_response
+        self._json_loads = json_loads
 
     @property
     def url(self) -> str:
@@ -109,7 +112,7 @@ class RESTResponse:
         return headers_
 
     async def json(self) -> Any:
-        json_ = await self._aiohttp_response.json()
+        json_ = await self._aiohttp_response.json(loads=self._json_loads)
         return json_
 
     async def text(self) -> str:
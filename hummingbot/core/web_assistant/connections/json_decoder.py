@@ -0,0 +1,41 @@
+import json
+from enum import Enum
+from typing import Any, Callable, List, Union
+
+import ujson
+
+JSONLoads = Callable[[Union[str, bytes]], Any]
+
+
+class JSONDecoder(Enum):
+    """The libraries that can decode the JSON payloads of the REST responses and the websocket messages.
+
+    `orjson` is the fastest one, but it is an optional dependency. `ujson` is always installed and is the default.
+    All the decoders raise a `ValueError` subclass on invalid JSON.
+    """
+    STDLIB = "json"
+    UJSON = "ujson"
+    ORJSON = "orjson"
+
+    @property
+    def loads(self) -> JSONLoads:
+        if self == JSONDecoder.ORJSON:
+            import orjson
+            return orjson.loads
+        if self == JSONDecoder.UJSON:
+            return ujson.loads
+        return json.loads
+
+    @classmethod
+    def available_decoders(cls) -> List["JSONDecoder"]:
+        decoders = []
+        for decoder in cls:
+            try:
+                _ = decoder.loads
+            except ImportError:
+                continue
+            decoders.append(decoder)
+        return decoders
+
+
+DEFAULT_JSON_DECODER = JSONDecoder.UJSON
@@ -1,19 +1,23 @@
 import asyncio
 import time
-from json import JSONDecodeError
 from typing import Any, Dict, Mapping, Optional
 
 import aiohttp
 from aiohttp import WebSocketError, WSCloseCode
 
+from hummingbot.core.utils.latency_tracer import LatencyStage, LatencyTracer
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_decoder import DEFAULT_JSON_DECODER, JSONLoads
+
+latency_tracer = LatencyTracer.get_instance()
 
 
 class WSConnection:
     _MAX_MSG_SIZE = 4 * 1024 * 1024  # default aiohttp: 4 * 1024 * 1024
 
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession, json_loads: JSONLoads = DEFAULT_JSON_DECODER.loads):
         self._client_session = aiohttp_client_session
+        self._json_loads = json_loads
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
@@ -66,7 +70,12 @@ class WSConnection:
             msg = await self._read_message()
             msg = await self._process_message(msg)
             if msg is not None:
-                response = self._build_resp(msg)
+                if latency_tracer.enabled:
+                    start_time = latency_tracer.now()
+                    response = self._build_resp(msg)
+                    latency_tracer.record_since(LatencyStage.WS_MESSAGE_DECODE, start_time)
+                else:
+                    response = self._build_resp(msg)
                 break
         return response
 
@@ -141,14 +150,14 @@ class WSConnection:
     async def _send_binary(self, payload: bytes):
         await self._connection.send_bytes(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
         if msg.type == aiohttp.WSMsgType.BINARY:
             data = msg.data
         else:
             try:
-                data = msg.json()
-            except JSONDecodeError:
+                data = msg.json(loads=self._json_loads)
+            except ValueError:
+                # All the decoders errors are ValueError subclasses
                 data = msg.data
         response = WSResponse(data)
         return response
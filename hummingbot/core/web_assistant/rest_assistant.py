@@ -4,12 +4,15 @@ from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.utils.latency_tracer import LatencyStage, LatencyTracer
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 
+latency_tracer = LatencyTracer.get_instance()
+
 
 class RESTAssistant:
     """A helper class to contain all REST-related logic.
@@ -116,7 +119,10 @@ class RESTAssistant:
 
     async def _authenticate(self, request: RESTRequest):
         if self._auth is not None and request.is_auth_required:
+            start_time = latency_tracer.now() if latency_tracer.enabled else None
             request = await self._auth.rest_authenticate(request)
+            if start_time is not None:
+                latency_tracer.record_since(LatencyStage.REQUEST_SIGNING, start_time)
         return request
 
     async def _post_process_response(self, response: RESTResponse) -> RESTResponse:
@@ -0,0 +1,194 @@
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import aiohttp
+
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+from hummingbot.logger import HummingbotLogger
+
+
+class EndpointStats:
+    """Rolling latency and health of one REST base URL."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.latency: Optional[float] = None
+        self.requests_count = 0
+        self.failures_count = 0
+        self.hedged_wins_count = 0
+        self.unhealthy_until = 0.0
+
+    def is_healthy(self, now: float) -> bool:
+        return self.unhealthy_until <= now
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "latency_ms": self.latency * 1e3 if self.latency is not None else None,
+            "requests_count": self.requests_count,
+            "failures_count": self.failures_count,
+            "hedged_wins_count": self.hedged_wins_count,
+        }
+
+
+class RESTEndpointRouter:
+    """Routes the REST requests of a connector to the fastest of several equivalent API hosts.
+
+    The latency of each host is an exponential moving average of its requests durations. Hosts never used yet are
+    tried first, so every host gets measured. A host whose connection fails is skipped for `failure_cooldown` seconds.
+
+    When `hedging_delay` is positive, a GET request still running after that delay is sent again to the second fastest
+    host, and the first response wins. The hedged request goes through the rest assistant like any other request, so
+    it is counted by the throttler.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(
+        self,
+        base_urls: List[str],
+        hedging_delay: float = 0,
+        latency_smoothing: float = 0.2,
+        failure_cooldown: float = 30,
+        time_provider: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        :param base_urls: the equivalent base URLs, the first one being the URL the connector builds its requests with
+        :param hedging_delay: seconds to wait before hedging a GET request to the second fastest host (0 to disable)
+        :param latency_smoothing: weight of the last request in the latency moving average
+        :param failure_cooldown: seconds a host is skipped after a connection failure
+        """
+        if len(base_urls) == 0:
+            raise ValueError("At least one base URL is required.")
+        self._base_urls = list(base_urls)
+        self._endpoints: Dict[str, EndpointStats] = {url: EndpointStats(url) for url in self._base_urls}
+        self._hedging_delay = hedging_delay
+        self._latency_smoothing = latency_smoothing
+        self._failure_cooldown = failure_cooldown
+        self._time = time_provider
+
+    @property
+    def base_urls(self) -> List[str]:
+        return list(self._base_urls)
+
+    @property
+    def hedging_delay(self) -> float:
+        return self._hedging_delay
+
+    def endpoint_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {base_url: stats.to_dict() for base_url, stats in self._endpoints.items()}
+
+    def ranked_base_urls(self) -> List[str]:
+        """
+        :return: the healthy base URLs from the fastest to the slowest (the ones not measured yet first), followed by
+        the unhealthy ones from the first to recover
+        """
+        now = self._time()
+        healthy = [stats for stats in self._endpoints.values() if stats.is_healthy(now)]
+        unhealthy = [stats for stats in self._endpoints.values() if not stats.is_healthy(now)]
+        healthy.sort(key=lambda stats: -1 if stats.latency is None else stats.latency)
+        unhealthy.sort(key=lambda stats: stats.unhealthy_until)
+        return [stats.base_url for stats in healthy + unhealthy]
+
+    def record_latency(self, base_url: str, latency: float):
+        stats = self._endpoints[base_url]
+        stats.requests_count += 1
+        if stats.latency is None:
+            stats.latency = latency
+        else:
+            stats.latency += self._latency_smoothing * (latency - stats.latency)
+
+    def record_failure(self, base_url: str):
+        stats = self._endpoints[base_url]
+        stats.requests_count += 1
+        stats.failures_count += 1
+        stats.unhealthy_until = self._time() + self._failure_cooldown
+
+    def routed_url(self, url: str, base_url: str) -> str:
+        """
+        :return: the URL with its base replaced by `base_url`, or the URL itself if it is not built on the first one
+        """
+        primary_base_url = self._base_urls[0]
+        if not url.startswith(primary_base_url):
+            return url
+        return base_url + url[len(primary_base_url):]
+
+    async def execute_request(
+        self,
+        rest_assistant: RESTAssistant,
+        url: str,
+        method: RESTMethod = RESTMethod.GET,
+        **kwargs,
+    ):
+        """
+        Executes the request with `rest_assistant.execute_request` on the fastest host, hedging it if it is a GET.
+        The keyword arguments are passed to `execute_request`.
+        """
+        if not url.startswith(self._base_urls[0]):
+            return await rest_assistant.execute_request(url=url, method=method, **kwargs)
+
+        ranked_base_urls = self.ranked_base_urls()
+        if method != RESTMethod.GET or self._hedging_delay <= 0 or len(ranked_base_urls) < 2:
+            return await self._execute_on_endpoint(ranked_base_urls[0], rest_assistant, url, method, **kwargs)
+
+        return await self._execute_hedged_request(ranked_base_urls[:2], rest_assistant, url, method, **kwargs)
+
+    async def _execute_on_endpoint(
+        self,
+        base_url: str,
+        rest_assistant: RESTAssistant,
+        url: str,
+        method: RESTMethod,
+        **kwargs,
+    ):
+        start = self._time()
+        try:
+            result = await rest_assistant.execute_request(url=self.routed_url(url, base_url), method=method, **kwargs)
+        except asyncio.CancelledError:
+            # The host lost a hedged race, it took at least the time elapsed so far
+            self.record_latency(base_url, self._time() - start)
+            raise
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            self.record_failure(base_url)
+            raise
+        self.record_latency(base_url, self._time() - start)
+        return result
+
+    async def _execute_hedged_request(
+        self,
+        base_urls: List[str],
+        rest_assistant: RESTAssistant,
+        url: str,
+        method: RESTMethod,
+        **kwargs,
+    ):
+        primary_task = asyncio.ensure_future(
+            self._execute_on_endpoint(base_urls[0], rest_assistant, url, method, **kwargs))
+        pending = {primary_task}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self._hedging_delay)
+            if primary_task in done:
+                return primary_task.result()
+
+            hedge_task = asyncio.ensure_future(
+                self._execute_on_endpoint(base_urls[1], rest_assistant, url, method, **kwargs))
+            pending.add(hedge_task)
+            while len(pending) > 0:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge_task:
+                            self._endpoints[base_urls[1]].hedged_wins_count += 1
+                        return task.result()
+            # Both requests failed, the error of the fastest host is the relevant one
+            raise primary_task.exception()
+        finally:
+            for task in pending:
+                task.cancel()
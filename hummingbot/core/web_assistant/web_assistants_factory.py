@@ -2,7 +2,13 @@ from typing import List, Optional
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.connection_pool import (
+    DEFAULT_CONNECTION_POOL_SETTINGS,
+    HTTPConnectionPoolSettings,
+    HTTPConnectionPoolStats,
+)
 from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.json_decoder import DEFAULT_JSON_DECODER, JSONDecoder
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
@@ -29,8 +35,11 @@ class WebAssistantsFactory:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        json_decoder: JSONDecoder = DEFAULT_JSON_DECODER,
+        connection_pool_settings: HTTPConnectionPoolSettings = DEFAULT_CONNECTION_POOL_SETTINGS,
     ):
-        self._connections_factory = ConnectionsFactory()
+        self._connections_factory = ConnectionsFactory(
+            json_decoder=json_decoder, connection_pool_settings=connection_pool_settings)
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._ws_pre_processors = ws_pre_processors or []
@@ -46,6 +55,18 @@ class WebAssistantsFactory:
     def auth(self) -> Optional[AuthBase]:
         return self._auth
 
+    @property
+    def connection_pool_settings(self) -> HTTPConnectionPoolSettings:
+        return self._connections_factory.connection_pool_settings
+
+    @connection_pool_settings.setter
+    def connection_pool_settings(self, settings: HTTPConnectionPoolSettings):
+        self._connections_factory.connection_pool_settings = settings
+
+    @property
+    def connection_pool_stats(self) -> HTTPConnectionPoolStats:
+        return self._connections_factory.connection_pool_stats
+
     async def get_rest_assistant(self) -> RESTAssistant:
         connection = await self._connections_factory.get_rest_connection()
         assistant = RESTAssistant(
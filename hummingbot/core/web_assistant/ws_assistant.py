@@ -1,12 +1,15 @@
 from copy import deepcopy
 from typing import AsyncGenerator, Dict, List, Optional
 
+from hummingbot.core.utils.latency_tracer import LatencyStage, LatencyTracer
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
 from hummingbot.core.web_assistant.ws_pre_processors import WSPreProcessorBase
 
+latency_tracer = LatencyTracer.get_instance()
+
 
 class WSAssistant:
     """A helper class to contain all WebSocket-related logic.
@@ -87,7 +90,10 @@ class WSAssistant:
 
     async def _authenticate(self, request: WSRequest) -> WSRequest:
         if self._auth is not None and request.is_auth_required:
+            start_time = latency_tracer.now() if latency_tracer.enabled else None
             request = await self._auth.ws_authenticate(request)
+            if start_time is not None:
+                latency_tracer.record_since(LatencyStage.REQUEST_SIGNING, start_time)
         return request
 
     async def _post_process_response(self, response: WSResponse) -> WSResponse:
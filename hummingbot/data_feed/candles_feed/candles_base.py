@@ -145,6 +145,15 @@ class CandlesBase(NetworkBase):
         """
         return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
 
+    @property
+    def last_candle(self) -> Optional[List[float]]:
+        """
+        This property returns the last candle as a list of the values of the columns, without building the DataFrame.
+        """
+        if len(self._candles) == 0:
+            return None
+        return [float(value) for value in self._candles[-1]]
+
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
 
@@ -11,4 +11,5 @@ def get_declarative_base():
     from .range_position_collected_fees import RangePositionCollectedFees  # noqa: F401
     from .range_position_update import RangePositionUpdate  # noqa: F401
     from .trade_fill import TradeFill  # noqa: F401
+    from .trade_fill_ledger import TradeFillLedger  # noqa: F401
     return HummingbotBase
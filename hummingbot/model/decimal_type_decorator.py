@@ -1,6 +1,6 @@
 from decimal import Decimal
 
-from sqlalchemy import BigInteger, TypeDecorator
+from sqlalchemy import BigInteger, Text, TypeDecorator
 
 
 class SqliteDecimal(TypeDecorator):
@@ -36,3 +36,24 @@ class SqliteDecimal(TypeDecorator):
 
     def _convert_decimal(self, value: Decimal) -> int:
         return int(Decimal(value) * self.multiplier_int) if value is not None else value
+
+
+class DecimalText(TypeDecorator):
+    """
+    This TypeDecorator use Sqlalchemy Text as impl. It stores Decimals as their string representation, so values such
+    as running totals are stored without losing precision nor being bounded by the size of an integer column.
+    """
+    impl = Text
+
+    @property
+    def python_type(self):
+        return Decimal
+
+    def process_bind_param(self, value, dialect):
+        return str(Decimal(value)) if value is not None else value
+
+    def process_result_value(self, value, dialect):
+        return Decimal(value) if value is not None else value
+
+    def process_literal_param(self, value, dialect):
+        return f"'{self.process_bind_param(value, dialect)}'"
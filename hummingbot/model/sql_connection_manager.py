@@ -12,6 +12,7 @@ from hummingbot import data_path
 from hummingbot.logger.logger import HummingbotLogger
 from hummingbot.model import get_declarative_base
 from hummingbot.model.metadata import Metadata as LocalMetadata
+from hummingbot.model.trade_fill_ledger import TradeFillLedger
 from hummingbot.model.transaction_base import TransactionBase
 
 if TYPE_CHECKING:
@@ -28,6 +29,8 @@ class SQLConnectionManager(TransactionBase):
 
     LOCAL_DB_VERSION_KEY = "local_db_version"
     LOCAL_DB_VERSION_VALUE = "20230516"
+    TRADE_FILL_LEDGER_VERSION_KEY = "trade_fill_ledger_version"
+    TRADE_FILL_LEDGER_VERSION_VALUE = "1"
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -95,6 +98,7 @@ class SQLConnectionManager(TransactionBase):
 
         if connection_type is SQLConnectionType.TRADE_FILLS and (not called_from_migrator):
             self.check_and_migrate_db(client_config_map)
+            self.check_and_build_trade_fill_ledger()
 
     @property
     def engine(self) -> Engine:
@@ -130,3 +134,23 @@ class SQLConnectionManager(TransactionBase):
                             # Cannot use variable local_db_version because reference is not valid
                             # since Migrator changed it
                             self.get_local_db_version(session=session).value = self.LOCAL_DB_VERSION_VALUE
+
+    def check_and_build_trade_fill_ledger(self):
+        """
+        Aggregates the trade fills recorded before the trade fill ledger existed. It only happens once per database,
+        the ledger is then updated as the fills are recorded.
+        """
+        with self.get_new_session() as session:
+            with session.begin():
+                ledger_version: Optional[LocalMetadata] = (session.query(LocalMetadata)
+                                                           .filter(LocalMetadata.key == self.TRADE_FILL_LEDGER_VERSION_KEY)
+                                                           .one_or_none())
+                if ledger_version is not None and ledger_version.value >= self.TRADE_FILL_LEDGER_VERSION_VALUE:
+                    return
+                self.logger().info("Building the trade fills ledger from the recorded trade fills...")
+                TradeFillLedger.rebuild(session)
+                if ledger_version is None:
+                    session.add(LocalMetadata(key=self.TRADE_FILL_LEDGER_VERSION_KEY,
+                                              value=self.TRADE_FILL_LEDGER_VERSION_VALUE))
+                else:
+                    ledger_version.value = self.TRADE_FILL_LEDGER_VERSION_VALUE
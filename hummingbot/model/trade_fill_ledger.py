@@ -0,0 +1,261 @@
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, Text
+from sqlalchemy.orm import Query, Session
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee
+from hummingbot.core.event.events import PositionAction
+from hummingbot.model import HummingbotBase
+from hummingbot.model.decimal_type_decorator import DecimalText
+from hummingbot.model.trade_fill import TradeFill
+
+s_decimal_0 = Decimal("0")
+
+
+class TradeFillLedger(HummingbotBase):
+    """
+    Running aggregates of the trade fills of a config file on a market, one entry per hour.
+
+    The entries are updated as the fills are recorded, so the performance of a period can be computed from the entries
+    it covers plus the fills of its first, partially covered, hour, instead of from all its fills.
+
+    Besides the volumes and fees of its hour, the latest entry of a market holds the running position, cost basis
+    (the quote amount paid for the open position) and realized P&L of the market, computed with the average cost
+    method. The fees are not included in the realized P&L.
+    """
+    __tablename__ = "TradeFillLedger"
+    __table_args__ = (Index("tfl_config_market_period_index",
+                            "config_file_path", "market", "symbol", "period_start", unique=True),
+                      Index("tfl_config_period_index",
+                            "config_file_path", "period_start"),
+                      )
+
+    PERIOD_DURATION_MS = 60 * 60 * 1000
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    symbol = Column(Text, nullable=False)
+    period_start = Column(BigInteger, nullable=False)
+    first_timestamp = Column(BigInteger, nullable=False)
+    last_timestamp = Column(BigInteger, nullable=False)
+    first_price = Column(DecimalText, nullable=False)
+    last_price = Column(DecimalText, nullable=False)
+    num_buys = Column(Integer, nullable=False, default=0)
+    num_sells = Column(Integer, nullable=False, default=0)
+    num_position_fills = Column(Integer, nullable=False, default=0)
+    buy_base_volume = Column(DecimalText, nullable=False, default=s_decimal_0)
+    buy_quote_volume = Column(DecimalText, nullable=False, default=s_decimal_0)
+    sell_base_volume = Column(DecimalText, nullable=False, default=s_decimal_0)
+    sell_quote_volume = Column(DecimalText, nullable=False, default=s_decimal_0)
+    deducted_fees_in_quote = Column(DecimalText, nullable=False, default=s_decimal_0)
+    fees = Column(JSON, nullable=False, default=dict)
+    position = Column(DecimalText, nullable=False, default=s_decimal_0)
+    cost_basis = Column(DecimalText, nullable=False, default=s_decimal_0)
+    realized_pnl = Column(DecimalText, nullable=False, default=s_decimal_0)
+
+    def __repr__(self) -> str:
+        return f"TradeFillLedger(config_file_path='{self.config_file_path}', market='{self.market}', " \
+               f"symbol='{self.symbol}', period_start={self.period_start}, num_buys={self.num_buys}, " \
+               f"num_sells={self.num_sells}, buy_base_volume={self.buy_base_volume}, " \
+               f"sell_base_volume={self.sell_base_volume}, position={self.position}, " \
+               f"cost_basis={self.cost_basis}, realized_pnl={self.realized_pnl})"
+
+    @property
+    def fee_amounts(self) -> Dict[str, Decimal]:
+        return {token: Decimal(amount) for token, amount in self.fees.items()}
+
+    @classmethod
+    def period_start_for(cls, timestamp: int) -> int:
+        return timestamp - timestamp % cls.PERIOD_DURATION_MS
+
+    @classmethod
+    def first_full_period_start(cls, start_timestamp: int) -> int:
+        """
+        :return: the start of the first period entirely after `start_timestamp` (itself if it starts a period)
+        """
+        return -(-start_timestamp // cls.PERIOD_DURATION_MS) * cls.PERIOD_DURATION_MS
+
+    @staticmethod
+    def get_entries(sql_session: Session,
+                    config_file_path: str,
+                    start_timestamp: int,
+                    market: Optional[str] = None,
+                    symbol: Optional[str] = None) -> List["TradeFillLedger"]:
+        """
+        :return: the entries of the periods starting at or after `start_timestamp` (in milliseconds), ordered by period
+        """
+        filters = [TradeFillLedger.config_file_path.like(f"%{config_file_path}%"),
+                   TradeFillLedger.period_start >= start_timestamp]
+        if market is not None:
+            filters.append(TradeFillLedger.market == market)
+        if symbol is not None:
+            filters.append(TradeFillLedger.symbol == symbol)
+        query: Query = (sql_session
+                        .query(TradeFillLedger)
+                        .filter(*filters)
+                        .order_by(TradeFillLedger.period_start.asc()))
+        return query.all()
+
+    @classmethod
+    def record_fill(cls, sql_session: Session, trade_fill: TradeFill):
+        """
+        Adds the fill to the entry of its period and updates the running position of its market. It has to be called
+        in the session the fill is added with.
+        """
+        timestamp = trade_fill.timestamp
+        period_start = cls.period_start_for(timestamp)
+        market_filters = [cls.config_file_path == trade_fill.config_file_path,
+                          cls.market == trade_fill.market,
+                          cls.symbol == trade_fill.symbol]
+        latest_entry: Optional[TradeFillLedger] = (sql_session
+                                                   .query(cls)
+                                                   .filter(*market_filters)
+                                                   .order_by(cls.period_start.desc())
+                                                   .first())
+        if latest_entry is not None and latest_entry.period_start == period_start:
+            entry = latest_entry
+        elif latest_entry is not None and latest_entry.period_start > period_start:
+            # A late fill, its volumes go to its own period but the running position is the latest one
+            entry = (sql_session
+                     .query(cls)
+                     .filter(*market_filters, cls.period_start == period_start)
+                     .one_or_none())
+        else:
+            entry = None
+
+        if entry is None:
+            is_latest_period = latest_entry is None or latest_entry.period_start < period_start
+            entry = cls._new_entry(trade_fill, period_start, latest_entry if is_latest_period else None)
+            sql_session.add(entry)
+            if is_latest_period:
+                latest_entry = entry
+
+        entry.add_fill(trade_fill)
+        latest_entry.update_running_position(trade_fill)
+
+    @classmethod
+    def rebuild(cls, sql_session: Session):
+        """
+        Recreates all the entries from the recorded fills. The entries are aggregated in memory, in one pass over the
+        fills in chronological order.
+        """
+        sql_session.query(cls).delete()
+        trade_fills: Query = (sql_session
+                              .query(TradeFill)
+                              .order_by(TradeFill.timestamp.asc())
+                              .yield_per(10000))
+        entries: Dict[Tuple[str, str, str, int], TradeFillLedger] = {}
+        latest_entries: Dict[Tuple[str, str, str], TradeFillLedger] = {}
+        for trade_fill in trade_fills:
+            market_key = (trade_fill.config_file_path, trade_fill.market, trade_fill.symbol)
+            period_start = cls.period_start_for(trade_fill.timestamp)
+            entry = entries.get(market_key + (period_start,))
+            if entry is None:
+                entry = cls._new_entry(trade_fill, period_start, latest_entries.get(market_key))
+                entries[market_key + (period_start,)] = entry
+                latest_entries[market_key] = entry
+            entry.add_fill(trade_fill)
+            latest_entries[market_key].update_running_position(trade_fill)
+        sql_session.add_all(entries.values())
+
+    @classmethod
+    def _new_entry(cls,
+                   trade_fill: TradeFill,
+                   period_start: int,
+                   running_entry: Optional["TradeFillLedger"]) -> "TradeFillLedger":
+        """
+        :param running_entry: the entry to carry the running position from, if the new entry is the latest one
+        """
+        price = cls._stored_value(TradeFill.price, trade_fill.price)
+        return cls(
+            config_file_path=trade_fill.config_file_path,
+            market=trade_fill.market,
+            symbol=trade_fill.symbol,
+            period_start=period_start,
+            first_timestamp=trade_fill.timestamp,
+            last_timestamp=trade_fill.timestamp,
+            first_price=price,
+            last_price=price,
+            num_buys=0,
+            num_sells=0,
+            num_position_fills=0,
+            buy_base_volume=s_decimal_0,
+            buy_quote_volume=s_decimal_0,
+            sell_base_volume=s_decimal_0,
+            sell_quote_volume=s_decimal_0,
+            deducted_fees_in_quote=s_decimal_0,
+            fees={},
+            position=running_entry.position if running_entry is not None else s_decimal_0,
+            cost_basis=running_entry.cost_basis if running_entry is not None else s_decimal_0,
+            realized_pnl=running_entry.realized_pnl if running_entry is not None else s_decimal_0,
+        )
+
+    def add_fill(self, trade_fill: TradeFill):
+        price = self._stored_value(TradeFill.price, trade_fill.price)
+        amount = self._stored_value(TradeFill.amount, trade_fill.amount)
+        if trade_fill.trade_type.upper() == TradeType.BUY.name:
+            self.num_buys += 1
+            self.buy_base_volume += amount
+            self.buy_quote_volume += amount * price
+        elif trade_fill.trade_type.upper() == TradeType.SELL.name:
+            self.num_sells += 1
+            self.sell_base_volume += amount
+            self.sell_quote_volume += amount * price
+        if trade_fill.position is not None and trade_fill.position != PositionAction.NIL.value:
+            self.num_position_fills += 1
+
+        if trade_fill.timestamp < self.first_timestamp:
+            self.first_timestamp = trade_fill.timestamp
+            self.first_price = price
+        if trade_fill.timestamp >= self.last_timestamp:
+            self.last_timestamp = trade_fill.timestamp
+            self.last_price = price
+
+        trade_fee = trade_fill.trade_fee
+        fees = self.fee_amounts
+        if trade_fee.get("percent") is not None:
+            fee_percent = Decimal(str(trade_fee["percent"]))
+            quote = trade_fill.symbol.split("-")[1]
+            fees[quote] = fees.get(quote, s_decimal_0) + price * amount * fee_percent
+            if trade_fee.get("fee_type") == DeductedFromReturnsTradeFee.type_descriptor_for_json():
+                self.deducted_fees_in_quote += amount * price * fee_percent
+        for flat_fee in trade_fee.get("flat_fees", []):
+            fees[flat_fee["token"]] = fees.get(flat_fee["token"], s_decimal_0) + Decimal(flat_fee["amount"])
+        # The JSON column is only saved when it is assigned a new value
+        self.fees = {token: str(fee_amount) for token, fee_amount in fees.items()}
+
+    def update_running_position(self, trade_fill: TradeFill):
+        price = self._stored_value(TradeFill.price, trade_fill.price)
+        amount = self._stored_value(TradeFill.amount, trade_fill.amount)
+        signed_amount = amount if trade_fill.trade_type.upper() == TradeType.BUY.name else -amount
+        position = self.position
+        if position == s_decimal_0 or (position > 0) == (signed_amount > 0):
+            self.cost_basis += amount * price
+            self.position = position + signed_amount
+            return
+
+        closed_amount = min(amount, abs(position))
+        average_cost = self.cost_basis / abs(position)
+        if position > 0:
+            self.realized_pnl += (price - average_cost) * closed_amount
+        else:
+            self.realized_pnl += (average_cost - price) * closed_amount
+        self.position = position + signed_amount
+        if self.position == s_decimal_0:
+            self.cost_basis = s_decimal_0
+        elif (self.position > 0) == (position > 0):
+            self.cost_basis -= average_cost * closed_amount
+        else:
+            # The fill reversed the position, the remaining amount is a new position at the fill price
+            self.cost_basis = abs(self.position) * price
+
+    @staticmethod
+    def _stored_value(column, value) -> Decimal:
+        """
+        :return: the value as it is read back from the column, so fills not stored yet are aggregated like stored ones
+        """
+        column_type = column.type
+        return column_type.process_result_value(column_type.process_bind_param(value, None), None)
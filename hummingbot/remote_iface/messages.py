@@ -26,6 +26,12 @@ class InternalEventMessage(PubSubMessage):
     data: Optional[dict] = {}
 
 
+class MarketDataMessage(PubSubMessage):
+    timestamp: Optional[int] = -1
+    type: Optional[str] = ''
+    data: Optional[Dict[str, Any]] = {}
+
+
 class LogMessage(PubSubMessage):
     timestamp: float = 0.0
     msg: str = ''
@@ -34,6 +40,10 @@ class LogMessage(PubSubMessage):
     logger_name: str = ''
 
 
+class BatchMessage(PubSubMessage):
+    messages: List[Dict[str, Any]] = []
+
+
 class ExternalEventMessage(PubSubMessage):
     timestamp: Optional[int] = -1
     sequence: Optional[int] = 0
@@ -117,6 +127,29 @@ class HistoryCommandMessage(RPCMessage):
         trades: Optional[List[Any]] = []
 
 
+class LatencyCommandMessage(RPCMessage):
+    class Request(RPCMessage.Request):
+        option: Optional[str] = None
+
+    class Response(RPCMessage.Response):
+        status: Optional[int] = MQTT_STATUS_CODE.SUCCESS
+        msg: Optional[str] = ''
+        enabled: Optional[bool] = False
+        data: Optional[Dict[str, Dict[str, Any]]] = {}
+
+
+class ProfileCommandMessage(RPCMessage):
+    class Request(RPCMessage.Request):
+        option: Optional[str] = 'start'
+        duration: Optional[float] = 30.0
+        sampling_interval: Optional[float] = 10.0
+        blocking_threshold: Optional[float] = 100.0
+
+    class Response(RPCMessage.Response):
+        status: Optional[int] = MQTT_STATUS_CODE.SUCCESS
+        msg: Optional[str] = ''
+
+
 class BalanceLimitCommandMessage(RPCMessage):
     class Request(RPCMessage.Request):
         exchange: str
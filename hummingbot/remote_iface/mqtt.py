@@ -21,6 +21,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
     from hummingbot.core.event.event_listener import EventListener  # noqa: F401
 
+from commlib.msg import PubSubMessage
 from commlib.node import Node, NodeState
 from commlib.transports.mqtt import ConnectionParameters as MQTTConnectionParameters
 
@@ -29,19 +30,24 @@ from hummingbot.core.event import events
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.pubsub import PubSub
 from hummingbot.core.utils.async_utils import call_sync, safe_ensure_future
+from hummingbot.core.utils.latency_tracer import LatencyTracer
 from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.remote_iface.messages import (
     MQTT_STATUS_CODE,
     BalanceLimitCommandMessage,
     BalancePaperCommandMessage,
+    BatchMessage,
     CommandShortcutMessage,
     ConfigCommandMessage,
     ExternalEventMessage,
     HistoryCommandMessage,
     ImportCommandMessage,
     InternalEventMessage,
+    LatencyCommandMessage,
     LogMessage,
+    MarketDataMessage,
     NotifyMessage,
+    ProfileCommandMessage,
     StartCommandMessage,
     StatusCommandMessage,
     StatusUpdateMessage,
@@ -61,6 +67,8 @@ class CommandTopicSpecs:
     BALANCE_LIMIT: str = '/balance/limit'
     BALANCE_PAPER: str = '/balance/paper'
     COMMAND_SHORTCUT: str = '/command_shortcuts'
+    LATENCY: str = '/latency'
+    PROFILE: str = '/profile'
 
 
 class TopicSpecs:
@@ -72,6 +80,207 @@ class TopicSpecs:
     STATUS_UPDATES: str = '/status_updates'
     HEARTBEATS: str = '/hb'
     EXTERNAL_EVENTS: str = '/external/event/*'
+    MARKET_DATA: str = '/market_data'
+
+
+class _TopicQueue:
+    def __init__(self, publisher: Any, max_size: int):
+        self.publisher = publisher
+        self.max_size = max_size
+        self.messages: deque = deque()
+        self.conflated_messages: Dict[Any, PubSubMessage] = {}
+        self.published_count = 0
+        self.dropped_count = 0
+        self.conflated_count = 0
+
+    def __len__(self):
+        return len(self.messages) + len(self.conflated_messages)
+
+
+class MQTTPublishQueue:
+    """
+    Publishes the messages of the MQTT bridge from a background thread, so the event loop only queues them.
+
+    The queued messages are published every `flush_interval` seconds, taking at most `max_batch_size` messages of
+    each topic at a time so a burst on one topic does not hold back the others. The queue of each topic is bounded to
+    `max_queue_size` messages, the oldest ones are dropped and counted when it is full. A message queued with a
+    conflation key replaces the queued message with the same key, so only the latest value of status-like messages
+    is published. With a `flush_interval` of 0 the messages are published as they are queued.
+
+    With `publish_batches` the messages of a topic taken at a time are published as a single `BatchMessage`, whose
+    `messages` field holds the list of their payloads in the order they were queued.
+    """
+    _DROPS_REPORT_INTERVAL = 60.0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global mqtts_logger
+        if mqtts_logger is None:  # pragma: no cover
+            mqtts_logger = logging.getLogger(__name__)
+        return mqtts_logger
+
+    def __init__(self,
+                 flush_interval: float = 0.1,
+                 max_queue_size: int = 10000,
+                 max_batch_size: int = 1000,
+                 publish_batches: bool = False):
+        self._flush_interval = flush_interval
+        self._max_queue_size = max_queue_size
+        self._max_batch_size = max_batch_size
+        self._publish_batches = publish_batches
+        self._queues: Dict[str, _TopicQueue] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._flushing = threading.local()
+        self._reported_dropped_count = 0
+        self._last_drops_report = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def put(self, publisher: Any, msg: PubSubMessage, conflation_key: Optional[Any] = None):
+        """
+        Queues the message to be published by the publisher. It can be called from any thread.
+
+        :param conflation_key: the key of the value the message holds, a queued message with the same key is replaced
+        """
+        with self._lock:
+            queue = self._queues.get(publisher.topic)
+            if queue is None:
+                queue = self._queues[publisher.topic] = _TopicQueue(publisher, self._max_queue_size)
+            # The publishers are created again when the gateway restarts
+            queue.publisher = publisher
+            if conflation_key is not None:
+                if conflation_key in queue.conflated_messages:
+                    queue.conflated_count += 1
+                elif len(queue) >= queue.max_size:
+                    queue.conflated_messages.pop(next(iter(queue.conflated_messages)), None)
+                    queue.dropped_count += 1
+                queue.conflated_messages[conflation_key] = msg
+            else:
+                if len(queue) >= queue.max_size and len(queue.messages) > 0:
+                    queue.messages.popleft()
+                    queue.dropped_count += 1
+                queue.messages.append(msg)
+        if self._flush_interval <= 0:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Publishes the messages queued when it is called.
+
+        :return: the number of messages published
+        """
+        if getattr(self._flushing, "value", False):
+            # A message queued while publishing (e.g. a log record of the transport) waits for the next flush
+            return 0
+        self._flushing.value = True
+        try:
+            return self._flush()
+        finally:
+            self._flushing.value = False
+
+    def _flush(self) -> int:
+        with self._lock:
+            remaining_count = sum(len(queue) for queue in self._queues.values())
+        published_count = 0
+        errors: Dict[str, Exception] = {}
+        while remaining_count > 0:
+            batch = self._next_batch()
+            if len(batch) == 0:
+                break
+            for queue, publisher, msgs in batch:
+                remaining_count -= len(msgs)
+                if self._publish_batches:
+                    published_count += self._publish(queue, publisher, self._batch_message(msgs), len(msgs), errors)
+                else:
+                    for msg in msgs:
+                        published_count += self._publish(queue, publisher, msg, 1, errors)
+        # Logged once the queued messages are published, the log records being published too
+        for topic, error in errors.items():
+            self.logger().error(f"Failed to publish MQTT messages on {topic}: {error}")
+        return published_count
+
+    def _next_batch(self) -> List[Tuple[_TopicQueue, Any, List[PubSubMessage]]]:
+        batch = []
+        with self._lock:
+            for queue in self._queues.values():
+                msgs = []
+                while len(msgs) < self._max_batch_size and len(queue.messages) > 0:
+                    msgs.append(queue.messages.popleft())
+                while len(msgs) < self._max_batch_size and len(queue.conflated_messages) > 0:
+                    msgs.append(queue.conflated_messages.pop(next(iter(queue.conflated_messages))))
+                if len(msgs) > 0:
+                    batch.append((queue, queue.publisher, msgs))
+        return batch
+
+    @staticmethod
+    def _publish(queue: _TopicQueue, publisher: Any, msg: PubSubMessage, msg_count: int,
+                 errors: Dict[str, Exception]) -> int:
+        try:
+            publisher.publish(msg)
+        except Exception as e:
+            errors[publisher.topic] = e
+            return 0
+        queue.published_count += msg_count
+        return msg_count
+
+    @staticmethod
+    def _batch_message(msgs: List[PubSubMessage]) -> BatchMessage:
+        return BatchMessage(messages=[msg.dict() if isinstance(msg, PubSubMessage) else msg for msg in msgs])
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        :return: the number of messages queued, published, dropped and replaced by a newer one, for each topic
+        """
+        with self._lock:
+            return {
+                topic: {
+                    "queued": len(queue),
+                    "published": queue.published_count,
+                    "dropped": queue.dropped_count,
+                    "conflated": queue.conflated_count,
+                }
+                for topic, queue in self._queues.items()
+            }
+
+    def start(self):
+        if self._thread is not None or self._flush_interval <= 0:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="MQTTPublishQueue", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the background thread and publishes the messages still queued.
+        """
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self):
+        while not self._stop_event.wait(self._flush_interval):
+            self.flush()
+            self._report_drops()
+
+    def _report_drops(self):
+        now = time.time()
+        if now - self._last_drops_report < self._DROPS_REPORT_INTERVAL:
+            return
+        with self._lock:
+            dropped_count = sum(queue.dropped_count for queue in self._queues.values())
+        if dropped_count > self._reported_dropped_count:
+            self.logger().warning(
+                f"{dropped_count - self._reported_dropped_count} MQTT messages were dropped because their topic "
+                f"queue was full."
+            )
+            self._reported_dropped_count = dropped_count
+            self._last_drops_report = now
 
 
 class MQTTCommands:
@@ -100,6 +309,8 @@ class MQTTCommands:
         self._balance_limit_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.BALANCE_LIMIT}'
         self._balance_paper_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.BALANCE_PAPER}'
         self._shortcuts_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.COMMAND_SHORTCUT}'
+        self._latency_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.LATENCY}'
+        self._profile_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.PROFILE}'
 
         self._init_commands()
 
@@ -149,6 +360,16 @@ class MQTTCommands:
             msg_type=CommandShortcutMessage,
             on_request=self._on_cmd_command_shortcut
         )
+        self._node.create_rpc(
+            rpc_name=self._latency_uri,
+            msg_type=LatencyCommandMessage,
+            on_request=self._on_cmd_latency
+        )
+        self._node.create_rpc(
+            rpc_name=self._profile_uri,
+            msg_type=ProfileCommandMessage,
+            on_request=self._on_cmd_profile
+        )
 
     def _on_cmd_start(self, msg: StartCommandMessage.Request):
         response = StartCommandMessage.Response()
@@ -359,6 +580,33 @@ class MQTTCommands:
             response.msg = str(e)
         return response
 
+    def _on_cmd_latency(self, msg: LatencyCommandMessage.Request):
+        response = LatencyCommandMessage.Response()
+        try:
+            latency_tracer = LatencyTracer.get_instance()
+            if msg.option is not None:
+                if msg.option not in ('start', 'stop', 'reset'):
+                    raise ValueError(f'Invalid latency option {msg.option}, expected start, stop or reset.')
+                # The tracer is used by the event loop, it is updated from there
+                self._ev_loop.call_soon_threadsafe(getattr(latency_tracer, msg.option))
+            response.enabled = {'start': True, 'stop': False}.get(msg.option, latency_tracer.enabled)
+            response.data = {} if msg.option == 'reset' else latency_tracer.stats()
+        except Exception as e:
+            response.status = MQTT_STATUS_CODE.ERROR
+            response.msg = str(e)
+        return response
+
+    def _on_cmd_profile(self, msg: ProfileCommandMessage.Request):
+        response = ProfileCommandMessage.Response()
+        try:
+            if msg.option not in ('start', 'stop'):
+                raise ValueError(f'Invalid profile option {msg.option}, expected start or stop.')
+            self._hb_app.profile(msg.option, msg.duration, msg.sampling_interval, msg.blocking_threshold)
+        except Exception as e:
+            response.status = MQTT_STATUS_CODE.ERROR
+            response.msg = str(e)
+        return response
+
 
 class MQTTMarketEventForwarder:
     @classmethod
@@ -459,7 +707,8 @@ class MQTTMarketEventForwarder:
 
         event_data = self._make_event_payload(event_data)
 
-        self.event_fw_pub.publish(
+        self._node.publish_queue.put(
+            self.event_fw_pub,
             InternalEventMessage(
                 timestamp=int(timestamp),
                 type=event_type,
@@ -525,7 +774,7 @@ class MQTTNotifier(NotifierBase):
         if threading.current_thread() != threading.main_thread():  # pragma: no cover
             self._ev_loop.call_soon_threadsafe(self.add_msg_to_queue, msg)
             return
-        self.notify_pub.publish(NotifyMessage(msg=msg))
+        self._node.publish_queue.put(self.notify_pub, NotifyMessage(msg=msg))
 
     def start(self) -> None:
         return None
@@ -560,18 +809,123 @@ class MQTTStatusUpdates:
             self._ev_loop.call_soon_threadsafe(self.add_msg_to_queue, msg, msg_type)
             return
 
-        self.status_updates_pub.publish(
+        # Only the latest update of each type matters
+        self._node.publish_queue.put(
+            self.status_updates_pub,
             StatusUpdateMessage(
                 msg=msg,
                 type=msg_type,
                 timestamp=int(time.time() * 1e3)
-            )
+            ),
+            conflation_key=msg_type
         )
 
     def stop(self):
         self.status_updates_pub.stop()
 
 
+class MQTTMarketDataStream:
+    """
+    Publishes the top of book of the order books of the markets, and the last candle of the candles feeds of the
+    strategy, every `interval` seconds. Each update replaces the queued update of the same order book or candles feed,
+    so a slow broker only receives the latest values.
+    """
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global mqtts_logger
+        if mqtts_logger is None:  # pragma: no cover
+            mqtts_logger = logging.getLogger(__name__)
+        return mqtts_logger
+
+    def __init__(self,
+                 hb_app: "HummingbotApplication",
+                 node: Node,
+                 interval: float = 1.0):
+        self._hb_app = hb_app
+        self._node = node
+        self._ev_loop: asyncio.AbstractEventLoop = self._hb_app.ev_loop
+        self._interval = interval
+        self._stream_task: Optional[asyncio.Task] = None
+
+        topic_prefix = TopicSpecs.PREFIX.format(
+            namespace=self._node.namespace,
+            instance_id=self._hb_app.instance_id
+        )
+        self._topic = f'{topic_prefix}{TopicSpecs.MARKET_DATA}'
+        self.market_data_pub = self._node.create_publisher(
+            topic=self._topic,
+            msg_type=MarketDataMessage
+        )
+
+    def start(self):
+        if self._stream_task is None:
+            self._stream_task = safe_ensure_future(self._stream_loop(), loop=self._ev_loop)
+
+    def stop(self):
+        if self._stream_task is not None:
+            self._stream_task.cancel()
+            self._stream_task = None
+
+    async def _stream_loop(self):
+        while True:
+            try:
+                self.publish_market_data()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error publishing the MQTT market data.", exc_info=True)
+            await asyncio.sleep(self._interval)
+
+    def publish_market_data(self):
+        timestamp = int(time.time() * 1e3)
+        for connector_name, market in self._hb_app.markets.items():
+            for trading_pair, order_book in getattr(market, "order_books", {}).items():
+                top_of_book = self._top_of_book(order_book)
+                if top_of_book is None:
+                    continue
+                self._node.publish_queue.put(
+                    self.market_data_pub,
+                    MarketDataMessage(
+                        timestamp=timestamp,
+                        type="top_of_book",
+                        data={"connector": connector_name, "trading_pair": trading_pair, **top_of_book}
+                    ),
+                    conflation_key=("top_of_book", connector_name, trading_pair)
+                )
+
+        market_data_provider = getattr(self._hb_app.strategy, "market_data_provider", None)
+        if market_data_provider is None:
+            return
+        for feed_key, candles_feed in market_data_provider.candles_feeds.items():
+            last_candle = candles_feed.last_candle
+            if last_candle is None:
+                continue
+            self._node.publish_queue.put(
+                self.market_data_pub,
+                MarketDataMessage(
+                    timestamp=timestamp,
+                    type="candle",
+                    data={"feed": feed_key, "interval": candles_feed.interval,
+                          **dict(zip(candles_feed.columns, last_candle))}
+                ),
+                conflation_key=("candle", feed_key)
+            )
+
+    @staticmethod
+    def _top_of_book(order_book) -> Optional[Dict[str, float]]:
+        try:
+            best_bid = order_book.get_price(False)
+            best_ask = order_book.get_price(True)
+        except EnvironmentError:
+            # The order book is empty
+            return None
+        return {
+            "best_bid": best_bid,
+            "best_ask": best_ask,
+            "mid_price": (best_bid + best_ask) / 2,
+        }
+
+
 class MQTTGateway(Node):
     NODE_NAME: str = 'hbot.$instance_id'
     _instance: Optional["MQTTGateway"] = None
@@ -604,9 +958,15 @@ class MQTTGateway(Node):
         self._commands: MQTTCommands = None
         self._logh: MQTTLogHandler = None
         self._external_events: MQTTExternalEvents = None
+        self._market_data: MQTTMarketDataStream = None
         self._hb_app: "HummingbotApplication" = hb_app
         self._ev_loop = self._hb_app.ev_loop
         self._params = self._create_mqtt_params_from_conf()
+        self._publish_queue = MQTTPublishQueue(
+            flush_interval=self._hb_app.client_config_map.mqtt_bridge.mqtt_publish_interval,
+            max_queue_size=self._hb_app.client_config_map.mqtt_bridge.mqtt_publish_queue_size,
+            publish_batches=self._hb_app.client_config_map.mqtt_bridge.mqtt_publish_batches,
+        )
         self.namespace = self._hb_app.client_config_map.mqtt_bridge.mqtt_namespace
         if self.namespace[-1] in ('/', '.'):
             self.namespace = self.namespace[:-1]
@@ -631,6 +991,10 @@ class MQTTGateway(Node):
     def health(self):
         return self._health
 
+    @property
+    def publish_queue(self) -> MQTTPublishQueue:
+        return self._publish_queue
+
     def _safe_get_log_handlers(self, max_tries=3):  # pragma: no cover
         current_try = 0
         while current_try < max_tries:
@@ -725,11 +1089,23 @@ class MQTTGateway(Node):
             self._market_events = MQTTMarketEventForwarder(self._hb_app, self)
             if self.state == NodeState.RUNNING:
                 self._market_events.event_fw_pub.run()
+        if self._hb_app.client_config_map.mqtt_bridge.mqtt_market_data:
+            self._remove_market_data_stream()
+            self._market_data = MQTTMarketDataStream(
+                self._hb_app, self, self._hb_app.client_config_map.mqtt_bridge.mqtt_market_data_interval)
+            if self.state == NodeState.RUNNING:
+                self._market_data.market_data_pub.run()
+            self._market_data.start()
 
     def _remove_market_event_listeners(self):
         if self._market_events is not None:
             self._market_events._stop_event_listeners()
 
+    def _remove_market_data_stream(self):
+        if self._market_data is not None:
+            self._market_data.stop()
+            self._market_data = None
+
     def _init_external_events(self):
         if self._hb_app.client_config_map.mqtt_bridge.mqtt_external_events:
             self._external_events = MQTTExternalEvents(self._hb_app, self)
@@ -852,10 +1228,14 @@ class MQTTGateway(Node):
             self._start_health_monitoring_loop()
 
         self.run()
+        self._publish_queue.start()
         self.broadcast_status_update("online", msg_type="availability")
 
     def stop(self, with_health: bool = True):
         self.broadcast_status_update("offline", msg_type="availability")
+        self._remove_market_data_stream()
+        # Publishes the queued messages while the transports are still connected
+        self._publish_queue.stop()
         super().stop()
         if self._hb_thread:
             self._hb_thread.stop()
@@ -895,9 +1275,7 @@ class MQTTLogHandler(logging.Handler):
                                                    msg_type=LogMessage)
 
     def emit(self, record: logging.LogRecord):
-        if threading.current_thread() != threading.main_thread():  # pragma: no cover
-            self._ev_loop.call_soon_threadsafe(self.emit, record)
-            return
+        # The publish queue is thread safe, the records of other threads are queued from their thread
         msg_str = self.format(record)
         msg = LogMessage(
             timestamp=time.time(),
@@ -907,7 +1285,7 @@ class MQTTLogHandler(logging.Handler):
             logger_name=record.name
 
         )
-        self.log_pub.publish(msg)
+        self._node.publish_queue.put(self.log_pub, msg)
 
 
 class MQTTExternalEvents:
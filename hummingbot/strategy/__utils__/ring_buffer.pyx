@@ -1,11 +1,17 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport isfinite, sqrt
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of float values. Values are mirrored in a buffer of twice the length so that the ordered
+    content is always a contiguous slice, and running sums are kept so the mean, the variance and the sum of squared
+    differences between consecutive values are available in O(1) for every added value.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -14,18 +20,64 @@ cdef class RingBuffer:
         return pmm_logger
 
     def __cinit__(self, int length):
-        self._length = length
-        self._buffer = np.zeros(length, dtype=np.float64)
-        self._delimiter = 0
-        self._is_full = False
+        self.c_reset(length)
 
     def __dealloc__(self):
         self._buffer = None
 
+    cdef void c_reset(self, int64_t length):
+        self._length = length
+        self._buffer = np.zeros(2 * length, dtype=np.float64)
+        self._delimiter = 0
+        self._is_full = False
+        self._shift = 0
+        self._shifted_sum = 0
+        self._shifted_sum_squares = 0
+        self._sum_squared_diffs = 0
+
     cdef void c_add_value(self, float val):
-        self._buffer[self._delimiter] = val
+        cdef:
+            double value = val
+            double old_value
+            double last_value
+
+        if self._length > 1 and not self.c_is_empty():
+            last_value = self.c_get_last_value()
+            self._sum_squared_diffs += (value - last_value) * (value - last_value)
+        elif self.c_is_empty():
+            self._shift = value
+
+        if self._is_full:
+            old_value = self._buffer[self._delimiter]
+            self._shifted_sum -= old_value - self._shift
+            self._shifted_sum_squares -= (old_value - self._shift) * (old_value - self._shift)
+            if self._length > 1:
+                self._sum_squared_diffs -= ((self._buffer[self._delimiter + 1] - old_value)
+                                            * (self._buffer[self._delimiter + 1] - old_value))
+        else:
+            old_value = 0
+
+        self._buffer[self._delimiter] = value
+        self._buffer[self._delimiter + self._length] = value
+        self._shifted_sum += value - self._shift
+        self._shifted_sum_squares += (value - self._shift) * (value - self._shift)
         self.c_increment_delimiter()
 
+        # Accumulated rounding errors are cleared once per buffer length, non finite values leaving the buffer
+        # would otherwise stay in the running sums
+        if self._delimiter == 0 or not isfinite(old_value) or not isfinite(self._shifted_sum_squares):
+            self.c_recalculate_running_sums()
+
+    cdef void c_recalculate_running_sums(self):
+        cdef np.ndarray values = self.c_get_as_numpy_view()
+
+        if values.size == 0:
+            return
+        self._shift = values[values.size - 1]
+        self._shifted_sum = np.sum(values - self._shift)
+        self._shifted_sum_squares = np.sum(np.square(values - self._shift))
+        self._sum_squared_diffs = np.sum(np.square(np.diff(values)))
+
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
@@ -42,39 +94,60 @@ cdef class RingBuffer:
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
+    cdef double c_running_mean(self):
+        cdef int64_t size = self.c_size()
+        if size == 0:
+            return np.nan
+        return self._shift + self._shifted_sum / size
+
+    cdef double c_running_variance(self):
+        cdef:
+            int64_t size = self.c_size()
+            double variance
+        if size == 0:
+            return np.nan
+        variance = (self._shifted_sum_squares - self._shifted_sum * self._shifted_sum / size) / size
+        return variance if variance > 0 or not isfinite(variance) else 0
+
+    cdef double c_sum_squared_diffs(self):
+        return self._sum_squared_diffs
+
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self.c_running_mean()
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self.c_running_variance()
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_running_variance())
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+    cdef np.ndarray c_get_as_numpy_view(self):
+        cdef np.ndarray view
 
         if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
+            view = np.asarray(self._buffer)[0:self._delimiter]
         else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            view = np.asarray(self._buffer)[self._delimiter:self._delimiter + self._length]
+        view.flags.writeable = False
+        return view
+
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        return self.c_get_as_numpy_view().copy()
 
     def __init__(self, length):
-        self._length = length
-        self._buffer = np.zeros(length, dtype=np.double)
-        self._delimiter = 0
-        self._is_full = False
+        self.c_reset(length)
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -82,6 +155,13 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_as_numpy_view(self):
+        """
+        Returns a read only view of the buffer content from the oldest to the newest value, without copying it.
+        The view is only valid until the next value is added.
+        """
+        return self.c_get_as_numpy_view()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -89,6 +169,10 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -101,6 +185,21 @@ cdef class RingBuffer:
     def variance(self):
         return self.c_variance()
 
+    @property
+    def running_mean(self):
+        """Mean of the current content, available before the buffer is full"""
+        return self.c_running_mean()
+
+    @property
+    def running_variance(self):
+        """Population variance of the current content, available before the buffer is full"""
+        return self.c_running_variance()
+
+    @property
+    def sum_squared_diffs(self):
+        """Sum of the squared differences between consecutive values of the current content"""
+        return self.c_sum_squared_diffs()
+
     @property
     def length(self) -> int:
         return self._length
@@ -109,10 +208,7 @@ cdef class RingBuffer:
     def length(self, value):
         data = self.get_as_numpy_array()
 
-        self._length = value
-        self._buffer = np.zeros(value, dtype=np.float64)
-        self._delimiter = 0
-        self._is_full = False
+        self.c_reset(value)
 
         for val in data[-value:]:
             self.add_value(val)
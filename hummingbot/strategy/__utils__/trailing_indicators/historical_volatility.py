@@ -1,18 +1,36 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Log returns between the samples of the sampling buffer, one less than the samples
+        self._log_returns_buffer = RingBuffer(max(sampling_length - 1, 1))
+
+    def add_sample(self, value: float):
+        last_value = self._sampling_buffer.get_last_value()
+        self._sampling_buffer.add_value(value)
+        if not np.isnan(last_value) and self.sampling_length > 1:
+            self._log_returns_buffer.add_value(np.log(self._sampling_buffer.get_last_value()) - np.log(last_value))
+        indicator_value = self._indicator_calculation()
+        self._processing_buffer.add_value(indicator_value)
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        if self._sampling_buffer.size > 0:
+            return self._log_returns_buffer.running_variance
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
+        processing_array = self._processing_buffer.get_as_numpy_view()
         if processing_array.size > 0:
             return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_buffer.length
+
+    @sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._log_returns_buffer.length = max(value - 1, 1)
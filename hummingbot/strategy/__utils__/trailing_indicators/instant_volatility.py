@@ -10,8 +10,11 @@ class InstantVolatilityIndicator(BaseTrailingIndicator):
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
-        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
-        vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+        # The sum of the squared differences between ticks is kept up to date by the buffer on every sample.
+        buffer_size = self._sampling_buffer.size
+        if buffer_size == 0:
+            return np.nan
+        vol = np.sqrt(self._sampling_buffer.sum_squared_diffs / buffer_size)
         return vol
 
     def _processing_calculation(self) -> float:
@@ -12,18 +12,26 @@ cdef class TradingIntensityIndicator:
     cdef:
         double _alpha
         double _kappa
-        dict _trade_samples
+        object _sample_timestamps
+        object _sample_price_levels
+        object _sample_amounts
+        int _samples_count
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
+        list _quote_timestamps
+        list _quote_prices
         int _sampling_length
         int _samples_length
+        str _fit_method
+        int _refit_interval
+        int _calculations_since_fit
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
     cdef c_estimate_intensity(self)
+    cdef c_estimate_intensity_log_linear(self, object price_levels, object lambdas)
 
 cdef class TradesForwarder(EventListener):
     cdef:
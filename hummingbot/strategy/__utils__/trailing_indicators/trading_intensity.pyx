@@ -17,6 +17,9 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+FIT_METHOD_CURVE_FIT = "curve_fit"
+FIT_METHOD_LOG_LINEAR = "log_linear"
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -27,10 +30,28 @@ cdef class TradesForwarder(EventListener):
 
 cdef class TradingIntensityIndicator:
 
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 fit_method: str = FIT_METHOD_CURVE_FIT,
+                 refit_interval: int = 1):
+        """
+        :param sampling_length: number of distinct sampling timestamps kept in the buffer
+        :param fit_method: "curve_fit" for the non-linear least squares fit of a * exp(-b * t), or "log_linear" for
+        the closed-form fit of log(lambda) = log(a) - b * t
+        :param refit_interval: number of calls to calculate between two estimations once the buffer is full
+        """
+        if fit_method not in (FIT_METHOD_CURVE_FIT, FIT_METHOD_LOG_LINEAR):
+            raise ValueError(f"Invalid fit method {fit_method}.")
+        if refit_interval < 1:
+            raise ValueError(f"Invalid refit interval {refit_interval}, it must be at least 1.")
         self._alpha = 0
         self._kappa = 0
-        self._trade_samples = {}
+        self._sample_timestamps = np.empty(0, dtype=np.float64)
+        self._sample_price_levels = np.empty(0, dtype=np.float64)
+        self._sample_amounts = np.empty(0, dtype=np.float64)
+        self._samples_count = 0
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,7 +59,12 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        # Ascending order of price-timestamp quotes
+        self._quote_timestamps = []
+        self._quote_prices = []
+        self._fit_method = fit_method
+        self._refit_interval = refit_interval
+        self._calculations_since_fit = 0
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -48,12 +74,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return self._samples_count == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != self._samples_count
+        self._samples_length = self._samples_count
         return is_changed
 
     @property
@@ -64,57 +90,106 @@ cdef class TradingIntensityIndicator:
     def sampling_length(self, new_len: int):
         self._sampling_length = new_len
 
+    @property
+    def fit_method(self) -> str:
+        return self._fit_method
+
+    @fit_method.setter
+    def fit_method(self, value: str):
+        if value not in (FIT_METHOD_CURVE_FIT, FIT_METHOD_LOG_LINEAR):
+            raise ValueError(f"Invalid fit method {value}.")
+        self._fit_method = value
+
+    @property
+    def refit_interval(self) -> int:
+        return self._refit_interval
+
+    @refit_interval.setter
+    def refit_interval(self, value: int):
+        if value < 1:
+            raise ValueError(f"Invalid refit interval {value}, it must be at least 1.")
+        self._refit_interval = value
+
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(reversed(self._quote_timestamps), reversed(self._quote_prices))]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        self._quote_timestamps = [quote["timestamp"] for quote in reversed(value)]
+        self._quote_prices = [float(quote["price"]) for quote in reversed(value)]
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
     cdef c_calculate(self, timestamp):
-        price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
-
-        latest_processed_quote_idx = None
-        for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
-
-        # THere are no trades left to process
-        self._current_trade_sample = []
-        # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
-
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        cdef:
+            object trade_timestamps
+            object trade_prices
+            object trade_amounts
+            object quote_idx
+            object matched
+            object quote_timestamps
+            object quote_prices
+            object sample_timestamps
+            object unique_timestamps
+            object keep
+            bint samples_changed = False
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+        price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
+        self._quote_timestamps.append(timestamp)
+        self._quote_prices.append(float(price))
+
+        if len(self._current_trade_sample) > 0:
+            trade_timestamps = np.fromiter((trade.timestamp for trade in self._current_trade_sample),
+                                           dtype=np.float64, count=len(self._current_trade_sample))
+            trade_prices = np.fromiter((trade.price for trade in self._current_trade_sample),
+                                       dtype=np.float64, count=len(self._current_trade_sample))
+            trade_amounts = np.fromiter((trade.amount for trade in self._current_trade_sample),
+                                        dtype=np.float64, count=len(self._current_trade_sample))
+            # THere are no trades left to process
+            self._current_trade_sample = []
+
+            # Each trade is matched against the latest quote that happened strictly before it
+            quote_timestamps = np.asarray(self._quote_timestamps, dtype=np.float64)
+            quote_prices = np.asarray(self._quote_prices, dtype=np.float64)
+            quote_idx = np.searchsorted(quote_timestamps, trade_timestamps, side="left") - 1
+            matched = quote_idx >= 0
+
+            if matched.any():
+                quote_idx = quote_idx[matched]
+                self._sample_timestamps = np.concatenate(
+                    (self._sample_timestamps, quote_timestamps[quote_idx] + 1))
+                self._sample_price_levels = np.concatenate(
+                    (self._sample_price_levels, np.abs(trade_prices[matched] - quote_prices[quote_idx])))
+                self._sample_amounts = np.concatenate((self._sample_amounts, trade_amounts[matched]))
+
+                # Store quotes that happened after the latest trade + one before
+                latest_processed_quote_idx = int(quote_idx.max())
+                del self._quote_timestamps[:latest_processed_quote_idx]
+                del self._quote_prices[:latest_processed_quote_idx]
+                samples_changed = True
+
+        if samples_changed or self._samples_count > self._sampling_length:
+            unique_timestamps = np.unique(self._sample_timestamps)
+            if len(unique_timestamps) > self._sampling_length:
+                keep = self._sample_timestamps >= unique_timestamps[-self._sampling_length]
+                self._sample_timestamps = self._sample_timestamps[keep]
+                self._sample_price_levels = self._sample_price_levels[keep]
+                self._sample_amounts = self._sample_amounts[keep]
+                self._samples_count = self._sampling_length
+            else:
+                self._samples_count = len(unique_timestamps)
 
         if self.is_sampling_buffer_full:
-            self.c_estimate_intensity()
+            self._calculations_since_fit += 1
+            if self._calculations_since_fit >= self._refit_interval:
+                self._calculations_since_fit = 0
+                self.c_estimate_intensity()
 
     def register_trade(self, trade):
         """A helper method to be used in unit tests"""
@@ -125,31 +200,22 @@ cdef class TradingIntensityIndicator:
 
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
+            object price_levels
+            object inverse
+            object lambdas
 
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        # Calculate lambdas / trading intensities, in descending order of price level
+        price_levels, inverse = np.unique(self._sample_price_levels, return_inverse=True)
+        lambdas = np.bincount(inverse, weights=self._sample_amounts, minlength=len(price_levels))
+        price_levels = price_levels[::-1]
+        lambdas = lambdas[::-1]
 
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas_adj = np.where(lambdas == 0, 10**-10, lambdas)
+
+        if self._fit_method == FIT_METHOD_LOG_LINEAR:
+            self.c_estimate_intensity_log_linear(price_levels, lambdas_adj)
+            return
 
         # Fit the probability density function; reuse previously calculated parameters as initial values
         try:
@@ -164,3 +230,15 @@ cdef class TradingIntensityIndicator:
             self._alpha = Decimal(str(params[0][0]))
         except (RuntimeError, ValueError) as e:
             pass
+
+    cdef c_estimate_intensity_log_linear(self, object price_levels, object lambdas):
+        # Closed-form least squares fit of log(lambda) = log(alpha) - kappa * price_level
+        if len(price_levels) < 2:
+            return
+        log_lambdas = np.log(lambdas.clip(min=10**-10))
+        slope, intercept = np.polyfit(price_levels, log_lambdas, 1)
+        if not np.isfinite(slope) or not np.isfinite(intercept):
+            return
+        # Keep the same bounds as the non-linear fit
+        self._kappa = max(-slope, 0.)
+        self._alpha = np.exp(intercept)
@@ -15,6 +15,10 @@ from hummingbot.client.config.config_validators import (
 from hummingbot.client.config.strategy_config_data_types import BaseTradingStrategyConfigMap
 from hummingbot.client.settings import required_exchanges
 from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import (
+    FIT_METHOD_CURVE_FIT,
+    FIT_METHOD_LOG_LINEAR,
+)
 
 
 class InfiniteModel(BaseClientModel):
@@ -311,6 +315,28 @@ class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
             prompt=lambda mi: "Enter amount of ticks that will be stored to estimate order book liquidity",
         ),
     )
+    trading_intensity_fit_method: str = Field(
+        default=FIT_METHOD_CURVE_FIT,
+        description=(
+            "The method used to fit the order book liquidity: curve_fit for the non-linear least squares fit,"
+            " or log_linear for the faster closed-form fit of the log of the trading intensity."
+        ),
+        client_data=ClientFieldData(
+            prompt=lambda mi: (
+                f"Enter the method used to estimate order book liquidity"
+                f" ({FIT_METHOD_CURVE_FIT}/{FIT_METHOD_LOG_LINEAR})"
+            ),
+        ),
+    )
+    trading_intensity_refit_interval: int = Field(
+        default=1,
+        description="The number of ticks between two estimations of order book liquidity once its buffer is full.",
+        ge=1,
+        le=10_000,
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Enter the number of ticks between two estimations of order book liquidity",
+        ),
+    )
     order_levels_mode: Union[SingleOrderLevelModel, MultiOrderLevelModel] = Field(
         default=SingleOrderLevelModel.construct(),
         description="Allows activating multi-order levels.",
@@ -390,6 +416,22 @@ class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
             raise ValueError(ret)
         return v
 
+    @validator("trading_intensity_fit_method", pre=True)
+    def validate_trading_intensity_fit_method(cls, v: str):
+        if v not in (FIT_METHOD_CURVE_FIT, FIT_METHOD_LOG_LINEAR):
+            raise ValueError(
+                f"Invalid fit method, please choose value from {[FIT_METHOD_CURVE_FIT, FIT_METHOD_LOG_LINEAR]}."
+            )
+        return v
+
+    @validator("trading_intensity_refit_interval", pre=True)
+    def validate_trading_intensity_refit_interval(cls, v: str):
+        """Used for client-friendly error output."""
+        ret = validate_int(v, 1, 10_000)
+        if ret is not None:
+            raise ValueError(ret)
+        return v
+
     @validator("order_levels_mode", pre=True)
     def validate_order_levels_mode(cls, v: Union[str, SingleOrderLevelModel, MultiOrderLevelModel]):
         if isinstance(v, (SingleOrderLevelModel, MultiOrderLevelModel, Dict)):
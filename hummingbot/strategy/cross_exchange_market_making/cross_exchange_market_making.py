@@ -1,10 +1,12 @@
+import asyncio
 import logging
+import time
 from collections import defaultdict, deque
 from decimal import Decimal
 from enum import Enum
 from functools import lru_cache
 from math import ceil, floor
-from typing import Dict, List, Tuple, cast
+from typing import Dict, List, Set, Tuple, cast
 
 import pandas as pd
 from bidict import bidict
@@ -15,10 +17,14 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.clock import Clock
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import TokenAmount
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     MarketOrderFailureEvent,
+    OrderBookEvent,
+    OrderBookTopOfBookChangeEvent,
     OrderCancelledEvent,
     OrderExpiredEvent,
     OrderFilledEvent,
@@ -26,6 +32,7 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
 from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making_config_map_pydantic import (
     CrossExchangeMarketMakingConfigMap,
     PassiveOrderRefreshMode,
@@ -52,6 +59,11 @@ class LogOption(Enum):
     MAKER_ORDER_HEDGED = 6
 
 
+class EvaluationTrigger(Enum):
+    TICK = "tick"
+    TAKER_ORDER_BOOK = "taker order book"
+
+
 class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
     OPTION_LOG_ALL = (
@@ -134,6 +146,22 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         # Holds hedging trade ids for respective maker orders
         self._maker_to_hedging_trades = {}
 
+        # Taker top of book tracking, to react to the taker price moves and measure how fast the maker orders follow
+        self._taker_top_of_book_forwarder = SourceInfoEventForwarder(self._did_change_taker_top_of_book)
+        self._taker_order_book_market_pairs: Dict[OrderBook, List[MakerTakerMarketPair]] = {}
+        # Taker best bid and ask when each market pair was last evaluated
+        self._taker_top_of_book_references: Dict[MakerTakerMarketPair, Tuple[float, float]] = {}
+        # Time of the first taker top of book move (beyond the threshold) not evaluated yet, for each market pair
+        self._taker_top_of_book_change_times: Dict[MakerTakerMarketPair, float] = {}
+        # Time of the taker top of book move behind the current evaluation of each market pair
+        self._evaluated_change_times: Dict[MakerTakerMarketPair, Tuple[float, EvaluationTrigger]] = {}
+        self._market_pairs_in_evaluation: Set[MakerTakerMarketPair] = set()
+        self._market_pair_reaction_tasks: Dict[MakerTakerMarketPair, asyncio.Task] = {}
+        self._last_reaction_times: Dict[MakerTakerMarketPair, float] = {}
+        self._cancel_latency_histograms: Dict[EvaluationTrigger, LatencyHistogram] = {
+            trigger: LatencyHistogram() for trigger in EvaluationTrigger
+        }
+
         all_markets = list(self._maker_markets | self._taker_markets)
 
         self.add_markets(all_markets)
@@ -221,6 +249,18 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
     def adjust_orders_enabled(self):
         return self._config_map.adjust_orders_enabled
 
+    @property
+    def taker_order_book_reaction_enabled(self) -> bool:
+        return self._config_map.taker_order_book_reaction_enabled
+
+    @property
+    def cancel_latency_histograms(self) -> Dict[EvaluationTrigger, LatencyHistogram]:
+        """
+        Latencies between a taker top of book move and the cancellation of the maker orders it made stale, grouped by
+        what triggered the evaluation that canceled the orders.
+        """
+        return self._cancel_latency_histograms
+
     @property
     def gas_to_maker_base_conversion_rate(self):
         return self._config_map.gas_to_maker_base_conversion_rate
@@ -354,6 +394,12 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
             warning_lines.extend(self.balance_warning([market_pair.maker, market_pair.taker]))
 
+        latency_lines = [f"    {trigger.value}: {histogram.summary()}"
+                         for trigger, histogram in self._cancel_latency_histograms.items()
+                         if histogram.count > 0]
+        if len(latency_lines) > 0:
+            lines.extend(["", "  Taker price move to maker cancel latency:"] + latency_lines)
+
         if len(warning_lines) > 0:
             lines.extend(["", "  *** WARNINGS ***"] + warning_lines)
 
@@ -363,6 +409,15 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         super().start(clock, timestamp)
         self._last_timestamp = timestamp
 
+    def stop(self, clock: Clock):
+        for order_book in self._taker_order_book_market_pairs.keys():
+            order_book.remove_listener(OrderBookEvent.TopOfBookChangeEvent, self._taker_top_of_book_forwarder)
+        self._taker_order_book_market_pairs.clear()
+        for task in self._market_pair_reaction_tasks.values():
+            task.cancel()
+        self._market_pair_reaction_tasks.clear()
+        super().stop(clock)
+
     def tick(self, timestamp: float):
         """
         Clock tick entry point.
@@ -392,6 +447,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                 # Markets are ready, ok to proceed.
                 if LogOption.STATUS_REPORT:
                     self.logger().info("Markets are ready.")
+                self.register_taker_order_book_listeners()
 
         if not self._conversions_ready:
             for market_pair in self._market_pairs.values():
@@ -425,23 +481,15 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
     async def main(self, timestamp: float):
         try:
             # Calculate a mapping from market pair to list of active limit orders on the market.
-            market_pair_to_active_orders = defaultdict(list)
-
-            for maker_market, limit_order, order_id in self.active_maker_limit_orders:
-                market_pair = self._market_pairs.get((maker_market, limit_order.trading_pair))
-                if market_pair is None:
-                    self.log_with_clock(logging.WARNING,
-                                        f"The in-flight maker order in for the trading pair '{limit_order.trading_pair}' "
-                                        f"does not correspond to any whitelisted trading pairs. Skipping.")
-                    continue
-
-                if not self._sb_order_tracker.has_in_flight_cancel(limit_order.client_order_id) and \
-                        limit_order.client_order_id in self._maker_to_taker_order_ids.keys():
-                    market_pair_to_active_orders[market_pair].append(limit_order)
+            market_pair_to_active_orders = self.get_market_pair_to_active_orders()
 
             # Process each market pair independently.
             for market_pair in self._market_pairs.values():
-                await self.process_market_pair(timestamp, market_pair, market_pair_to_active_orders[market_pair])
+                if market_pair in self._market_pairs_in_evaluation:
+                    # Already being re-evaluated after a taker order book move
+                    continue
+                await self.evaluate_market_pair(
+                    timestamp, market_pair, market_pair_to_active_orders[market_pair], EvaluationTrigger.TICK)
 
             # log conversion rates every 5 minutes
             if self._last_conv_rates_logged + (60. * 5) < timestamp:
@@ -450,6 +498,109 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         finally:
             self._last_timestamp = timestamp
 
+    def get_market_pair_to_active_orders(self) -> Dict[MakerTakerMarketPair, List[LimitOrder]]:
+        market_pair_to_active_orders = defaultdict(list)
+
+        for maker_market, limit_order, order_id in self.active_maker_limit_orders:
+            market_pair = self._market_pairs.get((maker_market, limit_order.trading_pair))
+            if market_pair is None:
+                self.log_with_clock(logging.WARNING,
+                                    f"The in-flight maker order in for the trading pair '{limit_order.trading_pair}' "
+                                    f"does not correspond to any whitelisted trading pairs. Skipping.")
+                continue
+
+            if not self._sb_order_tracker.has_in_flight_cancel(limit_order.client_order_id) and \
+                    limit_order.client_order_id in self._maker_to_taker_order_ids.keys():
+                market_pair_to_active_orders[market_pair].append(limit_order)
+        return market_pair_to_active_orders
+
+    async def evaluate_market_pair(self,
+                                   timestamp: float,
+                                   market_pair: MakerTakerMarketPair,
+                                   active_orders: List[LimitOrder],
+                                   trigger: EvaluationTrigger):
+        """
+        Processes a market pair, keeping track of the taker top of book move being evaluated, so the latency until the
+        maker orders are canceled can be measured.
+        """
+        self._market_pairs_in_evaluation.add(market_pair)
+        change_time = self._taker_top_of_book_change_times.pop(market_pair, None)
+        if change_time is not None:
+            self._evaluated_change_times[market_pair] = (change_time, trigger)
+        self._taker_top_of_book_references[market_pair] = self.get_taker_top_of_book(market_pair)
+        try:
+            await self.process_market_pair(timestamp, market_pair, active_orders)
+        finally:
+            self._evaluated_change_times.pop(market_pair, None)
+            self._market_pairs_in_evaluation.discard(market_pair)
+
+    def register_taker_order_book_listeners(self):
+        """
+        Listens to the top of book changes of the taker order books. The moves beyond the threshold trigger an
+        immediate re-evaluation of the market pair when the taker order book reaction is enabled, and are used to
+        measure the cancel latency in any case.
+        """
+        for market_pair in self._market_pairs.values():
+            if self.is_gateway_market(market_pair.taker):
+                continue
+            order_book = market_pair.taker.order_book
+            if order_book not in self._taker_order_book_market_pairs:
+                self._taker_order_book_market_pairs[order_book] = []
+                order_book.add_listener(OrderBookEvent.TopOfBookChangeEvent, self._taker_top_of_book_forwarder)
+            self._taker_order_book_market_pairs[order_book].append(market_pair)
+
+    @staticmethod
+    def get_taker_top_of_book(market_pair: MakerTakerMarketPair) -> Tuple[float, float]:
+        if CrossExchangeMarketMakingStrategy.is_gateway_market(market_pair.taker):
+            return s_float_nan, s_float_nan
+        order_book = market_pair.taker.order_book
+        return order_book.get_price(False), order_book.get_price(True)
+
+    def _did_change_taker_top_of_book(self,
+                                      event_tag: int,
+                                      order_book: OrderBook,
+                                      event: OrderBookTopOfBookChangeEvent):
+        threshold = float(self._config_map.taker_order_book_reaction_threshold) / 100
+        for market_pair in self._taker_order_book_market_pairs.get(order_book, []):
+            reference = self._taker_top_of_book_references.get(market_pair)
+            if reference is None:
+                # The market pair was not evaluated yet
+                continue
+            reference_bid, reference_ask = reference
+            if not (abs(event.best_bid - reference_bid) >= reference_bid * threshold
+                    or abs(event.best_ask - reference_ask) >= reference_ask * threshold):
+                continue
+            if market_pair not in self._taker_top_of_book_change_times:
+                self._taker_top_of_book_change_times[market_pair] = time.perf_counter()
+            if self.taker_order_book_reaction_enabled:
+                self._schedule_market_pair_reaction(market_pair)
+
+    def _schedule_market_pair_reaction(self, market_pair: MakerTakerMarketPair):
+        task = self._market_pair_reaction_tasks.get(market_pair)
+        if task is not None and not task.done():
+            # The moves are coalesced in the pending re-evaluation
+            return
+        self._market_pair_reaction_tasks[market_pair] = safe_ensure_future(
+            self._react_to_taker_top_of_book_change(market_pair))
+
+    async def _react_to_taker_top_of_book_change(self, market_pair: MakerTakerMarketPair):
+        debounce = self._config_map.taker_order_book_reaction_debounce
+        delay = self._last_reaction_times.get(market_pair, -debounce) + debounce - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self._main_task is not None and not self._main_task.done():
+            await asyncio.wait([self._main_task])
+        if (market_pair not in self._taker_top_of_book_change_times
+                or market_pair in self._market_pairs_in_evaluation
+                or not self._conversions_ready
+                or not self.ready_for_new_trades()):
+            # Already evaluated by the tick, or not ready to trade
+            return
+        self._last_reaction_times[market_pair] = time.perf_counter()
+        active_orders = self.get_market_pair_to_active_orders()[market_pair]
+        await self.evaluate_market_pair(
+            self.current_timestamp, market_pair, active_orders, EvaluationTrigger.TAKER_ORDER_BOOK)
+
     async def get_gateway_quotes(self):
         for market_pair in self._market_pairs.values():
             if self.is_gateway_market(market_pair.taker):
@@ -1751,6 +1902,10 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
     def cancel_maker_order(self, market_pair: MakerTakerMarketPair, order_id: str):
         market_trading_pair_tuple = self._market_pair_tracker.get_market_pair_from_order_id(order_id)
         super().cancel_order(market_trading_pair_tuple.maker, order_id)
+        evaluated_change = self._evaluated_change_times.pop(market_pair, None)
+        if evaluated_change is not None:
+            change_time, trigger = evaluated_change
+            self._cancel_latency_histograms[trigger].record(time.perf_counter() - change_time)
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
 
@@ -336,6 +336,37 @@ class CrossExchangeMarketMakingConfigMap(BaseTradingStrategyMakerTakerConfigMap)
             prompt_on_new=True,
         ),
     )
+    taker_order_book_reaction_enabled: bool = Field(
+        default=False,
+        description="Re-evaluate the maker orders as soon as the taker top of book moves, instead of on the next tick.",
+        client_data=ClientFieldData(
+            prompt=lambda mi: (
+                "Do you want to re-evaluate the maker orders as soon as the taker order book top moves? (Yes/No)"
+            ),
+        ),
+    )
+    taker_order_book_reaction_threshold: Decimal = Field(
+        default=Decimal("0.05"),
+        description="Taker top of book price change triggering a re-evaluation, as a percentage.",
+        ge=0.0,
+        client_data=ClientFieldData(
+            prompt=lambda mi: (
+                "What taker best bid or best ask price change should trigger a re-evaluation of the maker orders? "
+                "(Enter 0.05 to indicate 0.05%)"
+            ),
+        ),
+    )
+    taker_order_book_reaction_debounce: float = Field(
+        default=0.1,
+        description="Minimum time between two re-evaluations of a market pair triggered by the taker order book.",
+        ge=0.0,
+        client_data=ClientFieldData(
+            prompt=lambda mi: (
+                "What is the minimum time between two re-evaluations triggered by the taker order book? "
+                "(in seconds)"
+            ),
+        ),
+    )
 
     debug_price_shim: bool = Field(
         default=False,
@@ -418,6 +449,7 @@ class CrossExchangeMarketMakingConfigMap(BaseTradingStrategyMakerTakerConfigMap)
 
     @validator(
         "adjust_order_enabled",
+        "taker_order_book_reaction_enabled",
         pre=True,
     )
     def validate_bool(cls, v: str):
@@ -437,6 +469,8 @@ class CrossExchangeMarketMakingConfigMap(BaseTradingStrategyMakerTakerConfigMap)
         "order_size_taker_balance_factor",
         "order_size_portfolio_ratio_limit",
         "slippage_buffer",
+        "taker_order_book_reaction_threshold",
+        "taker_order_book_reaction_debounce",
         pre=True,
     )
     def validate_decimal(cls, v: str, field: Field):
@@ -1,5 +1,6 @@
 from decimal import Decimal
 import logging
+import math
 import pandas as pd
 from typing import (
     List)
@@ -338,6 +339,26 @@ cdef class StrategyBase(TimeIterator):
     def add_markets(self, markets: List[ConnectorBase]):
         self.c_add_markets(markets)
 
+    cpdef double next_wakeup_time(self, double timestamp):
+        """
+        A strategy acts on the data of its markets, so it wakes up at the earliest wake up time of its markets, and
+        at its tick interval when one of them does not report one. Strategies with timers of their own should
+        override it.
+        """
+        cdef:
+            ConnectorBase market
+            double market_wakeup_time
+            double wakeup_time = math.inf
+        if len(self._sb_markets) == 0:
+            return TimeIterator.next_wakeup_time(self, timestamp)
+        for market in self._sb_markets:
+            market_wakeup_time = market.next_wakeup_time(timestamp)
+            if market_wakeup_time != market_wakeup_time:
+                # NaN
+                return market_wakeup_time
+            wakeup_time = min(wakeup_time, market_wakeup_time)
+        return wakeup_time
+
     cdef c_remove_markets(self, list markets):
         cdef:
             ConnectorBase typed_market
@@ -3,6 +3,7 @@ import logging
 from abc import ABC
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.latency_tracer import LatencyTracer
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.models.base import RunnableStatus
 
@@ -64,12 +65,17 @@ class RunnableBase(ABC):
         This method is responsible for executing the control task at the specified interval.
         """
         await self.on_start()
+        latency_tracer = LatencyTracer.get_instance()
         while not self.terminated.is_set():
             try:
+                # The orders submitted by the control task are traced from its start, like the ones of a clock tick
+                if latency_tracer.enabled:
+                    latency_tracer.tick_started(latency_tracer.now())
                 await self.control_task()
             except Exception as e:
                 self.logger().error(e, exc_info=True)
             finally:
+                latency_tracer.tick_ended()
                 await asyncio.sleep(self.update_interval)
         self.on_stop()
 
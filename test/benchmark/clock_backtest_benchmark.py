@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Measures the time to back test a period with iterators having work once in a while, stepping through every clock tick
+and skipping the idle ones:
+
+    python -m test.benchmark.clock_backtest_benchmark --days 30
+    python -m test.benchmark.clock_backtest_benchmark --iterators 10 --wakeup-interval 300
+"""
+import argparse
+import time
+
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+
+class PeriodicIterator(PyTimeIterator):
+    """
+    Has work every `wakeup_interval` seconds, like a data source replaying sparse data
+    """
+
+    def __init__(self, wakeup_interval: float):
+        super().__init__()
+        self._wakeup_interval = wakeup_interval
+        self.ticks_count = 0
+
+    def tick(self, timestamp: float):
+        self.ticks_count += 1
+
+    def next_wakeup_time(self, timestamp: float) -> float:
+        return (timestamp // self._wakeup_interval + 1) * self._wakeup_interval
+
+
+def measure(skip_idle_ticks: bool, days: float, iterators_count: int, wakeup_interval: float):
+    start_time = 1609459200.0
+    clock = Clock(ClockMode.BACKTEST, 1.0, start_time, start_time + days * 86400, skip_idle_ticks=skip_idle_ticks)
+    iterators = [PeriodicIterator(wakeup_interval) for _ in range(iterators_count)]
+    for iterator in iterators:
+        clock.add_iterator(iterator)
+    start = time.perf_counter()
+    with clock:
+        clock.backtest()
+    return time.perf_counter() - start, sum(iterator.ticks_count for iterator in iterators)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Back testing clock benchmark")
+    parser.add_argument("--days", type=float, default=7, help="Back tested period in days.")
+    parser.add_argument("--iterators", type=int, default=3, help="Number of iterators.")
+    parser.add_argument("--wakeup-interval", type=float, default=60, help="Seconds between the iterators work.")
+    args = parser.parse_args()
+
+    for skip_idle_ticks in (False, True):
+        duration, ticks_count = measure(skip_idle_ticks, args.days, args.iterators, args.wakeup_interval)
+        print(f"skip_idle_ticks={skip_idle_ticks!s:<5} {duration:8.3f} s {ticks_count:>10} iterator ticks")
+
+
+if __name__ == "__main__":
+    main()
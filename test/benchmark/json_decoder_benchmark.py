@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Compares the JSON decoders available to the web assistants on order book depth payloads.
+
+By default the payloads are generated with the layout of the Binance, OKX and Bybit depth stream messages. Recorded
+messages (one raw websocket frame per line) can be benchmarked instead:
+
+    python -m test.benchmark.json_decoder_benchmark --iterations 2000
+    python -m test.benchmark.json_decoder_benchmark --payloads-file binance_depth_frames.txt
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+from typing import Dict, List
+
+from hummingbot.core.web_assistant.connections.json_decoder import JSONDecoder
+
+
+def _levels(mid_price: float, depth: int, is_bid: bool) -> List[List[str]]:
+    sign = -1 if is_bid else 1
+    return [[f"{mid_price + sign * (i + 1) * 0.01:.2f}", f"{random.uniform(0.001, 20):.5f}"] for i in range(depth)]
+
+
+def sample_payloads(depth: int) -> Dict[str, str]:
+    binance = {
+        "stream": "btcusdt@depth@100ms",
+        "data": {
+            "e": "depthUpdate", "E": 1700000000123, "s": "BTCUSDT", "U": 157, "u": 160,
+            "b": _levels(37000, depth, True), "a": _levels(37000, depth, False),
+        },
+    }
+    okx = {
+        "arg": {"channel": "books", "instId": "BTC-USDT"},
+        "action": "update",
+        "data": [{
+            "asks": [level + ["0", "3"] for level in _levels(37000, depth, False)],
+            "bids": [level + ["0", "2"] for level in _levels(37000, depth, True)],
+            "ts": "1700000000123", "checksum": -855196043, "seqId": 123456, "prevSeqId": 123455,
+        }],
+    }
+    bybit = {
+        "topic": "orderbook.50.BTCUSDT",
+        "type": "delta",
+        "ts": 1700000000123,
+        "data": {"s": "BTCUSDT", "b": _levels(37000, depth, True), "a": _levels(37000, depth, False),
+                 "u": 400000, "seq": 7961638724},
+        "cts": 1700000000120,
+    }
+    return {"binance": json.dumps(binance), "okx": json.dumps(okx), "bybit": json.dumps(bybit)}
+
+
+def measure(decoder: JSONDecoder, payloads: List[str], iterations: int) -> float:
+    """
+    :return: the median time (in microseconds) to decode one payload
+    """
+    loads = decoder.loads
+    durations = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            for payload in payloads:
+                loads(payload)
+        durations.append((time.perf_counter() - start) / (iterations * len(payloads)))
+    return statistics.median(durations) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON decoders benchmark on order book depth payloads")
+    parser.add_argument("--iterations", type=int, default=1000, help="Number of decodes of each payload per run.")
+    parser.add_argument("--depth", type=int, default=50, help="Price levels per side in the generated payloads.")
+    parser.add_argument("--payloads-file", type=str, default=None, help="Recorded payloads, one per line.")
+    args = parser.parse_args()
+
+    if args.payloads_file is not None:
+        with open(args.payloads_file) as fd:
+            payload_sets = {args.payloads_file: [line.strip() for line in fd if line.strip()]}
+    else:
+        payload_sets = {name: [payload] for name, payload in sample_payloads(args.depth).items()}
+
+    decoders = JSONDecoder.available_decoders()
+    for name, payloads in payload_sets.items():
+        print(f"{name} ({len(payloads)} payloads, {sum(len(payload) for payload in payloads)} bytes):")
+        baseline = None
+        for decoder in decoders:
+            duration = measure(decoder, payloads, args.iterations)
+            baseline = baseline or duration
+            print(f"  {decoder.value:<8} {duration:10.2f} us/payload  x{baseline / duration:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""
+Measures the dispatch cost of `PubSub.trigger_event` for an increasing number of listeners, with a listener doing
+nothing so the time is the one of the dispatch itself:
+
+    python -m test.benchmark.pubsub_benchmark --iterations 20000
+    python -m test.benchmark.pubsub_benchmark --listeners 1 5 50
+"""
+import argparse
+import statistics
+import time
+from enum import Enum
+from typing import List
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.pubsub import PubSub
+
+
+class BenchmarkEvent(Enum):
+    Event = 1
+
+
+class NoOpListener(EventListener):
+    def __call__(self, arg):
+        pass
+
+
+def measure(listeners_count: int, iterations: int) -> float:
+    """
+    :return: the median time (in microseconds) of one event dispatch
+    """
+    pubsub = PubSub()
+    listeners: List[NoOpListener] = [NoOpListener() for _ in range(listeners_count)]
+    for listener in listeners:
+        pubsub.add_listener(BenchmarkEvent.Event, listener)
+    trigger_event = pubsub.trigger_event
+    event = object()
+    durations = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            trigger_event(BenchmarkEvent.Event, event)
+        durations.append((time.perf_counter() - start) / iterations)
+    return statistics.median(durations) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PubSub event dispatch benchmark")
+    parser.add_argument("--iterations", type=int, default=10000, help="Number of events triggered per run.")
+    parser.add_argument("--listeners", type=int, nargs="+", default=[1, 2, 5, 10, 50, 100, 500],
+                        help="Numbers of listeners to benchmark.")
+    args = parser.parse_args()
+
+    for listeners_count in args.listeners:
+        iterations = max(1, args.iterations // max(1, listeners_count // 10))
+        duration = measure(listeners_count, iterations)
+        print(f"{listeners_count:>5} listeners {duration:10.3f} us/event {duration * 1e3 / listeners_count:8.1f} "
+              f"ns/listener")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+Measures the startup time of `bin/hummingbot_quickstart.py` up to the creation of the connector settings, with and
+without the connector manifest.
+
+Each measure runs in a fresh interpreter so the import caches of one run don't affect the next one:
+
+    python test/benchmark/startup_time_benchmark.py --runs 5
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from os.path import join, realpath
+from typing import Dict, List
+
+ROOT_PATH = realpath(join(__file__, "../../../"))
+
+MEASURE_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+sys.path.insert(0, "bin")
+import hummingbot_quickstart  # noqa: F401
+imports_done = time.perf_counter()
+
+from hummingbot.client.settings import AllConnectorSettings
+AllConnectorSettings.create_connector_settings(use_manifest={use_manifest})
+settings_done = time.perf_counter()
+
+print(json.dumps({{
+    "imports": imports_done - start,
+    "connector_settings": settings_done - imports_done,
+    "total": settings_done - start,
+    "loaded_utils_modules": len([name for name in sys.modules
+                                 if name.startswith("hummingbot.connector.") and name.endswith("_utils")]),
+}}))
+"""
+
+
+def measure(use_manifest: bool) -> Dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE_SCRIPT.format(use_manifest=use_manifest)],
+        cwd=ROOT_PATH,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def report(name: str, results: List[Dict[str, float]]):
+    print(f"{name}:")
+    for key in ["imports", "connector_settings", "total"]:
+        values = [result[key] for result in results]
+        print(f"  {key:<20} median {statistics.median(values):8.3f}s  min {min(values):8.3f}s  max {max(values):8.3f}s")
+    print(f"  {'loaded utils modules':<20} {results[-1]['loaded_utils_modules']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hummingbot quickstart startup time benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Number of measures for each mode.")
+    args = parser.parse_args()
+
+    report("Full connectors scan", [measure(use_manifest=False) for _ in range(args.runs)])
+    # The full scan run above leaves an up to date manifest
+    report("Connector manifest", [measure(use_manifest=True) for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
@@ -81,6 +81,11 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ mqtt_events                     | True                 |\n"
                            "    | ∟ mqtt_external_events            | True                 |\n"
                            "    | ∟ mqtt_autostart                  | False                |\n"
+                           "    | ∟ mqtt_publish_interval           | 0.1                  |\n"
+                           "    | ∟ mqtt_publish_queue_size         | 10000                |\n"
+                           "    | ∟ mqtt_publish_batches            | False                |\n"
+                           "    | ∟ mqtt_market_data                | False                |\n"
+                           "    | ∟ mqtt_market_data_interval       | 1.0                  |\n"
                            "    | send_error_logs                   | True                 |\n"
                            "    | gateway                           |                      |\n"
                            "    | ∟ gateway_api_host                | localhost            |\n"
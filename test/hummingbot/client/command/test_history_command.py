@@ -16,6 +16,7 @@ from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_ledger import TradeFillLedger
 
 
 class HistoryCommandTest(unittest.TestCase):
@@ -172,3 +173,52 @@ class HistoryCommandTest(unittest.TestCase):
         )
 
         self.assertEqual(df_str_expected, captures[0])
+
+    def test_trades_are_loaded_as_ledger_entries_except_the_first_partial_hour(self):
+        self.client_config_map.db_mode = DBSqliteMode()
+        # The database of a previous test was deleted, it has to be created again
+        SQLConnectionManager._scm_trade_fills_instance = None
+        self.app.strategy_file_name = f"{self.mock_strategy_name}.yml"
+        hour = TradeFillLedger.PERIOD_DURATION_MS
+
+        trade_fee = AddedToCostTradeFee(percent=Decimal("0.1"))
+        with self.app.trade_fill_db.get_new_session() as session:
+            with session.begin():
+                fills = [("binance", "BTC-USDT", hour + 10, "NIL"),
+                         ("binance", "BTC-USDT", hour + 20, "NIL"),
+                         ("binance", "BTC-USDT", 2 * hour + 10, "NIL"),
+                         ("binance", "BTC-USDT", 3 * hour + 10, "NIL"),
+                         ("binance_perpetual", "BTC-USDT", 2 * hour + 20, "OPEN"),
+                         ("binance_perpetual", "BTC-USDT", 3 * hour + 20, "CLOSE")]
+                for i, (market, symbol, timestamp, position) in enumerate(fills):
+                    trade_fill = TradeFill(
+                        config_file_path=f"{self.mock_strategy_name}.yml",
+                        strategy=self.mock_strategy_name,
+                        market=market,
+                        symbol=symbol,
+                        base_asset="BTC",
+                        quote_asset="USDT",
+                        timestamp=timestamp,
+                        order_id=f"someId{i}",
+                        trade_type="BUY" if i % 2 else "SELL",
+                        order_type="LIMIT",
+                        price=Decimal("100"),
+                        amount=Decimal("1"),
+                        leverage=1,
+                        trade_fee=trade_fee.to_json(),
+                        exchange_trade_id=f"someExchangeId{i}",
+                        position=position,
+                    )
+                    session.add(trade_fill)
+                    TradeFillLedger.record_fill(session, trade_fill)
+
+        with self.app.trade_fill_db.get_new_session() as session:
+            trades, ledger_entries = self.app._get_trades_and_ledger_entries_from_session(
+                hour + 15, session=session, config_file_path=self.app.strategy_file_name)
+
+        # The fill of the first hour after the start time, and all the fills of the derivatives market
+        self.assertEqual([(hour + 20, "binance"), (2 * hour + 20, "binance_perpetual"),
+                          (3 * hour + 20, "binance_perpetual")],
+                         [(t.timestamp, t.market) for t in trades])
+        self.assertEqual([(2 * hour, "binance"), (3 * hour, "binance")],
+                         [(e.period_start, e.market) for e in ledger_entries])
@@ -0,0 +1,65 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.utils.latency_tracer import LatencyStage, LatencyTracer
+
+
+class LatencyCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+        self.latency_tracer = LatencyTracer.get_instance()
+        self.addCleanup(self.latency_tracer.reset)
+        self.addCleanup(self.latency_tracer.stop)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_start_stop_and_reset(self, notify_mock):
+        self.app.latency("start")
+        self.assertTrue(self.latency_tracer.enabled)
+        notify_mock.assert_called_with("Latency tracing started.")
+
+        self.latency_tracer.record(LatencyStage.THROTTLER_WAIT, 0.01)
+        self.app.latency("reset")
+        self.assertEqual({}, self.latency_tracer.stats())
+        notify_mock.assert_called_with("Latency statistics reset.")
+
+        self.app.latency("stop")
+        self.assertFalse(self.latency_tracer.enabled)
+        notify_mock.assert_called_with("Latency tracing stopped.")
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_show_latency_report(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        self.app.latency()
+        self.latency_tracer.start()
+        self.latency_tracer.record(LatencyStage.ORDER_ACK, 0.0042)
+        self.app.latency()
+
+        self.assertEqual(
+            "\n  Latency tracing is disabled.\n  Run `latency start` to trace the hot path latencies.", captures[0])
+        report_expected = (
+            "\n  Latency tracing is enabled."
+            "\n    +-----------+---------+-------------+------------+------------+------------+------------+"
+            "\n    | Stage     |   Count |   Mean (ms) |   p50 (ms) |   p90 (ms) |   p99 (ms) |   Max (ms) |"
+            "\n    |-----------+---------+-------------+------------+------------+------------+------------|"
+            "\n    | order_ack |       1 |         4.2 |        4.2 |        4.2 |        4.2 |        4.2 |"
+            "\n    +-----------+---------+-------------+------------+------------+------------+------------+"
+        )
+        self.assertEqual(report_expected, captures[1])
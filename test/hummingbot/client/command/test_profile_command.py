@@ -0,0 +1,79 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+
+
+class ProfileCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.output_dir.cleanup)
+        self.client_config_map.log_file_path = Path(self.output_dir.name)
+
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_profile_for_duration(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        self.app._profiling_stop_event = asyncio.Event()
+        self.async_run_with_timeout(self.app.profile_async(0.1, sampling_interval=5, blocking_threshold=100))
+
+        self.assertIsNone(self.app._profiling_stop_event)
+        self.assertEqual("Profiling for 0.1 seconds...", captures[0])
+        self.assertTrue(captures[1].startswith("Profiling done."))
+        self.assertEqual(2, len([file for file in os.listdir(self.output_dir.name) if file.startswith("profile_")]))
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_profile_stop(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        async def profile_and_stop():
+            self.app.profile(duration=30)
+            self.app.profile()
+            await asyncio.sleep(0.05)
+            self.app.profile("stop")
+            while self.app._profiling_stop_event is not None:
+                await asyncio.sleep(0.01)
+
+        self.async_run_with_timeout(profile_and_stop())
+        self.app.profile("stop")
+
+        self.assertEqual("A profiling is already running, run `profile stop` to stop it.", captures[0])
+        self.assertEqual("Profiling for 30 seconds...", captures[1])
+        self.assertTrue(captures[2].startswith("Profiling done."))
+        self.assertEqual("No profiling is running.", captures[3])
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_profile_rejects_non_positive_arguments(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        self.app.profile(duration=0)
+        self.app.profile(sampling_interval=-1)
+        self.app.profile(blocking_threshold=0)
+
+        self.assertIsNone(self.app._profiling_stop_event)
+        self.assertEqual(["The profiling duration must be greater than 0.",
+                          "The profiling sampling interval must be greater than 0.",
+                          "The profiling blocking threshold must be greater than 0."],
+                         captures)
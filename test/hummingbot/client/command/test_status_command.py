@@ -7,6 +7,8 @@ from unittest.mock import MagicMock, patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.connector.signing_service import SigningService
+from hummingbot.core.utils.loop_lag_monitor import LoopLagMonitor
 
 
 class StatusCommandTest(unittest.TestCase):
@@ -26,6 +28,13 @@ class StatusCommandTest(unittest.TestCase):
         self.cli_mock_assistant.stop()
         super().tearDown()
 
+    def isolate_signing_service(self) -> SigningService:
+        original_signing_service = SigningService._shared_instance
+        SigningService._shared_instance = SigningService(max_workers=1)
+        self.addCleanup(setattr, SigningService, "_shared_instance", original_signing_service)
+        self.addCleanup(SigningService._shared_instance.shutdown)
+        return SigningService._shared_instance
+
     @staticmethod
     def get_async_sleep_fn(delay: float):
         async def async_sleep(*_, **__):
@@ -74,3 +83,33 @@ class StatusCommandTest(unittest.TestCase):
                 msg="\nA network error prevented the connection check to complete. See logs for more details."
             )
         )
+
+    def test_strategy_status_includes_event_loop_lag(self):
+        original_loop_lag_monitor = LoopLagMonitor._shared_instance
+        LoopLagMonitor._shared_instance = LoopLagMonitor()
+        self.addCleanup(setattr, LoopLagMonitor, "_shared_instance", original_loop_lag_monitor)
+        self.isolate_signing_service()
+        self.app.strategy = MagicMock()
+        self.app.strategy.format_status.return_value = "Strategy status"
+
+        status = self.async_run_with_timeout(self.app.strategy_status())
+        self.assertEqual("\nStrategy status", status)
+
+        LoopLagMonitor.get_instance().record_lag(0.0015)
+        LoopLagMonitor.get_instance().record_lag(0.003)
+
+        status = self.async_run_with_timeout(self.app.strategy_status())
+        self.assertEqual("\nStrategy status\n\n  Event loop lag since start: p50 2.0 ms, p90 3.0 ms, p99 3.0 ms, max 3.0 ms",
+                         status)
+
+    def test_strategy_status_includes_signing_latency(self):
+        signing_service = self.isolate_signing_service()
+        self.app.strategy = MagicMock()
+        self.app.strategy.format_status.return_value = "Strategy status"
+
+        signing_service._record_latency("hyperliquid", 0.002)
+        signing_service._record_latency("hyperliquid", 0.004)
+
+        status = self.async_run_with_timeout(self.app.strategy_status())
+        self.assertIn("\n\n  Signing latency:\n"
+                      "    hyperliquid: 2 signatures, mean 3.0 ms, max 4.0 ms, last 4.0 ms", status)
@@ -1,8 +1,10 @@
 import asyncio
+import threading
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Awaitable
+from unittest.mock import patch
 
 from hummingbot.client.config import config_crypt, config_helpers, security
 from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger, store_password_verification, validate_password
@@ -150,3 +152,65 @@ class SecurityTest(unittest.TestCase):
         binance_loaded_config = Security.decrypted_value(binance_config.connector)
 
         self.assertEqual(binance_config, binance_loaded_config)
+
+    def test_lazy_login_decrypts_configs_on_demand(self):
+        password = "som-password"
+        secrets_manager = ETHKeyFileSecretManger(password)
+        store_password_verification(secrets_manager)
+        Security.secrets_manager = secrets_manager
+        config_map = self.store_binance_config()
+        self.reset_security()
+
+        Security.login(ETHKeyFileSecretManger(password), lazy_decryption=True)
+        self.async_run_with_timeout(Security.wait_til_decryption_done())
+
+        self.assertEqual({}, Security._secure_configs)
+        self.assertTrue(Security.any_secure_configs())
+
+        # The keys were derived in the background, decrypting on demand doesn't derive them again
+        with patch("hummingbot.client.config.config_crypt._derive_key",
+                   wraps=config_crypt._derive_key) as derive_key_mock:
+            api_keys = Security.api_keys(self.connector)
+            derive_key_mock.assert_not_called()
+
+        self.assertEqual(api_keys_from_connector_config_map(config_map), api_keys)
+        self.assertEqual([self.connector], list(Security.all_decrypted_values().keys()))
+
+    def test_prepare_decryption_clears_the_configs_under_the_decryption_lock(self):
+        Security._secure_configs[self.connector] = self.store_binance_config()
+
+        with Security._decryption_lock:
+            thread = threading.Thread(target=Security.prepare_decryption)
+            thread.start()
+            thread.join(0.1)
+            self.assertIn(self.connector, Security._secure_configs)
+        thread.join(1)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual({}, Security._secure_configs)
+
+    def test_secrets_manager_derives_key_once_for_its_values(self):
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        encrypted_values = [secrets_manager.encrypt_secret_value("attr", value) for value in ["one", "two", "three"]]
+
+        decrypting_manager = ETHKeyFileSecretManger("som-password")
+        with patch("hummingbot.client.config.config_crypt._derive_key",
+                   wraps=config_crypt._derive_key) as derive_key_mock:
+            decrypting_manager.prepare_decryption(encrypted_values)
+            decrypted_values = [decrypting_manager.decrypt_secret_value("attr", value) for value in encrypted_values]
+
+        self.assertEqual(["one", "two", "three"], decrypted_values)
+        self.assertEqual(1, derive_key_mock.call_count)
+
+    def test_secrets_manager_decrypts_values_with_different_salts(self):
+        encrypted_values = [
+            ETHKeyFileSecretManger("som-password").encrypt_secret_value("attr", value) for value in ["one", "two"]
+        ]
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+
+        secrets_manager.prepare_decryption(encrypted_values + ["not an encrypted value"])
+
+        self.assertEqual(["one", "two"],
+                         [secrets_manager.decrypt_secret_value("attr", value) for value in encrypted_values])
+        with self.assertRaises(ValueError):
+            ETHKeyFileSecretManger("another-password").decrypt_secret_value("attr", encrypted_values[0])
@@ -13,6 +13,7 @@ from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
 from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_ledger import TradeFillLedger
 
 trading_pair = "HBOT-USDT"
 base, quote = trading_pair.split("-")
@@ -341,3 +342,55 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         performance_metric = PerformanceMetrics()
         returned_impact = performance_metric._process_deducted_fees_impact_in_quote_vol(dummy_trade)
         self.assertEqual(returned_impact, Decimal("-100.0"))
+
+    def test_performance_metrics_from_ledger_entries_match_the_trades_ones(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices["BNB-USDT"] = Decimal("300")
+        RateOracle._shared_instance = rate_oracle
+
+        fees = [AddedToCostTradeFee(percent=Decimal("0.001")),
+                DeductedFromReturnsTradeFee(percent=Decimal("0.002"), flat_fees=[TokenAmount("BNB", Decimal("0.01"))])]
+        trades = [
+            TradeFill(
+                config_file_path="some-strategy.yml",
+                strategy="pure_market_making",
+                market="binance",
+                symbol=trading_pair,
+                base_asset=base,
+                quote_asset=quote,
+                timestamp=1000 + i,
+                order_id=f"someId{i}",
+                trade_type="BUY" if i % 3 else "SELL",
+                order_type="LIMIT",
+                price=Decimal("100") + i,
+                amount=Decimal("1.5") + i,
+                trade_fee=fees[i % 2].to_json(),
+                exchange_trade_id=f"someExchangeId{i}",
+                position=PositionAction.NIL.value,
+            )
+            for i in range(7)
+        ]
+        ledger_entries = []
+        for trades_of_period in (trades[2:5], trades[5:]):
+            entry = TradeFillLedger(
+                period_start=trades_of_period[0].timestamp,
+                first_timestamp=trades_of_period[0].timestamp,
+                last_timestamp=trades_of_period[0].timestamp,
+                first_price=trades_of_period[0].price,
+                last_price=trades_of_period[0].price,
+                num_buys=0, num_sells=0, num_position_fills=0,
+                buy_base_volume=Decimal("0"), buy_quote_volume=Decimal("0"),
+                sell_base_volume=Decimal("0"), sell_quote_volume=Decimal("0"),
+                deducted_fees_in_quote=Decimal("0"), fees={})
+            for trade in trades_of_period:
+                entry.add_fill(trade)
+            ledger_entries.append(entry)
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+
+        from_trades = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, cur_bals))
+        from_ledger = self.async_run_with_timeout(
+            PerformanceMetrics.create(trading_pair, trades[:2], cur_bals, ledger_entries))
+
+        self.assertEqual(7, from_ledger.num_trades)
+        self.assertEqual(from_trades.__dict__, from_ledger.__dict__)
+        self.assertEqual(dict(from_trades.fees), dict(from_ledger.fees))
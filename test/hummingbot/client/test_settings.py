@@ -1,8 +1,19 @@
+import importlib
+import json
+import tempfile
 import unittest
+from os.path import join
+from unittest.mock import patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot.client.settings import (
+    AllConnectorSettings,
+    ConnectorManifest,
+    ConnectorSetting,
+    ConnectorType,
+    LazyConnectorConfigKeys,
+)
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
@@ -61,3 +72,98 @@ class SettingsTest(unittest.TestCase):
         }
 
         self.assertEqual(expected_params, params)
+
+
+class ConnectorManifestTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = join(self.temp_dir.name, "connector_manifest.json")
+        path_patcher = patch.object(ConnectorManifest, "path", return_value=self.manifest_path)
+        path_patcher.start()
+        self.addCleanup(path_patcher.stop)
+        self.addCleanup(self.temp_dir.cleanup)
+        self.addCleanup(AllConnectorSettings.create_connector_settings)
+
+    def test_full_scan_writes_manifest(self):
+        settings = AllConnectorSettings.create_connector_settings(use_manifest=False)
+
+        with open(self.manifest_path) as fd:
+            manifest = json.load(fd)
+
+        self.assertEqual(set(settings.keys()), set(manifest["connectors"].keys()))
+        self.assertEqual("hummingbot.connector.exchange.binance.binance_utils",
+                         manifest["connectors"]["binance"]["util_module"])
+        self.assertTrue(manifest["connectors"]["binance_us"]["is_sub_domain"])
+        self.assertEqual("binance", manifest["connectors"]["binance_us"]["parent_name"])
+
+    def test_settings_from_manifest_match_full_scan(self):
+        full_scan_settings = AllConnectorSettings.create_connector_settings(use_manifest=False)
+        full_scan_values = {name: (cs.type, cs.example_pair, cs.trade_fee_schema, cs.is_sub_domain,
+                                   cs.domain_parameter, cs.config_keys.__class__)
+                            for name, cs in full_scan_settings.items()}
+
+        with patch("hummingbot.client.settings.importlib.import_module") as import_module_mock:
+            manifest_settings = AllConnectorSettings.create_connector_settings()
+            import_module_mock.assert_not_called()
+
+        manifest_values = {name: (cs.type, cs.example_pair, cs.trade_fee_schema, cs.is_sub_domain,
+                                  cs.domain_parameter, cs.config_keys.__class__)
+                           for name, cs in manifest_settings.items()}
+        self.assertEqual(full_scan_values, manifest_values)
+
+    def test_outdated_manifest_is_regenerated(self):
+        with open(self.manifest_path, "w") as fd:
+            json.dump({"fingerprint": "outdated", "connectors": {}}, fd)
+
+        settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertIn("binance", settings)
+        with open(self.manifest_path) as fd:
+            self.assertNotEqual("outdated", json.load(fd)["fingerprint"])
+
+    def test_manifest_is_regenerated_when_missing_module_is_installed(self):
+        original_import_module = importlib.import_module
+
+        def import_module(name, *args, **kwargs):
+            if name == "hummingbot.connector.exchange.binance.binance_utils":
+                raise ModuleNotFoundError("No module named 'some_sdk'", name="some_sdk")
+            return original_import_module(name, *args, **kwargs)
+
+        with patch("hummingbot.client.settings.importlib.import_module", side_effect=import_module):
+            settings = AllConnectorSettings.create_connector_settings(use_manifest=False)
+
+        self.assertNotIn("binance", settings)
+        with open(self.manifest_path) as fd:
+            self.assertEqual("some_sdk", json.load(fd)["missing_modules"]["binance"])
+
+        settings = AllConnectorSettings.create_connector_settings()
+        self.assertNotIn("binance", settings)
+
+        with patch.object(ConnectorManifest, "_is_module_installed", return_value=True):
+            settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertIn("binance", settings)
+        with open(self.manifest_path) as fd:
+            self.assertNotIn("binance", json.load(fd)["missing_modules"])
+
+    def test_module_installed_check_uses_the_full_module_name(self):
+        self.assertTrue(ConnectorManifest._is_module_installed("json.decoder"))
+        self.assertFalse(ConnectorManifest._is_module_installed("json.not_a_module"))
+        self.assertFalse(ConnectorManifest._is_module_installed("not_a_package.module"))
+
+    def test_config_keys_are_loaded_lazily(self):
+        AllConnectorSettings.create_connector_settings(use_manifest=False)
+        AllConnectorSettings.create_connector_settings()
+        self.addCleanup(setattr, AllConnectorSettings, "paper_trade_connectors_names",
+                        AllConnectorSettings.paper_trade_connectors_names)
+        AllConnectorSettings.initialize_paper_trade_settings(["binance"])
+
+        lazy_keys = AllConnectorSettings.get_connector_settings()["binance_paper_trade"]._asdict()["config_keys"]
+        self.assertIsInstance(lazy_keys, LazyConnectorConfigKeys)
+        self.assertFalse(lazy_keys.is_loaded)
+
+        config_keys = AllConnectorSettings.get_connector_config_keys("binance_paper_trade")
+
+        self.assertIsInstance(config_keys, BinanceConfigMap)
+        self.assertTrue(lazy_keys.is_loaded)
@@ -1,12 +1,13 @@
 import asyncio
 import unittest
 from typing import Awaitable
+from unittest.mock import MagicMock
 
 from prompt_toolkit.document import Document
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
-from hummingbot.client.ui.custom_widgets import FormattedTextLexer
+from hummingbot.client.ui.custom_widgets import CustomTextArea, FormattedTextLexer
 
 
 class CustomWidgetUnitTests(unittest.TestCase):
@@ -91,3 +92,58 @@ class CustomWidgetUnitTests(unittest.TestCase):
         line_fragments = get_line(1)
         self.assertEqual(0, len(line_fragments))
         self.assertEqual(expected_fragments, line_fragments)
+
+    def test_text_area_keeps_the_last_lines_in_a_ring_buffer(self):
+        text_area = CustomTextArea(max_line_count=3, initial_text="first")
+
+        for i in range(4):
+            text_area.log(f"line {i}")
+
+        self.assertEqual(["line 1", "line 2", "line 3"], list(text_area.log_lines))
+        self.assertEqual("line 1\nline 2\nline 3", text_area.text)
+        self.assertEqual(len(text_area.text), text_area.document.cursor_position)
+
+    def test_text_area_renders_the_visible_lines_and_all_of_them_when_scrolled(self):
+        text_area = CustomTextArea(max_line_count=100)
+        text_area.window.render_info = MagicMock(window_width=102, window_height=2)
+
+        text_area.log("\n".join(f"line {i}" for i in range(10)))
+
+        self.assertEqual("line 6\nline 7\nline 8\nline 9", text_area.text)
+
+        text_area.buffer.cursor_up()
+
+        all_lines = "\n".join([""] + [f"line {i}" for i in range(10)])
+        self.assertEqual(all_lines, text_area.text)
+        self.assertEqual(all_lines.index("line 8") + len("line 8"), text_area.document.cursor_position)
+
+    def test_text_area_live_update_is_rendered_without_being_logged(self):
+        text_area = CustomTextArea(max_line_count=100, initial_text="logged")
+
+        text_area.log("live update", save_log=False)
+        self.assertEqual("live update", text_area.text)
+        self.assertEqual(["logged"], list(text_area.log_lines))
+
+        text_area.log("silent", silent=True)
+        self.assertEqual("live update", text_area.text)
+
+    def test_text_area_refreshes_are_batched_at_the_max_refresh_rate(self):
+        text_area = CustomTextArea(max_line_count=100, initial_text="", max_refresh_rate=20)
+        text_area._set_document = MagicMock(wraps=text_area._set_document)
+
+        async def log_lines():
+            for i in range(5):
+                text_area.log(f"line {i}")
+            await asyncio.sleep(0.01)
+            # The pane was rendered when created, the next refresh is one frame (50 ms) later
+            self.assertEqual(0, text_area._set_document.call_count)
+            await asyncio.sleep(0.05)
+            self.assertEqual(1, text_area._set_document.call_count)
+            for i in range(5, 10):
+                text_area.log(f"line {i}")
+            await asyncio.sleep(0.1)
+
+        self.async_run_with_timeout(log_lines())
+
+        self.assertEqual(2, text_area._set_document.call_count)
+        self.assertEqual("\n".join([""] + [f"line {i}" for i in range(10)]), text_area.text)
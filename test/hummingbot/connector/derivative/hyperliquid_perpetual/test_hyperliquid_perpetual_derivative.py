@@ -9,7 +9,7 @@ from unittest.mock import AsyncMock, patch
 
 import pandas as pd
 from aioresponses import aioresponses
-from aioresponses.core import RequestCall
+from aioresponses.core import CallbackResult, RequestCall
 
 import hummingbot.connector.derivative.hyperliquid_perpetual.hyperliquid_perpetual_constants as CONSTANTS
 import hummingbot.connector.derivative.hyperliquid_perpetual.hyperliquid_perpetual_web_utils as web_utils
@@ -455,12 +455,22 @@ class HyperliquidPerpetualDerivativeTests(AbstractPerpetualDerivativeTests.Perpe
         """
         :return: a list of all configured URLs for the cancelations
         """
-        all_urls = []
-        url = self.configure_successful_cancelation_response(order=successful_order, mock_api=mock_api)
-        all_urls.append(url)
-        url = self.configure_erroneous_cancelation_response(order=erroneous_order, mock_api=mock_api)
-        all_urls.append(url)
-        return all_urls
+        url = web_utils.public_rest_url(
+            CONSTANTS.CANCEL_ORDER_URL
+        )
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?") + ".*")
+        successful_response = self._order_cancelation_request_successful_mock_response(order=successful_order)
+
+        # The cancels are signed concurrently, so the response depends on the canceled order and not on the
+        # order of the requests
+        def response_callback(*args, **kwargs):
+            request_data = json.loads(kwargs["data"])
+            if request_data["action"]["cancels"][0]["cloid"] == successful_order.client_order_id:
+                return CallbackResult(body=json.dumps(successful_response))
+            return CallbackResult(status=400)
+
+        mock_api.post(regex_url, callback=response_callback, repeat=True)
+        return [url, url]
 
     def configure_order_not_found_error_cancelation_response(
             self, order: InFlightOrder, mock_api: aioresponses,
@@ -215,6 +215,56 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
             "Subscribed to public order book and trade channels..."
         ))
 
+    def test_trading_pairs_shards_respect_the_exchange_limit(self):
+        data_source = BinanceAPIOrderBookDataSource(trading_pairs=[f"PAIR{i}-HBOT" for i in range(1030)],
+                                                    connector=self.connector,
+                                                    api_factory=self.connector._web_assistants_factory,
+                                                    domain=self.domain)
+
+        self.assertTrue(data_source.supports_ws_sharding)
+        self.assertEqual([512, 512, 6], [len(shard) for shard in data_source.trading_pairs_shards()])
+
+        data_source.ws_trading_pairs_per_connection = 400
+        self.assertEqual([400, 400, 230], [len(shard) for shard in data_source.trading_pairs_shards()])
+
+        data_source.ws_trading_pairs_per_connection = 2000
+        self.assertEqual([512, 512, 6], [len(shard) for shard in data_source.trading_pairs_shards()])
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_listen_for_subscriptions_splits_trading_pairs_across_connections(self, ws_connect_mock):
+        other_ex_trading_pair = "OTHERHBOT"
+        self.connector._set_trading_pair_symbol_map(
+            bidict({self.ex_trading_pair: self.trading_pair, other_ex_trading_pair: "OTHER-HBOT"}))
+        data_source = BinanceAPIOrderBookDataSource(trading_pairs=[self.trading_pair, "OTHER-HBOT"],
+                                                    connector=self.connector,
+                                                    api_factory=self.connector._web_assistants_factory,
+                                                    domain=self.domain)
+        data_source.ws_trading_pairs_per_connection = 1
+        websocket_mocks = [self.mocking_assistant.create_websocket_mock(),
+                           self.mocking_assistant.create_websocket_mock()]
+        ws_connect_mock.side_effect = websocket_mocks
+        for websocket_mock, ex_trading_pair in zip(websocket_mocks, [self.ex_trading_pair, other_ex_trading_pair]):
+            self.mocking_assistant.add_websocket_aiohttp_message(
+                websocket_mock=websocket_mock,
+                message=json.dumps({"e": "trade", "s": ex_trading_pair, "t": 1, "p": "1", "q": "1", "T": 1}))
+
+        self.listening_task = self.ev_loop.create_task(data_source.listen_for_subscriptions())
+        for websocket_mock in websocket_mocks:
+            self.mocking_assistant.run_until_all_aiohttp_messages_delivered(websocket_mock)
+
+        for websocket_mock, ex_trading_pair in zip(websocket_mocks, [self.ex_trading_pair, other_ex_trading_pair]):
+            sent_subscription_messages = self.mocking_assistant.json_messages_sent_through_websocket(
+                websocket_mock=websocket_mock)
+            self.assertEqual([f"{ex_trading_pair.lower()}@trade"], sent_subscription_messages[0]["params"])
+            self.assertEqual([f"{ex_trading_pair.lower()}@depth@100ms"], sent_subscription_messages[1]["params"])
+
+        # Both connections feed the same queue
+        self.assertEqual(2, data_source._message_queue[CONSTANTS.TRADE_EVENT_TYPE].qsize())
+        shards_stats = data_source.ws_shards_stats
+        self.assertEqual([[self.trading_pair], ["OTHER-HBOT"]], [stats.trading_pairs for stats in shards_stats])
+        self.assertEqual([1, 1], [stats.connections_count for stats in shards_stats])
+        self.assertEqual([1, 1], [stats.messages_count for stats in shards_stats])
+
     @patch("hummingbot.core.data_type.order_book_tracker_data_source.OrderBookTrackerDataSource._sleep")
     @patch("aiohttp.ClientSession.ws_connect")
     def test_listen_for_subscriptions_raises_cancel_exception(self, mock_ws, _: AsyncMock):
@@ -1378,3 +1378,129 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 "isBestMatch": True
             }
         ]
+
+    def test_rest_endpoint_router_is_only_created_when_enabled(self):
+        self.assertIsNone(self.exchange.rest_endpoint_router)
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.rest_endpoint_selection.rest_endpoint_selection_enabled = True
+        client_config_map.rest_endpoint_selection.rest_request_hedging_delay = 0.5
+        exchange = BinanceExchange(
+            client_config_map=client_config_map,
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+
+        self.assertEqual(CONSTANTS.REST_URLS["com"], exchange.rest_endpoint_router.base_urls)
+        self.assertEqual(0.5, exchange.rest_endpoint_router.hedging_delay)
+
+    @aioresponses()
+    def test_api_request_is_routed_to_the_fastest_host(self, mock_api):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.rest_endpoint_selection.rest_endpoint_selection_enabled = True
+        exchange = BinanceExchange(
+            client_config_map=client_config_map,
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+        for base_url in CONSTANTS.REST_URLS["com"]:
+            latency = 0.01 if base_url == "https://api-gcp.binance.com/api/" else 0.1
+            exchange.rest_endpoint_router.record_latency(base_url, latency)
+        mock_api.get("https://api-gcp.binance.com/api/v3/ping", body=json.dumps({}))
+
+        result = self.async_run_with_timeout(exchange._api_get(path_url=CONSTANTS.PING_PATH_URL))
+
+        self.assertEqual({}, result)
+
+    def _start_tracking_orders(self, count: int) -> List[InFlightOrder]:
+        for i in range(count):
+            self.exchange.start_tracking_order(
+                order_id=f"{self.client_order_id_prefix}{i}",
+                exchange_order_id=f"{self.exchange_order_id_prefix}{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        return list(self.exchange.in_flight_orders.values())
+
+    @aioresponses()
+    def test_update_orders_status_in_bulk_with_open_orders(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        open_order, filled_order = self._start_tracking_orders(count=2)
+        open_orders_url = web_utils.private_rest_url(CONSTANTS.OPEN_ORDERS_PATH_URL)
+        open_order_response = self._order_status_request_partially_filled_mock_response(order=open_order)
+        mock_api.get(re.compile(f"^{open_orders_url}".replace(".", r"\.")), body=json.dumps([open_order_response]))
+        order_url = self.configure_canceled_order_status_response(order=filled_order, mock_api=mock_api)
+
+        self.async_run_with_timeout(self.exchange._update_orders())
+
+        self.assertEqual(OrderState.PARTIALLY_FILLED, open_order.current_state)
+        self.assertEqual(OrderState.CANCELED, filled_order.current_state)
+        self.assertEqual(1, len(self._all_executed_requests(mock_api, open_orders_url)))
+        # Only the order missing from the open orders is requested on its own
+        order_requests = self._all_executed_requests(mock_api, order_url)
+        self.assertEqual(1, len(order_requests))
+        self.assertEqual(filled_order.client_order_id, order_requests[0].kwargs["params"]["origClientOrderId"])
+
+    @aioresponses()
+    def test_update_orders_fills_in_bulk_with_recent_fills(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        filled_order, open_order = self._start_tracking_orders(count=2)
+        trades_url = web_utils.private_rest_url(CONSTANTS.MY_TRADES_PATH_URL)
+        trades_response = self._order_fills_request_full_fill_mock_response(order=filled_order)
+        mock_api.get(re.compile(f"^{trades_url}".replace(".", r"\.")), body=json.dumps(trades_response))
+
+        self.async_run_with_timeout(self.exchange._update_orders_fills(orders=[filled_order, open_order]))
+
+        trades_requests = self._all_executed_requests(mock_api, trades_url)
+        self.assertEqual(1, len(trades_requests))
+        self.assertNotIn("orderId", trades_requests[0].kwargs["params"])
+        self.assertEqual(filled_order.amount, filled_order.executed_amount_base)
+        self.assertEqual(Decimal(0), open_order.executed_amount_base)
+
+    @aioresponses()
+    def test_update_orders_fills_one_by_one_when_recent_fills_are_truncated(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        orders = self._start_tracking_orders(count=2)
+        trades_url = web_utils.private_rest_url(CONSTANTS.MY_TRADES_PATH_URL)
+        regex_url = re.compile(f"^{trades_url}".replace(".", r"\."))
+        other_fill = self._order_fills_request_full_fill_mock_response(order=orders[0])[0]
+        other_fill["orderId"] = 1
+        mock_api.get(regex_url, body=json.dumps([other_fill] * CONSTANTS.MY_TRADES_MAX_LIMIT))
+        for _ in orders:
+            mock_api.get(regex_url, body=json.dumps([]))
+
+        self.async_run_with_timeout(self.exchange._update_orders_fills(orders=orders))
+
+        trades_requests = self._all_executed_requests(mock_api, trades_url)
+        self.assertEqual(3, len(trades_requests))
+        self.assertEqual({order.exchange_order_id for order in orders},
+                         {str(request.kwargs["params"]["orderId"]) for request in trades_requests[1:]})
+
+    def test_orders_status_requests_run_concurrently_up_to_the_limit(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.ORDER_UPDATES_MAX_CONCURRENCY = 3
+        orders = self._start_tracking_orders(count=8)
+        running_requests = 0
+        max_running_requests = 0
+
+        async def request_order_status(tracked_order: InFlightOrder):
+            nonlocal running_requests, max_running_requests
+            running_requests += 1
+            max_running_requests = max(max_running_requests, running_requests)
+            await asyncio.sleep(0.01)
+            running_requests -= 1
+            raise IOError("Order status not available")
+
+        error_handler = AsyncMock()
+        with patch.object(self.exchange, "_request_bulk_order_status", AsyncMock(return_value={})), \
+                patch.object(self.exchange, "_request_order_status", side_effect=request_order_status):
+            self.async_run_with_timeout(
+                self.exchange._update_orders_with_error_handler(orders=orders, error_handler=error_handler))
+
+        self.assertEqual(3, max_running_requests)
+        self.assertEqual(len(orders), error_handler.call_count)
@@ -54,3 +54,34 @@ class HyperliquidAuthTests(TestCase):
         self.assertEqual(4, len(params))
         self.assertEqual(None, params.get("vaultAddress"))
         self.assertEqual("order", params.get("action")["type"])
+
+    def test_sign_l1_action_matches_full_structured_data_signature(self):
+        action = {"type": "cancelByCloid", "cancels": [{"asset": 4, "cloid": "0x000000000000000000000000000ee056"}]}
+        nonce = int(self._get_timestamp() * 1e3)
+        phantom_agent = self.auth.construct_phantom_agent(self.auth.action_hash(action, None, nonce), True)
+        expected_signature = self.auth.sign_inner(self.auth.wallet, {
+            "domain": {
+                "chainId": 1337,
+                "name": "Exchange",
+                "verifyingContract": "0x0000000000000000000000000000000000000000",
+                "version": "1",
+            },
+            "types": {
+                "Agent": [
+                    {"name": "source", "type": "string"},
+                    {"name": "connectionId", "type": "bytes32"},
+                ],
+                "EIP712Domain": [
+                    {"name": "name", "type": "string"},
+                    {"name": "version", "type": "string"},
+                    {"name": "chainId", "type": "uint256"},
+                    {"name": "verifyingContract", "type": "address"},
+                ],
+            },
+            "primaryType": "Agent",
+            "message": phantom_agent,
+        })
+
+        signature = self.auth.sign_l1_action(self.auth.wallet, action, None, nonce, True)
+
+        self.assertEqual(expected_signature, signature)
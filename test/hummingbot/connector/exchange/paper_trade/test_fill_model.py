@@ -0,0 +1,80 @@
+from decimal import Decimal
+from unittest import TestCase
+
+from hummingbot.connector.exchange.paper_trade.fill_model import PaperTradeFillModel
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class PaperTradeFillModelTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.order_book = CompositeOrderBook()
+        self.order_book.apply_snapshot(
+            bids=[OrderBookRow(99.5, 10, 1), OrderBookRow(98.5, 20, 1)],
+            asks=[OrderBookRow(100.5, 10, 1), OrderBookRow(101.5, 20, 1)],
+            update_id=1,
+        )
+        self.fill_model = PaperTradeFillModel()
+
+    def test_volume_at_price(self):
+        self.assertEqual(Decimal("10"), PaperTradeFillModel.volume_at_price(self.order_book, True, Decimal("99.5")))
+        self.assertEqual(Decimal("20"), PaperTradeFillModel.volume_at_price(self.order_book, False, Decimal("101.5")))
+        self.assertEqual(Decimal("0"), PaperTradeFillModel.volume_at_price(self.order_book, True, Decimal("99")))
+        self.assertEqual(Decimal("0"), PaperTradeFillModel.volume_at_price(self.order_book, False, Decimal("100")))
+
+    def test_trades_at_order_price_consume_queue_ahead_first(self):
+        self.fill_model.add_order("bid", True, Decimal("99.5"), Decimal("5"), 1, self.order_book)
+
+        self.assertEqual((Decimal("0"), Decimal("8")),
+                         self.fill_model.match_trade("bid", Decimal("99.5"), Decimal("8"), 1))
+        self.assertEqual((Decimal("2"), Decimal("4")),
+                         self.fill_model.match_trade("bid", Decimal("99.5"), Decimal("4"), 1))
+
+        state = self.fill_model.register_fill("bid", Decimal("2"), Decimal("2"), Decimal("199"))
+
+        self.assertFalse(state.is_filled)
+        self.assertEqual(Decimal("3"), self.fill_model.remaining_amount("bid", Decimal("5")))
+        self.assertEqual((Decimal("3"), Decimal("3")),
+                         self.fill_model.match_trade("bid", Decimal("99.5"), Decimal("10"), 1))
+
+    def test_trades_through_order_price_clear_the_queue(self):
+        self.fill_model.add_order("ask", False, Decimal("100.5"), Decimal("5"), 1, self.order_book)
+
+        self.assertEqual((Decimal("0"), Decimal("0")),
+                         self.fill_model.match_trade("ask", Decimal("100"), Decimal("3"), 1))
+        self.assertEqual((Decimal("3"), Decimal("3")),
+                         self.fill_model.match_trade("ask", Decimal("101"), Decimal("3"), 1))
+        self.assertEqual(Decimal("0"), self.fill_model.get_order("ask").queue_ahead)
+
+    def test_orders_are_not_filled_before_order_entry_latency(self):
+        fill_model = PaperTradeFillModel(order_entry_latency=2)
+        fill_model.add_order("bid", True, Decimal("99"), Decimal("5"), 1, self.order_book)
+
+        self.assertFalse(fill_model.is_active("bid", 2))
+        self.assertEqual((Decimal("0"), Decimal("0")), fill_model.match_trade("bid", Decimal("98"), Decimal("3"), 2))
+        self.assertEqual(Decimal("0"), fill_model.match_crossed_book("bid", Decimal("98"), 2))
+        self.assertTrue(fill_model.is_active("bid", 3))
+        self.assertEqual(Decimal("5"), fill_model.match_crossed_book("bid", Decimal("98"), 3))
+
+    def test_touching_opposite_price_does_not_fill(self):
+        self.fill_model.add_order("bid", True, Decimal("100.5"), Decimal("5"), 1, self.order_book)
+
+        self.assertEqual(Decimal("0"), self.fill_model.match_crossed_book("bid", Decimal("100.5"), 1))
+        self.assertEqual(Decimal("5"), self.fill_model.match_crossed_book("bid", Decimal("100.4"), 1))
+
+    def test_queue_position_can_be_disabled(self):
+        fill_model = PaperTradeFillModel(queue_position=False)
+        fill_model.add_order("bid", True, Decimal("99.5"), Decimal("5"), 1, self.order_book)
+
+        self.assertEqual((Decimal("4"), Decimal("4")),
+                         fill_model.match_trade("bid", Decimal("99.5"), Decimal("4"), 1))
+
+    def test_removed_orders_are_not_matched(self):
+        self.fill_model.add_order("bid", True, Decimal("99"), Decimal("5"), 1, self.order_book)
+        self.fill_model.remove_order("bid")
+
+        self.assertIsNone(self.fill_model.get_order("bid"))
+        self.assertEqual((Decimal("0"), Decimal("0")),
+                         self.fill_model.match_trade("bid", Decimal("98"), Decimal("3"), 1))
@@ -0,0 +1,180 @@
+import json
+import tempfile
+from decimal import Decimal
+from os.path import join
+from typing import Any, Dict, List
+from unittest import TestCase
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.l2_replay_exchange import (
+    L2ReplayEventType,
+    L2ReplayExchange,
+    merge_replay_events,
+    read_order_book_events,
+    read_trade_events,
+    recorded_data_file_path,
+)
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent
+from hummingbot.strategy.strategy_py_base import StrategyPyBase
+
+
+class MarketBuyStrategy(StrategyPyBase):
+    """
+    Records its ticks, and buys with a market order once its market is ready.
+    """
+    def __init__(self, market: L2ReplayExchange, trading_pair: str):
+        super().__init__()
+        self.market = market
+        self.trading_pair = trading_pair
+        self.tick_timestamps: List[float] = []
+        self.order_id = None
+        self.add_markets([market])
+
+    def tick(self, timestamp: float):
+        self.tick_timestamps.append(timestamp)
+        if self.order_id is None and self.market.ready:
+            self.order_id = self.market.buy(self.trading_pair, Decimal("1"), OrderType.MARKET)
+
+
+class L2ReplayExchangeTests(TestCase):
+    start_timestamp = 1700000000.0
+    trading_pair = "ETH-USDT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.order_book_file = join(self.temp_dir.name, "order_book.txt")
+        self.trades_file = join(self.temp_dir.name, "trades.txt")
+        self.write_records(self.order_book_file, [
+            {"ts": self.start_timestamp + 1, "bids": [[99, 1], [98, 2]], "asks": [[101, 1], [102, 2]]},
+            {"ts": self.start_timestamp + 3, "type": "diff", "bids": [[99, 0], [99.5, 3]], "asks": []},
+            {"ts": self.start_timestamp + 5, "bids": [[97, 1]], "asks": [[100, 1]]},
+        ])
+        self.write_records(self.trades_file, [
+            {"ts": self.start_timestamp, "price": 99, "q_base": 1, "side": "sell"},
+            {"ts": self.start_timestamp + 2, "price": 101, "q_base": 0.5, "side": "buy"},
+            {"ts": self.start_timestamp + 4, "price": 98.9, "q_base": 2, "side": "sell"},
+        ])
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def write_records(file_path: str, records: List[Dict[str, Any]]):
+        with open(file_path, "w") as fd:
+            # The recording script starts each dump with a new line
+            fd.write("\n" + "\n".join(json.dumps(record) for record in records))
+
+    def create_exchange(self) -> L2ReplayExchange:
+        exchange = L2ReplayExchange.from_files(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            exchange_name="binance",
+            order_book_files={self.trading_pair: self.order_book_file},
+            trade_files={self.trading_pair: self.trades_file},
+        )
+        exchange.set_balance("ETH", Decimal("10"))
+        exchange.set_balance("USDT", Decimal("10000"))
+        return exchange
+
+    def test_recorded_events_are_merged_in_timestamp_order(self):
+        events = list(merge_replay_events(
+            read_trade_events(self.trades_file, self.trading_pair),
+            read_order_book_events(self.order_book_file, self.trading_pair),
+        ))
+
+        self.assertEqual(sorted(event.timestamp for event in events), [event.timestamp for event in events])
+        self.assertEqual(
+            [L2ReplayEventType.TRADE, L2ReplayEventType.SNAPSHOT, L2ReplayEventType.TRADE, L2ReplayEventType.DIFF,
+             L2ReplayEventType.TRADE, L2ReplayEventType.SNAPSHOT],
+            [event.event_type for event in events])
+
+    def test_recorded_data_file_path(self):
+        self.assertEqual(
+            join(self.temp_dir.name, "binance_paper_trade_ETH-USDT_trades_2024-01-01.txt"),
+            recorded_data_file_path("binance_paper_trade", self.trading_pair, "trades", "2024-01-01",
+                                    self.temp_dir.name))
+
+    def test_order_books_follow_the_recorded_data(self):
+        exchange = self.create_exchange()
+        order_book = exchange.get_order_book(self.trading_pair)
+        trades_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TradeEvent, trades_logger)
+
+        self.assertEqual(self.start_timestamp, exchange.first_timestamp)
+        self.assertFalse(exchange.ready)
+
+        exchange.replay_until(self.start_timestamp + 1)
+        self.assertTrue(exchange.ready)
+        self.assertEqual(99, order_book.get_price(False))
+        self.assertEqual(101, order_book.get_price(True))
+        # Trades recorded before the first snapshot are skipped
+        self.assertEqual(0, len(trades_logger.event_log))
+
+        exchange.replay_until(self.start_timestamp + 3)
+        self.assertEqual(99.5, order_book.get_price(False))
+        self.assertEqual(1, len(trades_logger.event_log))
+
+        exchange.replay_until(self.start_timestamp + 5)
+        self.assertEqual(97, order_book.get_price(False))
+        self.assertEqual(100, order_book.get_price(True))
+        self.assertTrue(exchange.replay_finished)
+        self.assertIsNone(exchange.first_timestamp)
+        self.assertEqual(6, exchange.replayed_events_count)
+
+    def test_replay_driven_by_clock_fills_limit_orders_with_recorded_trades(self):
+        exchange = self.create_exchange()
+        clock = Clock(ClockMode.BACKTEST, 1, self.start_timestamp, self.start_timestamp + 10)
+        clock.add_iterator(exchange)
+        fill_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+
+        with clock:
+            clock.backtest_til(self.start_timestamp + 1)
+            self.assertTrue(exchange.ready)
+            exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99.2"))
+
+            clock.backtest_til(self.start_timestamp + 3)
+            self.assertEqual(0, len(fill_logger.event_log))
+
+            clock.backtest_til(self.start_timestamp + 4)
+            self.assertEqual(1, len(fill_logger.event_log))
+            self.assertEqual(Decimal("99.2"), fill_logger.event_log[0].price)
+
+            clock.backtest_til(self.start_timestamp + 10)
+
+        self.assertTrue(exchange.replay_finished)
+        # Binance maker fees are deducted from the acquired base asset
+        self.assertEqual(Decimal("10.999"), exchange.get_balance("ETH"))
+
+    def test_backtest_skipping_idle_ticks_wakes_up_at_replay_events_and_queued_orders(self):
+        self.write_records(self.order_book_file, [
+            {"ts": self.start_timestamp + 1, "bids": [[99, 1]], "asks": [[101, 2]]},
+            {"ts": self.start_timestamp + 600, "bids": [[100, 1]], "asks": [[102, 2]]},
+            {"ts": self.start_timestamp + 1800, "type": "diff", "bids": [[100.5, 1]], "asks": []},
+        ])
+        self.write_records(self.trades_file, [])
+        exchange = self.create_exchange()
+        strategy = MarketBuyStrategy(exchange, self.trading_pair)
+        clock = Clock(ClockMode.BACKTEST, 1, self.start_timestamp, self.start_timestamp + 3600, skip_idle_ticks=True)
+        clock.add_iterator(exchange)
+        clock.add_iterator(strategy)
+        fill_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+
+        with clock:
+            clock.backtest()
+
+        self.assertTrue(exchange.replay_finished)
+        # The strategy buys at the first snapshot, the market order is executed after the paper trade execution delay,
+        # and nothing is ticked once the replay is finished
+        self.assertEqual([self.start_timestamp + offset for offset in (1, 6, 600, 1800)], strategy.tick_timestamps)
+        self.assertEqual(self.start_timestamp + 3600, clock.current_timestamp)
+        self.assertEqual(1, len(fill_logger.event_log))
+        self.assertEqual(strategy.order_id, fill_logger.event_log[0].order_id)
+        self.assertEqual(self.start_timestamp + 6, fill_logger.event_log[0].timestamp)
+        self.assertEqual(Decimal("101"), fill_logger.event_log[0].price)
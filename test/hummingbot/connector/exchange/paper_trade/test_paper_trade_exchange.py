@@ -1,11 +1,21 @@
+from decimal import Decimal
 from unittest import TestCase
 
+import pandas as pd
+
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.exchange.paper_trade.fill_model import PaperTradeFillModel
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookTradeEvent
 
 
 class PaperTradeExchangeTests(TestCase):
@@ -29,3 +39,137 @@ class PaperTradeExchangeTests(TestCase):
             client_config_map=ClientConfigAdapter(ClientConfigMap()),
             trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+    def test_create_paper_trade_market_with_realistic_fills(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        paper_exchange = create_paper_trade_market(
+            exchange_name="binance",
+            client_config_map=client_config_map,
+            trading_pairs=["COINALPHA-HBOT"])
+        self.assertIsNone(paper_exchange.fill_model)
+
+        client_config_map.paper_trade.paper_trade_realistic_fills = True
+        client_config_map.paper_trade.paper_trade_order_entry_latency = 0.5
+        client_config_map.paper_trade.paper_trade_cancel_latency = 1
+        paper_exchange = create_paper_trade_market(
+            exchange_name="binance",
+            client_config_map=client_config_map,
+            trading_pairs=["COINALPHA-HBOT"])
+        self.assertEqual(0.5, paper_exchange.fill_model.order_entry_latency)
+        self.assertEqual(1, paper_exchange.fill_model.cancel_latency)
+
+
+class PaperTradeExchangeFillModelTests(TestCase):
+    start_timestamp: float = pd.Timestamp("2019-01-01", tz="UTC").timestamp()
+    end_timestamp: float = pd.Timestamp("2019-01-01 01:00:00", tz="UTC").timestamp()
+    trading_pair = "HBOT-ETH"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1, self.start_timestamp, self.end_timestamp)
+        self.market: MockPaperExchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        # Bids at 99.5 (10), 98.5 (20)... and asks at 100.5 (10), 101.5 (20)...
+        self.market.set_balanced_order_book(trading_pair=self.trading_pair,
+                                            mid_price=100,
+                                            min_price=1,
+                                            max_price=200,
+                                            price_step_size=1,
+                                            volume_step_size=10)
+        self.market.set_balance("HBOT", 500)
+        self.market.set_balance("ETH", 5000)
+        self.market.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        self.clock.add_iterator(self.market)
+        self.fill_logger: EventLogger = EventLogger()
+        self.buy_completed_logger: EventLogger = EventLogger()
+        self.cancel_logger: EventLogger = EventLogger()
+        self.market.add_listener(MarketEvent.OrderFilled, self.fill_logger)
+        self.market.add_listener(MarketEvent.BuyOrderCompleted, self.buy_completed_logger)
+        self.market.add_listener(MarketEvent.OrderCancelled, self.cancel_logger)
+        self.clock.backtest_til(self.start_timestamp + 1)
+
+    def simulate_trade(self, is_buy: bool, price: float, amount: float):
+        order_book = self.market.get_order_book(self.trading_pair)
+        order_book.apply_trade(OrderBookTradeEvent(
+            self.trading_pair,
+            self.clock.current_timestamp,
+            TradeType.BUY if is_buy else TradeType.SELL,
+            price,
+            amount,
+        ))
+
+    def test_limit_order_without_fill_model_is_filled_completely(self):
+        self.market.buy(self.trading_pair, Decimal("5"), OrderType.LIMIT, Decimal("99.5"))
+
+        self.simulate_trade(is_buy=False, price=99.4, amount=1)
+
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("5"), self.fill_logger.event_log[0].amount)
+        self.assertEqual(1, len(self.buy_completed_logger.event_log))
+        self.assertEqual(0, len(self.market.limit_orders))
+
+    def test_limit_order_is_filled_after_queue_ahead(self):
+        self.market.set_fill_model(PaperTradeFillModel())
+        order_id = self.market.buy(self.trading_pair, Decimal("5"), OrderType.LIMIT, Decimal("99.5"))
+
+        self.simulate_trade(is_buy=False, price=99.5, amount=8)
+        self.assertEqual(0, len(self.fill_logger.event_log))
+
+        self.simulate_trade(is_buy=False, price=99.5, amount=4)
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("2"), self.fill_logger.event_log[0].amount)
+        self.assertEqual(Decimal("99.5"), self.fill_logger.event_log[0].price)
+        self.assertEqual(0, len(self.buy_completed_logger.event_log))
+        self.assertEqual(Decimal("5000") - Decimal("199"), self.market.get_balance("ETH"))
+        self.assertEqual(Decimal("3") * Decimal("99.5"), self.market.on_hold_balances["ETH"])
+
+        self.simulate_trade(is_buy=False, price=99.5, amount=10)
+        self.assertEqual(2, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("3"), self.fill_logger.event_log[1].amount)
+        self.assertEqual(1, len(self.buy_completed_logger.event_log))
+        completed_event = self.buy_completed_logger.event_log[0]
+        self.assertEqual(order_id, completed_event.order_id)
+        self.assertEqual(Decimal("5"), completed_event.base_asset_amount)
+        self.assertEqual(Decimal("497.5"), completed_event.quote_asset_amount)
+        self.assertEqual(0, len(self.market.limit_orders))
+        self.assertEqual(0, len(self.market.fill_model.orders))
+
+    def test_trade_volume_is_shared_by_orders_in_price_priority(self):
+        self.market.set_fill_model(PaperTradeFillModel())
+        self.market.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("99.8"))
+        self.market.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("99.7"))
+
+        self.simulate_trade(is_buy=False, price=99.6, amount=3)
+
+        self.assertEqual([Decimal("2"), Decimal("1")], [event.amount for event in self.fill_logger.event_log])
+        self.assertEqual([Decimal("99.8"), Decimal("99.7")], [event.price for event in self.fill_logger.event_log])
+
+    def test_limit_order_is_not_filled_before_order_entry_latency(self):
+        self.market.set_fill_model(PaperTradeFillModel(order_entry_latency=2))
+        self.market.buy(self.trading_pair, Decimal("5"), OrderType.LIMIT, Decimal("99.5"))
+
+        self.simulate_trade(is_buy=False, price=99, amount=10)
+        self.assertEqual(0, len(self.fill_logger.event_log))
+
+        self.clock.backtest_til(self.start_timestamp + 3)
+        self.simulate_trade(is_buy=False, price=99, amount=10)
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("5"), self.fill_logger.event_log[0].amount)
+
+    def test_cancel_is_effective_after_cancel_latency(self):
+        self.market.set_fill_model(PaperTradeFillModel(cancel_latency=2))
+        order_id = self.market.buy(self.trading_pair, Decimal("5"), OrderType.LIMIT, Decimal("99.5"))
+
+        self.market.cancel(self.trading_pair, order_id)
+        self.clock.backtest_til(self.start_timestamp + 2)
+
+        self.assertEqual(0, len(self.cancel_logger.event_log))
+        self.assertEqual(1, len(self.market.limit_orders))
+
+        self.simulate_trade(is_buy=False, price=99, amount=1)
+        self.clock.backtest_til(self.start_timestamp + 3)
+
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(1, len(self.cancel_logger.event_log))
+        self.assertEqual(order_id, self.cancel_logger.event_log[0].order_id)
+        self.assertEqual(0, len(self.market.limit_orders))
+        self.assertEqual(0, len(self.market.fill_model.orders))
@@ -3,7 +3,7 @@ import time
 import unittest
 from decimal import Decimal
 from typing import Awaitable
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 from xrpl.asyncio.clients import XRPLRequestFailureException
 from xrpl.models import OfferCancel, Request, Response, Transaction
@@ -132,9 +132,13 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.connector._xrpl_query_client.__aenter__.return_value = self.connector._xrpl_query_client
         self.connector._xrpl_query_client.__aexit__.return_value = None
 
-        self.connector._xrpl_place_order_client = AsyncMock()
-        self.connector._xrpl_place_order_client.__aenter__.return_value = self.connector._xrpl_place_order_client
-        self.connector._xrpl_place_order_client.__aexit__.return_value = None
+        self.submission_client = AsyncMock()
+        self.submission_client.is_open = MagicMock(return_value=True)
+        self.connector._xrpl_submission_client_pool._create_client = MagicMock(return_value=self.submission_client)
+        self.second_node_client = AsyncMock()
+        self.second_node_client.is_open = MagicMock(return_value=True)
+        self.connector._xrpl_second_node_client_pool._create_client = MagicMock(return_value=self.second_node_client)
+        self.connector._xrpl_account_sequence._fetch_next_sequence = AsyncMock(return_value=1)
 
     def tearDown(self) -> None:
         self.listening_task and self.listening_task.cancel()
@@ -959,6 +963,38 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertEqual(0.22452700389932698, asks[0].price)
         self.assertEqual(91.846106, asks[0].amount)
 
+    @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_sign")
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_submit")
+    def test_submit_transaction_prepares_again_a_transaction_invalidated_by_a_failure(
+        self,
+        submit_mock,
+        sign_mock,
+        autofill_mock,
+        mock_async_websocket_client,
+    ):
+        mock_async_websocket_client.return_value.__aenter__.return_value = AsyncMock()
+        autofill_mock.return_value = {}
+        sign_mock.return_value = Transaction(
+            sequence=1, last_ledger_sequence=1, account="r1234", transaction_type=TransactionType.OFFER_CANCEL
+        )
+        submit_mock.return_value = Response(
+            status=ResponseStatus.SUCCESS, result={"engine_result": "tesSUCCESS", "engine_result_message": "something"}
+        )
+        account_sequence = self.connector._xrpl_account_sequence
+        account_sequence.reserve = AsyncMock(side_effect=[11, 10])
+        # A transaction with a lower sequence failed while the first one was being prepared
+        account_sequence.wait_for_submission_turn = AsyncMock(side_effect=[False, True])
+        account_sequence.release = AsyncMock()
+
+        request = OfferCancel(account="r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK", offer_sequence=1)  # noqa: mock
+        self.async_run_with_timeout(self.connector._submit_transaction(request))
+
+        self.assertEqual([11, 10], [c.args[0].sequence for c in autofill_mock.call_args_list])
+        submit_mock.assert_called_once()
+        self.assertEqual([call(11, failed=False), call(10, failed=False)], account_sequence.release.call_args_list)
+
     @patch('hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient')
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._verify_transaction_result")
     @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.tx_autofill")
@@ -2914,11 +2950,11 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertEqual(trade_fills[0].fill_quote_amount, Decimal("1354.473138"))
 
     @patch("hummingbot.connector.exchange.xrpl.xrpl_auth.XRPLAuth.get_account")
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.request_with_retry")
-    def test_fetch_account_transactions(self, request_with_retry_mock, get_account_mock):
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange.pooled_request_with_retry")
+    def test_fetch_account_transactions(self, pooled_request_with_retry_mock, get_account_mock):
 
         get_account_mock.return_value = "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK"  # noqa: mock
-        request_with_retry_mock.return_value = Response(
+        pooled_request_with_retry_mock.return_value = Response(
             status=ResponseStatus.SUCCESS,
             result={"transactions": ["something"]},
             id="account_info_644216",
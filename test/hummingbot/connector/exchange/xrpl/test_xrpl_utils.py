@@ -1,7 +1,7 @@
 import asyncio
 import unittest
 from typing import Awaitable
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 from xrpl.asyncio.clients import XRPLRequestFailureException
 from xrpl.asyncio.transaction import XRPLReliableSubmissionException
@@ -10,6 +10,8 @@ from xrpl.models.response import ResponseStatus
 
 from hummingbot.connector.exchange.xrpl import xrpl_constants as CONSTANTS
 from hummingbot.connector.exchange.xrpl.xrpl_utils import (
+    XRPLAccountSequence,
+    XRPLClientPool,
     XRPLConfigMap,
     _wait_for_final_transaction_outcome,
     autofill,
@@ -369,3 +371,127 @@ class TestXRPLUtils(unittest.TestCase):
         self.assertEqual(response.result["ledger_index"], 99999221)
         self.assertEqual(response.result["validated"], True)
         self.assertEqual(response.result["meta"]["TransactionResult"], "tesSUCCESS")
+
+    def _mock_client(self, is_open: bool = True) -> AsyncMock:
+        client = AsyncMock()
+        client.is_open = MagicMock(return_value=is_open)
+        client._websocket = MagicMock()
+        return client
+
+    def test_client_pool_reuses_open_clients(self):
+        pool = XRPLClientPool("wss://node.test", size=2)
+        clients = [self._mock_client(), self._mock_client()]
+        pool._create_client = MagicMock(side_effect=clients)
+
+        used_clients = [self.async_run_with_timeout(pool.get_client()) for _ in range(4)]
+
+        self.assertEqual(clients + clients, used_clients)
+        self.assertEqual(2, pool._create_client.call_count)
+        clients[0].open.assert_awaited_once()
+
+        self.async_run_with_timeout(pool.close())
+
+        clients[0].close.assert_awaited_once()
+        clients[1].close.assert_awaited_once()
+
+    def test_client_pool_replaces_closed_clients(self):
+        pool = XRPLClientPool("wss://node.test")
+        closed_client = self._mock_client()
+        new_client = self._mock_client()
+        pool._create_client = MagicMock(side_effect=[closed_client, new_client])
+
+        self.assertEqual(closed_client, self.async_run_with_timeout(pool.get_client()))
+        closed_client.is_open.return_value = False
+
+        self.assertEqual(new_client, self.async_run_with_timeout(pool.get_client()))
+
+    def test_account_sequence_is_assigned_locally(self):
+        account_sequence = XRPLAccountSequence("r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK")  # noqa: mock
+        account_sequence._fetch_next_sequence = AsyncMock(return_value=10)
+
+        sequences = [self.async_run_with_timeout(account_sequence.reserve(AsyncMock())) for _ in range(3)]
+
+        self.assertEqual([10, 11, 12], sequences)
+        account_sequence._fetch_next_sequence.assert_awaited_once()
+
+    def test_account_sequence_is_fetched_again_after_failure(self):
+        account_sequence = XRPLAccountSequence("r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK")  # noqa: mock
+        account_sequence._fetch_next_sequence = AsyncMock(side_effect=[10, 10])
+
+        sequence = self.async_run_with_timeout(account_sequence.reserve(AsyncMock()))
+        self.async_run_with_timeout(account_sequence.release(sequence, failed=True))
+
+        self.assertEqual(10, self.async_run_with_timeout(account_sequence.reserve(AsyncMock())))
+        self.assertEqual(2, account_sequence._fetch_next_sequence.await_count)
+
+    def test_sequences_reserved_after_a_failure_are_invalidated_and_fetched_again(self):
+        account_sequence = XRPLAccountSequence("r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK")  # noqa: mock
+        account_sequence._fetch_next_sequence = AsyncMock(side_effect=[10, 10])
+
+        async def fail_and_reserve_again():
+            failed_sequence = await account_sequence.reserve(AsyncMock())
+            pending_sequence = await account_sequence.reserve(AsyncMock())
+            await account_sequence.release(failed_sequence, failed=True)
+            # The node would reject the pending transaction with terPRE_SEQ
+            self.assertFalse(await account_sequence.wait_for_submission_turn(pending_sequence))
+            # No sequence is handed out until the pending one is released
+            new_sequence_task = asyncio.ensure_future(account_sequence.reserve(AsyncMock()))
+            await asyncio.sleep(0.01)
+            self.assertFalse(new_sequence_task.done())
+            await account_sequence.release(pending_sequence)
+            return await new_sequence_task
+
+        self.assertEqual(10, self.async_run_with_timeout(fail_and_reserve_again()))
+        self.assertEqual(2, account_sequence._fetch_next_sequence.await_count)
+
+    def test_sequences_are_fetched_again_when_the_resync_wait_times_out(self):
+        account_sequence = XRPLAccountSequence(
+            "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK", submission_turn_timeout=0.01  # noqa: mock
+        )
+        account_sequence._fetch_next_sequence = AsyncMock(side_effect=[10, 10])
+
+        failed_sequence = self.async_run_with_timeout(account_sequence.reserve(AsyncMock()))
+        self.async_run_with_timeout(account_sequence.reserve(AsyncMock()))
+        self.async_run_with_timeout(account_sequence.release(failed_sequence, failed=True))
+
+        # The pending sequence 11 is never released, the new sequence skips it
+        self.assertEqual(12, self.async_run_with_timeout(account_sequence.reserve(AsyncMock())))
+        self.assertEqual(2, account_sequence._fetch_next_sequence.await_count)
+
+    def test_account_sequence_fetched_again_skips_pending_sequences(self):
+        account_sequence = XRPLAccountSequence("r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK")  # noqa: mock
+        account_sequence._fetch_next_sequence = AsyncMock(return_value=10)
+        account_sequence._unsubmitted = {10, 11}
+
+        self.assertEqual(12, self.async_run_with_timeout(account_sequence.reserve(AsyncMock())))
+
+    def test_transactions_are_submitted_in_sequence_order(self):
+        account_sequence = XRPLAccountSequence("r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK")  # noqa: mock
+        account_sequence._fetch_next_sequence = AsyncMock(return_value=10)
+        submitted = []
+
+        async def submit(delay: float):
+            sequence = await account_sequence.reserve(AsyncMock())
+            # Signing the first transaction takes longer than signing the second one
+            await asyncio.sleep(delay)
+            await account_sequence.wait_for_submission_turn(sequence)
+            submitted.append(sequence)
+            await account_sequence.release(sequence)
+
+        async def submit_both():
+            await asyncio.gather(submit(0.05), submit(0))
+
+        self.async_run_with_timeout(submit_both())
+
+        self.assertEqual([10, 11], submitted)
+
+    def test_submission_turn_wait_times_out(self):
+        account_sequence = XRPLAccountSequence(
+            "r2XdzWFVoHGfGVmXugtKhxMu3bqhsYiWK", submission_turn_timeout=0.01  # noqa: mock
+        )
+        account_sequence._fetch_next_sequence = AsyncMock(return_value=10)
+        self.async_run_with_timeout(account_sequence.reserve(AsyncMock()))
+        sequence = self.async_run_with_timeout(account_sequence.reserve(AsyncMock()))
+
+        # The first sequence is never released, the second transaction is submitted after the timeout
+        self.assertTrue(self.async_run_with_timeout(account_sequence.wait_for_submission_turn(sequence)))
@@ -0,0 +1,118 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Any, Dict
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.gateway.amm.gateway_ethereum_amm import GatewayEthereumAMM
+from hummingbot.core.data_type.common import TradeType
+
+
+class GatewayAMMBaseQuotePriceTest(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        with patch("hummingbot.connector.gateway.amm.gateway_amm_base.GatewayAMMBase.load_token_data",
+                   new_callable=AsyncMock):
+            self.connector = GatewayEthereumAMM(
+                client_config_map=ClientConfigAdapter(ClientConfigMap()),
+                connector_name="uniswap",
+                chain="ethereum",
+                network="goerli",
+                address="0xabc",
+                trading_pairs=["DAI-WETH"],
+                trading_required=False,
+            )
+        self.gateway_release = asyncio.Event()
+        self.gateway_release.set()
+        self.gateway = MagicMock()
+        self.gateway.get_price = AsyncMock(side_effect=self._get_price)
+        gateway_patcher = patch.object(self.connector, "_get_gateway_instance", return_value=self.gateway)
+        self.addCleanup(gateway_patcher.stop)
+        gateway_patcher.start()
+        shim_patcher = patch("hummingbot.connector.gateway.amm.gateway_amm_base.GatewayPriceShim.get_instance")
+        self.addCleanup(shim_patcher.stop)
+        shim_patcher.start().return_value.get_connector_price = AsyncMock(return_value=None)
+
+    async def _get_price(self, chain, network, connector, base, quote, amount, side, **kwargs) -> Dict[str, Any]:
+        await self.gateway_release.wait()
+        price = Decimal("0.0005") * (Decimal("1.01") if side == TradeType.BUY else Decimal("0.99"))
+        return {
+            "price": str(price + amount / Decimal("1000000000")),
+            "gasLimit": "200000",
+            "gasPrice": "10",
+            "gasCost": "0.002",
+            "gasPriceToken": "ETH",
+        }
+
+    async def test_concurrent_identical_quotes_share_one_request(self):
+        self.gateway_release.clear()
+        tasks = [asyncio.ensure_future(self.connector.get_quote_price("DAI-WETH", True, Decimal("1000")))
+                 for _ in range(3)]
+        order_price_task = asyncio.ensure_future(self.connector.get_order_price("DAI-WETH", True, Decimal("1000")))
+        await asyncio.sleep(0)
+        self.gateway_release.set()
+
+        prices = await asyncio.gather(*tasks, order_price_task)
+
+        self.assertEqual(1, self.gateway.get_price.await_count)
+        self.assertEqual(1, len(set(prices)))
+        self.assertEqual(Decimal("0.000506"), prices[0])
+
+    async def test_quotes_are_cached(self):
+        first_price = await self.connector.get_quote_price("DAI-WETH", True, Decimal("1000"))
+        second_price = await self.connector.get_quote_price("DAI-WETH", True, Decimal("1000.0"))
+        sell_price = await self.connector.get_quote_price("DAI-WETH", False, Decimal("1000"))
+
+        self.assertEqual(first_price, second_price)
+        self.assertNotEqual(first_price, sell_price)
+        self.assertEqual(2, self.gateway.get_price.await_count)
+
+        self.connector._quote_price_cache.clear()
+        await self.connector.get_quote_price("DAI-WETH", True, Decimal("1000"))
+
+        self.assertEqual(3, self.gateway.get_price.await_count)
+
+    async def test_cancelled_caller_does_not_cancel_shared_request(self):
+        self.gateway_release.clear()
+        cancelled_task = asyncio.ensure_future(self.connector.get_quote_price("DAI-WETH", True, Decimal("1000")))
+        waiting_task = asyncio.ensure_future(self.connector.get_quote_price("DAI-WETH", True, Decimal("1000")))
+        await asyncio.sleep(0)
+        cancelled_task.cancel()
+        self.gateway_release.set()
+
+        price = await waiting_task
+
+        self.assertTrue(cancelled_task.cancelled())
+        self.assertEqual(Decimal("0.000506"), price)
+        self.assertEqual(1, self.gateway.get_price.await_count)
+
+    async def test_failed_request_is_not_kept_in_flight(self):
+        self.gateway.get_price.side_effect = Exception("Test error")
+
+        price = await self.connector.get_quote_price("DAI-WETH", True, Decimal("1000"))
+        await asyncio.sleep(0)
+
+        self.assertIsNone(price)
+        self.assertEqual(0, len(self.connector._quote_price_requests))
+
+    async def test_quote_price_ladder(self):
+        self.gateway_release.clear()
+        single_quote_task = asyncio.ensure_future(self.connector.get_quote_price("DAI-WETH", False, Decimal("10")))
+        await asyncio.sleep(0)
+        ladder_task = asyncio.ensure_future(self.connector.get_quote_price_ladder(
+            "DAI-WETH", False, [Decimal("10"), Decimal("100"), Decimal("1000"), Decimal("100")]
+        ))
+        await asyncio.sleep(0)
+        self.gateway_release.set()
+
+        ladder = await ladder_task
+        await single_quote_task
+
+        self.assertEqual([Decimal("10"), Decimal("100"), Decimal("1000")], list(ladder.keys()))
+        self.assertEqual(Decimal("0.00049501"), ladder[Decimal("10")])
+        self.assertEqual(Decimal("0.0004951"), ladder[Decimal("100")])
+        self.assertEqual(Decimal("0.000496"), ladder[Decimal("1000")])
+        self.assertEqual(3, self.gateway.get_price.await_count)
@@ -21,6 +21,7 @@ from hummingbot.core.event.events import (
     OrderCancelledEvent,
     OrderFilledEvent,
 )
+from hummingbot.core.utils.latency_tracer import LatencyStage, LatencyTracer
 
 
 class MockExchange(ExchangeBase):
@@ -307,6 +308,34 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
             )
         )
 
+    def test_process_order_update_records_order_acknowledgement_latency(self):
+        latency_tracer = LatencyTracer.get_instance()
+        latency_tracer.start()
+        self.addCleanup(latency_tracer.reset)
+        self.addCleanup(latency_tracer.stop)
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        latency_tracer.order_submitted(order.client_order_id)
+        self.tracker.start_tracking_order(order)
+
+        order_creation_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_creation_update))
+
+        self.assertEqual(1, latency_tracer.histogram(LatencyStage.ORDER_ACK).count)
+
     def test_process_order_update_trigger_order_creation_event(self):
         order: InFlightOrder = InFlightOrder(
             client_order_id="someClientOrderId",
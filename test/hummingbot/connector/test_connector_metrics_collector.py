@@ -7,11 +7,12 @@ from unittest import TestCase
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import hummingbot.connector.connector_metrics_collector
-from hummingbot.connector.connector_metrics_collector import TradeVolumeMetricCollector
+from hummingbot.connector.connector_metrics_collector import LoopLagMetricCollector, TradeVolumeMetricCollector
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.core.utils.loop_lag_monitor import LoopLagMonitor
 
 
 class TradeVolumeMetricCollectorTests(TestCase):
@@ -255,3 +256,97 @@ class TradeVolumeMetricCollectorTests(TestCase):
         dispatched_metric = self.dispatcher_mock.request.call_args[0][0]
 
         self.assertEqual(expected_dispatch_request, dispatched_metric)
+
+
+class LoopLagMetricCollectorTests(TestCase):
+    level = 0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.metrics_collector_url = "localhost"
+        self.instance_id = "test_instance_id"
+        self.client_version = "0.1"
+        self.dispatcher_mock = MagicMock()
+        type(self.dispatcher_mock).log_server_url = PropertyMock(return_value=self.metrics_collector_url)
+
+        self.original_client_version = hummingbot.connector.connector_metrics_collector.CLIENT_VERSION
+        hummingbot.connector.connector_metrics_collector.CLIENT_VERSION = self.client_version
+        self.original_loop_lag_monitor = LoopLagMonitor._shared_instance
+        LoopLagMonitor._shared_instance = LoopLagMonitor(interval=0.002)
+
+        self.metrics_collector = LoopLagMetricCollector(dispatch_interval=0.01, instance_id=self.instance_id)
+        self.metrics_collector._dispatcher = self.dispatcher_mock
+        self.metrics_collector.logger().setLevel(1)
+        self.metrics_collector.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.metrics_collector.stop()
+        LoopLagMonitor.get_instance().stop()
+        self.metrics_collector.logger().removeHandler(self)
+        hummingbot.connector.connector_metrics_collector.CLIENT_VERSION = self.original_client_version
+        LoopLagMonitor._shared_instance = self.original_loop_lag_monitor
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_no_metric_dispatched_without_lag_samples(self):
+        self.metrics_collector.dispatch_loop_lag()
+
+        self.dispatcher_mock.request.assert_not_called()
+
+    def test_dispatch_loop_lag_percentile_without_exchange(self):
+        LoopLagMonitor.get_instance().record_lag(0.003)
+
+        self.metrics_collector.dispatch_loop_lag()
+
+        self.dispatcher_mock.request.assert_called_once()
+        dispatched_metric = self.dispatcher_mock.request.call_args[0][0]
+        dispatched_data = json.loads(dispatched_metric["request_obj"]["data"])
+        self.assertEqual(f"{self.metrics_collector_url}/client_metrics", dispatched_metric["url"])
+        self.assertEqual(LoopLagMetricCollector.METRIC_NAME, dispatched_data["name"])
+        self.assertEqual(self.instance_id, dispatched_data["instance_id"])
+        self.assertEqual(self.client_version, dispatched_data["version"])
+        self.assertNotIn("exchange", dispatched_data)
+        self.assertEqual(str(3.0), dispatched_data["value"])
+
+    def test_dispatched_percentile_only_covers_the_lag_since_the_previous_dispatch(self):
+        LoopLagMonitor.get_instance().record_lag(0.5)
+        self.metrics_collector.dispatch_loop_lag()
+        LoopLagMonitor.get_instance().record_lag(0.003)
+        self.metrics_collector.dispatch_loop_lag()
+        self.metrics_collector.dispatch_loop_lag()
+
+        self.assertEqual(2, self.dispatcher_mock.request.call_count)
+        dispatched_values = [json.loads(request_call[0][0]["request_obj"]["data"])["value"]
+                             for request_call in self.dispatcher_mock.request.call_args_list]
+        self.assertEqual(["500", "3.0"], dispatched_values)
+
+    def test_metric_dispatched_periodically_until_stopped(self):
+        LoopLagMonitor.get_instance().start()
+        self.metrics_collector.start()
+        self.dispatcher_mock.start.assert_called()
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+        self.metrics_collector.stop()
+        self.dispatcher_mock.stop.assert_called()
+        dispatches_count = self.dispatcher_mock.request.call_count
+        self.async_run_with_timeout(asyncio.sleep(0.03))
+
+        self.assertGreater(dispatches_count, 1)
+        self.assertEqual(dispatches_count, self.dispatcher_mock.request.call_count)
+
+    def test_dispatch_errors_are_logged_and_do_not_stop_the_dispatches(self):
+        LoopLagMonitor.get_instance().start()
+        self.dispatcher_mock.request.side_effect = Exception("Test error")
+
+        self.metrics_collector.start()
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        self.assertGreater(self.dispatcher_mock.request.call_count, 1)
+        self.assertTrue(any(record.getMessage() == "Unexpected error dispatching the event loop lag metric."
+                            for record in self.log_records))
@@ -0,0 +1,196 @@
+import asyncio
+import os
+import threading
+import unittest
+from typing import Awaitable
+
+from eth_account import Account
+from eth_account.messages import encode_structured_data
+from eth_utils import keccak
+
+from hummingbot.connector.signing_service import EIP712StructHasher, SigningBatcher, SigningService
+
+
+class EIP712StructHasherTests(unittest.TestCase):
+    domain = {
+        "chainId": 1337,
+        "name": "Exchange",
+        "verifyingContract": "0x0000000000000000000000000000000000000000",
+        "version": "1",
+    }
+    types = {
+        "Order": [
+            {"name": "source", "type": "string"},
+            {"name": "connectionId", "type": "bytes32"},
+            {"name": "amount", "type": "uint256"},
+            {"name": "isBuy", "type": "bool"},
+            {"name": "trader", "type": "address"},
+            {"name": "payload", "type": "bytes"},
+        ],
+        "EIP712Domain": [
+            {"name": "name", "type": "string"},
+            {"name": "version", "type": "string"},
+            {"name": "chainId", "type": "uint256"},
+            {"name": "verifyingContract", "type": "address"},
+        ],
+    }
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.wallet = Account.from_key("13e56ca9cceebf1f33065c2c5376ab38570a114bc1b003b60d838f92be9d7930")  # noqa: mock
+
+    def test_signature_matches_full_structured_data_encoding(self):
+        hasher = EIP712StructHasher(domain=self.domain, types=self.types, primary_type="Order")
+        message = {
+            "source": "a",
+            "connectionId": keccak(b"action"),
+            "amount": 1000,
+            "isBuy": True,
+            "trader": self.wallet.address,
+            "payload": b"\x01\x02",
+        }
+        expected = self.wallet.sign_message(encode_structured_data({
+            "domain": self.domain,
+            "types": self.types,
+            "primaryType": "Order",
+            "message": message,
+        }))
+
+        signed = self.wallet.sign_message(hasher.signable_message(message))
+
+        self.assertEqual(expected.signature, signed.signature)
+
+    def test_nested_types_are_not_supported(self):
+        types = dict(self.types)
+        types["Batch"] = [{"name": "orders", "type": "Order[]"}]
+
+        with self.assertRaises(NotImplementedError):
+            EIP712StructHasher(domain=self.domain, types=types, primary_type="Batch")
+
+
+class SigningServiceTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.service = SigningService(max_workers=2)
+
+    def tearDown(self) -> None:
+        self.service.shutdown()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def test_sign_runs_outside_the_event_loop_thread(self):
+        result = self.async_run_with_timeout(
+            self.service.sign(lambda value: (value, threading.get_ident()), "data", label="test")
+        )
+
+        self.assertEqual("data", result[0])
+        self.assertNotEqual(threading.get_ident(), result[1])
+
+    def test_sign_raises_the_signing_function_errors(self):
+        def failing_sign():
+            raise ValueError("Invalid key")
+
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(self.service.sign(failing_sign, label="test"))
+
+        self.assertEqual(1, self.service.latency_stats("test").count)
+
+    def test_signatures_of_a_label_run_concurrently(self):
+        # Both signatures have to be running at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=1)
+
+        results = self.async_run_with_timeout(asyncio.gather(
+            self.service.sign(barrier.wait, label="test"),
+            self.service.sign(barrier.wait, label="test"),
+        ))
+
+        self.assertEqual({0, 1}, set(results))
+        self.assertEqual(2, self.service.latency_stats("test").count)
+
+    def test_sign_batch_returns_the_results_in_order_and_records_each_latency(self):
+        results = self.async_run_with_timeout(
+            self.service.sign_batch(lambda value: (value, threading.get_ident()), [(1,), (2,), (3,)], label="test")
+        )
+
+        self.assertEqual([1, 2, 3], [value for value, _ in results])
+        self.assertEqual(1, len({thread_id for _, thread_id in results}))
+        self.assertNotEqual(threading.get_ident(), results[0][1])
+        self.assertEqual(3, self.service.latency_stats("test").count)
+
+    def test_sign_batch_raises_the_signing_function_errors(self):
+        with self.assertRaises(ZeroDivisionError):
+            self.async_run_with_timeout(self.service.sign_batch(divmod, [(1, 1), (1, 0)], label="test"))
+
+        self.assertEqual(1, self.service.latency_stats("test").count)
+
+    def test_sign_with_process_pool_runs_in_another_process(self):
+        pid = self.async_run_with_timeout(self.service.sign(os.getpid, label="test", use_process_pool=True), timeout=30)
+        results = self.async_run_with_timeout(
+            self.service.sign_batch(pow, [(2, 3), (3, 2)], label="test", use_process_pool=True), timeout=30
+        )
+
+        self.assertNotEqual(os.getpid(), pid)
+        self.assertEqual([8, 9], results)
+        self.assertEqual(3, self.service.latency_stats("test").count)
+
+    def test_latency_stats_are_recorded_per_label(self):
+        self.assertIsNone(self.service.latency_stats("test"))
+        self.assertEqual([], self.service.labels())
+
+        for _ in range(3):
+            self.async_run_with_timeout(self.service.sign(lambda: None, label="test"))
+        self.async_run_with_timeout(self.service.sign(lambda: None, label="other"))
+
+        stats = self.service.latency_stats("test")
+        self.assertEqual(3, stats.count)
+        self.assertGreaterEqual(stats.max, stats.mean)
+        self.assertGreaterEqual(stats.last, 0)
+        self.assertEqual(1, self.service.latency_stats("other").count)
+        self.assertEqual(["other", "test"], self.service.labels())
+
+
+class SigningBatcherTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.service = SigningService(max_workers=2)
+
+    def tearDown(self) -> None:
+        self.service.shutdown()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def test_signatures_requested_together_are_signed_in_a_single_job(self):
+        batcher = SigningBatcher(lambda value: (value, threading.get_ident()), label="test", signing_service=self.service)
+
+        results = self.async_run_with_timeout(asyncio.gather(batcher.sign(1), batcher.sign(2), batcher.sign(3)))
+
+        self.assertEqual([1, 2, 3], [value for value, _ in results])
+        self.assertEqual(1, len({thread_id for _, thread_id in results}))
+        self.assertEqual(3, self.service.latency_stats("test").count)
+
+    def test_signatures_requested_later_are_signed_in_another_job(self):
+        batcher = SigningBatcher(lambda value: value * 2, label="test", signing_service=self.service)
+
+        first = self.async_run_with_timeout(batcher.sign(1))
+        second = self.async_run_with_timeout(batcher.sign(2))
+
+        self.assertEqual(2, first)
+        self.assertEqual(4, second)
+
+    def test_signature_errors_are_raised_to_all_the_requests_of_the_job(self):
+        def failing_sign(value: int):
+            raise ValueError("Invalid key")
+
+        batcher = SigningBatcher(failing_sign, label="test", signing_service=self.service)
+
+        results = self.async_run_with_timeout(
+            asyncio.gather(batcher.sign(1), batcher.sign(2), return_exceptions=True)
+        )
+
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
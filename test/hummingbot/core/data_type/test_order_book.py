@@ -2,9 +2,14 @@
 
 import logging
 import unittest
-from hummingbot.core.data_type.order_book import OrderBook
+
 import numpy as np
 
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTopOfBookChangeEvent
+
 
 class OrderBookUnitTest(unittest.TestCase):
     @classmethod
@@ -50,6 +55,23 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_top_of_book_change_event_only_triggered_when_best_prices_change(self):
+        order_book = OrderBook()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TopOfBookChangeEvent, event_logger)
+
+        order_book.apply_snapshot([OrderBookRow(1, 1, 1), OrderBookRow(2, 1, 1)],
+                                  [OrderBookRow(3, 1, 1), OrderBookRow(4, 1, 1)], 1)
+        self.assertEqual([OrderBookTopOfBookChangeEvent(2, 3, 1)], event_logger.event_log)
+
+        # Updating the amounts or the levels behind the top does not change the best prices
+        order_book.apply_diffs([OrderBookRow(1, 5, 2), OrderBookRow(2, 3, 2)], [OrderBookRow(5, 1, 2)], 2)
+        self.assertEqual(1, len(event_logger.event_log))
+
+        order_book.apply_diffs([], [OrderBookRow(3, 0, 3)], 3)
+        self.assertEqual(2, len(event_logger.event_log))
+        self.assertEqual(OrderBookTopOfBookChangeEvent(2, 4, 3), event_logger.event_log[-1])
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
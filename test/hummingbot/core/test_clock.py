@@ -5,6 +5,7 @@ import unittest
 import pandas as pd
 
 from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
@@ -122,3 +123,131 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_backtest_ticks_iterators_at_their_tick_interval(self):
+        class CountingIterator(PyTimeIterator):
+            def __init__(self):
+                super().__init__()
+                self.tick_timestamps = []
+
+            def tick(self, timestamp: float):
+                self.tick_timestamps.append(timestamp)
+
+        fast_iterator = CountingIterator()
+        slow_iterator = CountingIterator()
+        slow_iterator.tick_interval = 5
+        self.clock_backtest.add_iterator(fast_iterator)
+        self.clock_backtest.add_iterator(slow_iterator)
+
+        with self.clock_backtest:
+            self.clock_backtest.backtest_til(self.backtest_start_timestamp + 10)
+
+        self.assertEqual(10, len(fast_iterator.tick_timestamps))
+        self.assertEqual([self.backtest_start_timestamp + 5, self.backtest_start_timestamp + 10],
+                         slow_iterator.tick_timestamps)
+
+    def test_run_til_ticks_iterators_at_their_tick_interval(self):
+        class CountingIterator(PyTimeIterator):
+            def __init__(self):
+                super().__init__()
+                self.tick_timestamps = []
+
+            def tick(self, timestamp: float):
+                self.tick_timestamps.append(timestamp)
+
+        clock = Clock(ClockMode.REALTIME, 1.0, self.realtime_start_timestamp, self.realtime_end_timestamp)
+        fast_iterator = CountingIterator()
+        fast_iterator.tick_interval = 0.1
+        default_iterator = CountingIterator()
+        clock.add_iterator(fast_iterator)
+        clock.add_iterator(default_iterator)
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 1.05))
+
+        self.assertGreaterEqual(len(fast_iterator.tick_timestamps), 8)
+        self.assertLessEqual(len(default_iterator.tick_timestamps), 2)
+        for timestamp in fast_iterator.tick_timestamps:
+            self.assertAlmostEqual(round(timestamp, 1), timestamp, places=6)
+        for timestamp in default_iterator.tick_timestamps:
+            self.assertEqual(int(timestamp), timestamp)
+            self.assertIn(timestamp, fast_iterator.tick_timestamps)
+
+        fast_stats = clock.tick_stats[fast_iterator]
+        self.assertEqual(len(fast_iterator.tick_timestamps), fast_stats.ticks_count)
+        self.assertGreaterEqual(fast_stats.max_duration, fast_stats.average_duration)
+        self.assertEqual(fast_stats.ticks_count, fast_stats.to_dict()["ticks_count"])
+
+    def test_run_til_records_overruns(self):
+        class SlowIterator(PyTimeIterator):
+            def tick(self, timestamp: float):
+                time.sleep(0.25)
+
+        clock = Clock(ClockMode.REALTIME, 1.0, self.realtime_start_timestamp, self.realtime_end_timestamp)
+        slow_iterator = SlowIterator()
+        slow_iterator.tick_interval = 0.1
+        clock.add_iterator(slow_iterator)
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.5))
+
+        stats = clock.tick_stats[slow_iterator]
+        self.assertGreater(stats.ticks_count, 0)
+        self.assertEqual(stats.ticks_count, stats.overruns_count)
+        self.assertGreaterEqual(stats.missed_ticks_count, 2 * stats.overruns_count)
+
+    def test_negative_tick_interval_raises_error(self):
+        time_iterator = TimeIterator()
+        with self.assertRaises(ValueError):
+            time_iterator.tick_interval = -1
+
+    def test_backtest_skipping_idle_ticks_jumps_to_next_wakeup_time(self):
+        class EventIterator(PyTimeIterator):
+            def __init__(self, event_timestamps):
+                super().__init__()
+                self.event_timestamps = event_timestamps
+                self.tick_timestamps = []
+
+            def tick(self, timestamp: float):
+                self.tick_timestamps.append(timestamp)
+
+            def next_wakeup_time(self, timestamp: float) -> float:
+                return min((t for t in self.event_timestamps if t > timestamp), default=float("inf"))
+
+        start = self.backtest_start_timestamp
+        clock = Clock(ClockMode.BACKTEST, 1.0, start, start + 3600, skip_idle_ticks=True)
+        data_iterator = EventIterator([start + 10, start + 10.5, start + 600])
+        strategy_iterator = EventIterator([start + 300])
+        clock.add_iterator(data_iterator)
+        clock.add_iterator(strategy_iterator)
+
+        with clock:
+            clock.backtest()
+
+        self.assertTrue(clock.skip_idle_ticks)
+        self.assertEqual([start + 10, start + 11, start + 600], data_iterator.tick_timestamps)
+        self.assertEqual([start + 300], strategy_iterator.tick_timestamps)
+        self.assertEqual(start + 3600, clock.current_timestamp)
+
+    def test_backtest_skipping_idle_ticks_keeps_tick_intervals(self):
+        class CountingIterator(PyTimeIterator):
+            def __init__(self):
+                super().__init__()
+                self.tick_timestamps = []
+
+            def tick(self, timestamp: float):
+                self.tick_timestamps.append(timestamp)
+
+        start = self.backtest_start_timestamp
+        clock = Clock(ClockMode.BACKTEST, 1.0, start, start + 3600, skip_idle_ticks=True)
+        every_tick_iterator = CountingIterator()
+        minute_iterator = CountingIterator()
+        minute_iterator.tick_interval = 60
+        clock.add_iterator(every_tick_iterator)
+        clock.add_iterator(minute_iterator)
+
+        with clock:
+            clock.backtest_til(start + 120)
+
+        self.assertEqual(120, len(every_tick_iterator.tick_timestamps))
+        self.assertEqual([start + 60, start + 120], minute_iterator.tick_timestamps)
@@ -3,6 +3,7 @@ import gc
 import weakref
 
 from hummingbot.core.pubsub import PubSub
+from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_logger import EventLogger
 
 from test.mock.mock_events import MockEventType, MockEvent
@@ -89,6 +90,46 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_lapsed_listener_is_skipped_and_removed_on_trigger_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        listener_zero_weakref = weakref.ref(self.listener_zero)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertIsNone(listener_zero_weakref())
+        self.assertEqual(3, len(self.listener_one.event_log))
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+
+    def test_listeners_changed_while_triggering_take_effect_on_next_event(self):
+        pubsub = self.pubsub
+        listener_one = self.listener_one
+
+        class SubscribingListener(EventListener):
+            def __init__(self):
+                super().__init__()
+                self.calls_count = 0
+
+            def __call__(self, event_object):
+                self.calls_count += 1
+                pubsub.remove_listener(MockEventType.EVENT_ZERO, self)
+                pubsub.add_listener(MockEventType.EVENT_ZERO, listener_one)
+
+        subscribing_listener = SubscribingListener()
+        self.pubsub.add_listener(self.event_tag_zero, subscribing_listener)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, subscribing_listener.calls_count)
+        self.assertEqual(0, len(self.listener_one.event_log))
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, subscribing_listener.calls_count)
+        self.assertEqual(1, len(self.listener_one.event_log))
+
 
 if __name__ == "__main__":
     unittest.main()
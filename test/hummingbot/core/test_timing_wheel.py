@@ -0,0 +1,60 @@
+import unittest
+
+from hummingbot.core.timing_wheel import TimingWheel
+
+
+class TimingWheelTest(unittest.TestCase):
+    def test_empty_wheel(self):
+        wheel = TimingWheel(slots_count=8)
+
+        self.assertEqual(0, len(wheel))
+        self.assertEqual(8, wheel.slots_count)
+        self.assertIsNone(wheel.next_tick())
+        self.assertEqual([], wheel.pop(3))
+
+    def test_invalid_slots_count_raises_error(self):
+        with self.assertRaises(ValueError):
+            TimingWheel(slots_count=0)
+
+    def test_pop_returns_items_due_in_scheduling_order(self):
+        wheel = TimingWheel(slots_count=8)
+        wheel.schedule("b", 10)
+        wheel.schedule("a", 10)
+        wheel.schedule("c", 12)
+
+        self.assertEqual(10, wheel.next_tick())
+        self.assertEqual(["b", "a"], wheel.pop(10))
+        self.assertNotIn("a", wheel)
+        self.assertEqual(12, wheel.next_tick())
+        self.assertEqual(["c"], wheel.pop(12))
+        self.assertIsNone(wheel.next_tick())
+
+    def test_items_due_in_later_revolutions_share_slots(self):
+        wheel = TimingWheel(slots_count=4)
+        wheel.schedule("later", 9)
+        wheel.schedule("sooner", 5)
+
+        self.assertEqual(5, wheel.next_tick())
+        self.assertEqual(["sooner"], wheel.pop(5))
+        self.assertEqual(9, wheel.next_tick())
+        self.assertEqual(["later"], wheel.pop(9))
+
+    def test_schedule_replaces_previous_schedule(self):
+        wheel = TimingWheel(slots_count=4)
+        wheel.schedule("a", 6)
+        wheel.schedule("a", 3)
+
+        self.assertEqual(1, len(wheel))
+        self.assertEqual(3, wheel.due_tick("a"))
+        self.assertEqual(3, wheel.next_tick())
+        self.assertEqual([], wheel.pop(6))
+
+    def test_unschedule(self):
+        wheel = TimingWheel(slots_count=4)
+        wheel.schedule("a", 2)
+        wheel.schedule("b", 3)
+        wheel.unschedule("a")
+        wheel.unschedule("unknown")
+
+        self.assertIsNone(wheel.due_tick("a"))
+        self.assertEqual(3, wheel.next_tick())
@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+
+
+class LatencyHistogramTests(TestCase):
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        self.assertEqual(0, histogram.count)
+        self.assertIsNone(histogram.mean_ms)
+        self.assertIsNone(histogram.percentile_ms(50))
+        self.assertEqual("no samples", histogram.summary())
+
+    def test_samples_are_counted_in_their_bucket(self):
+        histogram = LatencyHistogram(bucket_bounds_ms=(10, 100))
+
+        for latency in (0.001, 0.01, 0.05, 0.5):
+            histogram.record(latency)
+
+        self.assertEqual([(10, 2), (100, 1), (float("inf"), 1)], histogram.buckets())
+        self.assertEqual(4, histogram.count)
+        self.assertAlmostEqual(140.25, histogram.mean_ms)
+        self.assertAlmostEqual(500, histogram.max_ms)
+
+    def test_percentiles_are_estimated_with_the_bucket_bounds(self):
+        histogram = LatencyHistogram(bucket_bounds_ms=(10, 100))
+        for _ in range(9):
+            histogram.record(0.005)
+        histogram.record(0.3)
+
+        self.assertEqual(10, histogram.percentile_ms(50))
+        self.assertEqual(10, histogram.percentile_ms(90))
+        self.assertAlmostEqual(300, histogram.percentile_ms(99))
+
+        histogram.record(0.02)
+        self.assertEqual(100, histogram.percentile_ms(90))
+
+    def test_reset(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.1)
+
+        histogram.reset()
+
+        self.assertEqual(0, histogram.count)
+        self.assertTrue(all(count == 0 for _, count in histogram.buckets()))
@@ -0,0 +1,89 @@
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.utils.latency_tracer import MAX_TRACKED_ORDERS, LatencyStage, LatencyTracer
+
+
+class LatencyTracerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.tracer = LatencyTracer()
+
+    def test_get_instance_returns_shared_instance(self):
+        self.assertIs(LatencyTracer.get_instance(), LatencyTracer.get_instance())
+
+    def test_nothing_recorded_while_disabled(self):
+        self.tracer.record(LatencyStage.THROTTLER_WAIT, 0.1)
+        self.tracer.order_submitted("OID1")
+        self.tracer.order_acknowledged("OID1")
+
+        self.assertEqual(0, self.tracer.histogram(LatencyStage.THROTTLER_WAIT).count)
+        self.assertEqual(0, self.tracer.histogram(LatencyStage.ORDER_ACK).count)
+        self.assertEqual({}, self.tracer.stats())
+
+    def test_record(self):
+        self.tracer.start()
+        self.tracer.record(LatencyStage.REQUEST_SIGNING, 0.002)
+        self.tracer.record(LatencyStage.REQUEST_SIGNING, -0.001)
+
+        stats = self.tracer.stats()
+
+        self.assertEqual(["request_signing"], list(stats))
+        self.assertEqual(1, stats["request_signing"]["count"])
+        self.assertAlmostEqual(2, stats["request_signing"]["max_ms"])
+
+    @patch.object(LatencyTracer, "now")
+    def test_order_latencies_from_submission_in_tick(self, now_mock):
+        self.tracer.start()
+        now_mock.side_effect = [10.001, 10.051]
+
+        self.tracer.tick_started(10.0)
+        self.tracer.order_submitted("OID1")
+        self.tracer.tick_ended()
+        self.tracer.order_acknowledged("OID1")
+
+        self.assertAlmostEqual(1, self.tracer.histogram(LatencyStage.TICK_TO_ORDER).max_ms)
+        self.assertAlmostEqual(50, self.tracer.histogram(LatencyStage.ORDER_ACK).max_ms)
+        self.assertAlmostEqual(51, self.tracer.histogram(LatencyStage.TICK_TO_ACK).max_ms)
+
+    @patch.object(LatencyTracer, "now")
+    def test_order_latencies_from_submission_out_of_tick(self, now_mock):
+        self.tracer.start()
+        now_mock.side_effect = [10.0, 10.05]
+
+        self.tracer.order_submitted("OID1")
+        self.tracer.order_acknowledged("OID1")
+        self.tracer.order_acknowledged("OID1")
+
+        self.assertEqual(0, self.tracer.histogram(LatencyStage.TICK_TO_ORDER).count)
+        self.assertEqual(1, self.tracer.histogram(LatencyStage.ORDER_ACK).count)
+        self.assertEqual(0, self.tracer.histogram(LatencyStage.TICK_TO_ACK).count)
+
+    def test_discarded_and_oldest_orders_are_not_followed(self):
+        self.tracer.start()
+        for i in range(MAX_TRACKED_ORDERS + 1):
+            self.tracer.order_submitted(f"OID{i}")
+        self.tracer.order_discarded("OID1")
+
+        self.tracer.order_acknowledged("OID0")
+        self.tracer.order_acknowledged("OID1")
+        self.assertEqual(0, self.tracer.histogram(LatencyStage.ORDER_ACK).count)
+
+        self.tracer.order_acknowledged("OID2")
+        self.assertEqual(1, self.tracer.histogram(LatencyStage.ORDER_ACK).count)
+
+    def test_stop_and_reset(self):
+        self.tracer.start()
+        self.tracer.record(LatencyStage.WS_MESSAGE_DECODE, 0.0001)
+        self.tracer.order_submitted("OID1")
+
+        self.tracer.stop()
+        self.assertFalse(self.tracer.enabled)
+        self.assertEqual(1, self.tracer.histogram(LatencyStage.WS_MESSAGE_DECODE).count)
+
+        self.tracer.start()
+        self.tracer.order_acknowledged("OID1")
+        self.assertEqual(0, self.tracer.histogram(LatencyStage.ORDER_ACK).count)
+
+        self.tracer.reset()
+        self.assertEqual({}, self.tracer.stats())
@@ -0,0 +1,114 @@
+import asyncio
+import time
+import unittest
+from typing import Awaitable
+
+from hummingbot.core.utils.loop_lag_monitor import LoopLagMonitor
+from hummingbot.core.utils.stall_detector import BlockingCallback
+
+
+class LoopLagMonitorTest(unittest.TestCase):
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.monitor = LoopLagMonitor(interval=0.01, lag_threshold=0.1)
+        self.monitor.logger().setLevel(1)
+        self.monitor.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.monitor.stop()
+        self.monitor.logger().removeHandler(self)
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_get_instance_returns_shared_instance(self):
+        self.assertIs(LoopLagMonitor.get_instance(), LoopLagMonitor.get_instance())
+
+    def test_record_lag_below_threshold_is_not_logged(self):
+        self.monitor.record_lag(0.004)
+
+        self.assertEqual(0.004, self.monitor.last_lag)
+        self.assertEqual(1, self.monitor.lag_histogram.count)
+        self.assertEqual(0, len(self.log_records))
+
+    def test_log_blocking_callback(self):
+        self.monitor.log_blocking_callback(
+            BlockingCallback(start_time=0, duration=0.25, task_name="some_task", stack="some stack\n"))
+
+        self.assertEqual(1, len(self.log_records))
+        self.assertEqual("WARNING", self.log_records[0].levelname)
+        self.assertEqual("The event loop was blocked for 250 ms by some_task:\nsome stack\n",
+                         self.log_records[0].getMessage())
+
+    def test_stats(self):
+        self.assertEqual({}, self.monitor.stats())
+
+        self.monitor.record_lag(0.0015)
+        self.monitor.record_lag(0.003)
+
+        stats = self.monitor.stats()
+        self.assertEqual(2, stats["count"])
+        self.assertEqual(2, stats["p50_ms"])
+        self.assertEqual(3, stats["p99_ms"])
+        self.assertEqual(3, stats["max_ms"])
+
+        self.monitor.reset()
+
+        self.assertEqual({}, self.monitor.stats())
+        self.assertIsNone(self.monitor.last_lag)
+
+    def test_window_stats_restart_at_each_snapshot(self):
+        self.assertEqual({}, self.monitor.window_stats())
+
+        self.monitor.record_lag(0.0015)
+        self.monitor.record_lag(0.03)
+
+        window_stats = self.monitor.window_stats()
+        self.assertEqual(2, window_stats["count"])
+        self.assertEqual(30, window_stats["p99_ms"])
+
+        self.monitor.record_lag(0.003)
+
+        window_stats = self.monitor.window_stats()
+        self.assertEqual(1, window_stats["count"])
+        self.assertEqual(3, window_stats["p99_ms"])
+        self.assertEqual({}, self.monitor.window_stats())
+        # The stats since the start are not affected by the snapshots
+        self.assertEqual(3, self.monitor.stats()["count"])
+        self.assertEqual(30, self.monitor.stats()["p99_ms"])
+
+    def test_monitor_attributes_blocking_callback(self):
+        async def blocking_coroutine():
+            await asyncio.sleep(0.05)
+            time.sleep(0.3)
+            await asyncio.sleep(0.05)
+
+        async def monitor():
+            self.monitor.start(self.ev_loop)
+            self.assertTrue(self.monitor.is_running)
+            await asyncio.ensure_future(blocking_coroutine())
+            self.monitor.stop()
+
+        self.async_run_with_timeout(monitor())
+
+        self.assertFalse(self.monitor.is_running)
+        self.assertGreater(self.monitor.lag_histogram.count, 1)
+        self.assertGreaterEqual(self.monitor.lag_histogram.max_ms, 200)
+        blocking_logs = [record.getMessage() for record in self.log_records if record.levelname == "WARNING"]
+        self.assertEqual(1, len(blocking_logs))
+        self.assertIn("by LoopLagMonitorTest.test_monitor_attributes_blocking_callback.<locals>.blocking_coroutine",
+                      blocking_logs[0])
+        self.assertIn("time.sleep(0.3)", blocking_logs[0])
@@ -0,0 +1,75 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from typing import Awaitable
+
+from hummingbot.core.utils.sampling_profiler import SamplingProfiler, fold_stack, task_name
+
+
+class SamplingProfilerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_fold_stack(self):
+        def inner_function():
+            import sys
+            return fold_stack(sys._getframe())
+
+        folded_stack = inner_function()
+
+        self.assertTrue(folded_stack.endswith("inner_function (test_sampling_profiler.py:22)"))
+        self.assertIn("test_fold_stack (test_sampling_profiler.py:21);inner_function", folded_stack)
+
+    def test_task_name(self):
+        async def some_coroutine():
+            return task_name(asyncio.current_task())
+
+        self.assertEqual("loop", task_name(None))
+        self.assertEqual("SamplingProfilerTest.test_task_name.<locals>.some_coroutine",
+                         self.async_run_with_timeout(some_coroutine()))
+
+    def test_profile_blocking_callback(self):
+        async def blocking_coroutine():
+            await asyncio.sleep(0.05)
+            time.sleep(0.3)
+            await asyncio.sleep(0.05)
+
+        profiler = SamplingProfiler(self.ev_loop, sampling_interval=0.005, blocking_threshold=0.1)
+
+        async def profile():
+            profiler.start()
+            self.assertTrue(profiler.is_running)
+            await asyncio.ensure_future(blocking_coroutine())
+            profiler.stop()
+
+        self.async_run_with_timeout(profile())
+
+        self.assertFalse(profiler.is_running)
+        self.assertGreater(profiler.samples_count, 0)
+        self.assertTrue(any(stack.startswith("SamplingProfilerTest.test_profile_blocking_callback.<locals>"
+                                             ".blocking_coroutine;") for stack in profiler.folded_stacks()))
+        self.assertEqual(1, len(profiler.blocking_callbacks))
+        blocking_callback = profiler.blocking_callbacks[0]
+        self.assertTrue(blocking_callback.task_name.endswith("blocking_coroutine"))
+        self.assertGreater(blocking_callback.duration, 0.1)
+        self.assertIn("time.sleep(0.3)", blocking_callback.stack)
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            folded_stacks_path, blocking_callbacks_path = profiler.write_reports(output_dir)
+
+            self.assertEqual(output_dir, os.path.dirname(folded_stacks_path))
+            with open(folded_stacks_path) as folded_stacks_file:
+                lines = folded_stacks_file.read().splitlines()
+            self.assertEqual(profiler.samples_count, sum(int(line.rsplit(" ", 1)[1]) for line in lines))
+            with open(blocking_callbacks_path) as blocking_callbacks_file:
+                report = blocking_callbacks_file.read()
+            self.assertTrue(report.startswith("1 callbacks blocked the event loop for more than 100 ms\n"))
+            self.assertIn("time.sleep(0.3)", report)
@@ -0,0 +1,80 @@
+import asyncio
+import time
+import unittest
+from typing import Awaitable, List
+
+from hummingbot.core.utils.stall_detector import BlockingCallback, StallDetector, task_name
+
+
+class StallDetectorTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.blocking_callbacks: List[BlockingCallback] = []
+        self.lags: List[float] = []
+        self.samples_tasks: List[str] = []
+        self.detector = StallDetector(
+            interval=0.01,
+            threshold=0.1,
+            on_blocking_callback=self.blocking_callbacks.append,
+            on_heartbeat=self.lags.append,
+            on_sample=lambda task, frame: self.samples_tasks.append(task_name(task)),
+        )
+
+    def tearDown(self) -> None:
+        self.detector.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_task_name(self):
+        async def some_coroutine():
+            return task_name(asyncio.current_task())
+
+        self.assertEqual("loop", task_name(None))
+        self.assertEqual("StallDetectorTest.test_task_name.<locals>.some_coroutine",
+                         self.async_run_with_timeout(some_coroutine()))
+
+    def test_detects_blocking_callback(self):
+        async def blocking_coroutine():
+            await asyncio.sleep(0.05)
+            time.sleep(0.3)
+            await asyncio.sleep(0.05)
+
+        async def detect():
+            self.detector.start(self.ev_loop)
+            self.assertTrue(self.detector.is_running)
+            await asyncio.ensure_future(blocking_coroutine())
+            self.detector.stop()
+
+        self.async_run_with_timeout(detect())
+
+        self.assertFalse(self.detector.is_running)
+        self.assertGreater(len(self.lags), 1)
+        self.assertGreaterEqual(max(self.lags), 0.2)
+        self.assertIn("StallDetectorTest.test_detects_blocking_callback.<locals>.blocking_coroutine",
+                      self.samples_tasks)
+        self.assertEqual(1, len(self.blocking_callbacks))
+        blocking_callback = self.blocking_callbacks[0]
+        self.assertTrue(blocking_callback.task_name.endswith("blocking_coroutine"))
+        self.assertEqual(max(self.lags), blocking_callback.duration)
+        self.assertIn("time.sleep(0.3)", blocking_callback.stack)
+
+    def test_blocking_callback_pending_at_stop_is_reported(self):
+        async def block_and_stop():
+            self.detector.start(self.ev_loop)
+            await asyncio.sleep(0.02)
+            time.sleep(0.3)
+            self.detector.stop()
+
+        self.async_run_with_timeout(block_and_stop())
+
+        self.assertEqual(1, len(self.blocking_callbacks))
+        self.assertGreater(self.blocking_callbacks[0].duration, 0.1)
+        self.assertIn("time.sleep(0.3)", self.blocking_callbacks[0].stack)
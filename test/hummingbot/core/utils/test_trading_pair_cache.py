@@ -0,0 +1,157 @@
+import asyncio
+import json
+import tempfile
+import time
+import unittest
+from os.path import join
+from typing import Awaitable
+from unittest.mock import AsyncMock, patch
+
+from bidict import bidict
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.core.utils.trading_pair_cache import TradingPairCache
+
+
+class TradingPairCacheTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = TradingPairCache(cache_dir=join(self.temp_dir.name, "trading_pairs"), ttl=60)
+        self.exchange_info = {
+            "symbols": [
+                {
+                    "symbol": "COINALPHAHBOT",
+                    "status": "TRADING",
+                    "baseAsset": "COINALPHA",
+                    "quoteAsset": "HBOT",
+                    "permissionSets": [["SPOT"]],
+                }
+            ]
+        }
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def _create_exchange(self) -> BinanceExchange:
+        return BinanceExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=["COINALPHA-HBOT"],
+            trading_required=False,
+        )
+
+    def test_load_returns_none_when_connector_not_cached(self):
+        self.assertIsNone(self.cache.load("binance"))
+
+    def test_save_and_load(self):
+        self.cache.save("binance", ["ETH-BTC", "LTC-BTC"], {"ETHBTC": "ETH-BTC", "LTCBTC": "LTC-BTC"})
+
+        entry = self.cache.load("binance")
+
+        self.assertEqual(["ETH-BTC", "LTC-BTC"], entry.trading_pairs)
+        self.assertEqual({"ETHBTC": "ETH-BTC", "LTCBTC": "LTC-BTC"}, entry.symbol_map)
+        self.assertFalse(self.cache.is_stale(entry))
+        self.assertEqual(entry, self.cache.load_fresh("binance"))
+
+    def test_save_symbol_map_stores_the_trading_pairs(self):
+        self.cache.save_symbol_map("binance", bidict({"ETHBTC": "ETH-BTC"}))
+
+        entry = self.cache.load("binance")
+
+        self.assertEqual(["ETH-BTC"], entry.trading_pairs)
+        self.assertEqual({"ETHBTC": "ETH-BTC"}, entry.symbol_map)
+
+    def test_entries_older_than_ttl_are_stale(self):
+        self.cache.save("binance", ["ETH-BTC"])
+        entry = self.cache.load("binance")
+
+        self.assertFalse(self.cache.is_stale(entry, now=entry.timestamp + 60))
+        self.assertTrue(self.cache.is_stale(entry, now=entry.timestamp + 61))
+
+        with open(self.cache.path("binance"), "w") as fd:
+            json.dump({"timestamp": time.time() - 61, "trading_pairs": ["ETH-BTC"], "symbol_map": {}}, fd)
+
+        self.assertIsNotNone(self.cache.load("binance"))
+        self.assertIsNone(self.cache.load_fresh("binance"))
+
+    def test_invalid_cache_file_is_ignored(self):
+        self.cache.save("binance", ["ETH-BTC"])
+        with open(self.cache.path("binance"), "w") as fd:
+            fd.write("{invalid")
+
+        self.assertIsNone(self.cache.load("binance"))
+
+    def test_save_and_load_exchange_info(self):
+        self.assertIsNone(self.cache.load_exchange_info("binance"))
+
+        self.cache.save_exchange_info("binance", self.exchange_info)
+
+        self.assertEqual(self.exchange_info, self.cache.load_exchange_info("binance"))
+        self.assertIsNone(self.cache.load("binance"))
+
+    def test_exchange_warm_starts_symbol_map_from_cached_exchange_info(self):
+        self.cache.save_exchange_info("binance", self.exchange_info)
+        self.cache.save_symbol_map("binance", {"COINALPHAHBOT": "COINALPHA-HBOT"})
+        exchange = self._create_exchange()
+        exchange.set_trading_pair_cache(self.cache)
+
+        # No exchange info request is mocked, the map can only come from the cache
+        with patch.object(exchange, "_initialize_trading_pair_symbols_from_exchange_info",
+                          wraps=exchange._initialize_trading_pair_symbols_from_exchange_info) as initialize_mock:
+            symbol_map = self.async_run_with_timeout(exchange.trading_pair_symbol_map())
+
+        # The connector state derived from the exchange info is replayed, not only the symbol map
+        initialize_mock.assert_called_once_with(exchange_info=self.exchange_info)
+        self.assertEqual({"COINALPHAHBOT": "COINALPHA-HBOT"}, dict(symbol_map))
+        self.assertTrue(exchange.trading_pair_symbol_map_ready())
+
+    def test_exchange_does_not_warm_start_without_cached_exchange_info(self):
+        self.cache.save_symbol_map("binance", {"COINALPHAHBOT": "COINALPHA-HBOT"})
+        exchange = self._create_exchange()
+        exchange.set_trading_pair_cache(self.cache)
+
+        self.assertFalse(exchange._warm_start_trading_pair_symbol_map())
+        self.assertFalse(exchange.trading_pair_symbol_map_ready())
+
+    def test_exchange_does_not_warm_start_from_stale_cache(self):
+        self.cache.save_exchange_info("binance", self.exchange_info)
+        with open(self.cache.path("binance"), "w") as fd:
+            json.dump({"timestamp": time.time() - 61,
+                       "trading_pairs": ["COINALPHA-HBOT"],
+                       "symbol_map": {"COINALPHAHBOT": "COINALPHA-HBOT"}}, fd)
+        exchange = self._create_exchange()
+        exchange.set_trading_pair_cache(self.cache)
+
+        self.assertFalse(exchange._warm_start_trading_pair_symbol_map())
+        self.assertFalse(exchange.trading_pair_symbol_map_ready())
+
+    def test_exchange_stores_symbol_map_and_exchange_info_in_cache(self):
+        exchange = self._create_exchange()
+        exchange.set_trading_pair_cache(self.cache)
+        exchange._make_trading_pairs_request = AsyncMock(return_value=self.exchange_info)
+
+        self.async_run_with_timeout(exchange._initialize_trading_pair_symbol_map())
+
+        entry = self.cache.load("binance")
+        self.assertEqual(["COINALPHA-HBOT"], entry.trading_pairs)
+        self.assertEqual({"COINALPHAHBOT": "COINALPHA-HBOT"}, entry.symbol_map)
+        self.assertEqual(self.exchange_info, self.cache.load_exchange_info("binance"))
+
+    def test_exchange_without_cache_does_not_store_symbol_map(self):
+        exchange = self._create_exchange()
+        exchange._make_trading_pairs_request = AsyncMock(return_value=self.exchange_info)
+
+        self.async_run_with_timeout(exchange._initialize_trading_pair_symbol_map())
+
+        self.assertTrue(exchange.trading_pair_symbol_map_ready())
+        self.assertIsNone(self.cache.load("binance"))
+        self.assertIsNone(self.cache.load_exchange_info("binance"))
@@ -1,8 +1,10 @@
 import asyncio
 import json
+import tempfile
+import time
 import unittest
 from decimal import Decimal
-from typing import Any, Awaitable, Dict
+from typing import Any, Awaitable, Dict, List
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from aioresponses import aioresponses
@@ -14,6 +16,7 @@ from hummingbot.client.config.security import Security
 from hummingbot.client.settings import ConnectorSetting, ConnectorType
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot.core.utils.trading_pair_cache import TradingPairCache
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 
 
@@ -36,9 +39,14 @@ class TestTradingPairFetcher(unittest.TestCase):
         self._original_async_loop = asyncio.get_event_loop()
         self.async_loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.async_loop)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        data_path_patcher = patch("hummingbot.core.utils.trading_pair_cache.data_path")
+        self.addCleanup(data_path_patcher.stop)
+        data_path_patcher.start().return_value = self.temp_dir.name
 
     def tearDown(self) -> None:
         super().tearDown()
+        self.temp_dir.cleanup()
         self.async_loop.stop()
         self.async_loop.close()
         asyncio.set_event_loop(self._original_async_loop)
@@ -47,6 +55,12 @@ class TestTradingPairFetcher(unittest.TestCase):
         ret = self.async_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
         return ret
 
+    @staticmethod
+    def _save_stale_cache_entry(cache: TradingPairCache, connector_name: str, trading_pairs: List[str]):
+        cache.save(connector_name, trading_pairs)
+        with open(cache.path(connector_name), "w") as fd:
+            json.dump({"timestamp": time.time() - cache.ttl - 1, "trading_pairs": trading_pairs}, fd)
+
     class MockConnectorSetting(MagicMock):
         def __init__(self, name, parent_name=None, connector=None, *args, **kwargs) -> None:
             super().__init__(name, *args, **kwargs)
@@ -258,3 +272,72 @@ class TestTradingPairFetcher(unittest.TestCase):
         self.assertIn("ETH-BTC", binance_pairs)
         self.assertIn("LTC-BTC", binance_pairs)
         self.assertNotIn("BNB-BTC", binance_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_fresh_cached_trading_pairs_are_used_without_fetching(self, _, mock_connector_settings):
+        TradingPairCache().save("mockConnector", ["CACHED-HBOT"])
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+
+        self.assertEqual({"mockConnector": ["CACHED-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        connector.all_trading_pairs.assert_not_called()
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_stale_cached_trading_pairs_are_refreshed(self, _, mock_connector_settings):
+        cache = TradingPairCache()
+        self._save_stale_cache_entry(cache, "mockConnector", ["CACHED-HBOT"])
+        fetch_done = asyncio.Event()
+
+        async def all_trading_pairs():
+            await fetch_done.wait()
+            return ["MOCK-HBOT"]
+
+        connector = MagicMock()
+        connector.all_trading_pairs.side_effect = all_trading_pairs
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+
+        # The stale pairs are available while the exchange is queried
+        self.assertEqual({"mockConnector": ["CACHED-HBOT"]}, trading_pair_fetcher.trading_pairs)
+
+        fetch_done.set()
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual({"mockConnector": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        entry = cache.load("mockConnector")
+        self.assertEqual(["MOCK-HBOT"], entry.trading_pairs)
+        self.assertFalse(cache.is_stale(entry))
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_cached_trading_pairs_are_kept_when_refresh_fails(self, _, mock_connector_settings):
+        self._save_stale_cache_entry(TradingPairCache(), "mockConnector", ["CACHED-HBOT"])
+        connector = AsyncMock()
+        connector.all_trading_pairs.side_effect = Exception("Test error")
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual({"mockConnector": ["CACHED-HBOT"]}, trading_pair_fetcher.trading_pairs)
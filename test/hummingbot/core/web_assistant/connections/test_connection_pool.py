@@ -0,0 +1,90 @@
+import ssl
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import MagicMock
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from hummingbot.core.web_assistant.connections.connection_pool import (
+    HTTPConnectionPoolSettings,
+    HTTPConnectionPoolStats,
+)
+
+
+class HTTPConnectionPoolSettingsTests(IsolatedAsyncioWrapperTestCase):
+
+    async def test_build_connector(self):
+        settings = HTTPConnectionPoolSettings(limit=20, limit_per_host=5, keepalive_timeout=30, dns_cache_ttl=60)
+
+        connector = settings.build_connector()
+
+        self.assertIsInstance(connector, aiohttp.TCPConnector)
+        self.assertEqual(20, connector.limit)
+        self.assertEqual(5, connector.limit_per_host)
+        self.assertTrue(connector.use_dns_cache)
+        self.assertEqual(30, connector._keepalive_timeout)
+        await connector.close()
+
+    async def test_build_connector_with_ssl_context(self):
+        ssl_context = ssl.create_default_context()
+
+        connector = HTTPConnectionPoolSettings().build_connector(ssl_context=ssl_context)
+
+        self.assertIs(ssl_context, connector._ssl)
+        await connector.close()
+
+    async def test_build_connector_with_custom_builder(self):
+        custom_connector = MagicMock()
+        builder = MagicMock(return_value=custom_connector)
+        settings = HTTPConnectionPoolSettings(connector_builder=builder)
+
+        connector = settings.build_connector()
+
+        self.assertIs(custom_connector, connector)
+        builder.assert_called_once_with(settings, None)
+
+
+class HTTPConnectionPoolStatsTests(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        app = web.Application()
+        app.router.add_get("/ping", self._ping)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+        await super().asyncTearDown()
+
+    @staticmethod
+    async def _ping(request: web.Request) -> web.Response:
+        return web.json_response({"pong": True})
+
+    def test_empty_stats(self):
+        stats = HTTPConnectionPoolStats()
+
+        self.assertEqual(0, stats.requests_count)
+        self.assertIsNone(stats.reuse_ratio)
+
+    async def test_requests_reuse_the_pooled_connection(self):
+        stats = HTTPConnectionPoolStats()
+        session = aiohttp.ClientSession(connector=HTTPConnectionPoolSettings().build_connector(),
+                                        trace_configs=[stats.trace_config()])
+
+        for _ in range(3):
+            async with session.get(self.server.make_url("/ping")) as response:
+                await response.json()
+        await session.close()
+
+        self.assertEqual(3, stats.requests_count)
+        self.assertEqual(1, stats.connections_created)
+        self.assertEqual(2, stats.connections_reused)
+        self.assertAlmostEqual(2 / 3, stats.reuse_ratio)
+        self.assertEqual(2, stats.to_dict()["connections_reused"])
+
+        stats.reset()
+
+        self.assertEqual(0, stats.requests_count)
+        self.assertIsNone(stats.reuse_ratio)
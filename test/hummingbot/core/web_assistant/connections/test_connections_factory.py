@@ -2,12 +2,10 @@ import asyncio
 import unittest
 from typing import Awaitable
 
-from hummingbot.core.web_assistant.connections.connections_factory import (
-    ConnectionsFactory
-)
-from hummingbot.core.web_assistant.connections.rest_connection import (
-    RESTConnection
-)
+from hummingbot.core.web_assistant.connections.connection_pool import HTTPConnectionPoolSettings
+from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.json_decoder import JSONDecoder
+from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
 
@@ -34,3 +32,27 @@ class ConnectionsFactoryTest(unittest.TestCase):
         rest_connection = self.async_run_with_timeout(factory.get_ws_connection())
 
         self.assertIsInstance(rest_connection, WSConnection)
+
+    def test_connections_use_the_factory_json_decoder(self):
+        factory = ConnectionsFactory(json_decoder=JSONDecoder.STDLIB)
+
+        rest_connection = self.async_run_with_timeout(factory.get_rest_connection())
+        ws_connection = self.async_run_with_timeout(factory.get_ws_connection())
+
+        self.assertEqual(JSONDecoder.STDLIB, factory.json_decoder)
+        self.assertIs(JSONDecoder.STDLIB.loads, rest_connection._json_loads)
+        self.assertIs(JSONDecoder.STDLIB.loads, ws_connection._json_loads)
+
+    def test_shared_client_uses_the_connection_pool_settings(self):
+        factory = ConnectionsFactory()
+        factory.connection_pool_settings = HTTPConnectionPoolSettings(limit=10, limit_per_host=2, dns_cache_ttl=0)
+
+        self.async_run_with_timeout(factory.get_rest_connection())
+        connector = factory._shared_client.connector
+
+        self.assertEqual(10, connector.limit)
+        self.assertEqual(2, connector.limit_per_host)
+        self.assertFalse(connector.use_dns_cache)
+        self.assertIn(factory.connection_pool_stats.trace_config().on_request_start[0].__func__,
+                      [callback.__func__ for config in factory._shared_client._trace_configs
+                       for callback in config.on_request_start])
@@ -0,0 +1,23 @@
+import unittest
+
+from hummingbot.core.web_assistant.connections.json_decoder import DEFAULT_JSON_DECODER, JSONDecoder
+
+
+class JSONDecoderTest(unittest.TestCase):
+
+    def test_all_available_decoders_decode_the_same_payload(self):
+        payload = '{"lastUpdateId": 160, "bids": [["0.0024", "10"]], "asks": [], "ts": 1700000000123, "px": 0.1}'
+        expected = {"lastUpdateId": 160, "bids": [["0.0024", "10"]], "asks": [], "ts": 1700000000123, "px": 0.1}
+
+        for decoder in JSONDecoder.available_decoders():
+            self.assertEqual(expected, decoder.loads(payload), decoder)
+            self.assertEqual(expected, decoder.loads(payload.encode()), decoder)
+
+    def test_invalid_json_raises_value_error(self):
+        for decoder in JSONDecoder.available_decoders():
+            with self.assertRaises(ValueError):
+                decoder.loads("pong")
+
+    def test_default_decoder_is_always_available(self):
+        self.assertIn(DEFAULT_JSON_DECODER, JSONDecoder.available_decoders())
+        self.assertIn(JSONDecoder.STDLIB, JSONDecoder.available_decoders())
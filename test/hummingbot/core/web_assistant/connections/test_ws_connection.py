@@ -123,6 +123,34 @@ class WSConnectionTest(unittest.TestCase):
         self.assertEqual(data, response.data)
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
 
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_returns_the_raw_text_when_it_is_not_json(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message="pong")
+
+        response = self.async_run_with_timeout(self.ws_connection.receive())
+
+        self.assertEqual("pong", response.data)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_decodes_with_the_configured_json_decoder(self, ws_connect_mock):
+        decoded_payloads = []
+
+        def json_loads(payload):
+            decoded_payloads.append(payload)
+            return json.loads(payload)
+
+        ws_connection = WSConnection(self.client_session, json_loads=json_loads)
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(ws_connection.connect(self.ws_url))
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message='{"one": 1}')
+
+        response = self.async_run_with_timeout(ws_connection.receive())
+
+        self.assertEqual({"one": 1}, response.data)
+        self.assertEqual(['{"one": 1}'], decoded_payloads)
+
     @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_receive_disconnects_and_raises_on_aiohttp_closed(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
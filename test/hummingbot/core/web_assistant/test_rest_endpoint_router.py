@@ -0,0 +1,140 @@
+import asyncio
+import re
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+import aiohttp
+from aioresponses import CallbackResult, aioresponses
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+from hummingbot.core.web_assistant.rest_endpoint_router import RESTEndpointRouter
+
+
+class RESTEndpointRouterTests(IsolatedAsyncioWrapperTestCase):
+    base_urls = ["https://api.test.com/api/", "https://api1.test.com/api/", "https://api2.test.com/api/"]
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.now = 1000.0
+        self.throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="/orders", limit=100, time_interval=60)])
+        self.session = aiohttp.ClientSession()
+        self.rest_assistant = RESTAssistant(connection=RESTConnection(self.session), throttler=self.throttler)
+
+    async def asyncTearDown(self) -> None:
+        await self.session.close()
+        await super().asyncTearDown()
+
+    def _time(self) -> float:
+        return self.now
+
+    def test_ranked_base_urls_prefers_unmeasured_then_fastest_hosts(self):
+        router = RESTEndpointRouter(base_urls=self.base_urls, time_provider=self._time)
+        router.record_latency(self.base_urls[0], 0.2)
+        router.record_latency(self.base_urls[1], 0.05)
+
+        self.assertEqual([self.base_urls[2], self.base_urls[1], self.base_urls[0]], router.ranked_base_urls())
+
+        router.record_latency(self.base_urls[2], 0.1)
+        router.record_latency(self.base_urls[1], 0.55)
+
+        # The latency is a moving average: 0.05 + 0.2 * (0.55 - 0.05)
+        self.assertAlmostEqual(150, router.endpoint_stats()[self.base_urls[1]]["latency_ms"])
+        self.assertEqual([self.base_urls[2], self.base_urls[1], self.base_urls[0]], router.ranked_base_urls())
+
+    def test_failed_hosts_are_skipped_during_the_cooldown(self):
+        router = RESTEndpointRouter(base_urls=self.base_urls, failure_cooldown=30, time_provider=self._time)
+        for base_url, latency in zip(self.base_urls, (0.01, 0.02, 0.03)):
+            router.record_latency(base_url, latency)
+
+        router.record_failure(self.base_urls[0])
+
+        self.assertEqual(self.base_urls[0], router.ranked_base_urls()[-1])
+        self.assertEqual(1, router.endpoint_stats()[self.base_urls[0]]["failures_count"])
+
+        self.now += 31
+        self.assertEqual(self.base_urls[0], router.ranked_base_urls()[0])
+
+    def test_routed_url(self):
+        router = RESTEndpointRouter(base_urls=self.base_urls)
+
+        self.assertEqual("https://api2.test.com/api/v3/order",
+                         router.routed_url("https://api.test.com/api/v3/order", self.base_urls[2]))
+        self.assertEqual("https://other.test.com/v3/order",
+                         router.routed_url("https://other.test.com/v3/order", self.base_urls[2]))
+
+    @aioresponses()
+    async def test_request_is_sent_to_the_fastest_host(self, mocked_api):
+        router = RESTEndpointRouter(base_urls=self.base_urls)
+        router.record_latency(self.base_urls[0], 0.3)
+        router.record_latency(self.base_urls[1], 0.2)
+        router.record_latency(self.base_urls[2], 0.1)
+        mocked_api.post(self.base_urls[2] + "v3/orders", body='{"orderId": 1}')
+
+        result = await router.execute_request(
+            rest_assistant=self.rest_assistant,
+            url=self.base_urls[0] + "v3/orders",
+            method=RESTMethod.POST,
+            throttler_limit_id="/orders")
+
+        self.assertEqual({"orderId": 1}, result)
+        self.assertEqual(2, router.endpoint_stats()[self.base_urls[2]]["requests_count"])
+
+    @aioresponses()
+    async def test_connection_failure_marks_the_host_unhealthy(self, mocked_api):
+        router = RESTEndpointRouter(base_urls=self.base_urls[:2])
+        router.record_latency(self.base_urls[1], 0.2)
+        mocked_api.get(self.base_urls[0] + "v3/orders", exception=aiohttp.ClientConnectionError())
+
+        with self.assertRaises(aiohttp.ClientConnectionError):
+            await router.execute_request(
+                rest_assistant=self.rest_assistant, url=self.base_urls[0] + "v3/orders", throttler_limit_id="/orders")
+
+        self.assertEqual([self.base_urls[1], self.base_urls[0]], router.ranked_base_urls())
+
+    @aioresponses()
+    async def test_slow_get_request_is_hedged_to_the_second_host(self, mocked_api):
+        router = RESTEndpointRouter(base_urls=self.base_urls[:2], hedging_delay=0.05)
+        router.record_latency(self.base_urls[0], 0.01)
+        router.record_latency(self.base_urls[1], 0.02)
+
+        async def slow_response(*args, **kwargs):
+            await asyncio.sleep(1)
+            return CallbackResult(body='{"host": 0}')
+
+        mocked_api.get(re.compile(r"^https://api\.test\.com/.*"), callback=slow_response)
+        mocked_api.get(re.compile(r"^https://api1\.test\.com/.*"), body='{"host": 1}')
+
+        result = await router.execute_request(
+            rest_assistant=self.rest_assistant, url=self.base_urls[0] + "v3/orders", throttler_limit_id="/orders")
+
+        self.assertEqual({"host": 1}, result)
+        self.assertEqual(1, router.endpoint_stats()[self.base_urls[1]]["hedged_wins_count"])
+        # Both requests were sent, so both are counted by the rate limiter
+        self.assertEqual(2, len(self.throttler._task_logs))
+        # The slow host is charged with the time it took, once its cancelled request is done
+        await asyncio.sleep(0)
+        self.assertGreaterEqual(router.endpoint_stats()[self.base_urls[0]]["latency_ms"], 10 + 0.2 * (50 - 10))
+
+    @aioresponses()
+    async def test_post_request_is_not_hedged(self, mocked_api):
+        router = RESTEndpointRouter(base_urls=self.base_urls[:2], hedging_delay=0.01)
+        router.record_latency(self.base_urls[0], 0.01)
+        router.record_latency(self.base_urls[1], 0.02)
+
+        async def slow_response(*args, **kwargs):
+            await asyncio.sleep(0.1)
+            return CallbackResult(body='{"host": 0}')
+
+        mocked_api.post(self.base_urls[0] + "v3/orders", callback=slow_response)
+
+        result = await router.execute_request(
+            rest_assistant=self.rest_assistant,
+            url=self.base_urls[0] + "v3/orders",
+            method=RESTMethod.POST,
+            throttler_limit_id="/orders")
+
+        self.assertEqual({"host": 0}, result)
+        self.assertEqual(1, len(self.throttler._task_logs))
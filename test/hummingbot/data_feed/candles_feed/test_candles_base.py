@@ -93,6 +93,12 @@ class TestCandlesBase(unittest.TestCase, ABC):
 
         pd.testing.assert_frame_equal(self.data_feed.candles_df, expected_df)
 
+    def test_last_candle_property(self):
+        self.assertIsNone(self.data_feed.last_candle)
+        self.data_feed._candles.extend(self._candles_data_mock())
+
+        self.assertEqual([float(value) for value in self._candles_data_mock()[-1]], self.data_feed.last_candle)
+
     def test_get_exchange_trading_pair(self):
         result = self.data_feed.get_exchange_trading_pair(self.trading_pair)
         self.assertEqual(result, self.ex_trading_pair)
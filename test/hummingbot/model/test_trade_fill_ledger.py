@@ -0,0 +1,149 @@
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.event.events import PositionAction
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_ledger import TradeFillLedger
+
+
+class TradeFillLedgerTests(TestCase):
+    hour = TradeFillLedger.PERIOD_DURATION_MS
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def setUp(self, engine_mock) -> None:
+        super().setUp()
+        self.config_file_path = "test_config.yml"
+        engine_mock.return_value = create_engine("sqlite:///:memory:")
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        self._trades_count = 0
+
+    def trade_fill(self, timestamp: int, trade_type: str, price: str, amount: str, trade_fee=None,
+                   symbol: str = "COINALPHA-HBOT", position: str = PositionAction.NIL.value) -> TradeFill:
+        self._trades_count += 1
+        base, quote = symbol.split("-")
+        return TradeFill(
+            config_file_path=self.config_file_path,
+            strategy="test_strategy",
+            market="test_market",
+            symbol=symbol,
+            base_asset=base,
+            quote_asset=quote,
+            timestamp=timestamp,
+            order_id=f"OID{self._trades_count}",
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=Decimal(price),
+            amount=Decimal(amount),
+            leverage=1,
+            trade_fee=(trade_fee or AddedToCostTradeFee()).to_json(),
+            exchange_trade_id=f"TID{self._trades_count}",
+            position=position,
+        )
+
+    def record_fills(self, trade_fills):
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                for trade_fill in trade_fills:
+                    session.add(trade_fill)
+                    TradeFillLedger.record_fill(session, trade_fill)
+
+    def entries(self, start_timestamp: int = 0):
+        with self.manager.get_new_session() as session:
+            return TradeFillLedger.get_entries(session, self.config_file_path, start_timestamp)
+
+    def test_period_boundaries(self):
+        self.assertEqual(2 * self.hour, TradeFillLedger.period_start_for(2 * self.hour + 10))
+        self.assertEqual(3 * self.hour, TradeFillLedger.first_full_period_start(2 * self.hour + 10))
+        self.assertEqual(2 * self.hour, TradeFillLedger.first_full_period_start(2 * self.hour))
+
+    def test_fills_are_aggregated_per_hour(self):
+        self.record_fills([
+            self.trade_fill(self.hour + 1, "BUY", "100", "2", AddedToCostTradeFee(percent=Decimal("0.01"))),
+            self.trade_fill(self.hour + 2, "SELL", "110", "1", DeductedFromReturnsTradeFee(
+                percent=Decimal("0.01"), flat_fees=[TokenAmount("BNB", Decimal("0.5"))])),
+            self.trade_fill(2 * self.hour + 5, "BUY", "90", "1.5"),
+        ])
+
+        entries = self.entries()
+
+        self.assertEqual(2, len(entries))
+        first, second = entries
+        self.assertEqual(self.hour, first.period_start)
+        self.assertEqual((1, 1), (first.num_buys, first.num_sells))
+        self.assertEqual(Decimal("2"), first.buy_base_volume)
+        self.assertEqual(Decimal("200"), first.buy_quote_volume)
+        self.assertEqual(Decimal("1"), first.sell_base_volume)
+        self.assertEqual(Decimal("110"), first.sell_quote_volume)
+        self.assertEqual(Decimal("1.1"), first.deducted_fees_in_quote)
+        self.assertEqual({"HBOT": Decimal("3.1"), "BNB": Decimal("0.5")}, first.fee_amounts)
+        self.assertEqual((Decimal("100"), Decimal("110")), (first.first_price, first.last_price))
+        self.assertEqual(2 * self.hour, second.period_start)
+        self.assertEqual(Decimal("135"), second.buy_quote_volume)
+        self.assertEqual([2 * self.hour], [entry.period_start for entry in self.entries(
+            TradeFillLedger.first_full_period_start(self.hour + 3))])
+
+    def test_running_position_realized_pnl_and_cost_basis(self):
+        self.record_fills([
+            self.trade_fill(self.hour + 1, "BUY", "100", "2"),
+            self.trade_fill(self.hour + 2, "BUY", "130", "1"),
+            self.trade_fill(2 * self.hour + 1, "SELL", "120", "1.5"),
+        ])
+
+        latest = self.entries()[-1]
+        self.assertEqual(Decimal("1.5"), latest.position)
+        self.assertEqual(Decimal("165"), latest.cost_basis)
+        self.assertEqual(Decimal("15"), latest.realized_pnl)
+
+        # Selling more than the position closes it and opens a short position at the fill price
+        self.record_fills([self.trade_fill(2 * self.hour + 2, "SELL", "100", "2")])
+
+        latest = self.entries()[-1]
+        self.assertEqual(Decimal("-0.5"), latest.position)
+        self.assertEqual(Decimal("50"), latest.cost_basis)
+        self.assertEqual(Decimal("0"), latest.realized_pnl)
+
+    def test_late_fill_is_aggregated_in_its_period_and_moves_the_latest_position(self):
+        self.record_fills([
+            self.trade_fill(3 * self.hour + 1, "BUY", "100", "1"),
+            self.trade_fill(self.hour + 1, "BUY", "80", "1"),
+        ])
+
+        entries = self.entries()
+
+        self.assertEqual([self.hour, 3 * self.hour], [entry.period_start for entry in entries])
+        self.assertEqual(Decimal("80"), entries[0].buy_quote_volume)
+        self.assertEqual(Decimal("2"), entries[1].position)
+        self.assertEqual(Decimal("180"), entries[1].cost_basis)
+
+    def test_fill_values_are_aggregated_as_stored(self):
+        self.record_fills([self.trade_fill(self.hour, "BUY", "1.23456789", "1")])
+
+        self.assertEqual(Decimal("1.234567"), self.entries()[0].buy_quote_volume)
+
+    def test_ledger_is_built_from_fills_recorded_before_it(self):
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                session.add(self.trade_fill(self.hour + 1, "BUY", "100", "2"))
+                session.add(self.trade_fill(2 * self.hour + 1, "SELL", "120", "1"))
+                session.query(Metadata).filter(
+                    Metadata.key == SQLConnectionManager.TRADE_FILL_LEDGER_VERSION_KEY).delete()
+
+        self.manager.check_and_build_trade_fill_ledger()
+
+        entries = self.entries()
+        self.assertEqual(2, len(entries))
+        self.assertEqual(Decimal("20"), entries[-1].realized_pnl)
+        with self.manager.get_new_session() as session:
+            version = session.query(Metadata).filter(
+                Metadata.key == SQLConnectionManager.TRADE_FILL_LEDGER_VERSION_KEY).one()
+            self.assertEqual(SQLConnectionManager.TRADE_FILL_LEDGER_VERSION_VALUE, version.value)
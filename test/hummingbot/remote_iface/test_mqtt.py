@@ -1,8 +1,10 @@
 import asyncio
+import threading
+import time
 from decimal import Decimal
 from typing import Awaitable
 from unittest import TestCase
-from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, call, patch
 
 from async_timeout import timeout
 
@@ -15,6 +17,7 @@ from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, OrderExpiredEvent, SellOrderCreatedEvent
 from hummingbot.core.mock_api.mock_mqtt_server import FakeMQTTBroker
+from hummingbot.core.utils.latency_tracer import LatencyTracer
 from hummingbot.model.order import Order
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.remote_iface.mqtt import MQTTGateway, MQTTMarketEventForwarder
@@ -42,6 +45,8 @@ class RemoteIfaceMQTTTests(TestCase):
             'balance/limit',
             'balance/paper',
             'command_shortcuts',
+            'latency',
+            'profile',
         ]
         cls.START_URI = 'hbot/$instance_id/start'
         cls.STOP_URI = 'hbot/$instance_id/stop'
@@ -52,6 +57,8 @@ class RemoteIfaceMQTTTests(TestCase):
         cls.BALANCE_LIMIT_URI = 'hbot/$instance_id/balance/limit'
         cls.BALANCE_PAPER_URI = 'hbot/$instance_id/balance/paper'
         cls.COMMAND_SHORTCUT_URI = 'hbot/$instance_id/command_shortcuts'
+        cls.LATENCY_URI = 'hbot/$instance_id/latency'
+        cls.PROFILE_URI = 'hbot/$instance_id/profile'
         cls.fake_mqtt_broker = FakeMQTTBroker()
 
     def setUp(self) -> None:
@@ -386,6 +393,50 @@ class RemoteIfaceMQTTTests(TestCase):
         self.async_run_with_timeout(self.wait_for_rcv(topic, msg, msg_key='data'), timeout=10)
         self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
 
+    def test_mqtt_command_latency(self):
+        self.start_mqtt()
+        self.addCleanup(LatencyTracer.get_instance().reset)
+        self.addCleanup(LatencyTracer.get_instance().stop)
+
+        self.fake_mqtt_broker.publish_to_subscription(self.get_topic_for(self.LATENCY_URI), {'option': 'start'})
+        topic = f"test_reply/hbot/{self.instance_id}/latency"
+        msg = {'status': 200, 'msg': '', 'enabled': True, 'data': {}}
+        self.async_run_with_timeout(self.wait_for_rcv(topic, msg, msg_key='data'), timeout=10)
+        self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
+        # The tracer is started on the event loop
+        self.async_run_with_timeout(asyncio.sleep(0))
+        self.assertTrue(LatencyTracer.get_instance().enabled)
+
+    def test_mqtt_command_latency_invalid_option(self):
+        self.start_mqtt()
+
+        self.fake_mqtt_broker.publish_to_subscription(self.get_topic_for(self.LATENCY_URI), {'option': 'pause'})
+        topic = f"test_reply/hbot/{self.instance_id}/latency"
+        msg = {'status': 400, 'msg': 'Invalid latency option pause, expected start, stop or reset.', 'enabled': False,
+               'data': {}}
+        self.async_run_with_timeout(self.wait_for_rcv(topic, msg, msg_key='data'), timeout=10)
+        self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
+
+    @patch("hummingbot.client.command.profile_command.ProfileCommand.profile")
+    def test_mqtt_command_profile(self, profile_mock: MagicMock):
+        self.start_mqtt()
+
+        self.fake_mqtt_broker.publish_to_subscription(self.get_topic_for(self.PROFILE_URI), {'duration': 10.0})
+        topic = f"test_reply/hbot/{self.instance_id}/profile"
+        msg = {'status': 200, 'msg': ''}
+        self.async_run_with_timeout(self.wait_for_rcv(topic, msg, msg_key='data'), timeout=10)
+        self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
+        profile_mock.assert_called_once_with('start', 10.0, 10.0, 100.0)
+
+    def test_mqtt_command_profile_invalid_option(self):
+        self.start_mqtt()
+
+        self.fake_mqtt_broker.publish_to_subscription(self.get_topic_for(self.PROFILE_URI), {'option': 'pause'})
+        topic = f"test_reply/hbot/{self.instance_id}/profile"
+        msg = {'status': 400, 'msg': 'Invalid profile option pause, expected start or stop.'}
+        self.async_run_with_timeout(self.wait_for_rcv(topic, msg, msg_key='data'), timeout=10)
+        self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
+
     def test_mqtt_command_command_shortcuts(self):
         self.start_mqtt()
 
@@ -1312,3 +1363,95 @@ class RemoteIfaceMQTTTests(TestCase):
         pub2.send("test/a/b", test_msg)
         pub2.send("test/c/d", test_msg)
         self.assertTrue(1)
+
+    def test_publish_queue_conflates_status_messages_and_drops_the_oldest(self):
+        from hummingbot.remote_iface.mqtt import MQTTPublishQueue
+        publish_queue = MQTTPublishQueue(flush_interval=10, max_queue_size=2)
+        events_pub = MagicMock(topic="test/events")
+        status_pub = MagicMock(topic="test/status_updates")
+        for i in range(3):
+            publish_queue.put(events_pub, i)
+        publish_queue.put(status_pub, "online", conflation_key="availability")
+        publish_queue.put(status_pub, "offline", conflation_key="availability")
+
+        self.assertEqual(3, publish_queue.flush())
+        self.assertEqual([call(1), call(2)], events_pub.publish.call_args_list)
+        status_pub.publish.assert_called_once_with("offline")
+        stats = publish_queue.stats()
+        self.assertEqual({"queued": 0, "published": 2, "dropped": 1, "conflated": 0}, stats["test/events"])
+        self.assertEqual({"queued": 0, "published": 1, "dropped": 0, "conflated": 1}, stats["test/status_updates"])
+
+    def test_publish_queue_publishes_from_its_thread_in_batches(self):
+        from hummingbot.remote_iface.mqtt import MQTTPublishQueue
+        publish_queue = MQTTPublishQueue(flush_interval=0.01, max_batch_size=2)
+        events_pub = MagicMock(topic="test/events")
+        publish_threads = set()
+        events_pub.publish.side_effect = lambda msg: publish_threads.add(threading.current_thread())
+        publish_queue.start()
+        for i in range(5):
+            publish_queue.put(events_pub, i)
+
+        deadline = time.time() + 3
+        while events_pub.publish.call_count < 5 and time.time() < deadline:
+            time.sleep(0.01)
+        publish_queue.stop()
+
+        self.assertEqual([call(i) for i in range(5)], events_pub.publish.call_args_list)
+        self.assertNotIn(threading.main_thread(), publish_threads)
+        self.assertFalse(publish_queue.is_running)
+
+    def test_publish_queue_publishes_a_list_per_topic_with_publish_batches(self):
+        from hummingbot.remote_iface.messages import BatchMessage, NotifyMessage
+        from hummingbot.remote_iface.mqtt import MQTTPublishQueue
+        publish_queue = MQTTPublishQueue(flush_interval=10, max_batch_size=2, publish_batches=True)
+        notify_pub = MagicMock(topic="test/notify")
+        status_pub = MagicMock(topic="test/status_updates")
+        for i in range(3):
+            publish_queue.put(notify_pub, NotifyMessage(seq=i, msg=f"notification {i}"))
+        publish_queue.put(status_pub, {"msg": "online"}, conflation_key="availability")
+
+        self.assertEqual(4, publish_queue.flush())
+        self.assertEqual(2, notify_pub.publish.call_count)
+        first_batch, second_batch = [c.args[0] for c in notify_pub.publish.call_args_list]
+        self.assertIsInstance(first_batch, BatchMessage)
+        self.assertEqual([0, 1], [msg["seq"] for msg in first_batch.messages])
+        self.assertEqual([2], [msg["seq"] for msg in second_batch.messages])
+        status_pub.publish.assert_called_once_with(BatchMessage(messages=[{"msg": "online"}]))
+        self.assertEqual(3, publish_queue.stats()["test/notify"]["published"])
+
+    def test_publish_queue_without_interval_publishes_immediately(self):
+        from hummingbot.remote_iface.mqtt import MQTTPublishQueue
+        publish_queue = MQTTPublishQueue(flush_interval=0)
+        events_pub = MagicMock(topic="test/events")
+        publish_queue.start()
+
+        publish_queue.put(events_pub, 1)
+
+        events_pub.publish.assert_called_once_with(1)
+        self.assertFalse(publish_queue.is_running)
+
+    def test_mqtt_market_data_stream(self):
+        self.client_config_map.mqtt_bridge.mqtt_market_data = True
+        self.client_config_map.mqtt_bridge.mqtt_market_data_interval = 0.1
+        self.test_market.set_balanced_order_book("COINALPHA-HBOT", 100, 50, 150, 1, 10)
+        candles_feed = MagicMock(interval="1m", columns=["timestamp", "open", "close"], last_candle=[60.0, 1.0, 2.0])
+        self.hbapp.strategy = MagicMock()
+        self.hbapp.strategy.market_data_provider.candles_feeds = {"binance_COINALPHA-HBOT_1m": candles_feed}
+        self.start_mqtt()
+
+        market_data_topic = f"hbot/{self.instance_id}/market_data"
+        self.async_run_with_timeout(self.wait_for_rcv(market_data_topic, "top_of_book", msg_key='type'), timeout=10)
+        self.async_run_with_timeout(self.wait_for_rcv(market_data_topic, "candle", msg_key='type'), timeout=10)
+
+        msgs = self.fake_mqtt_broker.received_msgs[market_data_topic]
+        top_of_book = next(msg["data"] for msg in msgs if msg["type"] == "top_of_book")
+        self.assertEqual("test_market_paper_trade", top_of_book["connector"])
+        self.assertEqual("COINALPHA-HBOT", top_of_book["trading_pair"])
+        self.assertLess(top_of_book["best_bid"], top_of_book["best_ask"])
+        self.assertEqual((top_of_book["best_bid"] + top_of_book["best_ask"]) / 2, top_of_book["mid_price"])
+        candle = next(msg["data"] for msg in msgs if msg["type"] == "candle")
+        self.assertEqual({"feed": "binance_COINALPHA-HBOT_1m", "interval": "1m",
+                          "timestamp": 60.0, "open": 1.0, "close": 2.0}, candle)
+
+        self.gateway.stop()
+        self.assertIsNone(self.gateway._market_data)
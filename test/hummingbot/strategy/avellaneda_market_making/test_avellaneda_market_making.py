@@ -702,6 +702,22 @@ class AvellanedaMarketMakingUnitTests(unittest.TestCase):
         self.assertAlmostEqual(118.45210662343376, alpha, 3)
         self.assertAlmostEqual(3.3468695409821243, kappa, 3)
 
+    def test_trading_intensity_created_with_configured_fit(self):
+        config_settings = self.get_default_map()
+        config_settings["trading_intensity_fit_method"] = "log_linear"
+        config_settings["trading_intensity_refit_interval"] = 5
+        config_map = ClientConfigAdapter(AvellanedaMarketMakingConfigMap(**config_settings))
+
+        strategy = AvellanedaMarketMakingStrategy()
+        strategy.init_params(
+            config_map=config_map,
+            market_info=self.market_info,
+        )
+        strategy.get_config_map_indicators()
+
+        self.assertEqual("log_linear", strategy.trading_intensity.fit_method)
+        self.assertEqual(5, strategy.trading_intensity.refit_interval)
+
     def test_calculate_reservation_price_and_optimal_spread_timeframe_constrained(self):
         # Init params
         start_time = (
@@ -200,6 +200,24 @@ class AvellanedaMarketMakingConfigMapPydanticTest(unittest.TestCase):
         model.hanging_orders_cancel_pct = "3"
         self.assertEqual(3, model.hanging_orders_cancel_pct)
 
+        self.config_map.trading_intensity_fit_method = "log_linear"
+        self.assertEqual("log_linear", self.config_map.trading_intensity_fit_method)
+
+        with self.assertRaises(ConfigValidationError) as e:
+            self.config_map.trading_intensity_fit_method = "XXX"
+
+        error_msg = "Invalid fit method, please choose value from ['curve_fit', 'log_linear']."
+        self.assertEqual(error_msg, str(e.exception))
+
+        self.config_map.trading_intensity_refit_interval = "10"
+        self.assertEqual(10, self.config_map.trading_intensity_refit_interval)
+
+        with self.assertRaises(ConfigValidationError) as e:
+            self.config_map.trading_intensity_refit_interval = "0"
+
+        error_msg = "Value must be between 1 and 10000."
+        self.assertEqual(error_msg, str(e.exception))
+
     def test_load_configs_from_yaml(self):
         cur_dir = Path(__file__).parent
         f_path = cur_dir / "test_config.yml"
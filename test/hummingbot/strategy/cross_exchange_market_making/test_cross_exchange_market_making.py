@@ -32,6 +32,7 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making import (
     CrossExchangeMarketMakingStrategy,
+    EvaluationTrigger,
     LogOption,
 )
 from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making_config_map_pydantic import (
@@ -495,6 +496,47 @@ class HedgedMarketMakingUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("0.98457"), bid_order.price)
         self.assertEqual(Decimal("1.0156"), ask_order.price)
 
+    def test_taker_order_book_reaction_cancels_stale_orders_before_the_next_tick(self):
+        self.config_map_raw.taker_order_book_reaction_enabled = True
+        self.clock.backtest_til(self.start_timestamp + 5)
+        self.ev_loop.run_until_complete(self.maker_order_created_logger.wait_for(BuyOrderCreatedEvent))
+        self.assertEqual(1, len(self.strategy.active_maker_bids))
+        self.assertEqual(1, len(self.strategy.active_maker_asks))
+
+        self.simulate_order_book_widening(self.taker_market.order_books[self.trading_pairs_taker[0]], 0.99, 1.01)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+
+        self.assertEqual(2, len(self.maker_cancel_order_logger.event_log))
+        self.assertEqual(1, self.strategy.cancel_latency_histograms[EvaluationTrigger.TAKER_ORDER_BOOK].count)
+        self.assertEqual(0, self.strategy.cancel_latency_histograms[EvaluationTrigger.TICK].count)
+        self.assertIn("Taker price move to maker cancel latency", self.strategy.format_status())
+
+    def test_taker_order_book_moves_wait_for_the_next_tick_when_reaction_disabled(self):
+        self.clock.backtest_til(self.start_timestamp + 5)
+        self.ev_loop.run_until_complete(self.maker_order_created_logger.wait_for(BuyOrderCreatedEvent))
+
+        self.simulate_order_book_widening(self.taker_market.order_books[self.trading_pairs_taker[0]], 0.99, 1.01)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+        self.assertEqual(0, len(self.maker_cancel_order_logger.event_log))
+
+        self.clock.backtest_til(self.start_timestamp + 6)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+
+        self.assertEqual(2, len(self.maker_cancel_order_logger.event_log))
+        self.assertEqual(1, self.strategy.cancel_latency_histograms[EvaluationTrigger.TICK].count)
+        self.assertEqual(0, self.strategy.cancel_latency_histograms[EvaluationTrigger.TAKER_ORDER_BOOK].count)
+
+    def test_taker_order_book_moves_below_the_threshold_are_ignored(self):
+        self.config_map_raw.taker_order_book_reaction_enabled = True
+        self.config_map_raw.taker_order_book_reaction_threshold = Decimal("5")
+        self.clock.backtest_til(self.start_timestamp + 5)
+        self.ev_loop.run_until_complete(self.maker_order_created_logger.wait_for(BuyOrderCreatedEvent))
+
+        self.simulate_order_book_widening(self.taker_market.order_books[self.trading_pairs_taker[0]], 0.99, 1.01)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+
+        self.assertEqual(0, len(self.maker_cancel_order_logger.event_log))
+
     def test_market_became_narrower(self):
         self.clock.backtest_til(self.start_timestamp + 5)
         self.ev_loop.run_until_complete(self.maker_order_created_logger.wait_for(BuyOrderCreatedEvent))
@@ -107,3 +107,63 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_numpy_view(self):
+        buffer = RingBuffer(4)
+
+        for i in range(6):
+            buffer.add_value(i)
+
+        view = buffer.get_as_numpy_view()
+        self.assertTrue(np.array_equal(view, np.array([2, 3, 4, 5])))
+        self.assertFalse(view.flags.writeable)
+        self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), view))
+
+    def test_numpy_array_longer_than_int16_range(self):
+        length = 40000
+        buffer = RingBuffer(length)
+
+        for i in range(length + 10):
+            buffer.add_value(i % 1000)
+
+        array = buffer.get_as_numpy_array()
+        self.assertEqual(length, array.size)
+        self.assertEqual(9, array[-1])
+        self.assertEqual(10 % 1000, array[0])
+
+    def test_running_statistics_match_numpy(self):
+        np.random.seed(123456789)
+        buffer = RingBuffer(self.BUFFER_LENGTH)
+
+        for value in np.random.normal(100, 5, self.BUFFER_LENGTH * 3 + 7):
+            buffer.add_value(value)
+            values = buffer.get_as_numpy_array()
+            self.assertEqual(values.size, buffer.size)
+            self.assertAlmostEqual(np.mean(values), buffer.running_mean, 8)
+            self.assertAlmostEqual(np.var(values), buffer.running_variance, 8)
+            self.assertAlmostEqual(np.sum(np.square(np.diff(values))), buffer.sum_squared_diffs, 8)
+            if buffer.is_full:
+                self.assertAlmostEqual(np.mean(values), buffer.mean_value, 8)
+                self.assertAlmostEqual(np.std(values), buffer.std_dev, 8)
+
+    def test_running_statistics_recover_from_nan(self):
+        buffer = RingBuffer(3)
+
+        buffer.add_value(np.nan)
+        self.assertTrue(np.isnan(buffer.running_mean))
+        for value in [1, 2, 3]:
+            buffer.add_value(value)
+
+        self.assertEqual(2, buffer.running_mean)
+        self.assertAlmostEqual(2 / 3, buffer.running_variance)
+        self.assertEqual(2, buffer.sum_squared_diffs)
+
+    def test_length_change_keeps_running_statistics(self):
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(i)
+
+        self.buffer.length = 5
+
+        self.assertTrue(np.array_equal(self.buffer.get_as_numpy_array(), np.arange(25, 30)))
+        self.assertEqual(27, self.buffer.mean_value)
+        self.assertEqual(4, self.buffer.sum_squared_diffs)
@@ -66,3 +66,14 @@ class HistoricalVolatilityTest(unittest.TestCase):
         energy_smoothed = sum(x ** 2 for x in np.diff(output_smoothed))
 
         self.assertGreater(energy_normal, energy_smoothed)
+
+    def test_indicator_matches_variance_of_buffer_log_returns(self):
+        samples = 100 * np.exp(np.cumsum(np.random.normal(0, 0.01, 50)))
+        self.indicator = HistoricalVolatilityIndicator(20, 1)
+
+        for sample in samples:
+            self.indicator.add_sample(sample)
+            prices = self.indicator._sampling_buffer.get_as_numpy_array()
+            if prices.size > 1:
+                expected = np.sqrt(np.var(np.diff(np.log(prices))))
+                self.assertAlmostEqual(expected, self.indicator.current_value, 5)
@@ -4,12 +4,13 @@ from decimal import Decimal
 
 import numpy as np
 import pandas as pd
+from scipy.optimize import curve_fit
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
-from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.common import PriceType, TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.event.events import OrderBookTradeEvent
@@ -259,3 +260,157 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_calculate_trading_intensity_deterministic_log_linear_fit(self):
+        last_price = 1
+        trade_price_levels = [2, 3, 4, 5]
+        a = 2
+        b = 0.1
+        ts = [a * np.exp(-b * (p - last_price)) for p in trade_price_levels]
+
+        timestamp = self.start_timestamp
+
+        trading_intensity_indicator = TradingIntensityIndicator(
+            OrderBook(), self.price_delegate, 1, fit_method="log_linear")
+        trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": last_price}]
+
+        timestamp += 1
+
+        for p, t in zip(trade_price_levels, ts):
+            new_trade = OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=timestamp,
+                price=p,
+                amount=t,
+                type=TradeType.SELL,
+            )
+            trading_intensity_indicator.register_trade(new_trade)
+
+        trading_intensity_indicator.calculate(timestamp)
+        alpha, kappa = trading_intensity_indicator.current_value
+
+        self.assertAlmostEqual(a, alpha, 10)
+        self.assertAlmostEqual(b, kappa, 10)
+
+    def test_invalid_fit_configuration_raises(self):
+        with self.assertRaises(ValueError):
+            TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, fit_method="unknown")
+        with self.assertRaises(ValueError):
+            TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, refit_interval=0)
+
+    def test_refit_interval_skips_estimations(self):
+        trading_intensity_indicator = TradingIntensityIndicator(
+            OrderBook(), self.price_delegate, 1, refit_interval=3)
+        timestamp = self.start_timestamp
+        trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+
+        values = []
+        for _ in range(6):
+            timestamp += 1
+            for p in [2, 3, 4, 5]:
+                trading_intensity_indicator.register_trade(OrderBookTradeEvent(
+                    trading_pair="COINALPHAHBOT",
+                    timestamp=timestamp,
+                    price=p,
+                    amount=2 * np.exp(-0.1 * (p - 1)),
+                    type=TradeType.SELL,
+                ))
+            trading_intensity_indicator.calculate(timestamp)
+            trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+            values.append(trading_intensity_indicator.current_value)
+
+        self.assertEqual((0, 0), values[0])
+        self.assertEqual((0, 0), values[1])
+        self.assertNotEqual((0, 0), values[2])
+
+    def test_calculate_trading_intensity_matches_reference_implementation(self):
+        N_SAMPLES = 120
+
+        bids_df, asks_df = TradingIntensityTest.make_order_books(
+            100, Decimal("10"), Decimal("1"), Decimal("0.05"), Decimal("0.1"), Decimal("0.01"), N_SAMPLES)
+        trades = TradingIntensityTest.make_trades(bids_df, asks_df)
+
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 20)
+        reference = _ReferenceTradingIntensity(sampling_length=20)
+
+        timestamp = self.start_timestamp
+        for bid_df, ask_df, trades_tick in zip(bids_df, asks_df, trades):
+            mid = (bid_df["price"].iloc[0] + ask_df["price"].iloc[0]) / 2
+            for trade in trades_tick:
+                indicator.register_trade(trade)
+                reference.register_trade(trade)
+            indicator.calculate(timestamp)
+            reference.calculate(timestamp, float(self.price_delegate.get_price_by_type(PriceType.MidPrice)))
+            indicator.last_quotes = [{"timestamp": timestamp, "price": mid}] + indicator.last_quotes
+            reference.last_quotes = [{"timestamp": timestamp, "price": mid}] + reference.last_quotes
+            timestamp += 1
+
+            self.assertEqual(reference.is_sampling_buffer_full, indicator.is_sampling_buffer_full)
+            self.assertAlmostEqual(float(reference.alpha), indicator.current_value[0], 6)
+            self.assertAlmostEqual(float(reference.kappa), indicator.current_value[1], 6)
+
+
+class _ReferenceTradingIntensity:
+    """Dictionary based implementation the vectorized indicator is checked against"""
+
+    def __init__(self, sampling_length: int):
+        self.alpha = 0
+        self.kappa = 0
+        self.sampling_length = sampling_length
+        self.trade_samples = {}
+        self.current_trade_sample = []
+        self.last_quotes = []
+
+    @property
+    def is_sampling_buffer_full(self) -> bool:
+        return len(self.trade_samples) == self.sampling_length
+
+    def register_trade(self, trade):
+        self.current_trade_sample.append(trade)
+
+    def calculate(self, timestamp, price):
+        self.last_quotes = [{'timestamp': timestamp, 'price': price}] + self.last_quotes
+
+        latest_processed_quote_idx = None
+        for trade in self.current_trade_sample:
+            for i, quote in enumerate(self.last_quotes):
+                if quote["timestamp"] < trade.timestamp:
+                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
+                        latest_processed_quote_idx = i
+                    sample = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
+                    self.trade_samples.setdefault(quote["timestamp"] + 1, []).append(sample)
+                    break
+
+        self.current_trade_sample = []
+        if latest_processed_quote_idx is not None:
+            self.last_quotes = self.last_quotes[0:latest_processed_quote_idx + 1]
+
+        if len(self.trade_samples) > self.sampling_length:
+            timestamps = sorted(self.trade_samples.keys())[-self.sampling_length:]
+            self.trade_samples = {timestamp: self.trade_samples[timestamp] for timestamp in timestamps}
+
+        if self.is_sampling_buffer_full:
+            self.estimate_intensity()
+
+    def estimate_intensity(self):
+        trades_consolidated = {}
+        for tick in self.trade_samples.values():
+            for trade in tick:
+                trades_consolidated[trade["price_level"]] = (
+                    trades_consolidated.get(trade["price_level"], 0) + trade["amount"])
+
+        price_levels = sorted(trades_consolidated.keys(), reverse=True)
+        lambdas = [trades_consolidated[price_level] for price_level in price_levels]
+        lambdas_adj = [10**-10 if x == 0 else x for x in lambdas]
+
+        try:
+            params = curve_fit(lambda t, a, b: a * np.exp(-b * t),
+                               price_levels,
+                               lambdas_adj,
+                               p0=(self.alpha, self.kappa),
+                               method='dogbox',
+                               bounds=([0, 0], [np.inf, np.inf]))
+            self.kappa = Decimal(str(params[0][1]))
+            self.alpha = Decimal(str(params[0][0]))
+        except (RuntimeError, ValueError):
+            pass
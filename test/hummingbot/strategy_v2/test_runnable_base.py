@@ -2,6 +2,7 @@ import asyncio
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from test.logger_mixin_for_test import LoggerMixinForTest
 
+from hummingbot.core.utils.latency_tracer import LatencyStage, LatencyTracer
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.runnable_base import RunnableBase
 
@@ -25,3 +26,25 @@ class TestRunnableBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         self.component.start()
         await asyncio.sleep(0.05)
         self.is_logged("Test", "error")
+
+    async def test_orders_submitted_by_the_control_task_are_traced_from_its_start(self):
+        latency_tracer = LatencyTracer.get_instance()
+        latency_tracer.reset()
+        latency_tracer.start()
+        self.addCleanup(latency_tracer.reset)
+        self.addCleanup(latency_tracer.stop)
+        submitted = asyncio.Event()
+
+        async def submit_order():
+            await asyncio.sleep(0)
+            latency_tracer.order_submitted("OID1")
+            submitted.set()
+
+        self.component.control_task = submit_order
+        self.component.start()
+        await asyncio.wait_for(submitted.wait(), timeout=1)
+        # Out of the control task there is no tick to trace the orders from
+        latency_tracer.order_submitted("OID2")
+        self.component.stop()
+
+        self.assertEqual(1, latency_tracer.histogram(LatencyStage.TICK_TO_ORDER).count)